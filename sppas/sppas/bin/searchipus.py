@@ -56,6 +56,8 @@ from sppas import sppasParam
 from sppas import sppasAnnotationsManager
 from sppas import sppasLogSetup
 from sppas import sppasAppConfig
+from sppas.src.annotations.log import sppasLog
+from sppas.src.ui.term.textprogress import ProcessProgressTerminal
 
 if __name__ == "__main__":
 
@@ -121,6 +123,14 @@ if __name__ == "__main__":
         help='Output file extension. One of: {:s}'
              ''.format(" ".join(extensions_out)))
 
+    group_io.add_argument(
+        "-p",
+        metavar="nb",
+        type=int,
+        default=1,
+        help='Number of processes to annotate the files of -I, '
+             '0 for all the CPUs (default: 1)')
+
     # Add arguments from the options of the annotation
     # ------------------------------------------------
 
@@ -171,7 +181,7 @@ if __name__ == "__main__":
 
     arguments = vars(args)
     for a in arguments:
-        if a not in ('i', 'o', 'I', 'e', 'quiet', 'log'):
+        if a not in ('i', 'o', 'I', 'e', 'p', 'quiet', 'log'):
             parameters.set_option_value(ann_step_idx, a, arguments[a])
 
     if args.i:
@@ -191,6 +201,29 @@ if __name__ == "__main__":
                     ann.get_location().get_best().get_end().get_midpoint(),
                     ann.get_best_tag().get_typed_content()))
 
+    elif args.I and args.p != 1:
+
+        # Perform the annotation on a set of files, with several processes
+        # ----------------------------------------------------------------
+
+        log = sppasLog(parameters)
+        if args.log:
+            log.create(args.log)
+            log.print_header()
+
+        ann = sppasSearchIPUs(log=log)
+        ann.fix_options(parameters.get_options(ann_step_idx))
+        ann.set_nb_proc(args.p)
+        progress = None
+        if not args.quiet:
+            progress = ProcessProgressTerminal()
+            progress.set_header(parameters.get_step_name(ann_step_idx))
+        ann.batch_processing([os.path.abspath(f) for f in args.I],
+                             progress, args.e)
+        if progress:
+            progress.close()
+        log.close()
+
     elif args.I:
 
         # Perform the annotation on a set of files
@@ -38,6 +38,7 @@
 """
 import sys
 import os.path
+import multiprocessing
 from argparse import ArgumentParser
 
 PROGRAM = os.path.abspath(__file__)
@@ -47,22 +48,40 @@ sys.path.append(SPPAS)
 import sppas.src.audiodata.aio
 from sppas.src.audiodata.channelformatter import sppasChannelFormatter
 from sppas.src.audiodata.audio import sppasAudioPCM
+from sppas.src.audiodata.autils import convert_audio_file
 
 # ----------------------------------------------------------------------------
 
-parser = ArgumentParser(usage="%s -w input file -o output file [options]" % os.path.basename(PROGRAM),
-                        description="... a script to reformat an audio file.")
+parser = ArgumentParser(usage="%s -w input file -o output file [options]\n"
+                              "       %s -i input dir -d output dir [options]"
+                              "" % (os.path.basename(PROGRAM),
+                                    os.path.basename(PROGRAM)),
+                        description="... a script to reformat an audio file "
+                                    "or all the audio files of a corpus.")
 
 parser.add_argument("-w",
                     metavar="file",
-                    required=True,
                     help='Audio Input file name')
 
 parser.add_argument("-o",
                     metavar="file",
-                    required=True,
                     help='Audio Output file name')
 
+parser.add_argument("-i",
+                    metavar="dir",
+                    help='Input directory: convert all its audio files '
+                         '(batch mode)')
+
+parser.add_argument("-d",
+                    metavar="dir",
+                    help='Output directory of the batch mode')
+
+parser.add_argument("-p",
+                    metavar="value",
+                    default=0, type=int,
+                    help='Number of processes of the batch mode '
+                         '(default: 0=all the CPUs)')
+
 parser.add_argument("-s",
                     metavar="value",
                     type=int,
@@ -77,6 +96,11 @@ parser.add_argument("-r",
                     type=int,
                     help='The expected framerate of the output audio file')
 
+parser.add_argument("-a",
+                    action='store_true',
+                    help='Change the framerate with a band-limited resampler '
+                         '(no aliasing, but much slower)')
+
 parser.add_argument("-m",
                     metavar="value",
                     type=int,
@@ -93,37 +117,111 @@ if len(sys.argv) <= 1:
 args = parser.parse_args()
 
 # ----------------------------------------------------------------------------
+# Batch mode: convert a corpus into the 16kHz 16bits mono format of
+# the aligner (or the given ones), one file per process.
+# ----------------------------------------------------------------------------
+
+
+def convert_file(filenames):
+    """Convert a file; return an error message or an empty string."""
+    try:
+        convert_audio_file(filenames[0], filenames[1],
+                           framerate=args.r or 16000,
+                           sampwidth=args.s or 2,
+                           idx=args.c - 1,
+                           antialias=args.a)
+    except Exception as e:
+        return "{:s}: {:s}".format(filenames[0], str(e))
+    return ""
+
+
+def convert_corpus():
+    """Convert all the audio files of the input directory."""
+    if not args.d:
+        parser.error("the output directory (-d) is required with -i.")
+    if args.m or args.b:
+        parser.error("options -m and -b are not supported with -i.")
+    if os.path.exists(args.d) is False:
+        os.makedirs(args.d)
+
+    files = list()
+    for root, dirs, filenames in os.walk(args.i):
+        for filename in sorted(filenames):
+            name, ext = os.path.splitext(filename)
+            if ext.lower() not in sppas.src.audiodata.aio.extensions:
+                continue
+            out_dir = os.path.join(args.d, os.path.relpath(root, args.i))
+            if os.path.exists(out_dir) is False:
+                os.makedirs(out_dir)
+            files.append((os.path.join(root, filename),
+                          os.path.join(out_dir, name + ".wav")))
+
+    nb_proc = args.p
+    if nb_proc == 0:
+        nb_proc = multiprocessing.cpu_count()
+    if nb_proc > 1 and len(files) > 1:
+        pool = multiprocessing.Pool(nb_proc)
+        try:
+            errors = pool.map(convert_file, files)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        errors = [convert_file(f) for f in files]
+
+    errors = [e for e in errors if len(e) > 0]
+    for error in errors:
+        print(error)
+    print("{:d} files converted.".format(len(files) - len(errors)))
+
+# ----------------------------------------------------------------------------
+
+
+def convert_one():
+    """Convert the input file, with the options -m and -b."""
+    if not args.w or not args.o:
+        parser.error("the arguments -w and -o are required.")
 
-audio = sppas.src.audiodata.aio.open(args.w)
+    audio = sppas.src.audiodata.aio.open(args.w)
 
-# Get the expected channel
-idx = audio.extract_channel(args.c-1)
+    # Get the expected channel
+    idx = audio.extract_channel(args.c-1)
 
-# Do the job (do not modify the initial channel).
-formatter = sppasChannelFormatter(audio.get_channel(idx))
+    # Do the job (do not modify the initial channel).
+    formatter = sppasChannelFormatter(audio.get_channel(idx))
 
-if args.r:
-    formatter.set_framerate(args.r)
-else:
-    formatter.set_framerate(audio.get_framerate())
+    if args.r:
+        formatter.set_framerate(args.r)
+    else:
+        formatter.set_framerate(audio.get_framerate())
 
-if args.b:
-    formatter.set_sampwidth(args.b)
-else:
-    formatter.set_sampwidth(audio.get_sampwidth())
+    if args.s:
+        formatter.set_sampwidth(args.s)
+    else:
+        formatter.set_sampwidth(audio.get_sampwidth())
 
-formatter.convert()
+    formatter.set_antialias(args.a)
+    formatter.convert()
 
-# no more need of input data, can close
-audio.close()
+    # no more need of input data, can close
+    audio.close()
 
-if args.m:
-    formatter.mul(args.m)
+    if args.m:
+        formatter.mul(args.m)
+
+    if args.b:
+        formatter.bias(args.b)
+
+    # Save the converted channel
+    audio_out = sppasAudioPCM()
+    audio_out.append_channel(formatter.get_channel())
+    sppas.src.audiodata.aio.save(args.o, audio_out)
+
+# ----------------------------------------------------------------------------
 
-if args.b:
-    formatter.bias(args.b)
 
-# Save the converted channel
-audio_out = sppasAudioPCM()
-audio_out.append_channel(formatter.get_channel())
-sppas.src.audiodata.aio.save(args.o, audio_out)
+if __name__ == "__main__":
+    if args.i:
+        convert_corpus()
+    else:
+        convert_one()
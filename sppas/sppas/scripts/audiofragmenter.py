@@ -33,7 +33,7 @@
     scripts.audiofragmenter.py
     ~~~~~~~~~~~~~~~~~~~~~~~~~
 
-    ... a script to extract a fragment of an audio file.
+    ... a script to extract fragments of an audio file.
 
 """
 from argparse import ArgumentParser
@@ -44,13 +44,19 @@ PROGRAM = os.path.abspath(__file__)
 SPPAS = os.path.dirname(os.path.dirname(os.path.dirname(PROGRAM)))
 sys.path.append(SPPAS)
 
-import sppas.src.audiodata.aio
-from sppas.src.audiodata.audio import sppasAudioPCM
+from sppas import sppasRW
+from sppas.src.audiodata.audiofragmenter import sppasAudioFragmenter
 
 # ----------------------------------------------------------------------------
 
-parser = ArgumentParser(usage="%s -w input file -o output file [OPTIONS]" % os.path.basename(PROGRAM),
-                        description="... a script to extract a fragment of an audio file.")
+parser = ArgumentParser(usage="%s -w input file -o output file [OPTIONS]\n"
+                              "       %s -w input file -i annotated file "
+                              "-t tier -d output dir [OPTIONS]"
+                              "" % (os.path.basename(PROGRAM),
+                                    os.path.basename(PROGRAM)),
+                        description="... a script to extract a fragment of "
+                                    "an audio file, or all the intervals "
+                                    "of a tier.")
 
 parser.add_argument("-w",
                     metavar="file",
@@ -59,7 +65,6 @@ parser.add_argument("-w",
 
 parser.add_argument("-o",
                     metavar="file",
-                    required=True,
                     help='Audio Output file name')
 
 parser.add_argument("-bs",
@@ -86,6 +91,40 @@ parser.add_argument("-ef",
                     type=float,
                     help='The position (in number of frames) when ends the mix, don\'t use with -es')
 
+parser.add_argument("-i",
+                    metavar="file",
+                    help='Annotated file with the intervals to extract')
+
+parser.add_argument("-t",
+                    metavar="name",
+                    help='Name of the tier with the intervals to extract')
+
+parser.add_argument("-d",
+                    metavar="dir",
+                    help='Output directory of the extracted intervals')
+
+parser.add_argument("-c",
+                    metavar="value",
+                    type=int,
+                    help='The channel to extract (default: all)')
+
+parser.add_argument("-r",
+                    metavar="value",
+                    type=int,
+                    help='The expected framerate of the output audio files')
+
+parser.add_argument("-s",
+                    metavar="value",
+                    type=int,
+                    help='Sample width of the output audio files. Possible values are 1, 2, 4.')
+
+parser.add_argument("-p",
+                    metavar="value",
+                    default=sppasAudioFragmenter.NB_THREADS,
+                    type=int,
+                    help='Number of threads to write the files '
+                         '(default: {:d})'.format(sppasAudioFragmenter.NB_THREADS))
+
 if len(sys.argv) <= 1:
     sys.argv.append('-h')
 
@@ -93,9 +132,6 @@ args = parser.parse_args()
 
 # ----------------------------------------------------------------------------
 
-audio_out = sppasAudioPCM()
-audio = sppas.src.audiodata.aio.open(args.w)
-
 if args.bf and args.bs:
     print("bf option and bs option can't be used at the same time!")
     sys.exit(1)
@@ -104,24 +140,56 @@ if args.ef and args.es:
     print("ef option and es option can't be used at the same time!")
     sys.exit(1)
 
-if args.bf:
-    begin = args.bf
-elif args.bs:
-    begin = args.bs*audio.get_framerate()
-else:
-    begin = 0
-if args.ef:
-    end = args.ef
-elif args.es:
-    end = args.es*audio.get_framerate()
-else:
-    end = 0
-
-for i in range(audio.get_nchannels()):
-    idx = audio.extract_channel(i)
-    audio.rewind()
-    channel = audio.get_channel(idx)
-    extracter = channel.extract_fragment(begin, end)
-    audio_out.append_channel(extracter)
-
-sppas.src.audiodata.aio.save(args.o, audio_out)
+if args.i:
+    if not args.t or not args.d:
+        print("options -t and -d are required with -i.")
+        sys.exit(1)
+    trs = sppasRW(args.i).read()
+    tier = trs.find(args.t, case_sensitive=False)
+    if tier is None:
+        print('Tier {:s} not found in file {:s}'.format(args.t, args.i))
+        sys.exit(1)
+    if tier.is_interval() is False:
+        print('Only interval tiers can be extracted.')
+        sys.exit(1)
+elif not args.o:
+    print("option -o is required without -i.")
+    sys.exit(1)
+
+channel = None
+if args.c:
+    channel = args.c - 1
+fragmenter = sppasAudioFragmenter(args.w,
+                                  framerate=args.r,
+                                  sampwidth=args.s,
+                                  channel=channel)
+
+try:
+    if args.i:
+        # Write each interval of the tier into a file of the output dir
+        if os.path.exists(args.d) is False:
+            os.makedirs(args.d)
+        root = os.path.splitext(os.path.basename(args.w))[0]
+        intervals = tier.get_midpoint_intervals()
+        filenames = [os.path.join(args.d, "{:s}_{:04d}.wav".format(root, i + 1))
+                     for i in range(len(intervals))]
+        fragmenter.write_fragments(intervals, filenames, nb_threads=args.p)
+
+    else:
+        if args.bf:
+            begin = args.bf
+        elif args.bs:
+            begin = args.bs*fragmenter.get_framerate()
+        else:
+            begin = 0
+        if args.ef:
+            end = args.ef
+        elif args.es:
+            end = args.es*fragmenter.get_framerate()
+        else:
+            end = fragmenter.get_nframes()
+
+        fragmenter.write_fragment(args.o, begin, end)
+
+finally:
+    fragmenter.close()
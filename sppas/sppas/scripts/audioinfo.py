@@ -33,7 +33,7 @@
     scripts.audioinfo.py
     ~~~~~~~~~~~~~~~~~~~~
 
-    ... a script to get information about an audio file.
+    ... a script to get information about an audio file or a corpus.
 
 """
 import sys
@@ -48,13 +48,19 @@ import sppas.src.audiodata.aio
 from sppas.src.audiodata.audiovolume import sppasAudioVolume
 from sppas.src.audiodata.channelvolume import sppasChannelVolume
 from sppas.src.audiodata.audioframes import sppasAudioFrames
+from sppas.src.audiodata.audioinspector import sppasAudioInspector
 
 # ----------------------------------------------------------------------------
 # Verify and extract args:
 # ----------------------------------------------------------------------------
 
-parser = ArgumentParser(usage="%s -w file [options]" % os.path.basename(PROGRAM),
-                        description="... a script to get information about an audio file.")
+parser = ArgumentParser(usage="%s -w file [options]\n"
+                              "       %s -d dir -o report [options]"
+                              "" % (os.path.basename(PROGRAM),
+                                    os.path.basename(PROGRAM)),
+                        description="... a script to get information about "
+                                    "an audio file or about all the audio "
+                                    "files of a corpus.")
 
 parser.add_argument(
     "--noclip",
@@ -63,9 +69,32 @@ parser.add_argument(
 
 parser.add_argument("-w",
                     metavar="file",
-                    required=True,
                     help='Input audio file name')
 
+parser.add_argument("-d",
+                    metavar="dir",
+                    help='Input directory: scan all its audio files')
+
+parser.add_argument("-o",
+                    metavar="file",
+                    help='Report of the scanned directory (.csv or .json)')
+
+parser.add_argument("-p",
+                    metavar="value",
+                    default=0,
+                    type=int,
+                    help='Number of processes to scan the directory '
+                         '(default: 0=all the CPUs)')
+
+parser.add_argument("--cache",
+                    metavar="file",
+                    help='JSON file to cache the results of the scans')
+
+parser.add_argument(
+    "--header",
+    action='store_true',
+    help="Scan only the headers of the files of the directory")
+
 parser.add_argument("-f",
                     metavar="value",
                     default=0.02,
@@ -79,55 +108,97 @@ args = parser.parse_args()
 
 # ----------------------------------------------------------------------------
 
-audio = sppas.src.audiodata.aio.open(args.w)
-audio.frameduration = args.f
-
-print("Audio file name:     {:s}".format(args.w))
-print("Duration (seconds):  {:f}".format(audio.get_duration()))
-print("Frame rate (Hz):     {:d}".format(audio.get_framerate()))
-print("Sample width (bits): {:d}".format(audio.get_sampwidth()*8))
-nc = audio.get_nchannels()
-print("Number of channels:  {:d}".format(nc))
-
-if nc == 1:
-    if not args.noclip:
-        print("Clipping rate (in %):")
-        for i in range(2, 9, 2):
-            f = float(i)/10.
-            c = audio.clipping_rate(f) * 100.
-            print("  - factor={:.1f}:      {:.3f}".format(f, c))
-
-    audiovol = sppasAudioVolume(audio, args.f)
-    print("Volume:")
-    print("  - min:           {:d}".format(audiovol.min()))
-    print("  - max:           {:d}".format(audiovol.max()))
-    print("  - mean:          {:.2f}".format(audiovol.mean()))
-    print("  - median:        {:.2f}".format(audiovol.median()))
-    print("  - stdev:         {:.2f}".format(audiovol.stdev()))
-    print("  - coefvariation: {:.2f}".format(audiovol.coefvariation()))
-    print("  - std err:       {:.2f}".format(audiovol.stderr()))
-
-else:
-
-    for n in range(nc):
-        print("Channel {:d}".format(n))
-        cidx = audio.extract_channel(n)
-        channel = audio.get_channel(cidx)
-
-        # Values related to amplitude
-        frames = channel.get_frames(channel.get_nframes())
-        ca = sppasAudioFrames(frames, channel.get_sampwidth(), 1)
-        for i in range(2, 9, 2):
-            f = float(i)/10.
-            c = ca.clipping_rate(f) * 100.
-            print("  - factor={:.1f}:      {:.3f}".format(f, c))
-
-        # RMS (=volume)
-        cv = sppasChannelVolume(channel)
-        print("  Volume:")
-        print("  - min:           {:d}".format(cv.min()))
-        print("  - max:           {:d}".format(cv.max()))
-        print("  - mean:          {:.2f}".format(cv.mean()))
-        print("  - median:        {:.2f}".format(cv.median()))
-        print("  - stdev:         {:.2f}".format(cv.stdev()))
-        print("  - coefvariation: {:.2f}".format(cv.coefvariation()))
+
+def inspect_corpus():
+    """Scan the audio files of the directory and write a report."""
+    if not args.o:
+        parser.error("the report file (-o) is required with -d.")
+    filenames = list()
+    for root, dirs, files in os.walk(args.d):
+        for filename in sorted(files):
+            ext = os.path.splitext(filename)[1][1:].lower()
+            if sppasAudioInspector.READERS.get(ext, None) is not None:
+                filenames.append(os.path.join(root, filename))
+
+    inspector = sppasAudioInspector(stats=not args.header,
+                                    frame_duration=args.f,
+                                    cache_file=args.cache)
+    results = inspector.inspect_many(filenames, args.p)
+    inspector.save_cache()
+    sppasAudioInspector.write_report(results, args.o)
+
+    errors = [r for r in results if "error" in r]
+    for r in errors:
+        print("{:s}: {:s}".format(r["filename"], r["error"]))
+    print("{:d} files scanned. Report: {:s}"
+          "".format(len(results) - len(errors), args.o))
+
+# ----------------------------------------------------------------------------
+
+
+def print_file_info():
+    """Print information about the audio file."""
+    if not args.w:
+        parser.error("an audio file (-w) or a directory (-d) is required.")
+
+    audio = sppas.src.audiodata.aio.open(args.w)
+    audio.frameduration = args.f
+
+    print("Audio file name:     {:s}".format(args.w))
+    print("Duration (seconds):  {:f}".format(audio.get_duration()))
+    print("Frame rate (Hz):     {:d}".format(audio.get_framerate()))
+    print("Sample width (bits): {:d}".format(audio.get_sampwidth()*8))
+    nc = audio.get_nchannels()
+    print("Number of channels:  {:d}".format(nc))
+
+    if nc == 1:
+        if not args.noclip:
+            print("Clipping rate (in %):")
+            for i in range(2, 9, 2):
+                f = float(i)/10.
+                c = audio.clipping_rate(f) * 100.
+                print("  - factor={:.1f}:      {:.3f}".format(f, c))
+
+        audiovol = sppasAudioVolume(audio, args.f)
+        print("Volume:")
+        print("  - min:           {:d}".format(audiovol.min()))
+        print("  - max:           {:d}".format(audiovol.max()))
+        print("  - mean:          {:.2f}".format(audiovol.mean()))
+        print("  - median:        {:.2f}".format(audiovol.median()))
+        print("  - stdev:         {:.2f}".format(audiovol.stdev()))
+        print("  - coefvariation: {:.2f}".format(audiovol.coefvariation()))
+        print("  - std err:       {:.2f}".format(audiovol.stderr()))
+
+    else:
+
+        for n in range(nc):
+            print("Channel {:d}".format(n))
+            cidx = audio.extract_channel(n)
+            channel = audio.get_channel(cidx)
+
+            # Values related to amplitude
+            frames = channel.get_frames(channel.get_nframes())
+            ca = sppasAudioFrames(frames, channel.get_sampwidth(), 1)
+            for i in range(2, 9, 2):
+                f = float(i)/10.
+                c = ca.clipping_rate(f) * 100.
+                print("  - factor={:.1f}:      {:.3f}".format(f, c))
+
+            # RMS (=volume)
+            cv = sppasChannelVolume(channel)
+            print("  Volume:")
+            print("  - min:           {:d}".format(cv.min()))
+            print("  - max:           {:d}".format(cv.max()))
+            print("  - mean:          {:.2f}".format(cv.mean()))
+            print("  - median:        {:.2f}".format(cv.median()))
+            print("  - stdev:         {:.2f}".format(cv.stdev()))
+            print("  - coefvariation: {:.2f}".format(cv.coefvariation()))
+
+# ----------------------------------------------------------------------------
+
+
+if __name__ == "__main__":
+    if args.d:
+        inspect_corpus()
+    else:
+        print_file_info()
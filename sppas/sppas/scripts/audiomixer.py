@@ -39,6 +39,7 @@
 from argparse import ArgumentParser
 import os
 import sys
+import time
 
 PROGRAM = os.path.abspath(__file__)
 SPPAS = os.path.dirname(os.path.dirname(os.path.dirname(PROGRAM)))
@@ -64,6 +65,11 @@ parser.add_argument("-o",
                     required=True,
                     help='Audio Output file name')
 
+parser.add_argument("--bench",
+                    action='store_true',
+                    help='Print the durations of the mix, of the min/max '
+                         'and of the sample-by-sample mix')
+
 if len(sys.argv) <= 1:
     sys.argv.append('-h')
 
@@ -80,7 +86,29 @@ for inputFile in args.w:
         audio.rewind()
         mixer.append_channel(audio.get_channel(idx))
 
+start = time.time()
 new_channel = mixer.mix()
+t_mix = time.time() - start
+
+if args.bench:
+    start = time.time()
+    mixer.get_minmax()
+    t_minmax = time.time() - start
+
+    # the former sample-by-sample mix
+    start = time.time()
+    sampwidth = new_channel.get_sampwidth()
+    for pos in range(0, len(new_channel.get_frames()), sampwidth):
+        sppasChannelMixer._sample_calculator(mixer._channels, pos, sampwidth,
+                                             mixer._factors, 1)
+    t_samples = time.time() - start
+
+    print("{:d} channels of {:.2f} seconds.".format(
+        len(mixer._channels), new_channel.get_duration()))
+    print("{:>24s} {:12.2f}".format("mix", t_mix * 1000.))
+    print("{:>24s} {:12.2f}".format("get_minmax", t_minmax * 1000.))
+    print("{:>24s} {:12.2f}".format("sample by sample mix", t_samples * 1000.))
+    print("Durations are in milliseconds.")
 
 # Save the converted channel
 audio_out = sppasAudioPCM()
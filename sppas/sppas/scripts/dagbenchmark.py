@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+
+    scripts.dagbenchmark.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~
+
+    ... a script to benchmark the DAG algorithms on phonetization lattices.
+
+"""
+import sys
+import os
+import time
+from argparse import ArgumentParser
+
+PROGRAM = os.path.abspath(__file__)
+SPPAS = os.path.dirname(os.path.dirname(os.path.dirname(PROGRAM)))
+sys.path.append(SPPAS)
+
+from sppas.src.config import separators
+from sppas.src.annotations.Phon.dagphon import sppasDAGPhonetizer
+
+# ----------------------------------------------------------------------------
+# Verify and extract args:
+# ----------------------------------------------------------------------------
+
+parser = ArgumentParser(usage="%s [options]" % os.path.basename(PROGRAM),
+                        description="... a script to benchmark the DAG "
+                                    "algorithms on phonetization lattices.")
+
+parser.add_argument("-s",
+                    metavar="value",
+                    default=[4, 8, 12, 16, 200],
+                    type=int,
+                    nargs='+',
+                    help='Number of segments of the lattices '
+                         '(default: 4 8 12 16 200)')
+
+parser.add_argument("-w",
+                    metavar="value",
+                    default=3,
+                    type=int,
+                    help='Number of variants of each segment (default: 3)')
+
+parser.add_argument("-k",
+                    metavar="value",
+                    default=4,
+                    type=int,
+                    help='Number of shortest paths to search (default: 4)')
+
+parser.add_argument("--maxpaths",
+                    metavar="value",
+                    default=100000,
+                    type=int,
+                    help='Do not enumerate all paths of a lattice with '
+                         'more paths (default: 100000)')
+
+args = parser.parse_args()
+
+# ----------------------------------------------------------------------------
+
+
+def lattice_pron(nb_segments, nb_variants):
+    """Return a phonetization with the given number of variants/segment."""
+    segment = list()
+    for v in range(nb_variants):
+        segment.append(separators.phonemes.join(["p"+str(v)] * (v % 3 + 1)))
+    return " ".join([separators.variants.join(segment)] * nb_segments)
+
+
+def chrono(function, *arguments):
+    """Return the result of a function and its duration in milliseconds."""
+    start = time.time()
+    result = function(*arguments)
+    return result, (time.time() - start) * 1000.
+
+# ----------------------------------------------------------------------------
+
+
+dag_phon = sppasDAGPhonetizer(variants=args.k)
+
+print("{:>8s} {:>14s} {:>10s} {:>10s} {:>10s} {:>10s} {:>10s}"
+      "".format("segments", "paths", "topo", "shortest", "k-best",
+                "all-paths", "decompose"))
+
+for nb_segments in args.s:
+    pron = lattice_pron(nb_segments, args.w)
+    graph, prongraph = dag_phon.phon2DAG(pron)
+    end = len(graph) - 1
+    nb_paths = args.w ** nb_segments
+
+    def weight(node):
+        if node in (0, end):
+            return 0
+        return prongraph[node].count(separators.phonemes) + 1
+
+    _, t_topo = chrono(graph.topological_order)
+    _, t_short = chrono(graph.find_shortest_path, 0, end)
+    _, t_kbest = chrono(graph.find_k_shortest_paths, 0, end, args.k, weight)
+    if nb_paths <= args.maxpaths:
+        _, t_all = chrono(graph.find_all_paths, 0, end)
+        t_all = "{:10.2f}".format(t_all)
+    else:
+        t_all = "{:>10s}".format("-")
+    _, t_decomp = chrono(dag_phon.decompose, pron)
+
+    print("{:8d} {:14.3g} {:10.2f} {:10.2f} {:10.2f} {:s} {:10.2f}"
+          "".format(nb_segments, float(nb_paths), t_topo, t_short, t_kbest,
+                    t_all, t_decomp))
+
+print("Durations are in milliseconds.")
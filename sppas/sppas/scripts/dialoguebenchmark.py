@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    scripts.dialoguebenchmark.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    ... a script to benchmark Activity and ReOccurrences on dialogues.
+
+"""
+import sys
+import os
+import time
+import random
+from argparse import ArgumentParser
+
+PROGRAM = os.path.abspath(__file__)
+SPPAS = os.path.dirname(os.path.dirname(os.path.dirname(PROGRAM)))
+sys.path.append(SPPAS)
+
+from sppas import sppasTier, sppasLocation, sppasInterval, sppasPoint
+from sppas import sppasLabel, sppasTag
+from sppas.src.anndata.aio.aioutils import fill_gaps
+from sppas.src.annotations.Activity.activity import Activity
+from sppas.src.annotations.ReOccurrences.reoccurrences import Reoccurences
+
+# ----------------------------------------------------------------------------
+# Verify and extract args:
+# ----------------------------------------------------------------------------
+
+parser = ArgumentParser(usage="%s [options]" % os.path.basename(PROGRAM),
+                        description="... a script to benchmark Activity "
+                                    "and ReOccurrences on dialogues.")
+
+parser.add_argument("-d",
+                    metavar="value",
+                    default=0.5,
+                    type=float,
+                    help='Duration of the dialogue, in hours (default: 0.5)')
+
+parser.add_argument("--delta",
+                    metavar="value",
+                    default=5.,
+                    type=float,
+                    help='Max time of a re-occurrence, in seconds '
+                         '(default: 5.)')
+
+parser.add_argument("--seed",
+                    metavar="value",
+                    default=1234,
+                    type=int,
+                    help='Seed of the random generator (default: 1234)')
+
+args = parser.parse_args()
+
+# ----------------------------------------------------------------------------
+
+
+def dialogue_tiers(duration):
+    """Return the time-aligned tokens of 2 speakers taking turns.
+
+    A speaker produces a turn of tokens and pauses while the other
+    speaker is talking.
+
+    """
+    words = ["w" + str(i) for i in range(300)] + ["#", "+", "*", "@", "euh"]
+    tiers = [sppasTier("TokensAlign-1"), sppasTier("TokensAlign-2")]
+    t = 0.
+    speaker = 0
+    while t < duration:
+        end_turn = t + random.uniform(0.5, 10.)
+        while t < end_turn:
+            dur = random.uniform(0.05, 0.6)
+            if random.random() < 0.1:
+                t += random.uniform(0.05, 0.3)
+            tiers[speaker].create_annotation(
+                sppasLocation(sppasInterval(sppasPoint(t),
+                                            sppasPoint(t + dur))),
+                sppasLabel(sppasTag(random.choice(words))))
+            t += dur
+        t += random.uniform(0., 1.)
+        speaker = 1 - speaker
+    return tiers, t
+
+
+def activity_with_fill_gaps(activity, tier, tmin, tmax):
+    """Create the activity tier of the tokens after filling the gaps."""
+    return activity.get_tier(fill_gaps(tier, tmin, tmax), tmin, tmax)
+
+
+def reoccurrences_all_pairs(ref_tier, comp_tier, delta):
+    """Return the number of re-occurrences by comparing all the pairs."""
+    comp = [(a.get_lowest_localization().get_midpoint(),
+             a.get_highest_localization().get_midpoint(),
+             Reoccurences.get_tags(a)) for a in comp_tier]
+    result = list()
+    for ann in ref_tier:
+        tags = Reoccurences.get_tags(ann)
+        begin = ann.get_lowest_localization().get_midpoint()
+        end = ann.get_highest_localization().get_midpoint()
+        nb = 0
+        for b, e, comp_tags in comp:
+            if b < end + delta and e > begin - delta and tags & comp_tags:
+                nb += 1
+        if nb > 0:
+            result.append(nb)
+    return result
+
+
+def reoccurrences_tree(ref_tier, comp_tier, delta):
+    """Return the number of re-occurrences with the interval tree."""
+    tier = Reoccurences.make_reoccurrences(ref_tier, comp_tier, delta)
+    return [ann.get_best_tag().get_typed_content() for ann in tier]
+
+
+def serialize(tier):
+    """Return the localizations and labels of a tier."""
+    return [(str(ann.get_location()), ann.serialize_labels())
+            for ann in tier]
+
+
+def chrono(function, *arguments):
+    """Return the result of a function and its duration in milliseconds."""
+    start = time.time()
+    result = function(*arguments)
+    return result, (time.time() - start) * 1000.
+
+# ----------------------------------------------------------------------------
+
+
+random.seed(args.seed)
+tiers, duration = dialogue_tiers(args.d * 3600.)
+tmin = sppasPoint(0.)
+tmax = sppasPoint(duration)
+activity = Activity()
+
+print("{:.2f} hours, {:d} and {:d} tokens."
+      "".format(duration / 3600., len(tiers[0]), len(tiers[1])))
+print("{:>32s} {:>12s}".format("method", "duration"))
+
+expected, t_fill = chrono(activity_with_fill_gaps,
+                          activity, tiers[0], tmin, tmax)
+result, t_sweep = chrono(activity.get_tier, tiers[0], tmin, tmax)
+if serialize(result) != serialize(expected):
+    print("Error: the activity tiers are different.")
+    sys.exit(1)
+print("{:>32s} {:12.2f}".format("Activity with fill_gaps", t_fill))
+print("{:>32s} {:12.2f}".format("Activity with a sweep", t_sweep))
+
+expected, t_pairs = chrono(reoccurrences_all_pairs,
+                           tiers[0], tiers[1], args.delta)
+result, t_tree = chrono(reoccurrences_tree, tiers[0], tiers[1], args.delta)
+if result != expected:
+    print("Error: the re-occurrences are different.")
+    sys.exit(1)
+print("{:>32s} {:12.2f}".format("ReOccurrences of all pairs", t_pairs))
+print("{:>32s} {:12.2f}".format("ReOccurrences with a tree", t_tree))
+print("Durations are in milliseconds.")
@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    scripts.num2textbenchmark.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    ... a script to benchmark the conversion of numbers into words.
+
+"""
+import sys
+import os
+import time
+import random
+from argparse import ArgumentParser
+
+PROGRAM = os.path.abspath(__file__)
+SPPAS = os.path.dirname(os.path.dirname(os.path.dirname(PROGRAM)))
+sys.path.append(SPPAS)
+
+from sppas import sppasDictRepl, paths
+from sppas.src.annotations.TextNorm.normalize import TextNormalizer
+from sppas.src.annotations.TextNorm.num2text import sppasNumConstructor
+
+# ----------------------------------------------------------------------------
+# Verify and extract args:
+# ----------------------------------------------------------------------------
+
+parser = ArgumentParser(usage="%s [options]" % os.path.basename(PROGRAM),
+                        description="... a script to benchmark the "
+                                    "conversion of numbers into words.")
+
+parser.add_argument("-l",
+                    metavar="lang",
+                    default="cmn",
+                    help='Language code (default: cmn)')
+
+parser.add_argument("-n",
+                    metavar="value",
+                    default=5000,
+                    type=int,
+                    help='Number of utterances of the corpus (default: 5000)')
+
+parser.add_argument("-w",
+                    metavar="value",
+                    default=12,
+                    type=int,
+                    help='Number of tokens of each utterance (default: 12)')
+
+parser.add_argument("--seed",
+                    metavar="value",
+                    default=1234,
+                    type=int,
+                    help='Seed of the random generator (default: 1234)')
+
+args = parser.parse_args()
+
+# ----------------------------------------------------------------------------
+
+
+def numeric_corpus(nb_utterances, nb_tokens):
+    """Return utterances in which half of the tokens are numbers.
+
+    Small numbers are much more frequent than the large ones, like in
+    real texts (dates, ages, prices, phone numbers...).
+
+    """
+    corpus = list()
+    for i in range(nb_utterances):
+        utt = list()
+        for j in range(nb_tokens):
+            if j % 2 == 0:
+                utt.append("w" + str(j))
+            else:
+                digits = min(12, int(random.expovariate(0.5)) + 1)
+                utt.append(str(random.randint(0, 10 ** digits - 1)))
+        corpus.append(utt)
+    return corpus
+
+
+def convert_with_construct(corpus, lang, num_dict):
+    """Convert the corpus by creating a converter for each utterance."""
+    result = list()
+    for utt in corpus:
+        num2letter = sppasNumConstructor.construct(lang, num_dict)
+        result.append([num2letter.convert(t) if t.isdigit() else t
+                       for t in utt])
+    return result
+
+
+def convert_with_normalizer(corpus, normalizer):
+    """Convert the corpus with the numbers() of a TextNormalizer."""
+    return [normalizer.numbers(utt) for utt in corpus]
+
+
+def chrono(function, *arguments):
+    """Return the result of a function and its duration in milliseconds."""
+    start = time.time()
+    result = function(*arguments)
+    return result, (time.time() - start) * 1000.
+
+# ----------------------------------------------------------------------------
+
+
+random.seed(args.seed)
+corpus = numeric_corpus(args.n, args.w)
+nb_numbers = sum(1 for utt in corpus for t in utt if t.isdigit())
+nb_distinct = len(set(t for utt in corpus for t in utt if t.isdigit()))
+
+filename = os.path.join(paths.resources, "num", args.l + "_num.repl")
+num_dict = sppasDictRepl(filename, nodump=True)
+normalizer = TextNormalizer(lang=args.l)
+normalizer.set_num(num_dict)
+
+expected, t_construct = chrono(convert_with_construct, corpus, args.l, num_dict)
+result, t_normalizer = chrono(convert_with_normalizer, corpus, normalizer)
+if result != expected:
+    print("Error: the results of both methods are different.")
+    sys.exit(1)
+
+print("{:d} utterances, {:d} numbers, {:d} distinct ones."
+      "".format(len(corpus), nb_numbers, nb_distinct))
+print("{:>24s} {:>12s}".format("method", "duration"))
+print("{:>24s} {:12.2f}".format("construct+convert", t_construct))
+print("{:>24s} {:12.2f}".format("TextNormalizer.numbers", t_normalizer))
+print("Durations are in milliseconds.")
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+    scripts.pitchbenchmark.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    ... a script to benchmark the estimation of the pitch.
+
+    The accuracy is evaluated on the audio files of the samples which have
+    a reference PitchTier file.
+
+"""
+import sys
+import os
+import glob
+import time
+from argparse import ArgumentParser
+
+PROGRAM = os.path.abspath(__file__)
+SPPAS = os.path.dirname(os.path.dirname(os.path.dirname(PROGRAM)))
+sys.path.append(SPPAS)
+
+from sppas import sppasRW, paths
+from sppas.src.audiodata.audiopitch import AudioPitch
+
+# ----------------------------------------------------------------------------
+# Verify and extract args:
+# ----------------------------------------------------------------------------
+
+parser = ArgumentParser(usage="%s [options]" % os.path.basename(PROGRAM),
+                        description="... a script to benchmark the "
+                                    "estimation of the pitch.")
+
+parser.add_argument("-d",
+                    metavar="dir",
+                    default=paths.samples,
+                    help='Directory with audio and PitchTier files '
+                         '(default: samples of SPPAS)')
+
+parser.add_argument("-p",
+                    metavar="value",
+                    default=0,
+                    type=int,
+                    help='Number of processes (default: the nb of CPUs)')
+
+args = parser.parse_args()
+
+# ----------------------------------------------------------------------------
+
+
+def reference_pitch(filename, delta):
+    """Return a dict with the index and the value of reference pitch points."""
+    trs = sppasRW(filename).read()
+    tier = trs.find("PitchTier")
+    reference = dict()
+    for ann in tier:
+        point = ann.get_lowest_localization().get_midpoint()
+        value = ann.get_best_tag().get_typed_content()
+        reference[int(round(point / delta))] = value
+    return reference
+
+
+def evaluate(reference, pitch):
+    """Return the voicing recall, the nb of false voiced frames, the gross
+    pitch error rate and the mean absolute error of the other frames."""
+    voiced = [(value, pitch[i]) for i, value in reference.items()
+              if i < len(pitch) and pitch[i] > 0.]
+    false = sum(1 for i, p in enumerate(pitch)
+                if p > 0. and i not in reference)
+    fine = [abs(p - r) for r, p in voiced if abs(p - r) / r <= 0.2]
+    recall = float(len(voiced)) / max(1, len(reference))
+    gpe = 1. - float(len(fine)) / max(1, len(voiced))
+    mae = sum(fine) / max(1, len(fine))
+    return recall, false, gpe, mae
+
+
+def chrono(function, *arguments):
+    """Return the result of a function and its duration in milliseconds."""
+    start = time.time()
+    result = function(*arguments)
+    return result, (time.time() - start) * 1000.
+
+# ----------------------------------------------------------------------------
+
+
+audio_files = sorted(glob.glob(os.path.join(args.d, "*", "*.wav")))
+if len(audio_files) == 0:
+    print("No audio file in {:s}".format(args.d))
+    sys.exit(1)
+
+pitch = AudioPitch(delta=0.01)
+
+print("{:>32s} {:>9s} {:>9s} {:>7s} {:>6s} {:>6s} {:>7s}"
+      "".format("file", "audio", "duration", "recall", "false", "GPE", "MAE"))
+total_audio = 0.
+total_duration = 0.
+for filename in audio_files:
+    values, duration = chrono(pitch.eval_pitch, filename)
+    audio_duration = len(values) * pitch.get_pitch_delta()
+    total_audio += audio_duration
+    total_duration += duration
+    line = "{:>32s} {:9.2f} {:9.2f}".format(
+        os.path.basename(filename)[-32:], audio_duration, duration)
+
+    reference = os.path.splitext(filename)[0] + ".PitchTier"
+    if os.path.exists(reference):
+        scores = evaluate(reference_pitch(reference, 0.01), values)
+        line += " {:7.3f} {:6d} {:6.3f} {:7.2f}".format(*scores)
+    print(line)
+
+print("Sequential: {:.2f} ms for {:.2f} seconds of audio."
+      "".format(total_duration, total_audio))
+
+results, duration = chrono(pitch.eval_many, audio_files, args.p)
+print("Process pool: {:.2f} ms.".format(duration))
+print("Audio durations are in seconds, the other ones in milliseconds; "
+      "the MAE is in Hz.")
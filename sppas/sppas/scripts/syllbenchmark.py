@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    scripts.syllbenchmark.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~
+
+    ... a script to benchmark the syllabification.
+
+"""
+import sys
+import os
+import time
+import random
+from argparse import ArgumentParser
+
+PROGRAM = os.path.abspath(__file__)
+SPPAS = os.path.dirname(os.path.dirname(os.path.dirname(PROGRAM)))
+sys.path.append(SPPAS)
+
+from sppas import paths
+from sppas.src.annotations.Syll.syllabify import Syllabifier
+
+# ----------------------------------------------------------------------------
+# Verify and extract args:
+# ----------------------------------------------------------------------------
+
+parser = ArgumentParser(usage="%s [options]" % os.path.basename(PROGRAM),
+                        description="... a script to benchmark the "
+                                    "syllabification.")
+
+parser.add_argument("-l",
+                    metavar="lang",
+                    default="pol",
+                    help='Language code of the rules (default: pol)')
+
+parser.add_argument("-n",
+                    metavar="value",
+                    default=5000,
+                    type=int,
+                    help='Number of IPUs of the corpus (default: 5000)')
+
+parser.add_argument("-w",
+                    metavar="value",
+                    default=30,
+                    type=int,
+                    help='Max number of phonemes of each IPU (default: 30)')
+
+parser.add_argument("--seed",
+                    metavar="value",
+                    default=1234,
+                    type=int,
+                    help='Seed of the random generator (default: 1234)')
+
+args = parser.parse_args()
+
+# ----------------------------------------------------------------------------
+
+
+def phonemes_corpus(rules, nb_ipus, nb_phonemes):
+    """Return IPUs made of the phonemes of the rules and of some breaks."""
+    phonemes = sorted(rules.phonclass.keys())
+    corpus = list()
+    for i in range(nb_ipus):
+        ipu = [random.choice(phonemes)
+               for j in range(random.randint(1, nb_phonemes))]
+        corpus.append(ipu)
+    return corpus
+
+
+def get_gap(rules, phonemes):
+    """Return the shift of the first gap rule matching the phonemes.
+
+    The rules are compared one after the other to the phonemes.
+
+    """
+    phons = phonemes.split()
+    for gp in rules.gap:
+        if gp == phonemes:
+            return rules.gap[gp]
+        r = gp.split()
+        if "ANY" in r and len(r) == len(phons):
+            if all(r[i] in ("ANY", phons[i]) for i in range(len(r))):
+                return rules.gap[gp]
+    return 0
+
+
+def annotate(syllabifier, phonemes):
+    """Syllabify with the class names and by matching the rules strings."""
+    rules = syllabifier.rules
+    classes = [rules.get_class(p) for p in phonemes]
+    syllables = list()
+    nucleus = Syllabifier._fix_nucleus(classes, 0)
+    end_syll = -1
+    while nucleus != -1:
+        start_syll = Syllabifier._fix_start_syll(classes, end_syll, nucleus)
+        next_nucleus = Syllabifier._find_next_vowel(classes, nucleus+1)
+        next_break = Syllabifier._find_next_break(classes, nucleus)
+        if next_break != -1 and \
+                (next_break < next_nucleus or next_nucleus == -1):
+            syllables.append((start_syll, next_break-1))
+        elif next_break == -1 and next_nucleus == -1:
+            end_syll = len(phonemes) - 1
+            syllables.append((start_syll, end_syll))
+        else:
+            end_syll = nucleus + rules.get_class_rules_boundary(
+                "".join(classes[nucleus:next_nucleus+1]))
+            nb = next_nucleus - nucleus
+            if nb > 1:
+                context = ["ANY"] * max(0, 5-nb)
+                if nb <= 5:
+                    context.append("V")
+                context.extend(phonemes[nucleus+1:next_nucleus])
+                d = get_gap(rules, " ".join(context))
+                if d != 0 and next_nucleus >= end_syll + d >= nucleus:
+                    end_syll += d
+            syllables.append((start_syll, end_syll))
+        nucleus = next_nucleus
+    return syllables
+
+
+def annotate_interpreted(syllabifier, corpus):
+    """Syllabify each IPU by interpreting the rules."""
+    return [annotate(syllabifier, ipu) for ipu in corpus]
+
+
+def annotate_compiled(syllabifier, corpus):
+    """Syllabify all the IPUs with the compiled rules."""
+    return syllabifier.annotate_batch(corpus)
+
+
+def chrono(function, *arguments):
+    """Return the result of a function and its duration in milliseconds."""
+    start = time.time()
+    result = function(*arguments)
+    return result, (time.time() - start) * 1000.
+
+# ----------------------------------------------------------------------------
+
+
+random.seed(args.seed)
+filename = os.path.join(paths.resources, "syll", "syllConfig-" + args.l + ".txt")
+syllabifier = Syllabifier(filename)
+corpus = phonemes_corpus(syllabifier.rules, args.n, args.w)
+nb_phonemes = sum(len(ipu) for ipu in corpus)
+
+expected, t_interpreted = chrono(annotate_interpreted, syllabifier, corpus)
+result, t_compiled = chrono(annotate_compiled, syllabifier, corpus)
+if result != expected:
+    print("Error: the results of both methods are different.")
+    sys.exit(1)
+
+print("{:d} IPUs, {:d} phonemes, {:d} syllables, {:d} gap rules."
+      "".format(len(corpus), nb_phonemes, sum(len(s) for s in result),
+                len(syllabifier.rules.gap)))
+print("{:>24s} {:>12s}".format("method", "duration"))
+print("{:>24s} {:12.2f}".format("interpreted rules", t_interpreted))
+print("{:>24s} {:12.2f}".format("compiled rules (batch)", t_compiled))
+print("Durations are in milliseconds.")
@@ -39,7 +39,8 @@ from sppas.src.anndata import sppasTier
 from sppas.src.anndata import sppasInterval
 from sppas.src.anndata import sppasLocation
 from sppas.src.anndata import sppasLabel, sppasTag
-from sppas.src.anndata.aio.aioutils import fill_gaps, unfill_gaps
+from sppas.src.anndata.aio.aioutils import format_point_to_float
+from sppas.src.anndata.aio.aioutils import unfill_gaps
 from sppas.src.utils.makeunicode import sppasUnicode
 
 # ---------------------------------------------------------------------------
@@ -111,6 +112,8 @@ class Activity(object):
         """Create and return the activity tier.
 
         :param tokens_tier: (sppasTier) a tier with time-aligned tokens
+        :param tmin: (sppasPoint) Begin of the activity tier
+        :param tmax: (sppasPoint) End of the activity tier
         :returns: sppasTier
 
         """
@@ -119,31 +122,26 @@ class Activity(object):
 
         if tokens_tier.is_empty():
             return new_tier
-        tokens = fill_gaps(tokens_tier, tmin, tmax)
-
-        if len(tokens) == 0:
-            return new_tier
+        tokens = self._sweep_tokens(tokens_tier, tmin, tmax)
 
         if len(tokens) == 1:
             new_tier.create_annotation(
-                tokens[0].get_location().copy(),
-                sppasLabel(sppasTag(self.fix_activity(tokens[0]))))
+                tokens_tier[0].get_location().copy(),
+                sppasLabel(sppasTag(tokens[0][2])))
             return new_tier
 
-        for ann in tokens:
-            new_activity = self.fix_activity(ann)
+        first_point = tokens[0][0]
+        last_point = tokens[-1][1]
+        for lowest, highest, new_activity in tokens:
             # The activity has changed
             if activity != new_activity and activity != "<INIT>":
                 if len(new_tier) == 0:
-                    begin = tokens.get_first_point().copy()
+                    begin = first_point.copy()
                 else:
                     begin = new_tier.get_last_point().copy()
 
                 new_tier.create_annotation(
-                    sppasLocation(
-                        sppasInterval(
-                            begin,
-                            ann.get_lowest_localization())),
+                    sppasLocation(sppasInterval(begin, lowest)),
                     sppasLabel(sppasTag(activity)))
 
             # In any case, update current activity
@@ -154,23 +152,62 @@ class Activity(object):
         if len(new_tier) == 0:
             # we observed only one activity...
             new_tier.create_annotation(
-                sppasLocation(sppasInterval(
-                    tokens.get_first_point(),
-                    tokens.get_last_point())),
+                sppasLocation(sppasInterval(first_point, last_point)),
                 sppasLabel(sppasTag(activity)))
 
         else:
-            if new_tier.get_last_point() < tokens.get_last_point():
+            if new_tier.get_last_point() < last_point:
                 new_tier.create_annotation(
                     sppasLocation(sppasInterval(
                         new_tier.get_last_point(),
-                        tokens.get_last_point())),
+                        last_point)),
                     sppasLabel(sppasTag(activity)))
 
         new_tier = unfill_gaps(new_tier)
         new_tier.set_name('Activity')
         return new_tier
 
+    # -----------------------------------------------------------------------
+
+    def _sweep_tokens(self, tokens_tier, tmin, tmax):
+        """Return the localizations and activities of the tokens and gaps.
+
+        The tokens are swept in a single pass: the gaps between tokens,
+        and before tmin or after tmax, are the ones fill_gaps() would add
+        to the tier, with the activity of an un-labelled annotation.
+
+        :param tokens_tier: (sppasTier) a tier with time-aligned tokens
+        :param tmin: (sppasPoint)
+        :param tmax: (sppasPoint)
+        :returns: list of (lowest sppasPoint, highest sppasPoint, activity)
+
+        """
+        tokens = list()
+        fill = tokens_tier.is_interval()
+        gap_activity = self._activities.get(symbols.unk, "speech")
+
+        if fill is True and tmin is not None:
+            first_point = tokens_tier.get_first_point()
+            if format_point_to_float(first_point) > \
+                    format_point_to_float(tmin):
+                tokens.append((tmin, first_point, gap_activity))
+
+        prev_end = None
+        for ann in tokens_tier:
+            lowest = ann.get_lowest_localization()
+            if fill is True and prev_end is not None and prev_end < lowest:
+                tokens.append((prev_end, lowest, gap_activity))
+            prev_end = ann.get_highest_localization()
+            tokens.append((lowest, prev_end, self.fix_activity(ann)))
+
+        if fill is True and tmax is not None:
+            last_point = tokens_tier.get_last_point()
+            if format_point_to_float(last_point) < \
+                    format_point_to_float(tmax):
+                tokens.append((last_point, tmax, gap_activity))
+
+        return tokens
+
     # -----------------------------------------------------------------------
     # overloads
     # -----------------------------------------------------------------------
@@ -48,7 +48,7 @@ from sppas.src.config import separators
 from sppas.src.resources.mapping import sppasMapping
 from sppas.src.utils.makeunicode import sppasUnicode
 from sppas.src.anndata import sppasTag, sppasLabel
-import sppas.src.audiodata.autils as autils
+from sppas.src.audiodata.audiofragmenter import sppasAudioFragmenter
 
 from ..annotationsexc import BadInputError
 from ..annotationsexc import SizeInputsError
@@ -419,16 +419,14 @@ class TracksWriter:
         :param silence: (float) Duration of a silence to surround the tracks.
 
         """
-        channel = autils.extract_audio_channel(input_audio, 0)
-        channel = autils.format_channel(channel, 16000, 2)
-
-        for track, u in enumerate(units):
-            (s, e) = u
-            track_channel = \
-                autils.extract_channel_fragment(channel, s, e, silence)
-            track_name = \
+        fragmenter = sppasAudioFragmenter(input_audio, 16000, 2, channel=0)
+        try:
+            track_names = [
                 TrackNamesGenerator.audio_filename(dir_align, track + 1)
-            autils.write_channel(track_name, track_channel)
+                for track in range(len(units))]
+            fragmenter.write_fragments(units, track_names, silence)
+        finally:
+            fragmenter.close()
 
     # ------------------------------------------------------------------------
 
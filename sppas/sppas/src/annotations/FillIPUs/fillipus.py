@@ -37,6 +37,7 @@
 from sppas.src.config import symbols
 
 from ..SearchIPUs.searchipus import SearchIPUs
+from ..SearchIPUs.thresholdsweep import sppasThresholdSweep
 
 # ---------------------------------------------------------------------------
 
@@ -65,12 +66,45 @@ class FillIPUs(SearchIPUs):
         The given units can be either ipus+silences or ipus only.
 
         """
+        self.__sweep = None
         super(FillIPUs, self).__init__(channel)
         self._units = units
         self._nb_ipus = len([u for u in self._units if u != SIL_ORTHO])
 
     # -----------------------------------------------------------------------
 
+    def set_channel(self, channel):
+        """Set a channel, then reset all previous results.
+
+        :param channel: (sppasChannel)
+
+        """
+        super(FillIPUs, self).set_channel(channel)
+        self.__sweep = None
+
+    # -----------------------------------------------------------------------
+
+    def __search_tracks(self, threshold):
+        """Return the tracks found with a volume threshold.
+
+        The rms values are scanned only once for all the thresholds and
+        durations this filler will try.
+
+        :param threshold: (int) Expected minimum volume (rms value)
+        :returns: list of tuples (from_pos,to_pos)
+
+        """
+        if self.__sweep is None:
+            self.__sweep = sppasThresholdSweep(self)
+
+        return self.__sweep.get_tracks(threshold,
+                                       self._min_sil_dur,
+                                       self._min_ipu_dur,
+                                       self._shift_start,
+                                       self._shift_end)
+
+    # -----------------------------------------------------------------------
+
     def __check_boundaries(self, tracks):
         """Check if silences at start and end are as expected.
 
@@ -78,7 +112,7 @@ class FillIPUs(SearchIPUs):
         :returns: (bool)
 
         """
-        if len(self._units) == 0:
+        if len(self._units) == 0 or len(tracks) == 0:
             return False
         if self._channel is None:
             return False
@@ -126,7 +160,7 @@ class FillIPUs(SearchIPUs):
 
         # First Test
         self._vol_threshold = vmin
-        tracks = self.get_tracks(vmin)
+        tracks = self.__search_tracks(vmin)
         n = len(tracks)
         b = self.__check_boundaries(tracks)
 
@@ -149,7 +183,7 @@ class FillIPUs(SearchIPUs):
 
             # Find silences with these parameters
             self._vol_threshold = int(vmid)
-            tracks = self.get_tracks(vmid)
+            tracks = self.__search_tracks(vmid)
             n = len(tracks)
             b = self.__check_boundaries(tracks)
 
@@ -173,7 +207,7 @@ class FillIPUs(SearchIPUs):
         # Search tracks with default parameters
         self._vol_threshold = self.fix_threshold_vol()
 
-        tracks = self.get_tracks(self._vol_threshold)
+        tracks = self.__search_tracks(self._vol_threshold)
         n = len(tracks)
         b = self.__check_boundaries(tracks)
         if n == self._nb_ipus and b is True:
@@ -187,64 +187,80 @@ class Intsint(object):
     def optimise(self, mid, _range):
         """Fix tones.
 
+        The tones are chosen target after target. The search stops as soon
+        as the sum of squared errors is not less than the minimum one: the
+        tones of this mid and range can't be the best ones.
+
         :param mid:
         :param _range:
 
         """
         self.top = mid + _range / 2
         self.bottom = mid - _range / 2
-        f0 = self.targets[0]
-
-        if self.top - f0 < math.fabs(f0 - mid):
-            self.intsint[0] = "T"
-        elif f0 - self.bottom < math.fabs(f0 - mid):
-            self.intsint[0] = "B"
-        else:
-            self.intsint[0] = "M"
-
-        estimated = self.estimate(self.intsint[0], self.last_estimate)
-        self.estimates[0] = estimated
-        error = math.fabs(estimated - self.targets[0])
-        ss_error = error * error
-        self.last_estimate = estimated
-
-        for i in range(1, len(self.targets)):
-            target = self.targets[i]
-
-            # after pause choose from (MTB)
-            if self.time[i] - self.time[i - 1] > Intsint.MIN_PAUSE:
-                if self.top - target < math.fabs(target - mid):
-                    self.intsint[i] = "T"
-                elif target - self.bottom < math.fabs(target - mid):
-                    self.intsint[i] = "B"
+        top = self.top
+        bottom = self.bottom
+        targets = self.targets
+        times = self.time
+        intsint = self.intsint
+        estimates = self.estimates
+        fabs = math.fabs
+        higher = Intsint.HIGHER
+        lower = Intsint.LOWER
+        upper = Intsint.UP
+        downer = Intsint.DOWN
+        min_ss_error = self.min_ss_error
+        ss_error = 0.
+        last = self.last_estimate
+
+        for i in range(len(targets)):
+            target = targets[i]
+
+            # at start and after pause choose from (MTB)
+            if i == 0 or times[i] - times[i - 1] > Intsint.MIN_PAUSE:
+                if top - target < fabs(target - mid):
+                    tone = "T"
+                    estimate = top
+                elif target - bottom < fabs(target - mid):
+                    tone = "B"
+                    estimate = bottom
                 else:
-                    self.intsint[i] = "M"
-            # elsewhere any tone except M
+                    tone = "M"
+                    estimate = self.mid
+
+            # elsewhere any tone except M, in the order of Intsint.TONES
             else:
-                min_difference = BIG_NUMBER
-                best_tone = ""
-                for tone in Intsint.TONES:
-                    if tone != "M":
-                        estimate = self.estimate(tone, self.last_estimate)
-                        difference = math.fabs(target - estimate)
-                        if difference < min_difference:
-                            min_difference = difference
-                            best_tone = tone
-
-                self.intsint[i] = best_tone
-
-            estimate = self.estimate(self.intsint[i], self.last_estimate)
-            self.estimates[i] = estimate
-            error = math.fabs(estimate - self.targets[i])
+                up = top - last
+                down = last - bottom
+                tone = "T"
+                estimate = top
+                min_difference = fabs(target - top)
+                for t, value in (("B", bottom),
+                                 ("H", last + up * higher),
+                                 ("L", last - down * lower),
+                                 ("U", last + up * upper),
+                                 ("D", last - down * downer),
+                                 ("S", last)):
+                    difference = fabs(target - value)
+                    if difference < min_difference:
+                        min_difference = difference
+                        tone = t
+                        estimate = value
+
+            intsint[i] = tone
+            estimates[i] = estimate
+            error = fabs(estimate - target)
             ss_error += error * error
-            self.last_estimate = estimate
-
-        if ss_error < self.min_ss_error:
-            self.min_ss_error = ss_error
-            self.best_range = _range
-            self.best_mid = mid
-            self.best_intsint = self.intsint[:]
-            self.best_estimate = self.estimates[:]
+            last = estimate
+            if ss_error >= min_ss_error:
+                self.last_estimate = last
+                return
+
+        self.last_estimate = last
+        self.min_ss_error = ss_error
+        self.best_range = _range
+        self.best_mid = mid
+        self.best_intsint = intsint[:]
+        self.best_estimate = estimates[:]
 
     # -------------------------------------------------------------------
 
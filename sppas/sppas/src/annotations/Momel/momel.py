@@ -65,12 +65,21 @@
 
 """
 import math
+import logging
+from itertools import compress
+from functools import reduce
+from operator import add
 
 from .anchor import Anchor
 from .momelutil import quicksortcib
 
 # ----------------------------------------------------------------------------
 
+# Greatest integer such as all the integers until it are exact floats
+MAX_EXACT_INT = 2 ** 53
+
+# ----------------------------------------------------------------------------
+
 
 class Momel(object):
     """Implements Momel.
@@ -97,8 +106,9 @@ class Momel(object):
         self.nval = 0
         self.delta = 0.01
 
-        # Output of cible:
-        self.cib = []
+        # Output of cible: the targets x and y
+        self.cibx = []
+        self.ciby = []
         # Output of reduc:
         self.cibred = []
         # Output of reduc2:
@@ -136,8 +146,9 @@ class Momel(object):
         self.nval = 0
         self.delta = 0.01
 
-        # Output of cible:
-        self.cib = []
+        # Output of cible: the targets x and y
+        self.cibx = []
+        self.ciby = []
         # Output of reduc:
         self.cibred = []
         # Output of reduc2:
@@ -223,6 +234,18 @@ class Momel(object):
                 sxy += (p * xy)
                 sx2y += (p * x2y)
 
+        self.a0, self.a1, self.a2 = Momel.__regression(
+            pn, sx, sx2, sx3, sx4, sy, sxy, sx2y)
+
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def __regression(pn, sx, sx2, sx3, sx4, sy, sxy, sx2y):
+        """Return a0, a1, a2 of a quadratic regression from weighted sums.
+
+        :raises: ValueError
+
+        """
         if pn < 3.:
             raise ValueError('pn < 3')
 
@@ -236,135 +259,219 @@ class Momel(object):
         if spdx2 == 0. or muet == 0.:
             raise ValueError('spdx2 == 0. or muet == 0.')
 
-        self.a2 = (spdx2y * spdx2 - spdxy * spdx3) / muet
-        self.a1 = (spdxy - self.a2 * spdx3) / spdx2
-        self.a0 = (sy - self.a1 * sx - self.a2 * sx2) / pn
+        a2 = (spdx2y * spdx2 - spdxy * spdx3) / muet
+        a1 = (spdxy - a2 * spdx3) / spdx2
+        a0 = (sy - a1 * sx - a2 * sx2) / pn
+
+        return a0, a1, a2
 
     # ------------------------------------------------------------------
 
     def cible(self):
-        """Find momel target points."""
+        """Find momel target points.
+
+        A quadratic regression is estimated on the window of each pitch
+        value. The sums of the powers of the frame indexes are taken from
+        cumulative sums of the voiced values, so that only the sums
+        weighted by the pitch values are estimated on each window.
+        The targets are stored in the cibx and ciby arrays.
+
+        All the sums are the ones of calcrgp(), accumulated in floats in
+        the order of the frames. The integer sums of the powers are used
+        only while they are exactly represented by floats: after about
+        90 seconds of pitch values, the fourth power is summed on the
+        window.
+
+        """
         if len(self.hzptr) == 0:
             raise IOError('Empty pitch array')
         if self.hzsup < self.hzinf:
             raise ValueError('F0 ceiling > F0 threshold')
 
-        pond = []
-        pondloc = []  # local copy of pond
-        hzes = []
-        for ix in range(self.nval):
-            hzes.append(0.)
-            if self.hzptr[ix] > self.SEUILV:
-                pond.append(1.0)
-                pondloc.append(1.0)
-            else:
-                pond.append(0.0)
-                pondloc.append(0.0)
+        hz = self.hzptr
+        nval = self.nval
+        maxec = self.maxec
+        pond = [1 if h > self.SEUILV else 0 for h in hz]
+
+        # Powers of the frame indexes and pitch values weighted by pond
+        vx = list(range(nval))
+        vx2 = [x * x for x in vx]
+        vx3 = [x2 * x for x, x2 in zip(vx, vx2)]
+        vx4 = [x2 * x2 for x2 in vx2]
+        vxf = [float(x) for x in vx]
+        vy = [h if p else 0. for h, p in zip(hz, pond)]
+        vxy = [x * h for x, h in zip(vxf, vy)]
+        vx2y = [(x * x) * h for x, h in zip(vxf, vy)]
+
+        # Cumulative sums of the powers of the voiced frame indexes
+        powers = (pond, vx, vx2, vx3, vx4)
+        fpowers = None
+        if (nval - 1) ** 4 * (self.lfen1 + 1) > MAX_EXACT_INT:
+            fpowers = [[float(v) for v in values] for values in powers]
+        cumuls = list()
+        for values in powers:
+            cumul = [0] * (nval + 1)
+            total = 0
+            for i, (p, v) in enumerate(zip(pond, values)):
+                if p:
+                    total += v
+                cumul[i + 1] = total
+            cumuls.append(cumul)
+
+        half = int(self.lfen1 / 2)
+        cibx = [0.] * nval
+        ciby = [0.] * nval
 
         # Examinate each pitch value
-        for ix in range(self.nval):
+        for ix in range(nval):
             # Current interval to analyze: from dpx to fpx
-            dpx = ix - int(self.lfen1 / 2)
+            dpx = ix - half
             fpx = dpx + self.lfen1 + 1
 
             # BB: do not go out of the range!
             if dpx < 0:
                 dpx = 0
-            if fpx > self.nval:
-                fpx = self.nval
+            if fpx > nval:
+                fpx = nval
 
-            # copy original pond values for the current interval
-            for i in range(dpx, fpx):
-                pondloc[i] = pond[i]
+            # local copy of the original pond values for the current interval
+            pondloc = pond[dpx:fpx]
+            win_hz = hz[dpx:fpx]
+            win_x = vxf[dpx:fpx]
+
+            # weighted sums of the powers of x and of the pitch values
+            xsums = [cumul[fpx] - cumul[dpx] for cumul in cumuls]
+            ysums = [reduce(add, values[dpx:fpx], 0.)
+                     for values in (vy, vxy, vx2y)]
 
             nsup = 0
             nsupr = -1
             xc = yc = 0.0
+            a0 = a1 = a2 = 0.
             ret_rgp = True
             while nsup > nsupr:
                 nsupr = nsup
-                nsup = 0
                 try:
                     # Estimate values of: a0, a1, a2
-                    self.calcrgp(pondloc, dpx, fpx-1)
-                except Exception:
-                    # if calcrgp failed.
-                    # print "calcrgp failed: ",e
+                    a0, a1, a2 = Momel.__regression(*(
+                        Momel.__float_sums(xsums, fpowers, pondloc, dpx, fpx)
+                        + ysums))
+                except ValueError:
                     ret_rgp = False
                     break
-                else:
-                    # Estimate hzes
-                    for ix2 in range(dpx, fpx):
-                        hzes[ix2] = self.a0 + \
-                                    (self.a1 + self.a2 * float(ix2)) * \
-                                    float(ix2)
-                    for x in range(dpx, fpx):
-                        if self.hzptr[x] == 0. or \
-                                (hzes[x] / self.hzptr[x]) > self.maxec:
-                            nsup += 1
-                            pondloc[x] = 0.
+
+                # Remove the values too far from the estimated ones
+                sup = [y == 0. or (a0 + (a1 + a2 * x) * x) / y > maxec
+                       for y, x in zip(win_hz, win_x)]
+                nsup = sum(sup)
+                if nsup > nsupr:
+                    removed = [i for i, (p, s) in enumerate(zip(pondloc, sup))
+                               if p and s]
+                    if len(removed) == 0:
+                        # the next regression would be the same
+                        break
+                    for i in removed:
+                        pondloc[i] = 0
+                    removed = [dpx + i for i in removed]
+                    xsums = [xs - sum(values[i] for i in removed)
+                             for xs, values in zip(xsums, powers)]
+                    ysums = [reduce(add, compress(values[dpx:fpx], pondloc), 0.)
+                             for values in (vy, vxy, vx2y)]
 
             # Now estimate xc and yc for the new 'cible'
-            if ret_rgp is True and self.a2 != 0.:
-                vxc = (0.0 - self.a1) / (self.a2 + self.a2)
+            if ret_rgp is True and a2 != 0.:
+                vxc = (0.0 - a1) / (a2 + a2)
                 if (vxc > ix - self.lfen1) and (vxc < ix + self.lfen1):
-                    vyc = self.a0 + (self.a1 + self.a2 * vxc) * vxc
+                    vyc = a0 + (a1 + a2 * vxc) * vxc
                     if vyc > self.hzinf and vyc < self.hzsup:
                         xc = vxc
                         yc = vyc
 
-            c = Anchor()
-            c.set(xc, yc)
-            self.cib.append(c)
+            cibx[ix] = xc
+            ciby[ix] = yc
+
+        self.a0, self.a1, self.a2 = a0, a1, a2
+        self.cibx = cibx
+        self.ciby = ciby
+
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def __float_sums(xsums, fpowers, pondloc, dpx, fpx):
+        """Return the sums of the powers of x like calcrgp() does.
+
+        An integer sum is the float one only if it is exactly represented
+        by a float. Otherwise, the float powers of the voiced frames of
+        the window are summed in the order of the frames.
+
+        :param xsums: (list of int) Sums of the powers of x
+        :param fpowers: (list of list of float) Powers of x, or None
+        :param pondloc: (list) Voiced frames of the window
+        :param dpx: (int) Index of the first frame of the window
+        :param fpx: (int) Index after the last frame of the window
+        :returns: (list of float)
+
+        """
+        sums = list()
+        for i, total in enumerate(xsums):
+            if total <= MAX_EXACT_INT:
+                sums.append(float(total))
+            else:
+                sums.append(reduce(add, compress(fpowers[i][dpx:fpx],
+                                                 pondloc), 0.))
+        return sums
 
     # ------------------------------------------------------------------
 
     def reduc(self):
-        """First target reduction of too close points."""
+        """First target reduction of too close points.
+
+        The left and right means of the targets are estimated with
+        cumulative sums of the number of targets.
+
+        """
+        nval = self.nval
+        cibx = self.cibx
+        ciby = self.ciby
+
         # initialisations
         # ---------------
-        xdist = []
-        ydist = []
-        dist = []
-        for i in range(self.nval):
-            xdist.append(-1.)
-            ydist.append(-1.)
-            dist.append(-1.)
+        xdist = [-1.] * nval
+        ydist = [-1.] * nval
+        dist = [-1.] * nval
 
         lf = int(self.lfen2 / 2)
         xds = yds = 0.
         np = 0
 
+        # Targets more than SEUILV and the cumulative number of them
+        valid = [1 if y > self.SEUILV else 0 for y in ciby]
+        vx = [x if v else 0. for x, v in zip(cibx, valid)]
+        vy = [y if v else 0. for y, v in zip(ciby, valid)]
+        nb = [0] * (nval + 1)
+        for i, v in enumerate(valid):
+            nb[i + 1] = nb[i] + v
+
         # xdist and ydist estimations
-        for i in range(self.nval-1):
+        for i in range(nval-1):
             # j1 and j2 estimations (interval min and max values)
             j1 = 0
             if i > lf:
                 j1 = i - lf
-            j2 = self.nval - 1
-            if i+lf < self.nval-1:
+            j2 = nval - 1
+            if i+lf < nval-1:
                 j2 = i + lf
 
-            # left (g means left)
-            sxg = syg = 0.
-            ng = 0
-            for j in range(j1, i+1):
-                if self.cib[j].y > self.SEUILV:
-                    sxg = sxg + self.cib[j].x
-                    syg = syg + self.cib[j].y
-                    ng += 1
-
-            # right (d means right)
-            sxd = syd = 0.
-            nd = 0
-            for j in range(i+1, j2):
-                if self.cib[j].y > self.SEUILV:
-                    sxd = sxd + self.cib[j].x
-                    syd = syd + self.cib[j].y
-                    nd += 1
+            # left (g means left) and right (d means right)
+            ng = nb[i+1] - nb[j1]
+            nd = nb[j2] - nb[i+1]
 
             # xdist[i] and ydist[i] evaluations
             if nd * ng > 0:
+                sxg = sum(vx[j1:i+1])
+                syg = sum(vy[j1:i+1])
+                sxd = sum(vx[i+1:j2])
+                syd = sum(vy[i+1:j2])
                 xdist[i] = math.fabs(sxg / ng - sxd / nd)
                 ydist[i] = math.fabs(syg / ng - syd / nd)
                 xds = xds + xdist[i]
@@ -380,7 +487,7 @@ class Momel(object):
         # ----------------------------------------------------
         px = float(np) / xds
         py = float(np) / yds
-        for i in range(self.nval):
+        for i in range(nval):
             if xdist[i] > 0.:
                 dist[i] = (xdist[i] * px + ydist[i] * py) / (px + py)
 
@@ -395,9 +502,10 @@ class Momel(object):
         xd.append(0)
         xmax = 0
 
-        for i in range(self.nval):
-            if len(xd) > int(self.nval/2):
-                raise Exception('Too many partitions (', len(xd), ')\n')
+        for i in range(nval):
+            if len(xd) > int(nval/2):
+                raise ValueError('Too many partitions ({:d})\n'
+                                 ''.format(len(xd)))
             if susseuil is False:
                 if dist[i] > seuil:
                     susseuil = True
@@ -413,7 +521,7 @@ class Momel(object):
         if susseuil is True:
             xd.append(xmax)
         # Add the final value (=nval)
-        xd.append(self.nval)
+        xd.append(nval)
 
         # Partition sur les x
         # -------------------
@@ -428,11 +536,11 @@ class Momel(object):
             # moyenne sigma
             for j in range(parinf, parsup):
                 # sur la pop d'une partition
-                if self.cib[j].y > 0.:
-                    sx += self.cib[j].x
-                    sx2 += self.cib[j].x * self.cib[j].x
-                    sy += self.cib[j].y
-                    sy2 += self.cib[j].y * self.cib[j].y
+                if ciby[j] > 0.:
+                    sx += cibx[j]
+                    sx2 += cibx[j] * cibx[j]
+                    sy += ciby[j]
+                    sy2 += ciby[j] * ciby[j]
                     n += 1
 
             # pour la variance
@@ -457,22 +565,22 @@ class Momel(object):
 
                 #  Elimination (set cib to 0)
                 for j in range(parinf, parsup):
-                    if self.cib[j].y > 0. and \
-                            (self.cib[j].x < seuilbx or
-                             self.cib[j].x > seuilhx or
-                             self.cib[j].y < seuilby or
-                             self.cib[j].y > seuilhy):
-                        self.cib[j].x = 0.
-                        self.cib[j].y = 0.
+                    if ciby[j] > 0. and \
+                            (cibx[j] < seuilbx or
+                             cibx[j] > seuilhx or
+                             ciby[j] < seuilby or
+                             ciby[j] > seuilhy):
+                        cibx[j] = 0.
+                        ciby[j] = 0.
 
             # Recalcule moyennes
             # ------------------
             sx = sy = 0.
             n = 0
             for j in range(parinf, parsup):
-                if self.cib[j].y > 0.:
-                    sx += self.cib[j].x
-                    sy += self.cib[j].y
+                if ciby[j] > 0.:
+                    sx += cibx[j]
+                    sy += ciby[j]
                     n += 1
 
             # Reduit la liste des cibles
@@ -625,6 +733,7 @@ class Momel(object):
 
         :param pitch_values: (list)
         :returns: list of selected anchors
+        :raises: IOError, ValueError
 
         """
         # Get pitch values
@@ -637,14 +746,38 @@ class Momel(object):
         self.cible()
         self.reduc()
         if len(self.cibred) == 0:
-            raise Exception("No left point after the first pass of point "
+            raise ValueError("No left point after the first pass of point "
                             "reduction.\n")
 
         self.reduc2()
         if len(self.cibred2) == 0:
-            raise Exception("No left point after the second pass of point "
+            raise ValueError("No left point after the second pass of point "
                             "reduction.\n")
 
         self.borne()
 
         return self.cibred2
+
+    # ------------------------------------------------------------------
+
+    def annotate_batch(self, pitch_arrays):
+        """Apply momel on each of the given vectors of pitch values.
+
+        Each vector is the pitch of an IPU, one value each 0.01 sec. The
+        options are the same for all of them.
+
+        :param pitch_arrays: (list of list)
+        :returns: list of the lists of selected anchors, one for each vector.
+        The list is empty if no anchor was found in the vector.
+
+        """
+        anchors = list()
+        for i, pitch_values in enumerate(pitch_arrays):
+            try:
+                anchors.append(self.annotate(list(pitch_values)))
+            except (IOError, ValueError) as e:
+                logging.info('No anchors found in the pitch vector {:d}: {:s}'
+                             ''.format(i, str(e)))
+                anchors.append(list())
+
+        return anchors
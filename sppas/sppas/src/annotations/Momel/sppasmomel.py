@@ -33,6 +33,7 @@
     ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 """
+import os
 
 from sppas import sppasRW
 from sppas import sppasTranscription
@@ -45,6 +46,8 @@ from sppas import sppasTag
 from sppas import sppasOption
 
 import sppas.src.anndata.aio
+import sppas.src.audiodata.aio
+from sppas.src.audiodata.audiopitch import AudioPitch
 from sppas.src.config import annots
 
 from ..baseannot import sppasBaseAnnotation
@@ -214,6 +217,25 @@ class sppasMomel(sppasBaseAnnotation):
 
     # -----------------------------------------------------------------------
 
+    def eval_pitch(self, input_filename):
+        """Estimate pitch values from an audio file.
+
+        The F0 range is the one of the "lo" and "hi" options.
+
+        :returns: A list of pitch values (one value each 10 ms).
+
+        """
+        pitch = AudioPitch(delta=0.01,
+                           minf0=self._options['lo'],
+                           maxf0=self._options['hi'])
+        pitch_list = pitch.eval_pitch(input_filename)
+        if len(pitch_list) == 0:
+            raise EmptyInputError(name="Pitch")
+
+        return pitch_list
+
+    # -----------------------------------------------------------------------
+
     def estimate_momel(self, ipu_pitch, current_time):
         """Estimate momel on an IPU.
 
@@ -325,14 +347,18 @@ class sppasMomel(sppasBaseAnnotation):
     def run(self, input_file, opt_input_file=None, output_file=None):
         """Run the automatic annotation process on an input.
 
-        :param input_file: (list of str) pitch values
+        :param input_file: (list of str) pitch values or audio
         :param opt_input_file: (list of str) ignored
         :param output_file: (str) the output file name
         :returns: (sppasTranscription)
 
         """
         # Get pitch values from the input
-        pitch = self.fix_pitch(input_file[0])
+        ext = os.path.splitext(input_file[0])[1].lower()
+        if ext in sppas.src.audiodata.aio.extensions:
+            pitch = self.eval_pitch(input_file[0])
+        else:
+            pitch = self.fix_pitch(input_file[0])
 
         # Search for anchors
         anchors_tier = self.convert(pitch)
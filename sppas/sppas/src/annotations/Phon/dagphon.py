@@ -36,6 +36,8 @@
 
 """
 import re
+import heapq
+import itertools
 
 from sppas.src.config import separators
 from sppas.src.structs.dag import DAG
@@ -145,50 +147,141 @@ class sppasDAGPhonetizer(object):
 
     # -----------------------------------------------------------------------
 
+    @staticmethod
+    def phon2lattice(pron):
+        """Convert a phonetization into a lattice of variants.
+
+        The lattice is the list of the segments of the phonetization, each
+        segment being the list of its variants:
+
+            >>> sppasDAGPhonetizer.phon2lattice("p1 p2|x2 p3|x3")
+            >>> [['p1'], ['p2', 'x2'], ['p3', 'x3']]
+
+        It is equivalent to the DAG created by phon2DAG() but its paths
+        can be enumerated without building them all.
+
+        :param pron: (str)
+
+        """
+        return [segment.split(separators.variants) for segment in pron.split()]
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def kbest(lattice):
+        """Generate the paths of a lattice, the shortest first.
+
+        The length of a path is its number of phonemes. Paths of the same
+        length are generated in the order of the variants of the lattice,
+        i.e. in the order find_all_paths() would return them. Paths are
+        generated lazily: the cost to get the k first ones does not depend
+        on the total number of paths.
+
+        :param lattice: (list) List of segments with their variants
+        :returns: Generator of tuples (length, indexes, phonetization)
+
+        """
+        if len(lattice) == 0:
+            yield 1, (), ""
+            return
+
+        # Sort the variants of each segment by their number of phonemes.
+        # The sort is stable so that the order of the lattice is preserved
+        # for variants of the same length.
+        ranked = list()
+        for variants in lattice:
+            costs = [v.count(separators.phonemes) + 1 for v in variants]
+            order = sorted(range(len(variants)), key=lambda i: costs[i])
+            ranked.append([(costs[i], i, variants[i]) for i in order])
+
+        # Each state is (cost, indexes, ranks, last) where "last" is the
+        # last segment a rank was incremented: only segments from "last"
+        # can be incremented so that each path is pushed only once.
+        ranks = [0] * len(ranked)
+        cost = sum(segment[0][0] for segment in ranked)
+        indexes = tuple(segment[0][1] for segment in ranked)
+        heap = [(cost, indexes, ranks, 0)]
+
+        while heap:
+            cost, indexes, ranks, last = heapq.heappop(heap)
+            yield cost, indexes, separators.phonemes.join(
+                ranked[j][r][2] for j, r in enumerate(ranks))
+
+            for j in range(last, len(ranked)):
+                r = ranks[j] + 1
+                if r < len(ranked[j]):
+                    next_ranks = list(ranks)
+                    next_ranks[j] = r
+                    next_cost = cost - ranked[j][r-1][0] + ranked[j][r][0]
+                    next_indexes = indexes[:j] + (ranked[j][r][1],) + \
+                        indexes[j+1:]
+                    heapq.heappush(heap,
+                                   (next_cost, next_indexes, next_ranks, j))
+
+    # -----------------------------------------------------------------------
+
     def decompose(self, pron1, pron2=""):
         """Create a decomposed phonetization from a string as follow:
 
             >>> self.decompose("p1 p2|x2 p3|x3")
             >>> p1-p2-p3|p1-p2-x3|p1-x2-p3|p1-x2-x3
 
-        The input string is converted into a DAG, then output corresponds
-        to all paths.
+        The input string is converted into a lattice, then output
+        corresponds to the paths. If the number of variants is fixed,
+        only the shortest paths are explored.
 
         """
         if len(pron1) == 0 and len(pron2) == 0:
             return ""
 
-        # Complex phonetization: converted into a DAG
-        (graph1, prongraph1) = self.phon2DAG(pron1)
-        (graph2, prongraph2) = DAG(), list()
+        lattices = [self.phon2lattice(pron1)]
         if len(pron2) > 0:
-            (graph2, prongraph2) = self.phon2DAG(pron2)
-
-        # Create all pronunciations from the DAG
-        pron1 = self.DAG2phon(graph1, prongraph1)
-        if len(pron2) > 0:
-            pron2 = self.DAG2phon(graph2, prongraph2)
-        else:
-            pron2 = dict()
-
-        # Merge =======>
-        # TODO: MERGE DAGs instead of merging prons
-        pron = dict()
-        pron.update(pron1)
-        pron.update(pron2)
-
-        # Output selection
+            lattices.append(self.phon2lattice(pron2))
 
         v = separators.variants
 
         # Return all variants
         if self.variants == 0:
-            return v.join(pron.keys())
+            pron = list()
+            for lattice in lattices:
+                for path in itertools.product(*lattice):
+                    pron.append(separators.phonemes.join(path))
+            return v.join(self.__unique(pron))
+
+        # Choose the shortest variants: the k-best paths of both lattices
+        # are merged, the first one to be seen wins for a same length.
+        streams = [self.__tag_paths(self.kbest(lattice), n)
+                   for n, lattice in enumerate(lattices)]
+        pron = list()
+        seen = set()
+        for cost, n, indexes, p in heapq.merge(*streams):
+            if p not in seen:
+                seen.add(p)
+                pron.append(p)
+                if len(pron) == self.variants:
+                    break
+
+        return v.join(pron)
+
+    # -----------------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __tag_paths(paths, n):
+        """Add the index of the lattice to the paths of a k-best generator."""
+        for cost, indexes, p in paths:
+            yield cost, n, indexes, p
 
-        # Choose the shorter variants
-        if self.variants == 1:
-            return min(pron.items(), key=lambda x: x[1])[0]
+    # -----------------------------------------------------------------------
 
-        # Other number of variants: choose shorters
-        ll = sorted(pron.items(), key=lambda x: x[1])[:self.variants]
-        return v.join(list(zip(*ll))[0])
+    @staticmethod
+    def __unique(items):
+        """Return the list of items without duplicates, order preserved."""
+        seen = set()
+        unique = list()
+        for item in items:
+            if item not in seen:
+                seen.add(item)
+                unique.append(item)
+        return unique
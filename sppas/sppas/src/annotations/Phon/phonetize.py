@@ -34,6 +34,7 @@
 
 """
 import re
+import multiprocessing
 
 from sppas.src.config import symbols
 from sppas.src.config import separators
@@ -41,6 +42,7 @@ from sppas.src.config import annots
 from sppas.src.utils.makeunicode import sppasUnicode, u
 from sppas.src.resources import sppasMapping
 from sppas.src.resources import sppasDictPron
+from sppas.src.structs.lrucache import sppasLRUCache
 
 from .phonunk import sppasPhonUnk
 from .dagphon import sppasDAGPhonetizer
@@ -49,6 +51,9 @@ from .dagphon import sppasDAGPhonetizer
 
 SIL = list(symbols.phone.keys())[list(symbols.phone.values()).index("silence")]
 
+CACHE_SIZE = 65536  # Max nb of tokens and of mapped entries to remember
+MIN_PARALLEL = 2000  # Min nb of utterances to phonetize them in parallel
+
 # ---------------------------------------------------------------------------
 
 
@@ -80,6 +85,11 @@ class sppasDictPhonetizer(object):
     on the idea that given enough examples it should be possible to predict
     the pronunciation of unseen words purely by analogy.
 
+    The phonetization of each token and the mapping of each pronunciation
+    are memorized: frequent tokens are looked-up and mapped only once. The
+    caches are invalidated when the dictionary or the mapping table are
+    changed.
+
     """
 
     def __init__(self, pdict, maptable=None):
@@ -93,6 +103,8 @@ class sppasDictPhonetizer(object):
         self._phonunk = None
         self._map_table = sppasMapping()
         self._dag_phon = sppasDAGPhonetizer()
+        self._tokens_cache = sppasLRUCache(CACHE_SIZE)
+        self._map_cache = sppasLRUCache(CACHE_SIZE)
 
         self.set_dict(pdict)
         self.set_maptable(maptable)
@@ -120,6 +132,7 @@ class sppasDictPhonetizer(object):
 
         self._pdict = pron_dict
         self._phonunk = sppasPhonUnk(self._pdict)
+        self._tokens_cache.clear()
 
     # -----------------------------------------------------------------------
 
@@ -137,6 +150,8 @@ class sppasDictPhonetizer(object):
 
         self._map_table = map_table
         self._map_table.set_keep_miss(False)
+        self._tokens_cache.clear()
+        self._map_cache.clear()
 
     # -----------------------------------------------------------------------
 
@@ -147,6 +162,7 @@ class sppasDictPhonetizer(object):
 
         """
         self._dag_phon.set_variants(value)
+        self._tokens_cache.clear()
 
     # -----------------------------------------------------------------------
 
@@ -212,45 +228,14 @@ class sppasDictPhonetizer(object):
 
         for entry in tokens:
             entry = entry.strip()
-            phon = self._pdict.get_unkstamp()
-            status = annots.ok
-
-            # Enriched Orthographic Transcription Convention:
-            # entry can be already in SAMPA.
-            if entry.startswith("/") is True and entry.endswith("/") is True:
-                phon = entry.strip("/")
-                # It must use X-SAMPA,
-                # including minus character to separate phonemes.
-
-            else:
-
-                phon = self.get_phon_entry(entry)
-
-                if phon == self._pdict.get_unkstamp():
-                    status = annots.error
-
-                    # A missing compound word?
-                    if "-" in entry or "'" in entry or "_" in entry:
-                        _tabpron = [self.get_phon_entry(w)
-                                    for w in re.split("[-'_]", entry)]
-
-                        # OK, finally the entry is in the dictionary?
-                        if self._pdict.get_unkstamp() not in _tabpron:
-                            # ATTENTION: each part can have variants!
-                            # must be decomposed.
-                            self._dag_phon.variants = 4
-                            phon = sppasUnicode(
-                                self._dag_phon.decompose(" ".join(_tabpron))).to_strip()
-                            status = annots.warning
-
-                    if phon == self._pdict.get_unkstamp() and phonunk is True:
-                        try:
-                            phon = self._phonunk.get_phon(entry)
-                            status = annots.warning
-                        except:
-                            phon = self._pdict.get_unkstamp()
-                            status = annots.error
-
+            key = (entry, phonunk,
+                   self._pdict.get_version(), self._map_table.get_version())
+            result = self._tokens_cache.get(key)
+            if result is None:
+                result = self.__get_phon_token(entry, phonunk)
+                self._tokens_cache.set(key, result)
+
+            phon, status = result
             if len(phon) > 0:
                 tab.append((entry, phon, status))
 
@@ -280,10 +265,107 @@ class sppasDictPhonetizer(object):
 
         return phonetization.strip()
 
+    # -----------------------------------------------------------------------
+
+    def phonetize_many(self, utterances, phonunk=True, delimiter=" ",
+                       nb_proc=1):
+        """Return the phonetization of a list of utterances.
+
+        The tokens shared by the utterances are phonetized only once. If
+        there are a lot of utterances, they can be phonetized by several
+        processes.
+
+        :param utterances: (list) The utterance strings to be phonetized.
+        :param phonunk: (bool) Phonetize unknown words (or not).
+        :param delimiter: (char) The character to be used to separate entries
+        in the result and which was used in the given utterances.
+        :param nb_proc: (int) Max number of processes. If 0, the number of
+        CPUs is used.
+
+        :returns: List of strings with the phonetization of each utterance.
+
+        """
+        if len(delimiter) > 1:
+            raise TypeError('Delimiter must be a character.')
+
+        if nb_proc == 0:
+            nb_proc = multiprocessing.cpu_count()
+
+        if nb_proc < 2 or len(utterances) < MIN_PARALLEL:
+            return [self.phonetize(utt, phonunk, delimiter)
+                    for utt in utterances]
+
+        # Each process phonetizes a block of utterances with its own copy
+        # of the phonetizer: it is sent only once to each process.
+        size = len(utterances) // (nb_proc * 4) + 1
+        blocks = [utterances[i:i+size]
+                  for i in range(0, len(utterances), size)]
+        pool = multiprocessing.Pool(nb_proc,
+                                    initializer=_init_phonetizer,
+                                    initargs=(self, phonunk, delimiter))
+        try:
+            results = pool.map(_phonetize_block, blocks)
+        finally:
+            pool.close()
+            pool.join()
+
+        return [phon for block in results for phon in block]
+
     # -----------------------------------------------------------------------
     # Private
     # -----------------------------------------------------------------------
 
+    def __get_phon_token(self, entry, phonunk):
+        """Return the phonetization of a token and its status.
+
+        :param entry: (str) The stripped token to be phonetized.
+        :param phonunk: (bool) Phonetize unknown words (or not).
+        :returns: tuple (phon, status)
+
+        """
+        phon = self._pdict.get_unkstamp()
+        status = annots.ok
+
+        # Enriched Orthographic Transcription Convention:
+        # entry can be already in SAMPA.
+        if entry.startswith("/") is True and entry.endswith("/") is True:
+            phon = entry.strip("/")
+            # It must use X-SAMPA,
+            # including minus character to separate phonemes.
+
+        else:
+
+            phon = self.get_phon_entry(entry)
+
+            if phon == self._pdict.get_unkstamp():
+                status = annots.error
+
+                # A missing compound word?
+                if "-" in entry or "'" in entry or "_" in entry:
+                    _tabpron = [self.get_phon_entry(w)
+                                for w in re.split("[-'_]", entry)]
+
+                    # OK, finally the entry is in the dictionary?
+                    if self._pdict.get_unkstamp() not in _tabpron:
+                        # ATTENTION: each part can have variants!
+                        # must be decomposed.
+                        self._dag_phon.variants = 4
+                        phon = sppasUnicode(
+                            self._dag_phon.decompose(" ".join(_tabpron))).to_strip()
+                        status = annots.warning
+
+                if phon == self._pdict.get_unkstamp() and phonunk is True:
+                    try:
+                        phon = self._phonunk.get_phon(entry)
+                        status = annots.warning
+                    except:
+                        phon = self._pdict.get_unkstamp()
+                        status = annots.error
+
+        return phon, status
+
+    # -----------------------------------------------------------------------
+
     def _map_phonentry(self, phonentry):
         """Map phonemes of a phonetized entry.
 
@@ -293,10 +375,15 @@ class sppasDictPhonetizer(object):
         if self._map_table.is_empty() is True:
             return phonentry
 
-        tab = [self._map_variant(v)
-               for v in phonentry.split(separators.variants)]
+        key = (phonentry, self._map_table.get_version())
+        mapped = self._map_cache.get(key)
+        if mapped is None:
+            tab = [self._map_variant(v)
+                   for v in phonentry.split(separators.variants)]
+            mapped = separators.variants.join(tab)
+            self._map_cache.set(key, mapped)
 
-        return separators.variants.join(tab)
+        return mapped
 
     # -----------------------------------------------------------------------
 
@@ -370,3 +457,22 @@ class sppasDictPhonetizer(object):
 
         # Did not find any map for this entry! Return the shortest.
         return 1
+
+# ---------------------------------------------------------------------------
+# Functions used by the processes of sppasDictPhonetizer.phonetize_many()
+# ---------------------------------------------------------------------------
+
+_process_phonetizer = None
+
+
+def _init_phonetizer(phonetizer, phonunk, delimiter):
+    """Store the phonetizer and its options in the current process."""
+    global _process_phonetizer
+    _process_phonetizer = (phonetizer, phonunk, delimiter)
+
+
+def _phonetize_block(utterances):
+    """Phonetize a block of utterances in the current process."""
+    phonetizer, phonunk, delimiter = _process_phonetizer
+    return [phonetizer.phonetize(utt, phonunk, delimiter)
+            for utt in utterances]
@@ -38,11 +38,14 @@
 import re
 
 from sppas.src.utils.makeunicode import sppasUnicode
+from sppas.src.structs.lrucache import sppasLRUCache
+
 from .dagphon import sppasDAGPhonetizer
 
 # ---------------------------------------------------------------------------
 
 LIMIT_SIZE = 40  # Max nb of characters of an unknown entry
+CACHE_SIZE = 4096  # Max nb of unknown entries to remember
 
 # ---------------------------------------------------------------------------
 
@@ -69,6 +72,11 @@ class sppasPhonUnk(object):
         >>> d = { 'a':'a|aa', 'b':'b', 'c':'c|cc', 'abb':'abb', 'bac':'bac' }
         >>> p = sppasPhonUnk(d)
 
+    The phonetizations are memorized in a LRU cache: an unknown entry which
+    occurs several times in a corpus is phonetized only once. The cache is
+    cleared each time the number of variants is changed, or when the
+    version of the dictionary has changed (sppasDictPron.get_version()).
+
     """
     def __init__(self, pron_dict):
         """Create a sppasPhonUnk instance.
@@ -79,6 +87,8 @@ class sppasPhonUnk(object):
         """
         self.prondict = pron_dict
         self.dagphon = sppasDAGPhonetizer(variants=4)
+        self._cache = sppasLRUCache(CACHE_SIZE)
+        self._version = self.__get_dict_version()
 
     # ------------------------------------------------------------------
     # Getters and Setters
@@ -91,6 +101,7 @@ class sppasPhonUnk(object):
 
         """
         self.dagphon.set_variants(v)
+        self._cache.clear()
 
     # -----------------------------------------------------------------------
 
@@ -101,6 +112,39 @@ class sppasPhonUnk(object):
         :returns: a string with the proposed phonetization
         :raises: Exception if the word can NOT be phonetized
 
+        """
+        version = self.__get_dict_version()
+        if version != self._version:
+            self._cache.clear()
+            self._version = version
+
+        pron = self._cache.get(entry)
+        if pron is None:
+            pron = self.__get_phon(entry)
+            self._cache.set(entry, pron)
+
+        if pron is False:
+            raise Exception
+        return pron
+
+    # -----------------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------------
+
+    def __get_dict_version(self):
+        """Return the version of the dictionary, or None if not versioned."""
+        get_version = getattr(self.prondict, "get_version", None)
+        if get_version is None:
+            return None
+        return get_version()
+
+    # -----------------------------------------------------------------------
+
+    def __get_phon(self, entry):
+        """Return the phonetization of an unknown entry or False.
+
+        :param entry: (str) the string to phonetize
+
         """
         _str = sppasUnicode(entry).to_strip()
         _str = sppasUnicode(_str).to_lower()
@@ -112,7 +156,7 @@ class sppasPhonUnk(object):
             return ""
 
         if len(entry) > LIMIT_SIZE:
-            raise Exception
+            return False
 
         # Find all pronunciations of segments with a longest matching algo.
         _tabstr = re.split("[-'_\s]", _str)
@@ -147,11 +191,9 @@ class sppasPhonUnk(object):
         if len(pron) > 0:
             return pron
 
-        raise Exception
+        return False
 
     # -----------------------------------------------------------------------
-    # Private
-    # -----------------------------------------------------------------------
 
     def __longestlr(self, entry):
         """Select the longest phonetization of an entry, from the end.
@@ -28,49 +28,103 @@
         This banner notice must not be removed.
 
         ---------------------------------------------------------------------
+
+    src.annotations.ReOccurrences.reoccurrences.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
 """
-from sppas import sppasTier, sppasLocation
-from sppas import sppasInterval, sppasPoint
+from sppas import sppasTier
 from sppas import sppasLabel, sppasTag
 
+from ..intervaltree import sppasIntervalTree
+
+# ---------------------------------------------------------------------------
+
 
 class Reoccurences(object):
+    """Search for the re-occurrences of annotations.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+
+    An annotation of the comparison window is a re-occurrence of an
+    annotation of the reference window if they share a tag and if it
+    overlaps the reference annotation, or if it is at less than delta of it.
+
+    """
 
     def __init__(self):
         super(Reoccurences, self).__init__()
 
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def get_tags(ann):
+        """Return the set of the contents of the best tags of an annotation.
+
+        :param ann: (sppasAnnotation)
+        :returns: (set of str) Empty tags are ignored
+
+        """
+        tags = set()
+        for i in range(len(ann.get_labels())):
+            content = ann.get_best_tag(i).get_content()
+            if len(content) > 0:
+                tags.add(content)
+
+        return tags
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def find_reoccurrences(ann, comp_tree, delta=0.):
+        """Return the re-occurrences of an annotation.
+
+        :param ann: (sppasAnnotation) Annotation of the reference window
+        :param comp_tree: (sppasIntervalTree) Annotations of the comparison
+        :param delta: (float) Max time between the annotation and a
+        re-occurrence
+        :returns: list of sppasAnnotation
+
+        """
+        tags = Reoccurences.get_tags(ann)
+        if len(tags) == 0:
+            return list()
+
+        begin = ann.get_lowest_localization().get_midpoint()
+        end = ann.get_highest_localization().get_midpoint()
+        return [a for a in comp_tree.find(begin, end, delta)
+                if len(tags & Reoccurences.get_tags(a)) > 0]
+
+    # -----------------------------------------------------------------------
+
     @staticmethod
     def make_reoccurrences(ref_window, comp_window, delta):
-        occ = dict()
-        reocc = list()
-        reoccTier = sppasTier()
-
-        for ann_set_ref in ref_window:
-            occ[ann_set_ref] = 0
-
-        for ann_set_ref in ref_window:
-            for ann_set_comp in comp_window:
-                if len(ann_set_ref & ann_set_comp) != 0 and \
-                        len(ann_set_ref & ann_set_comp) / len(ann_set_ref):
-                    occ[ann_set_ref] += 1
-                    reocc.append(ann_set_comp)
-
-        for ann_set in occ.keys():
-            curr_reocc = list()
-            for ann_set_comp in reocc:
-                if len(ann_set & ann_set_comp) / len(ann_set):
-                    curr_reocc.append(ann_set_comp)
-
-            begin = 0.0
-            end = 0.0
-            i = 0
-            for ann in ann_set:
-                if i == 0:
-                    begin = ann.get_location().get_best().get_begin().get_value()
-                elif i == len(ann_set) - 1:
-                    end = ann.get_location().get_best().get_end().get_value()
-
-            reoccTier.create_annotation(
-                sppasLocation(sppasInterval(sppasPoint(begin), sppasPoint(end))),
-                [sppasLabel(sppasTag(begin)), sppasLabel(sppasTag())]
-            )
+        """Return a tier with the number of re-occurrences of annotations.
+
+        The annotations of the comparison window are indexed into an
+        interval tree, so that each annotation of the reference window is
+        compared only to the ones in its neighbourhood.
+
+        :param ref_window: (sppasTier, sppasAnnSet or list) Annotations
+        :param comp_window: (sppasTier, sppasAnnSet or list) Annotations
+        :param delta: (float) Max time between an annotation and a
+        re-occurrence
+        :returns: (sppasTier) The annotations of the reference window with
+        re-occurrences, labelled with their number of re-occurrences
+
+        """
+        comp_tree = sppasIntervalTree(comp_window)
+        reocc_tier = sppasTier("ReOccurrences")
+
+        for ann in ref_window:
+            reocc = Reoccurences.find_reoccurrences(ann, comp_tree, delta)
+            if len(reocc) > 0:
+                reocc_tier.create_annotation(
+                    ann.get_location().copy(),
+                    sppasLabel(sppasTag(len(reocc), tag_type="int")))
+
+        return reocc_tier
@@ -42,9 +42,11 @@
 from .searchipus import SearchIPUs
 from .silences import sppasSilences
 from .sppassearchipus import sppasSearchIPUs
+from .streamingipus import sppasStreamingIPUs
 
 __all__ = (
     "SearchIPUs",
     "sppasSilences",
-    "sppasSearchIPUs"
+    "sppasSearchIPUs",
+    "sppasStreamingIPUs"
 )
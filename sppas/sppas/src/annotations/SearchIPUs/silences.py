@@ -35,11 +35,18 @@
 """
 
 import logging
+from itertools import compress, islice, repeat
+from operator import lt, ne
+
 from sppas.src.audiodata.channel import sppasChannel
 from sppas.src.audiodata.channelvolume import sppasChannelVolume
 
 # ---------------------------------------------------------------------------
 
+FINE_BLOCK_SIZE = 256  # Nb of windows of vagueness estimated at once
+
+# ---------------------------------------------------------------------------
+
 
 class sppasSilences(object):
     """Silence search on a channel of an audio file.
@@ -75,6 +82,8 @@ class sppasSilences(object):
         self._channel = None
         self.__volume_stats = None
         self.__silences = list()
+        self.__fine_volumes = dict()
+        self.__fine_cache = dict()
         if channel is not None:
             self.set_channel(channel)
 
@@ -89,6 +98,7 @@ class sppasSilences(object):
 
         """
         self._vagueness = min(vagueness, self._win_len)
+        self.__reset_fine_volumes()
 
     # -----------------------------------------------------------------------
 
@@ -111,6 +121,7 @@ class sppasSilences(object):
         self._channel = channel
         self.__volume_stats = sppasChannelVolume(channel, self._win_len)
         self.__silences = list()
+        self.__reset_fine_volumes()
 
     # -----------------------------------------------------------------------
 
@@ -158,7 +169,7 @@ class sppasSilences(object):
         if self._channel is None:
             return
 
-        nframes = self._channel.get_nframes()
+        nframes = int(self._channel.get_nframes())
         for from_pos, to_pos in tracks:
             if nframes < from_pos:
                 # Accept a "DELTA" of 10 frames, in case of corrupted data.
@@ -189,27 +200,48 @@ class sppasSilences(object):
         if self._channel is None:
             return []
 
+        return sppasSilences.silences_to_tracks(
+            self.__silences,
+            self._channel.get_nframes(),
+            self._channel.get_framerate(),
+            min_track_dur, shift_dur_start, shift_dur_end)
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def silences_to_tracks(silences, nframes, framerate,
+                           min_track_dur, shift_dur_start, shift_dur_end):
+        """Return the tracks between the given silences.
+
+        :param silences: (list of tuples) List of (from_pos,to_pos)
+        :param nframes: (int) Number of frames of the channel
+        :param framerate: (int) Frame rate of the channel
+        :param min_track_dur: (float) The minimum duration for a track
+        :param shift_dur_start: (float) The time to remove to the start bound
+        :param shift_dur_end: (float) The time to add to the end boundary
+        :returns: list of tuples (from_pos,to_pos)
+
+        """
         tracks = list()
 
         # No silence: Only one track!
-        if len(self.__silences) == 0:
-            tracks.append((0, self._channel.get_nframes()))
+        if len(silences) == 0:
+            tracks.append((0, nframes))
             return tracks
 
         # Convert values from time to frames
-        delta = int(min_track_dur * self._channel.get_framerate())
-        shift_start = int(shift_dur_start * self._channel.get_framerate())
-        shift_end = int(shift_dur_end * self._channel.get_framerate())
+        delta = int(min_track_dur * framerate)
+        shift_start = int(shift_dur_start * framerate)
+        shift_end = int(shift_dur_end * framerate)
         from_pos = 0
 
-        for to_pos, next_from in self.__silences:
+        for to_pos, next_from in silences:
 
             if (to_pos-from_pos) >= delta:
                 # Track is long enough to be considered an IPU.
                 # Apply the shift values
                 shift_from_pos = max(from_pos - shift_start, 0)
-                shift_to_pos = min(to_pos + shift_end,
-                                   self._channel.get_nframes())
+                shift_to_pos = min(to_pos + shift_end, nframes)
                 # Store as it
                 tracks.append((int(shift_from_pos), int(shift_to_pos)))
 
@@ -217,7 +249,7 @@ class sppasSilences(object):
 
         # Last track after the last silence
         # (if the silence does not end at the end of the channel)
-        to_pos = self._channel.get_nframes()
+        to_pos = nframes
         if (to_pos - from_pos) >= delta:
             tracks.append((int(from_pos), int(to_pos)))
 
@@ -235,15 +267,35 @@ class sppasSilences(object):
         :returns: (int) volume value
 
         """
-        volumes = sorted(self.__volume_stats.volumes())
-        vmin = max(self.__volume_stats.min(), 0)  # provide negative values
-        logging.info("RMS min={:d}".format(vmin))
-        vmean = self.__volume_stats.mean()
-        logging.info("RMS mean={:.2f}".format(vmean))
-        vmedian = self.__volume_stats.median()
-        logging.info("RMS median={:2f}".format(vmedian))
-        vvar = self.__volume_stats.coefvariation()
-        logging.info("RMS coef. var={:2f}".format(vvar))
+        logging.info("RMS min={:d}".format(max(self.__volume_stats.min(), 0)))
+        logging.info("RMS mean={:.2f}".format(self.__volume_stats.mean()))
+        logging.info("RMS median={:2f}".format(self.__volume_stats.median()))
+        logging.info("RMS coef. var={:2f}".format(self.__volume_stats.coefvariation()))
+
+        threshold = sppasSilences.estimate_threshold(self.__volume_stats)
+        logging.info('Threshold value for the search of silences: {:d}'
+                     ''.format(threshold))
+
+        return threshold
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def estimate_threshold(volume_stats):
+        """Return the threshold estimated from the distribution of volumes.
+
+        The very high volume values (outliers) of the given volumes are
+        removed for distributions with a too high variability.
+
+        :param volume_stats: (sppasBaseVolume) Volume values
+        :returns: (int) volume value
+
+        """
+        volumes = sorted(volume_stats.volumes())
+        vmin = max(volume_stats.min(), 0)  # provide negative values
+        vmean = volume_stats.mean()
+        vmedian = volume_stats.median()
+        vvar = volume_stats.coefvariation()
 
         # Remove very high volume values (outliers)
         # only for distributions with a too high variability
@@ -251,15 +303,13 @@ class sppasSilences(object):
             logging.debug('The RMS distribution need to be normalized.')
 
             rms_threshold = volumes[int(0.85 * len(volumes))]
-            nb = 0
-            for i, v in enumerate(self.__volume_stats):
-                if v > rms_threshold:
-                    self.__volume_stats.set_volume_value(i, rms_threshold)
-                    nb += 1
+            volume_stats.set_volume_values(
+                list(map(min, volume_stats.volumes(),
+                         repeat(rms_threshold))))
 
-            vmean = self.__volume_stats.mean()
-            vmedian = self.__volume_stats.median()
-            vvar = self.__volume_stats.coefvariation()
+            vmean = volume_stats.mean()
+            vmedian = volume_stats.median()
+            vvar = volume_stats.coefvariation()
 
         # Normal situation... (more than 75% of the files!!!)
         vcvar = 1.5 * vvar
@@ -284,9 +334,6 @@ class sppasSilences(object):
         else:
             logging.debug(' ... threshold: normal estimator')
 
-        logging.info('Threshold value for the search of silences: {:d}'
-                     ''.format(threshold))
-
         return threshold
 
     # -----------------------------------------------------------------------
@@ -310,40 +357,29 @@ class sppasSilences(object):
         if threshold == 0:
             threshold = self.fix_threshold_vol()
 
-        # This scans the volumes whether it is lower than threshold,
-        # and if true, it is written to silence.
+        # The volumes are compared to the threshold all at once: the
+        # silences are between the indexes where the comparison changes.
         self.__silences = list()
-        inside = False  # inside a silence or not
-        idx_begin = 0
         nframes = self.__volume_stats.get_winlen() * self._channel.get_framerate()
-
-        i = 0
-        for v in self.__volume_stats:
-            if v < threshold:
-                # It's a small enough volume to consider the window a silence
-                if inside is False:
-                    # We consider it like the beginning of a block of silences
-                    idx_begin = i
-                    inside = True
-                # else: it's the continuation of a silence
-
-            else:
-                # It's a big enough volume to consider the window an IPU
-                if inside is True:
-                    # It's the first window of an IPU
-                    # so the previous window was the end of a silence
-                    from_pos = int(idx_begin * nframes)
-                    to_pos = int((i - 1) * nframes)
-                    self.__silences.append((from_pos, to_pos))
-                    inside = False
-
-                # else: it's the continuation of an IPU
-
-            i += 1
+        volumes = self.__volume_stats.volumes()
+        if len(volumes) == 0:
+            return threshold
+
+        inside = list(map(lt, volumes, repeat(threshold)))
+        changes = list(compress(range(1, len(inside)),
+                                map(ne, inside, islice(inside, 1, None))))
+        if inside[0] is True:
+            changes.insert(0, 0)
+
+        for idx_begin, idx_end in zip(changes[::2], changes[1::2]):
+            # It's the first window of an IPU
+            # so the previous window was the end of a silence
+            self.__silences.append((int(idx_begin * nframes),
+                                    int((idx_end - 1) * nframes)))
 
         # Last interval
-        if inside is True:
-            start_pos = int(idx_begin *
+        if len(changes) % 2 == 1:
+            start_pos = int(changes[-1] *
                             self.__volume_stats.get_winlen() *
                             self._channel.get_framerate())
             end_pos = self._channel.get_nframes()
@@ -372,12 +408,10 @@ class sppasSilences(object):
             threshold = self.fix_threshold_vol()
 
         # Adjust boundaries of the silences
-        adjusted = list()
-        for (from_pos, to_pos) in self.__silences:
-            adjusted.append((
-                self.__adjust_bound(from_pos, threshold, direction=-1),
-                to_pos))
-        self.__silences = adjusted
+        starts = self.adjust_bounds([from_pos for from_pos, _ in self.__silences],
+                                    threshold, direction=-1)
+        self.__silences = [(from_pos, to_pos) for from_pos, (_, to_pos)
+                           in zip(starts, self.__silences)]
 
         # Re-filter
         self.__filter_silences(min_sil_dur)
@@ -432,65 +466,157 @@ class sppasSilences(object):
         :returns: filtered silences
 
         """
-        filtered_sil = list()
-        for (start_pos, end_pos) in self.__silences:
-            sil_dur = float(end_pos-start_pos) / \
-                      float(self._channel.get_framerate())
-            if sil_dur > min_sil_dur:
-                filtered_sil.append((start_pos, end_pos))
-
-        self.__silences = filtered_sil
+        framerate = float(self._channel.get_framerate())
+        self.__silences = [(start_pos, end_pos)
+                           for (start_pos, end_pos) in self.__silences
+                           if float(end_pos - start_pos) / framerate > min_sil_dur]
 
     # -----------------------------------------------------------------------
 
-    def __adjust_bound(self, pos, threshold, direction=0):
-        """Adjust the position of a silence around a given position.
+    def adjust_bounds(self, positions, threshold, direction=0):
+        """Adjust the positions of silences around the given positions.
 
-        Here "around" the position means in a range of 18 windows,
-        i.e. 6 before + 12 after the position.
+        Here "around" a position means in a range of 18 windows of
+        vagueness, i.e. 6 before + 12 after the position. Their volumes
+        are shared by all the positions, and by the next searches.
 
-        :param pos: (int) Initial position of the silence
+        :param positions: (list of int) Initial positions of the silences
         :param threshold: (int) RMS threshold value for a silence
-        :param direction: (int)
-
-        :returns: new position
+        :param direction: (int) -1 for the beginning of the silences, or
+        1 for their end
+        :returns: (list of int) new positions
 
         """
         if self._vagueness == self._win_len:
-            return pos
+            return list(positions)
         if direction not in (-1, 1):
-            return pos
-
-        # Extract the frames of the windows around the pos
-        delta = int(1.5 * self.__volume_stats.get_winlen() * self._channel.get_framerate())
-        start_pos = int(max(pos - delta, 0))
-        self._channel.seek(start_pos)
-        frames = self._channel.get_frames(int(delta * 3))
-
-        # Create a channel and estimate volume values with a window
-        # of vagueness (i.e. 4 times more precise than the original)
-        c = sppasChannel(self._channel.get_framerate(),
-                         self._channel.get_sampwidth(),
-                         frames)
-        vol_stats = sppasChannelVolume(c, self._vagueness)
-
-        # we'll see if we can reduce the silence
-
-        if direction == 1:  # silence | ipu
-            for idx, v in enumerate(vol_stats):
-                shift = idx * (int(self._vagueness * self._channel.get_framerate()))
-                if v > threshold:
-                    return start_pos + int(shift)
-
-        elif direction == -1:  # ipu | silence
-            idx = len(vol_stats)  # = 12 (3 windows of 4 vagueness)
-            for v in reversed(vol_stats):
-                if v > threshold:
-                    shift = idx * (int(self._vagueness * self._channel.get_framerate()))
-                    return start_pos + int(shift)
-                idx -= 1
-
-        return pos
+            return list(positions)
+
+        # Estimate volume values of the windows around the pos, with a
+        # window of vagueness (i.e. 4 times more precise than the original)
+        framerate = self._channel.get_framerate()
+        delta = int(1.5 * self.__volume_stats.get_winlen() * framerate)
+        shift = int(self._vagueness * framerate)
+        nb_frames = self.__fine_length()
+
+        adjusted = list()
+        for pos in positions:
+            start_pos = int(max(pos - delta, 0))
+            vol_stats = self.__refine_volumes(start_pos, start_pos + int(delta * 3),
+                                              nb_frames)
+            new_pos = pos
+            # we'll see if we can reduce the silence
+            if direction == 1:  # silence | ipu
+                for idx, v in enumerate(vol_stats):
+                    if v > threshold:
+                        new_pos = start_pos + int(idx * shift)
+                        break
+
+            else:  # ipu | silence
+                idx = len(vol_stats)  # = 12 (3 windows of 4 vagueness)
+                for v in reversed(vol_stats):
+                    if v > threshold:
+                        new_pos = start_pos + int(idx * shift)
+                        break
+                    idx -= 1
+
+            adjusted.append(new_pos)
+
+        return adjusted
+
+    # -----------------------------------------------------------------------
+
+    def __reset_fine_volumes(self):
+        """Forget the volume values estimated to adjust the boundaries."""
+        self.__fine_volumes = dict()
+        self.__fine_cache = dict()
+
+    # -----------------------------------------------------------------------
+
+    def __fine_length(self):
+        """Return the number of frames of a window of vagueness, or 0.
+
+        The volumes of the windows are shared by all the boundaries only
+        if the positions of the silences are multiple of this length.
+
+        """
+        rate = self._channel.get_framerate()
+        nb_frames = int(self._vagueness * rate)
+        win_frames = self.__volume_stats.get_winlen() * rate
+        delta = int(1.5 * win_frames)
+        if nb_frames < 1 or win_frames != int(win_frames) or \
+                int(win_frames) % nb_frames != 0 or delta % nb_frames != 0:
+            return 0
+        return nb_frames
+
+    # -----------------------------------------------------------------------
+
+    def __fine_volumes_between(self, first, last, nb_frames):
+        """Return the volumes of the windows of vagueness between indexes.
+
+        The volumes are estimated by blocks of FINE_BLOCK_SIZE windows, the
+        first time one of the windows of the block is needed.
+
+        :param first: (int) Index of the first window
+        :param last: (int) Index after the last window
+        :param nb_frames: (int) Number of frames of a window
+        :returns: (list of int)
+
+        """
+        volumes = list()
+        for idx in range(first // FINE_BLOCK_SIZE,
+                         (last - 1) // FINE_BLOCK_SIZE + 1):
+            block = self.__fine_volumes.get(idx, None)
+            if block is None:
+                begin = idx * FINE_BLOCK_SIZE * nb_frames
+                block = self.__volume_stats.volumes_between(
+                    begin, begin + FINE_BLOCK_SIZE * nb_frames,
+                    self._vagueness)
+                block.extend([0] * (FINE_BLOCK_SIZE - len(block)))
+                self.__fine_volumes[idx] = block
+
+            offset = idx * FINE_BLOCK_SIZE
+            volumes.extend(block[max(0, first - offset):last - offset])
+
+        return volumes
+
+    # -----------------------------------------------------------------------
+
+    def __refine_volumes(self, from_pos, to_pos, nb_frames):
+        """Return the volumes of the windows of vagueness between positions.
+
+        They are the ones of volumes_between() the positions.
+
+        :param from_pos: (int) Position of the first frame
+        :param to_pos: (int) Position after the last frame
+        :param nb_frames: (int) Number of frames of a window, or 0 if the
+        volumes are not shared
+        :returns: (list of int)
+
+        """
+        nframes = int(self._channel.get_nframes())
+        to_pos = min(int(to_pos), nframes)
+        if nb_frames == 0 or from_pos % nb_frames != 0 or \
+                (to_pos % nb_frames != 0 and to_pos != nframes):
+            volumes = self.__fine_cache.get((from_pos, to_pos), None)
+            if volumes is None:
+                volumes = self.__volume_stats.volumes_between(
+                    from_pos, to_pos, self._vagueness)
+                self.__fine_cache[(from_pos, to_pos)] = volumes
+            return list(volumes)
+
+        duration = float(max(0, to_pos - from_pos)) / float(self._channel.get_framerate())
+        nb_vols = int(duration / self._vagueness) + 1
+        first = from_pos // nb_frames
+        nb_inside = min(nb_vols, (max(0, to_pos - from_pos) + nb_frames - 1) // nb_frames)
+        volumes = list()
+        if nb_inside > 0:
+            volumes = self.__fine_volumes_between(first, first + nb_inside, nb_frames)
+        volumes.extend([0] * (nb_vols - nb_inside))
+        if volumes[-1] == 0:
+            volumes.pop()
+
+        return volumes
 
     # -----------------------------------------------------------------------
     # overloads
@@ -34,6 +34,7 @@
 
 """
 import os
+import multiprocessing
 
 from sppas.src.config import symbols
 
@@ -92,6 +93,7 @@ class sppasSearchIPUs(sppasBaseAnnotation):
         """
         super(sppasSearchIPUs, self).__init__("searchipus.json", log)
         self.__searcher = SearchIPUs(channel=None)
+        self._nb_proc = 1
 
     # -----------------------------------------------------------------------
     # Methods to fix options
@@ -219,6 +221,26 @@ class sppasSearchIPUs(sppasBaseAnnotation):
         """
         self._options['shift_end'] = value
 
+    # -----------------------------------------------------------------------
+
+    def get_nb_proc(self):
+        """Return the number of processes of the batch processing."""
+        return self._nb_proc
+
+    # -----------------------------------------------------------------------
+
+    def set_nb_proc(self, value):
+        """Fix the number of processes of the batch processing.
+
+        :param value: (int) Max number of processes. If 0, the number of
+        CPUs is used.
+
+        """
+        value = int(value)
+        if value == 0:
+            value = multiprocessing.cpu_count()
+        self._nb_proc = max(1, value)
+
     # -----------------------------------------------------------------------
     # Annotate
     # -----------------------------------------------------------------------
@@ -303,11 +325,15 @@ class sppasSearchIPUs(sppasBaseAnnotation):
         for key, value in zip(meta, self.__searcher.get_rms_stats()):
             tier.set_meta(str(key), str(value))
 
+    # -----------------------------------------------------------------------
+
+    def _print_meta(self, tier):
+        """Print information about the IPUs of the tier in the user log."""
         self.logfile.print_message("Information: ", indent=1)
-        if self.__searcher.get_vol_threshold() == 0:
+        if tier.get_meta('required_threshold_volume') == "0":
             self.logfile.print_message(
-                "Automatically estimated threshold volume value: {:d}"\
-                "".format(self.__searcher.get_effective_threshold()),
+                "Automatically estimated threshold volume value: {:s}"\
+                "".format(tier.get_meta('estimated_threshold_volume')),
                 indent=2)
         self.logfile.print_message(
             "Number of IPUs found: {:s}".format(tier.get_meta("number_of_ipus")),
@@ -346,37 +372,74 @@ class sppasSearchIPUs(sppasBaseAnnotation):
 
     # -----------------------------------------------------------------------
 
-    def run(self, input_file, opt_input_file=None, output_file=None):
-        """Run the automatic annotation process on an input.
+    def convert_file(self, filename, mmap=False):
+        """Search for IPUs in the given audio file.
 
-        :param input_file: (list of str) audio
-        :param opt_input_file: (list of str) ignored
-        :param output_file: (str) the output file name
-        :returns: (sppasTranscription)
+        :param filename: (str) Name of an audio file with only one channel
+        :param mmap: (bool) Memory-map the frames of a wav file instead of
+        loading them: they are then read from the disk block by block,
+        while the volume values are estimated.
+        :returns: (sppasTier)
 
         """
         # Get audio and the channel we'll work on
-        audio_speech = sppas.src.audiodata.aio.open(input_file[0])
-        n = audio_speech.get_nchannels()
-        if n != 1:
-            raise IOError("An audio file with only one channel is expected. "
-                          "Got {:d} channels.".format(n))
+        extm = os.path.splitext(filename)[1].lower()
+        if mmap is True and extm == ".wav":
+            audio_speech = sppas.src.audiodata.aio.open_mmap(filename)
+        else:
+            audio_speech = sppas.src.audiodata.aio.open(filename)
 
-        # Extract the channel
-        idx = audio_speech.extract_channel(0)
-        channel = audio_speech.get_channel(idx)
-        tier = self.convert(channel)
+        try:
+            n = audio_speech.get_nchannels()
+            if n != 1:
+                raise IOError("An audio file with only one channel is expected. "
+                              "Got {:d} channels.".format(n))
+
+            # Extract the channel
+            idx = audio_speech.extract_channel(0)
+            channel = audio_speech.get_channel(idx)
+            return self.convert(channel)
+        finally:
+            audio_speech.close()
 
-        # Create the transcription to put the result
+    # -----------------------------------------------------------------------
+
+    def _create_transcription(self, filename, tier):
+        """Create the transcription with the IPUs found in an audio file.
+
+        :param filename: (str) Name of the audio file
+        :param tier: (sppasTier) IPUs of the audio file
+        :returns: (sppasTranscription)
+
+        """
         trs_output = sppasTranscription(self.name)
-        trs_output.set_meta('search_ipus_result_of', input_file[0])
+        trs_output.set_meta('search_ipus_result_of', filename)
         trs_output.append(tier)
 
-        extm = os.path.splitext(input_file[0])[1].lower()[1:]
-        media = sppasMedia(os.path.abspath(input_file[0]),
+        extm = os.path.splitext(filename)[1].lower()[1:]
+        media = sppasMedia(os.path.abspath(filename),
                            mime_type="audio/"+extm)
         tier.set_media(media)
 
+        return trs_output
+
+    # -----------------------------------------------------------------------
+
+    def run(self, input_file, opt_input_file=None, output_file=None):
+        """Run the automatic annotation process on an input.
+
+        :param input_file: (list of str) audio
+        :param opt_input_file: (list of str) ignored
+        :param output_file: (str) the output file name
+        :returns: (sppasTranscription)
+
+        """
+        tier = self.convert_file(input_file[0])
+        self._print_meta(tier)
+
+        # Create the transcription to put the result
+        trs_output = self._create_transcription(input_file[0], tier)
+
         # Save in a file
         if output_file is not None:
             parser = sppasRW(output_file)
@@ -404,42 +467,162 @@ class sppasSearchIPUs(sppasBaseAnnotation):
         out_name = self.get_out_name(input_file[0], output_format)
 
         # Is there already an existing output file (in any format)!
+        existing, result = self._use_existing_output(input_file[0], out_name)
+        if existing is True:
+            return result
+
+        try:
+            # Execute annotation
+            self.run(input_file, opt_input_file, out_name)
+        except Exception as e:
+            out_name = None
+            self.logfile.print_message("{:s}\n".format(str(e)), indent=2, status=-1)
+
+        return out_name
+
+    # -----------------------------------------------------------------------
+
+    def _use_existing_output(self, filename, out_name):
+        """Use the already existing output of an audio file, if any.
+
+        If the existing output file is in the expected format, it is not
+        overridden. If it is in another format, it is converted.
+
+        :param filename: (str) Name of the audio file
+        :param out_name: (str) Expected name of the output file
+        :returns: (bool, str) whether an output is existing, and the output
+        file name or None
+
+        """
         ext = []
         for e in sppas.src.anndata.aio.extensions_in:
             if e not in ('.txt', '.hz', '.PitchTier', '.IntensityTier'):
                 ext.append(e)
-        exist_out_name = sppasBaseAnnotation._get_filename(input_file[0], ext)
+        exist_out_name = sppasBaseAnnotation._get_filename(filename, ext)
+        if exist_out_name is None:
+            return False, None
+
+        # it's existing... in the expected format
+        if exist_out_name.lower() == out_name.lower():
+            self.logfile.print_message(
+                _info(1300).format(exist_out_name),
+                indent=2, status=annots.info)
+            return True, None
 
         # it's existing... but not in the expected format: convert!
-        if exist_out_name is not None:
-            if exist_out_name.lower() == out_name.lower():
-                self.logfile.print_message(
-                    _info(1300).format(exist_out_name),
-                    indent=2, status=annots.info)
-                return None
+        try:
+            parser = sppasRW(exist_out_name)
+            t = parser.read()
+            parser.set_filename(out_name)
+            parser.write(t)
+            self.logfile.print_message(
+                _info(1300).format(exist_out_name) +
+                _info(1302).format(out_name),
+                indent=2, status=annots.warning)
+            return True, out_name
+        except:
+            pass
+
+        return False, None
+
+    # -----------------------------------------------------------------------
 
+    def batch_processing(self,
+                         file_names,
+                         progress=None,
+                         output_format=annots.extension):
+        """Perform the annotation on a bunch of audio files.
+
+        If more than one process is allowed, the files are distributed to
+        a pool of processes. Each process searches for the IPUs of its
+        files and returns the tiers through the result queue of the pool,
+        in the order the files are done. The output files are written by
+        this process, and the progress is updated for each file done.
+
+        :param file_names: (list) List of inputs
+        :param progress: ProcessProgressTerminal() or ProcessProgressDialog()
+        :param output_format: (str)
+        :returns: (list of str) List of created files
+
+        """
+        if self._nb_proc < 2 or len(file_names) < 2:
+            return super(sppasSearchIPUs, self).batch_processing(
+                file_names, progress, output_format)
+
+        if len(self._options) > 0:
+            self.print_options()
+
+        total = len(file_names)
+        out_names = [None] * total
+        if progress:
+            progress.update(0, "")
+
+        # The files which are already annotated are not sent to the pool
+        todo = dict()
+        for i, input_files in enumerate(file_names):
+            required_inputs, optional_inputs = self._split_inputs(input_files)
+            self.print_diagnosis(*required_inputs)
+            out_name = self.get_out_name(required_inputs[0], output_format)
+            existing, result = self._use_existing_output(required_inputs[0],
+                                                         out_name)
+            if existing is True:
+                out_names[i] = result
+                self.__print_result(result)
             else:
-                try:
-                    parser = sppasRW(exist_out_name)
-                    t = parser.read()
-                    parser.set_filename(out_name)
-                    parser.write(t)
-                    self.logfile.print_message(
-                        _info(1300).format(exist_out_name) +
-                        _info(1302).format(out_name),
-                        indent=2, status=annots.warning)
-                    return out_name
-                except:
-                    pass
+                todo[i] = (required_inputs[0], out_name)
+
+        done = total - len(todo)
+        if progress:
+            progress.update(round(float(done) / float(total), 2), "")
+        if len(todo) > 0:
+            pool = multiprocessing.Pool(min(self._nb_proc, len(todo)),
+                                        initializer=_init_searchipus,
+                                        initargs=(self._options, ))
+            try:
+                tasks = [(i, todo[i][0]) for i in sorted(todo)]
+                for i, tier, error in pool.imap_unordered(_search_ipus_file, tasks):
+                    filename, out_name = todo[i]
+                    self.print_filename(filename)
+                    if tier is not None:
+                        self._print_meta(tier)
+                        try:
+                            trs_output = self._create_transcription(filename, tier)
+                            sppasRW(out_name).write(trs_output)
+                            out_names[i] = out_name
+                        except Exception as e:
+                            error = str(e)
+                    if error is not None:
+                        self.logfile.print_message("{:s}\n".format(error),
+                                                   indent=2, status=-1)
+                    self.__print_result(out_names[i])
+
+                    done += 1
+                    if progress:
+                        progress.update(round(float(done) / float(total), 2),
+                                        "{!s:s}".format(filename))
+            finally:
+                pool.close()
+                pool.join()
+
+        files_processed_success = [f for f in out_names if f is not None]
+
+        # Indicate completed!
+        if progress:
+            progress.update(1, (info(9000, "ui").format(
+                len(files_processed_success), total)))
+
+        return files_processed_success
 
-        try:
-            # Execute annotation
-            self.run(input_file, opt_input_file, out_name)
-        except Exception as e:
-            out_name = None
-            self.logfile.print_message("{:s}\n".format(str(e)), indent=2, status=-1)
+    # -----------------------------------------------------------------------
 
-        return out_name
+    def __print_result(self, out_name):
+        """Print the result of the annotation of a file in the user log."""
+        if out_name is None:
+            self.logfile.print_message(
+                info(1306, "annotations"), indent=1, status=annots.info)
+        else:
+            self.logfile.print_message(out_name, indent=1, status=annots.ok)
+        self.logfile.print_newline()
 
     # -----------------------------------------------------------------------
 
@@ -447,3 +630,30 @@ class sppasSearchIPUs(sppasBaseAnnotation):
     def get_input_extensions():
         """Extensions that the annotation expects for its input filename."""
         return sppas.src.audiodata.aio.extensions
+
+# ---------------------------------------------------------------------------
+# Search for IPUs in a process of a pool
+# ---------------------------------------------------------------------------
+
+_process_searchipus = None
+
+
+def _init_searchipus(options):
+    """Create the annotation of a process, with the given options."""
+    global _process_searchipus
+    _process_searchipus = sppasSearchIPUs()
+    _process_searchipus.set_threshold(options['threshold'])
+    _process_searchipus.set_win_length(options['win_length'])
+    _process_searchipus.set_min_sil(options['min_sil'])
+    _process_searchipus.set_min_ipu(options['min_ipu'])
+    _process_searchipus.set_shift_start(options['shift_start'])
+    _process_searchipus.set_shift_end(options['shift_end'])
+
+
+def _search_ipus_file(args):
+    """Return the index of the file, its tier of IPUs and an error message."""
+    index, filename = args
+    try:
+        return index, _process_searchipus.convert_file(filename, mmap=True), None
+    except Exception as e:
+        return index, None, str(e)
@@ -0,0 +1,522 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    src.annotations.SearchIPUs.streamingipus.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+"""
+from collections import deque
+
+from sppas.src.audiodata.channel import sppasChannel
+from sppas.src.audiodata.audioframes import sppasAudioFrames
+from sppas.src.audiodata.basevolume import sppasBaseVolume
+
+from .silences import sppasSilences
+from .searchipus import SearchIPUs
+
+# ---------------------------------------------------------------------------
+
+
+class sppasVolumeHistory(sppasBaseVolume):
+    """The volume values of the last windows of a stream.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2018  Brigitte Bigi
+
+    """
+
+    def __init__(self, win_len=0.01, max_len=1500):
+        """Create a sppasVolumeHistory instance.
+
+        :param win_len: (float) Size of the window (in seconds)
+        :param max_len: (int) Max number of volume values to keep
+
+        """
+        super(sppasVolumeHistory, self).__init__(win_len)
+        self._max_len = max(1, int(max_len))
+        self._volumes = deque(maxlen=self._max_len)
+
+    # -----------------------------------------------------------------------
+
+    def append(self, value):
+        """Append the volume of a new window, forget the oldest one if full.
+
+        :param value: (int) RMS value
+
+        """
+        self._volumes.append(value)
+        self._reset_stats()
+
+    # -----------------------------------------------------------------------
+
+    def copy(self):
+        """Return a copy of the history, with a list of volumes."""
+        history = sppasVolumeHistory(self._winlen, self._max_len)
+        history._volumes = list(self._volumes)
+        return history
+
+# ---------------------------------------------------------------------------
+
+
+class sppasStreamingIPUs(object):
+    """An online silence/tracks segmentation system.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2018  Brigitte Bigi
+
+    The audio frames are given block by block, and the IPUs are returned as
+    soon as the silence which follows them is long enough. The search is
+    the one of SearchIPUs: the windows with a volume lesser than the
+    threshold are silences, the beginning of a silence is adjusted with a
+    window of vagueness, then the tracks are shifted. The memory used does
+    not depend on the duration of the stream: only the frames needed to
+    adjust the boundaries and the volumes of the last HISTORY_DUR seconds
+    are kept.
+
+    If the volume threshold is 0, it is estimated like SearchIPUs does but
+    on the volumes of the history only: the first estimation is done after
+    WARMUP_DUR seconds, or later if the stream starts with a digital
+    silence, then it is updated every UPDATE_DUR seconds. The windows with
+    a volume of 0 are silences whatever the threshold, so that a digital
+    silence is searched without waiting for the first estimation. With a
+    fixed threshold, the IPUs are the ones of SearchIPUs.get_tracks().
+
+    >>> stream = sppasStreamingIPUs(framerate=16000, sampwidth=2)
+    >>> for frames in blocks:
+    >>>     for from_pos, to_pos in stream.process(frames):
+    >>>         print(from_pos, to_pos)
+    >>> tracks = stream.flush()
+
+    """
+
+    HISTORY_DUR = 30.
+    WARMUP_DUR = 2.
+    UPDATE_DUR = 1.
+
+    def __init__(self, framerate=16000, sampwidth=2, win_len=0.02):
+        """Create a new sppasStreamingIPUs instance.
+
+        :param framerate: (int) Frame rate of the stream
+        :param sampwidth: (int) Sample width of the stream
+        :param win_len: (float) Duration of a window to estimate the volume
+
+        """
+        self._framerate = int(framerate)
+        self._sampwidth = int(sampwidth)
+        self._win_len = float(win_len)
+        self._win_frames = self._win_len * self._framerate
+        self._vagueness = self._win_len / 4.
+
+        self._min_sil_dur = SearchIPUs.DEFAULT_MIN_SIL_DUR
+        self._min_ipu_dur = SearchIPUs.DEFAULT_MIN_IPU_DUR
+        self._vol_threshold = SearchIPUs.DEFAULT_VOL_THRESHOLD
+        self._shift_start = SearchIPUs.DEFAULT_SHIFT_START
+        self._shift_end = SearchIPUs.DEFAULT_SHIFT_END
+
+        self.reset()
+
+    # -----------------------------------------------------------------------
+
+    def reset(self):
+        """Forget the stream: the next frames are the beginning of a new one."""
+        self._nframes = 0          # Number of frames of the stream
+        self._frames = b""         # Frames kept in memory...
+        self._frames_pos = 0       # ... from this position of the stream
+        self._nwindows = 0         # Number of windows with a volume
+        self._history = sppasVolumeHistory(
+            self._win_len, int(self.HISTORY_DUR / self._win_len))
+        self._threshold = self._vol_threshold
+        self._waiting = list()     # Volumes waiting for the first threshold
+        self._current = 0          # Index of the next window to search in
+
+        self._track_begin = 0      # Position of the beginning of the track
+        self._nb_silences = 0      # Number of silences found
+        self._run_begin = None     # Index of the 1st window of a silence
+        self._run_last = None      # Index of its last window
+        self._run_start = None     # Its adjusted starting position
+        self._run_found = False    # The silence is long enough
+
+    # -----------------------------------------------------------------------
+    # Getters and setters
+    # -----------------------------------------------------------------------
+
+    def get_framerate(self):
+        return self._framerate
+
+    def get_sampwidth(self):
+        return self._sampwidth
+
+    def get_win_length(self):
+        return self._win_len
+
+    def get_vol_threshold(self):
+        """Return the initial volume threshold used to search for silences."""
+        return self._vol_threshold
+
+    def get_effective_threshold(self):
+        """Return the current threshold, or 0 if not estimated yet."""
+        return self._threshold
+
+    def get_min_sil_dur(self):
+        return self._min_sil_dur
+
+    def get_min_ipu_dur(self):
+        return self._min_ipu_dur
+
+    def get_shift_start(self):
+        return self._shift_start
+
+    def get_shift_end(self):
+        return self._shift_end
+
+    def get_nframes(self):
+        """Return the number of frames of the stream given until now."""
+        return self._nframes
+
+    # -----------------------------------------------------------------------
+
+    def get_latency(self):
+        """Return the max delay between the end of an IPU and its result.
+
+        It's the duration of the audio to be given after the end of an
+        IPU until it is returned, except before the estimation of the first
+        threshold (after WARMUP_DUR seconds).
+
+        :returns: (float) Duration in seconds
+
+        """
+        return self._min_sil_dur + 4. * self._win_len
+
+    # -----------------------------------------------------------------------
+
+    def set_vol_threshold(self, vol_threshold):
+        """Fix the volume threshold, or 0 to estimate it on the history.
+
+        :param vol_threshold: (int) RMS value
+
+        """
+        self._vol_threshold = int(vol_threshold)
+        if self._vol_threshold < 0:
+            self._vol_threshold = SearchIPUs.DEFAULT_VOL_THRESHOLD
+        if self._vol_threshold > 0:
+            self._threshold = self._vol_threshold
+
+    # -----------------------------------------------------------------------
+
+    def set_min_sil(self, min_sil_dur):
+        """Fix the minimum duration of a silence.
+
+        :param min_sil_dur: (float) Duration in seconds.
+
+        """
+        self._min_sil_dur = max(float(min_sil_dur), SearchIPUs.MIN_SIL_DUR)
+
+    # -----------------------------------------------------------------------
+
+    def set_min_ipu(self, min_ipu_dur):
+        """Fix the minimum duration of an IPU.
+
+        :param min_ipu_dur: (float) Duration in seconds.
+
+        """
+        self._min_ipu_dur = max(float(min_ipu_dur), SearchIPUs.MIN_IPU_DUR)
+
+    # -----------------------------------------------------------------------
+
+    def set_shift_start(self, s):
+        """Fix the start boundary shift value.
+
+        :param s: (float) Duration in seconds.
+
+        """
+        s = float(s)
+        if -self._min_ipu_dur < s < self._min_sil_dur:
+            self._shift_start = s
+
+    # -----------------------------------------------------------------------
+
+    def set_shift_end(self, s):
+        """Fix the end boundary shift value.
+
+        :param s: (float) Duration in seconds.
+
+        """
+        s = float(s)
+        if -self._min_ipu_dur < s < self._min_sil_dur:
+            self._shift_end = s
+
+    # -----------------------------------------------------------------------
+    # Segmentation
+    # -----------------------------------------------------------------------
+
+    def process(self, frames):
+        """Append frames to the stream and return the IPUs found.
+
+        :param frames: (bytes) Frames of the stream, following the previous
+        ones
+        :returns: list of tuples (from_pos,to_pos) of the IPUs ending in
+        the previous frames, in the order of the stream
+
+        """
+        self._frames += bytes(frames)
+        self._nframes = self._frames_pos + len(self._frames) // self._sampwidth
+
+        tracks = list()
+        win_frames = int(self._win_len * self._framerate)
+        while (self._nwindows + 1) * win_frames <= self._nframes:
+            volume = self.__window_volume(self._nwindows * win_frames,
+                                          (self._nwindows + 1) * win_frames)
+            self.__append_volume(volume, tracks)
+
+        self.__forget_frames()
+        return tracks
+
+    # -----------------------------------------------------------------------
+
+    def flush(self):
+        """Return the IPUs of the end of the stream, then reset.
+
+        :returns: list of tuples (from_pos,to_pos)
+
+        """
+        tracks = list()
+        win_frames = int(self._win_len * self._framerate)
+        if self._nwindows * win_frames < self._nframes:
+            # The last window is shorter, and ignored if its volume is 0
+            volume = self.__window_volume(self._nwindows * win_frames,
+                                          self._nframes)
+            if volume > 0:
+                self.__append_volume(volume, tracks)
+
+        if self._threshold == 0 and len(self._history) > 0:
+            self.__update_threshold()
+            for volume in self._waiting:
+                self.__search(volume, tracks)
+            self._waiting = list()
+
+        # Last interval: a silence until the end of the stream
+        if self._run_begin is not None and self._run_found is False:
+            from_pos = int(self._run_begin * self._win_len * self._framerate)
+            if self.__is_silence(from_pos, self._nframes, final=True) is True:
+                self.__add_silence(tracks)
+
+        # Last track after the last silence
+        delta = int(self._min_ipu_dur * self._framerate)
+        if self._run_begin is not None and self._run_found is True:
+            self._track_begin = self._nframes
+        if self._nb_silences == 0:
+            if self._nframes > 0:
+                tracks.append((0, self._nframes))
+        elif (self._nframes - self._track_begin) >= delta:
+            tracks.append((int(self._track_begin), int(self._nframes)))
+
+        self.reset()
+        return tracks
+
+    # -----------------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------------
+
+    def __window_volume(self, from_pos, to_pos):
+        """Return the volume of the frames between two positions."""
+        begin = (from_pos - self._frames_pos) * self._sampwidth
+        end = (to_pos - self._frames_pos) * self._sampwidth
+        return sppasAudioFrames(self._frames[begin:end], self._sampwidth).rms()
+
+    # -----------------------------------------------------------------------
+
+    def __append_volume(self, volume, tracks):
+        """Search for IPUs with the volume of the next window."""
+        self._nwindows += 1
+        self._history.append(volume)
+
+        if self._vol_threshold == 0:
+            nb_windows = int(round(self.UPDATE_DUR / self._win_len))
+            if self._threshold == 0:
+                # the volumes are waiting for a first threshold
+                self._waiting.append(volume)
+                if self._nwindows * self._win_len < self.WARMUP_DUR:
+                    return
+                # Without estimation, the waiting volumes are all 0: they
+                # are searched anyway so that their frames are forgotten
+                self.__update_threshold()
+                for v in self._waiting:
+                    self.__search(v, tracks)
+                self._waiting = list()
+                return
+
+            elif self._nwindows % nb_windows == 0:
+                self.__update_threshold()
+
+        self.__search(volume, tracks)
+
+    # -----------------------------------------------------------------------
+
+    def __update_threshold(self):
+        """Estimate the threshold from the volumes of the history.
+
+        The threshold can't be estimated if all the volumes of the history
+        are 0, like at the beginning of a stream with a digital silence:
+        the current threshold is kept.
+
+        :returns: (bool) The threshold was estimated
+
+        """
+        history = self._history.copy()
+        if history.mean() == 0:
+            return False
+        self._threshold = sppasSilences.estimate_threshold(history)
+        return True
+
+    # -----------------------------------------------------------------------
+
+    def __search(self, volume, tracks):
+        """Compare the volume of the next window to the threshold.
+
+        :param volume: (int) Volume of the next window
+        :param tracks: (list) the tracks found are appended
+
+        """
+        if volume < max(1, self._threshold):
+            # It's a small enough volume to consider the window a silence
+            if self._run_begin is None:
+                self._run_begin = self._current
+                self._run_start = None
+                self._run_found = False
+            self._run_last = self._current
+            if self._run_found is False:
+                from_pos = int(self._run_begin * self._win_frames)
+                to_pos = int(self._run_last * self._win_frames)
+                if self.__is_silence(from_pos, to_pos) is True:
+                    self.__add_silence(tracks)
+
+        elif self._run_begin is not None:
+            # It's the first window of an IPU
+            # so the previous window was the end of a silence
+            if self._run_found is True:
+                self._track_begin = int(self._run_last * self._win_frames)
+            self._run_begin = None
+
+        self._current += 1
+
+    # -----------------------------------------------------------------------
+
+    def __is_silence(self, from_pos, to_pos, final=False):
+        """Return True if the current block of windows is a silence.
+
+        :param from_pos: (int) Position of the first frame of the block
+        :param to_pos: (int) Position of the end of the block
+        :param final: (bool) The block is at the end of the stream
+
+        """
+        framerate = float(self._framerate)
+        if float(to_pos - from_pos) / framerate <= 2. * self._win_len:
+            return False
+
+        if self._run_start is None:
+            self._run_start = self.__adjust_bound(from_pos, final)
+            if self._run_start is None:
+                return False
+
+        return float(to_pos - self._run_start) / framerate > self._min_sil_dur
+
+    # -----------------------------------------------------------------------
+
+    def __adjust_bound(self, pos, final=False):
+        """Return the adjusted position of the beginning of a silence.
+
+        :param pos: (int) Initial position of the silence
+        :param final: (bool) All the frames of the stream are known
+        :returns: (int) new position or None if more frames are needed
+
+        """
+        delta = int(1.5 * self._win_len * self._framerate)
+        start_pos = int(max(pos - delta, 0))
+        end_pos = start_pos + int(delta * 3)
+        if end_pos > self._nframes:
+            if final is False:
+                return None
+            end_pos = self._nframes
+
+        begin = (start_pos - self._frames_pos) * self._sampwidth
+        end = (end_pos - self._frames_pos) * self._sampwidth
+        channel = sppasChannel(self._framerate, self._sampwidth,
+                               self._frames[begin:end])
+        silences = sppasSilences(channel, self._win_len, self._vagueness)
+        adjusted = silences.adjust_bounds([pos - start_pos],
+                                          max(1, self._threshold),
+                                          direction=-1)
+        return start_pos + adjusted[0]
+
+    # -----------------------------------------------------------------------
+
+    def __add_silence(self, tracks):
+        """Add the current block of windows as a silence.
+
+        The track between the previous silence and this one is appended
+        to the tracks if it is long enough to be an IPU.
+
+        """
+        self._nb_silences += 1
+        self._run_found = True
+        if (self._run_start - self._track_begin) >= \
+                int(self._min_ipu_dur * self._framerate):
+            # Track is long enough to be considered an IPU.
+            # Apply the shift values
+            from_pos = max(self._track_begin -
+                           int(self._shift_start * self._framerate), 0)
+            to_pos = min(self._run_start +
+                         int(self._shift_end * self._framerate),
+                         self._nframes)
+            tracks.append((int(from_pos), int(to_pos)))
+
+    # -----------------------------------------------------------------------
+
+    def __forget_frames(self):
+        """Forget the frames which won't be used anymore."""
+        delta = int(1.5 * self._win_len * self._framerate)
+        if self._run_begin is not None and self._run_start is None:
+            # the beginning of the current silence has to be adjusted
+            keep = int(self._run_begin * self._win_frames)
+        else:
+            # the next window is perhaps the beginning of a silence
+            keep = int(self._current * self._win_frames)
+        keep -= delta + int(self._win_len * self._framerate)
+
+        if keep > self._frames_pos:
+            self._frames = self._frames[(keep - self._frames_pos) * self._sampwidth:]
+            self._frames_pos = keep
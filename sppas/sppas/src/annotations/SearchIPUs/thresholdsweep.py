@@ -0,0 +1,210 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    src.annotations.SearchIPUs.thresholdsweep.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+"""
+
+from .silences import sppasSilences
+
+# ---------------------------------------------------------------------------
+
+
+class sppasThresholdSweep(object):
+    """Search for tracks with many volume thresholds and durations.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2018  Brigitte Bigi
+
+    The tracks are the same as the ones of SearchIPUs.get_tracks(), but
+    the rms values are scanned only once. A boundary between two windows
+    is a transition between a silence and a track for all the thresholds
+    t such as: min(rms) < t <= max(rms) of the two windows. These
+    intervals are indexed in a tree which gives all the transitions of a
+    threshold without visiting the windows of the silences and of the
+    tracks. The rms values used to adjust the boundaries are estimated
+    only once for each boundary.
+
+    >>> sweep = sppasThresholdSweep(search_ipus)
+    >>> tracks = sweep.get_tracks(threshold, min_sil_dur=0.25, min_ipu_dur=0.3)
+
+    """
+
+    def __init__(self, silences):
+        """Create a sppasThresholdSweep instance.
+
+        :param silences: (sppasSilences) with the channel to search for tracks
+
+        """
+        channel = silences._channel
+        self._silences = silences
+        self._nframes = channel.get_nframes()
+        self._framerate = channel.get_framerate()
+
+        vol_stats = silences.get_volstats()
+        self._win_len = vol_stats.get_winlen()
+        self._volumes = vol_stats.volumes()
+
+        # Tree of the intervals of thresholds of each boundary.
+        # The leaf of the boundary i, between the windows i-1 and i,
+        # is at index size+i.
+        size = 1
+        while size < len(self._volumes):
+            size *= 2
+        self._size = size
+        self._min = [float("inf")] * (2 * size)
+        self._max = [float("-inf")] * (2 * size)
+        for i in range(1, len(self._volumes)):
+            v1 = self._volumes[i - 1]
+            v2 = self._volumes[i]
+            self._min[size + i] = min(v1, v2)
+            self._max[size + i] = max(v1, v2)
+        for node in range(size - 1, 0, -1):
+            self._min[node] = min(self._min[2 * node], self._min[2 * node + 1])
+            self._max[node] = max(self._max[2 * node], self._max[2 * node + 1])
+
+    # -----------------------------------------------------------------------
+
+    def get_transitions(self, threshold):
+        """Return the boundaries between a silence and a track.
+
+        :param threshold: (int) Expected minimum volume (rms value)
+        :returns: (list) sorted index of the first window after each boundary
+
+        """
+        transitions = list()
+        if len(self._volumes) < 2:
+            return transitions
+
+        # In a subtree, a window is a silence and another one is not:
+        # at least one of its boundaries is then a transition.
+        stack = [1]
+        while stack:
+            node = stack.pop()
+            if self._min[node] >= threshold or self._max[node] < threshold:
+                continue
+            if node >= self._size:
+                transitions.append(node - self._size)
+            else:
+                stack.append(2 * node + 1)
+                stack.append(2 * node)
+
+        return transitions
+
+    # -----------------------------------------------------------------------
+
+    def get_silences(self, threshold, min_sil_dur):
+        """Return the silences like sppasSilences.filter_silences() does.
+
+        :param threshold: (int) Expected minimum volume (rms value)
+        :param min_sil_dur: (float) Minimum silence duration in seconds
+        :returns: list of tuples (from_pos,to_pos)
+
+        """
+        if len(self._volumes) == 0:
+            return []
+
+        # Search for the blocks of windows with a volume lesser than threshold
+        nframes = self._win_len * self._framerate
+        silences = list()
+        inside = self._volumes[0] < threshold
+        idx_begin = 0
+        for i in self.get_transitions(threshold):
+            if inside is False:
+                idx_begin = i
+                inside = True
+            else:
+                silences.append((int(idx_begin * nframes), int((i - 1) * nframes)))
+                inside = False
+        if inside is True:
+            silences.append((int(idx_begin * self._win_len * self._framerate),
+                             self._nframes))
+
+        # Filter the very small blocks, adjust the boundaries, re-filter
+        silences = self.__filter(silences, 2. * self._silences._win_len)
+        starts = self._silences.adjust_bounds(
+            [from_pos for from_pos, _ in silences], threshold, direction=-1)
+        silences = [(from_pos, to_pos) for from_pos, (_, to_pos)
+                    in zip(starts, silences)]
+
+        return self.__filter(silences, min_sil_dur)
+
+    # -----------------------------------------------------------------------
+
+    def get_tracks(self, threshold, min_sil_dur, min_ipu_dur,
+                   shift_start=0., shift_end=0.):
+        """Return the tracks like SearchIPUs.get_tracks() does.
+
+        :param threshold: (int) Expected minimum volume (rms value)
+        If threshold is set to 0, fix_threshold_vol() will assign a value.
+        :param min_sil_dur: (float) Minimum silence duration in seconds
+        :param min_ipu_dur: (float) Minimum track duration in seconds
+        :param shift_start: (float) The time to remove to the start bound
+        :param shift_end: (float) The time to add to the end boundary
+        :returns: list of tuples (from_pos,to_pos)
+
+        """
+        if threshold == 0:
+            threshold = self._silences.fix_threshold_vol()
+
+        return sppasSilences.silences_to_tracks(
+            self.get_silences(threshold, min_sil_dur),
+            self._nframes, self._framerate,
+            min_ipu_dur, shift_start, shift_end)
+
+    # -----------------------------------------------------------------------
+
+    def count_tracks(self, thresholds, min_sil_dur, min_ipu_dur):
+        """Return the number of tracks found with each given threshold.
+
+        :param thresholds: (list of int) Volume thresholds
+        :param min_sil_dur: (float) Minimum silence duration in seconds
+        :param min_ipu_dur: (float) Minimum track duration in seconds
+        :returns: (list of int)
+
+        """
+        return [len(self.get_tracks(t, min_sil_dur, min_ipu_dur))
+                for t in thresholds]
+
+    # -----------------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------------
+
+    def __filter(self, silences, min_sil_dur):
+        """Return the silences during more than the given duration."""
+        framerate = float(self._framerate)
+        return [(start_pos, end_pos) for start_pos, end_pos in silences
+                if float(end_pos - start_pos) / framerate > min_sil_dur]
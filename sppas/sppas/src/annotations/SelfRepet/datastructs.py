@@ -35,6 +35,7 @@
 
 """
 import re
+from bisect import bisect_left
 
 from sppas import symbols
 from sppas import sppasUnicode
@@ -227,6 +228,12 @@ class DataSpeaker(object):
 
     Stored data are a list of formatted unicode strings.
 
+    The entries are indexed when the instance is created: the words are
+    known, each word is mapped to the sorted list of its positions and the
+    longest sequence of words repeated later on is known for each position.
+    Searching for a repeated word is then a bisection in a list of positions
+    instead of a scan of the entries.
+
     """
 
     def __init__(self, tokens):
@@ -239,6 +246,13 @@ class DataSpeaker(object):
         for tok in tokens:
             self.__entries.append(Entry(tok).get())
 
+        # Index of the entries
+        self.__words = list()
+        self.__positions = dict()
+        self.__next_word = list()
+        self.__repeated_until = list()
+        self.__create_index()
+
     # -----------------------------------------------------------------------
 
     def is_word(self, idx):
@@ -259,15 +273,7 @@ class DataSpeaker(object):
         if idx >= len(self.__entries):
             return False
 
-        # An empty string
-        if len(self.__entries[idx]) == 0:
-            return False
-
-        # Symbols used by SPPAS to represent an event
-        if self.__entries[idx] in symbols.all:
-            return False
-
-        return True
+        return self.__words[idx]
 
     # -----------------------------------------------------------------------
 
@@ -282,13 +288,34 @@ class DataSpeaker(object):
         # check if current is a correct value
         self.__get_entry(current)
 
-        # search for the next word after the current index
-        c_next = current + 1
-        while c_next < len(self.__entries):
-            if self.is_word(c_next) is True:
-                return c_next
-            c_next += 1
+        return self.__next_word[current]
+
+    # -----------------------------------------------------------------------
+
+    def get_word_positions(self, word):
+        """Return the sorted list of indexes of a word in entries.
+
+        :param word: (str) A formatted entry
+        :returns: (list) Indexes, or an empty list if word is not a word
+
+        """
+        return self.__positions.get(word, [])
+
+    # -----------------------------------------------------------------------
+
+    def get_repeated_until(self, current):
+        """Return the index of the last word of a self-repeated sequence.
+
+        The sequence starts at the given index and each of its entries is a
+        word which occurs again later on.
+
+        :param current: (int) Index of the first entry of the sequence
+        :returns: (int) Index of the last entry of the sequence or -1 if the
+        entry at the given index is not a repeated word.
 
+        """
+        if 0 <= current < len(self.__entries):
+            return self.__repeated_until[current]
         return -1
 
     # -----------------------------------------------------------------------
@@ -305,22 +332,68 @@ class DataSpeaker(object):
         # Does the current entry is a word?
         if self.is_word(current) is False:
             return -1
+        if other_current < 0:
+            return -1
 
         # Search for this word in the other speaker data
-        word = self.__entries[current]
-        while 0 <= other_current < len(other_speaker):
-            other_token = other_speaker[other_current]
-            if word == other_token:
-                return other_current
-            # not found. try next one
-            other_current = other_speaker.get_next_word(other_current)
+        positions = other_speaker.get_word_positions(self.__entries[current])
+        i = bisect_left(positions, other_current)
+        if i < len(positions):
+            return positions[i]
 
         return -1
 
+    # -----------------------------------------------------------------------
+
+    def get_repeats(self, current, other_current, other_speaker):
+        """Return all the echos of a word.
+
+        :param current: (int) From index, in current speaker
+        :param other_current: (int) From index, in the other speaker
+        :param other_speaker: (DataSpeaker) Data of the other speaker
+        :returns: (list) sorted indexes of the echos
+
+        """
+        if self.is_word(current) is False:
+            return []
+        if other_current < 0:
+            return []
+
+        positions = other_speaker.get_word_positions(self.__entries[current])
+        return positions[bisect_left(positions, other_current):]
+
     # -----------------------------------------------------------------------
     # Private
     # -----------------------------------------------------------------------
 
+    def __create_index(self):
+        """Index the words of the entries.
+
+        An empty entry is not a word and the symbols used by SPPAS to
+        represent an event (silences, laughs...) are not words.
+
+        """
+        for idx, entry in enumerate(self.__entries):
+            is_word = len(entry) > 0 and entry not in symbols.all
+            self.__words.append(is_word)
+            if is_word is True:
+                self.__positions.setdefault(entry, list()).append(idx)
+
+        nb = len(self.__entries)
+        self.__next_word = [-1] * nb
+        self.__repeated_until = [-1] * nb
+        next_word = -1
+        for idx in range(nb - 1, -1, -1):
+            self.__next_word[idx] = next_word
+            if self.__words[idx] is True:
+                positions = self.__positions[self.__entries[idx]]
+                if positions[-1] > idx:
+                    self.__repeated_until[idx] = idx
+                    if idx + 1 < nb and self.__repeated_until[idx + 1] != -1:
+                        self.__repeated_until[idx] = \
+                            self.__repeated_until[idx + 1]
+                next_word = idx
+
     def __get_entry(self, idx):
         """Return the formatted "token" at the given index.
 
@@ -98,21 +98,7 @@ class SelfRepetition(DataRepetition):
         :returns: (int) Index or -1
 
         """
-        last_token = -1
-        # Get the longest string
-        for current_token in range(current, len(speaker)):
-
-            next_word = speaker.get_next_word(current_token)
-            repet_idx = speaker.is_word_repeated(current_token,
-                                                 next_word, speaker)
-            if repet_idx > -1:
-                if repet_idx == current_token:
-                    return current_token
-                last_token = current_token
-            else:
-                break
-
-        return last_token
+        return speaker.get_repeated_until(current)
 
     # -----------------------------------------------------------------------
 
@@ -158,17 +144,8 @@ class SelfRepetition(DataRepetition):
         # Find all repeated tokens of each token of the source
         repeats = list()
 
-        ridx = 0
-        i = start
-        while i <= end:
-            repeats.append(list())
-            idx2 = speaker.is_word_repeated(i, end+1, speaker)
-
-            while idx2 != -1:
-                repeats[ridx].append(idx2)
-                idx2 = speaker.is_word_repeated(i, idx2+1, speaker)
-            i += 1
-            ridx += 1
+        for i in range(start, end+1):
+            repeats.append(speaker.get_repeats(i, end+1, speaker))
 
         # Filter the repetitions (try to get the longest sequence)
         if len(repeats) == 1:
@@ -186,27 +163,18 @@ class SelfRepetition(DataRepetition):
     def __get_longest_repeated(start, repeats):
         """Select the longest echo from start position in repeats."""
         path_repeats = []
-        for i in range(len(repeats[start])):
-            path_repeats.append([])
-            path_repeats[i].append(repeats[start][i])
-
-            for j in range(start+1, len(repeats)):
-                prec_value = path_repeats[-1][-1]
-                v = 0
-                if prec_value not in repeats[j]:
-                    if (prec_value+1) not in repeats[j]:
-                        if (prec_value+2) not in repeats[j]:
-                            if (prec_value-1) not in repeats[j]:
-                                break
-                            else:
-                                v = repeats[j].index(prec_value-1)
-                        else:
-                            v = repeats[j].index(prec_value+2)
-                    else:
-                        v = repeats[j].index(prec_value+1)
+        following = [set(r) for r in repeats[start+1:]]
+        for value in repeats[start]:
+            path = [value]
+            for positions in following:
+                prec_value = path[-1]
+                for shift in (0, 1, 2, -1):
+                    if (prec_value + shift) in positions:
+                        path.append(prec_value + shift)
+                        break
                 else:
-                    v = repeats[j].index(prec_value)
-                path_repeats[i].append(repeats[j][v])
+                    break
+            path_repeats.append(path)
 
         # return the (first of the) longest path:
         return sorted(max(path_repeats, key=lambda x: len(x)))
@@ -32,6 +32,8 @@
     ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 """
+from bisect import bisect_left
+
 from sppas import symbols
 from sppas import sppasRW
 from sppas import sppasTranscription
@@ -86,33 +88,32 @@ class sppasSelfRepet(sppasBaseRepet):
     # -----------------------------------------------------------------------
 
     @staticmethod
-    def __find_next_break(tier, start, span):
+    def __find_next_break(breaks, start, span, nb_tokens):
         """Return the index of the next interval representing a break.
 
         It depends on the 'span' value.
 
-        :param tier: (sppasTier)
+        :param breaks: (list) sorted indexes of the intervals with a break
         :param start: (int) the position of the token where the search will start
         :param span: (int)
+        :param nb_tokens: (int) number of intervals in the tier
         :returns: (int) index of the next interval corresponding to the span
 
         """
-        nb_breaks = 0
-        for i in range(start, len(tier)):
-            if tier[i].serialize_labels() == SIL_ORTHO:
-                nb_breaks += 1
-                if nb_breaks == span:
-                    return i
-        return len(tier) - 1
+        if span > 0:
+            i = bisect_left(breaks, start) + span - 1
+            if i < len(breaks):
+                return breaks[i]
+        return nb_tokens - 1
 
     # -----------------------------------------------------------------------
 
-    def __fix_indexes(self, tier, tok_start, shift):
+    def __fix_indexes(self, breaks, nb_tokens, tok_start, shift):
         tok_start += shift
         tok_search = sppasSelfRepet.__find_next_break(
-            tier, tok_start + 1, span=1)
+            breaks, tok_start + 1, 1, nb_tokens)
         tok_end = sppasSelfRepet.__find_next_break(
-            tier, tok_start + 1, span=self._options['span'])
+            breaks, tok_start + 1, self._options['span'], nb_tokens)
 
         return tok_start, tok_search, tok_end
 
@@ -132,16 +133,19 @@ class sppasSelfRepet(sppasBaseRepet):
         src_tier = sppasTier("SR-Source")
         echo_tier = sppasTier("SR-Echo")
 
+        # The labels and the positions of the breaks are known only once
+        labels = [ann.serialize_labels() for ann in tier]
+        breaks = [i for i, label in enumerate(labels) if label == SIL_ORTHO]
+
         # Initialization of the indexes to work with tokens
-        tok_start, tok_search, tok_end = self.__fix_indexes(tier, 0, 0)
+        tok_start, tok_search, tok_end = self.__fix_indexes(
+            breaks, len(labels), 0, 0)
 
         # Detection is here:
         while tok_start < tok_end:
 
             # Build an array with the tokens
-            tokens = [tier[i].serialize_labels()
-                      for i in range(tok_start, tok_end+1)]
-            speaker = DataSpeaker(tokens)
+            speaker = DataSpeaker(labels[tok_start:tok_end+1])
 
             # Detect the first self-repetition in these data
             limit = tok_search - tok_start
@@ -157,7 +161,7 @@ class sppasSelfRepet(sppasBaseRepet):
 
             # Fix indexes for the next search
             tok_start, tok_search, tok_end = self.__fix_indexes(
-                tier, tok_start, shift)
+                breaks, len(labels), tok_start, shift)
 
         return src_tier, echo_tier
 
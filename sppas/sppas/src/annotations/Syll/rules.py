@@ -73,6 +73,15 @@ class SyllRules(object):
         self.gap = dict()        # list of gap rules
         self.phonclass = dict()  # list of tuple (phoneme, classe)
 
+        # rules compiled into lookup tables
+        self.__class_ids = dict()      # phoneme: class identifier
+        self.__class_names = list()    # class identifier: class name
+        self.__general_sizes = dict()  # length of a sequence: boundary
+        self.__boundaries = dict()     # class identifiers: boundary
+        self.__gap_rules = dict()      # rule: (rank, shift)
+        self.__gap_tables = list()     # (length, positions, table)
+        self.__gaps = dict()           # phonemes: shift
+
         if filename is not None:
             self.load(filename)
         else:
@@ -99,6 +108,8 @@ class SyllRules(object):
         for phone in symbols.all:
             self.phonclass[phone] = SyllRules.BREAK_SYMBOL
 
+        self.compile()
+
     # ------------------------------------------------------------------------
 
     def load(self, filename):
@@ -133,6 +144,55 @@ class SyllRules(object):
                     s = " ".join(wds[1:6])
                     self.gap[s] = int(wds[6])
 
+        self.compile()
+
+    # ------------------------------------------------------------------------
+
+    def compile(self):
+        """Compile the rules into lookup tables.
+
+        Phonemes are mapped to integer class identifiers: the break is 0,
+        "V" is 1 and "W" is 2. The general rules are indexed by the length
+        of the sequence and the gap rules are indexed by their phonemes,
+        except the "ANY" ones. The boundaries and the gaps already found
+        are cached.
+
+        This method must be invoked if the rules are modified otherwise
+        than with load() or reset().
+
+        """
+        self.__class_names = [SyllRules.BREAK_SYMBOL, "V", "W"]
+        class_ids = dict((c, i) for i, c in enumerate(self.__class_names))
+        self.__class_ids = dict()
+        for phoneme, class_name in self.phonclass.items():
+            if class_name not in class_ids:
+                class_ids[class_name] = len(self.__class_names)
+                self.__class_names.append(class_name)
+            self.__class_ids[phoneme] = class_ids[class_name]
+
+        # the first rule of a given length is the one to be applied
+        self.__general_sizes = dict()
+        for key, val in self.general.items():
+            if len(key) not in self.__general_sizes:
+                self.__general_sizes[len(key)] = val
+        self.__boundaries = dict()
+
+        # the first gap rule matching the phonemes is the one to be applied
+        self.__gap_rules = dict()
+        tables = dict()
+        for rank, gp in enumerate(self.gap):
+            self.__gap_rules[gp] = (rank, self.gap[gp])
+            r = gp.split()
+            if gp.find("ANY") > -1 and gp == " ".join(r):
+                positions = tuple(i for i in range(len(r)) if r[i] != "ANY")
+                table = tables.setdefault((len(r), positions), dict())
+                key = tuple(r[i] for i in positions)
+                if key not in table:
+                    table[key] = (rank, self.gap[gp])
+        self.__gap_tables = [(size, positions, table)
+                             for (size, positions), table in tables.items()]
+        self.__gaps = dict()
+
     # ------------------------------------------------------------------------
 
     def get_class(self, phoneme):
@@ -148,6 +208,32 @@ class SyllRules(object):
 
     # ------------------------------------------------------------------------
 
+    def get_class_ids(self, phonemes):
+        """Return the class identifiers of a sequence of phonemes.
+
+        The identifier of the break is 0, the ones of the vowels "V" and "W"
+        are 1 and 2. Unknown phonemes are breaks.
+
+        :param phonemes: (list of str) Phonemes
+        :returns: (list of int)
+
+        """
+        get = self.__class_ids.get
+        return [get(p, 0) for p in phonemes]
+
+    # ------------------------------------------------------------------------
+
+    def get_class_name(self, class_id):
+        """Return the class name of a class identifier.
+
+        :param class_id: (int) Identifier returned by get_class_ids()
+        :returns: (str)
+
+        """
+        return self.__class_names[class_id]
+
+    # ------------------------------------------------------------------------
+
     def is_exception(self, rule):
         """Return True if the rule is an exception rule.
 
@@ -200,11 +286,24 @@ class SyllRules(object):
             return self.exception[classes]
 
         # search into general
-        for key, val in self.general.items():
-            if len(key) == len(classes):
-                return val
+        return self.__general_sizes.get(len(classes), 0)
+
+    # ------------------------------------------------------------------------
+
+    def get_class_ids_boundary(self, class_ids):
+        """Get the index of the syllable boundary (EXCRULES or GENRULES).
+
+        :param class_ids: (tuple of int) The class identifiers to syllabify
+        :returns: (int) boundary index or 0 if it does not match any rule.
+
+        """
+        boundary = self.__boundaries.get(class_ids, None)
+        if boundary is None:
+            classes = "".join(self.__class_names[c] for c in class_ids)
+            boundary = self.get_class_rules_boundary(classes)
+            self.__boundaries[class_ids] = boundary
 
-        return 0
+        return boundary
 
     # ------------------------------------------------------------------------
 
@@ -215,25 +314,19 @@ class SyllRules(object):
         :returns: (int) boundary shift
 
         """
-        for gp in self.gap:
-            if gp == phonemes:
-                return self.gap[gp]
-
-            # Search by replacing a phoneme by "ANY"
-            if gp.find("ANY") > -1:
-                r = gp.split()
-                phons = phonemes.split()
-                new_phonemes = ""
-                if len(r) == len(phons):
-                    # For each phoneme, replace the ANY
-                    for ph in range(len(r)):
-                        if r[ph] == "ANY":
-                            new_phonemes += "ANY "
-                        else:
-                            new_phonemes += phons[ph] + " "
-                    new_phonemes = new_phonemes.strip()
-
-                if gp == new_phonemes:
-                    return self.gap[gp]
-
-        return 0
+        gap = self.__gaps.get(phonemes, None)
+        if gap is None:
+            best = self.__gap_rules.get(phonemes, None)
+
+            # Search by replacing phonemes by "ANY"
+            phons = phonemes.split()
+            for size, positions, table in self.__gap_tables:
+                if size == len(phons):
+                    found = table.get(tuple(phons[i] for i in positions))
+                    if found is not None and (best is None or found < best):
+                        best = found
+
+            gap = 0 if best is None else best[1]
+            self.__gaps[phonemes] = gap
+
+        return gap
@@ -186,6 +186,8 @@ class sppasSyll(sppasBaseAnnotation):
         syllables = sppasTier("SyllAlign")
         syllables.set_meta('syllabification_of_tier', phonemes.get_name())
 
+        # get the indexes of the phonemes of each interval
+        bounds = list()
         for interval in intervals:
 
             # get the index of the phonemes containing the begin
@@ -204,17 +206,20 @@ class sppasSyll(sppasBaseAnnotation):
                     interval.get_highest_localization(),
                     bound=1)
 
-            # syllabify within the interval
             if start_phon_idx != -1 and end_phon_idx != -1:
-                self.syllabify_interval(phonemes,
-                                        start_phon_idx,
-                                        end_phon_idx,
-                                        syllables)
+                bounds.append((start_phon_idx, end_phon_idx))
             else:
                 self.logfile.print_message(
                     (info(1224, "annotations")).format(interval),
                     indent=2, status=annots.warning)
 
+        # syllabify all the intervals at once
+        labels = [ann.get_best_tag().get_typed_content() for ann in phonemes]
+        sequences = [labels[from_p:to_p+1] for from_p, to_p in bounds]
+        results = self.__syllabifier.annotate_batch(sequences)
+        for (from_p, to_p), p, s in zip(bounds, sequences, results):
+            self.__add_syllables(phonemes, from_p, p, s, syllables)
+
         return syllables
 
     # ----------------------------------------------------------------------
@@ -260,7 +265,22 @@ class sppasSyll(sppasBaseAnnotation):
         s = self.__syllabifier.annotate(p)
 
         # add the syllables into the tier
-        for i, syll in enumerate(s):
+        self.__add_syllables(phonemes, from_p, p, s, syllables)
+
+    # ----------------------------------------------------------------------
+
+    @staticmethod
+    def __add_syllables(phonemes, from_p, p, s, syllables):
+        """Add the syllables of one interval into the tier.
+
+        :param phonemes: (sppasTier)
+        :param from_p: (int) index of the first syllabified phoneme
+        :param p: (list of str) the syllabified phonemes
+        :param s: (list of tuples) the syllables of Syllabifier.annotate()
+        :param syllables: (sppasTier)
+
+        """
+        for syll in s:
             start_idx, end_idx = syll
 
             # create the location
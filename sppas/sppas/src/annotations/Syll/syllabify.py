@@ -74,30 +74,34 @@ class Syllabifier(object):
         :returns: list of tuples (begin index, end index)
 
         """
-        # Convert a list of phonemes into a list of classes.
-        classes = [self.rules.get_class(p) for p in phonemes]
+        # Convert a list of phonemes into a list of class identifiers, and
+        # index the next vowel and the next break from each position.
+        classes = self.rules.get_class_ids(phonemes)
+        next_vowel, next_break, prev_stop = Syllabifier._index_classes(classes)
         syllables = list()
 
         # Find the first vowel = first nucleus
-        nucleus = Syllabifier._fix_nucleus(classes, 0)
+        nucleus = next_vowel[0]
         if nucleus == -1:
             return list()
 
         end_syll = -1
         while nucleus != -1:
 
-            start_syll = self._fix_start_syll(classes, end_syll, nucleus)
-            next_nucleus = Syllabifier._find_next_vowel(classes, nucleus+1)
-            next_break = Syllabifier._find_next_break(classes, nucleus)
+            if end_syll == nucleus:
+                start_syll = nucleus
+            else:
+                start_syll = max(prev_stop[nucleus], end_syll) + 1
+            next_nucleus = next_vowel[nucleus+1]
+            next_b = next_break[nucleus]
 
-            if next_break != -1 and \
-                    (next_break < next_nucleus or next_nucleus == -1):
+            if next_b != -1 and (next_b < next_nucleus or next_nucleus == -1):
                 # no rule to apply if the next event is a break.
                 # ie next break occurs before next nucleus or
                 # no next nucleus
-                syllables.append((start_syll, next_break-1))
+                syllables.append((start_syll, next_b-1))
 
-            elif next_break == -1 and next_nucleus == -1:
+            elif next_b == -1 and next_nucleus == -1:
                 # no rule to apply if current nucleus concerns
                 # the last syllable
                 end_syll = len(phonemes) - 1
@@ -105,9 +109,8 @@ class Syllabifier(object):
 
             else:
                 # apply the exception rule or the general one
-                end_syll = self._apply_class_rules(classes,
-                                                   nucleus,
-                                                   next_nucleus)
+                end_syll = nucleus + self.rules.get_class_ids_boundary(
+                    tuple(classes[nucleus:next_nucleus+1]))
                 # apply the specific rules on phonemes to shift the end
                 end_syll = self._apply_phon_rules(phonemes,
                                                   end_syll,
@@ -121,6 +124,21 @@ class Syllabifier(object):
 
     # -----------------------------------------------------------------------
 
+    def annotate_batch(self, sequences):
+        """Return the syllable boundaries of several sequences of phonemes.
+
+        >>> Syllabifier("fra-config-file").annotate_batch([['a', 'p'], ['#']])
+        >>> [[(0, 1)], []]
+
+        :param sequences: (list of list) Sequences of phonemes, like the
+        phonemes of each IPU of a tier or of a corpus
+        :returns: list of the list of tuples (begin index, end index)
+
+        """
+        return [self.annotate(phonemes) for phonemes in sequences]
+
+    # -----------------------------------------------------------------------
+
     @staticmethod
     def phonetize_syllables(phonemes, syllables):
         """Return the phonetized sequence of syllables.
@@ -161,6 +179,34 @@ class Syllabifier(object):
     # Private
     # -----------------------------------------------------------------------
 
+    @staticmethod
+    def _index_classes(class_ids):
+        """Index the vowels and the breaks of a sequence of class identifiers.
+
+        :param class_ids: (list of int) Identifiers of SyllRules.get_class_ids()
+        :returns: 3 lists of the indexes, from each position of the sequence:
+
+            - the next vowel, this position included, or -1;
+            - the next break, this position included, or -1;
+            - the previous vowel or break, this position excluded, or -1.
+
+        """
+        nb = len(class_ids)
+        next_vowel = [-1] * (nb + 1)
+        next_break = [-1] * (nb + 1)
+        for i in range(nb-1, -1, -1):
+            c = class_ids[i]
+            next_vowel[i] = i if c in (1, 2) else next_vowel[i+1]
+            next_break[i] = i if c == 0 else next_break[i+1]
+
+        prev_stop = [-1] * (nb + 1)
+        for i in range(nb):
+            prev_stop[i+1] = i if class_ids[i] < 3 else prev_stop[i]
+
+        return next_vowel, next_break, prev_stop
+
+    # -----------------------------------------------------------------------
+
     @staticmethod
     def _fix_nucleus(classes, from_index):
         """Search for the next nucleus of a syllable."""
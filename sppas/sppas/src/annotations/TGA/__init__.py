@@ -55,9 +55,11 @@ See also: <http://wwwhomes.uni-bielefeld.de/gibbon/TGA/>
 
 """
 from .timegroupanalysis import TimeGroupAnalysis
+from .timegroupcolumns import TimeGroupColumns
 from .sppastga import sppasTGA
 
 __all__ = (
     "TimeGroupAnalysis",
+    "TimeGroupColumns",
     "sppasTGA"
 )
@@ -47,7 +47,7 @@ from ..searchtier import sppasFindTier
 from ..annotationsexc import AnnotationOptionError
 from ..annotationsexc import EmptyOutputError
 
-from .timegroupanalysis import TimeGroupAnalysis
+from .timegroupcolumns import TimeGroupColumns
 
 # ----------------------------------------------------------------------------
 
@@ -328,87 +328,88 @@ class sppasTGA(sppasBaseAnnotation):
         :returns: (sppasTranscription)
 
         """
-        trs_out = sppasTranscription("TimeGroupAnalyser")
+        return self.convert_tiers([syllables])[0]
 
-        # Create the time groups: intervals of consecutive syllables
-        timegroups = self.syllables_to_timegroups(syllables)
-        timegroups.set_meta('timegroups_of_tier', syllables.get_name())
-        trs_out.append(timegroups)
-
-        # Create the time segments
-        timesegs = self.syllables_to_timesegments(syllables)
-        trs_out.append(timesegs)
-        trs_out.add_hierarchy_link("TimeAssociation", timegroups, timesegs)
-
-        # Get the duration of each syllable, grouped into the timegroups
-        tg_dur = self.timegroups_to_durations(syllables, timegroups)
-        # here, we could add an option to add durations and
-        # delta durations into the transcription output
-
-        # Estimate TGA
-        ts = TimeGroupAnalysis(tg_dur)
-
-        # Put TGA non-optional results into tiers
-        tier = sppasTGA.tga_to_tier(ts.len(), timegroups, "TGA-Occurrences", "int")
-        trs_out.append(tier)
-        trs_out.add_hierarchy_link("TimeAssociation", timegroups, tier)
-
-        tier = sppasTGA.tga_to_tier(ts.total(), timegroups, "TGA-Total")
-        trs_out.append(tier)
-        trs_out.add_hierarchy_link("TimeAssociation", timegroups, tier)
-
-        tier = sppasTGA.tga_to_tier(ts.mean(), timegroups, "TGA-Mean")
-        trs_out.append(tier)
-        trs_out.add_hierarchy_link("TimeAssociation", timegroups, tier)
+    # ----------------------------------------------------------------------
 
-        tier = sppasTGA.tga_to_tier(ts.median(), timegroups, "TGA-Median")
-        trs_out.append(tier)
-        trs_out.add_hierarchy_link("TimeAssociation", timegroups, tier)
+    def convert_tiers(self, tiers):
+        """Estimate TGA on several tiers of syllables at once.
 
-        tier = sppasTGA.tga_to_tier(ts.stdev(), timegroups, "TGA-StdDev")
-        trs_out.append(tier)
-        trs_out.add_hierarchy_link("TimeAssociation", timegroups, tier)
+        The time groups of all the tiers are analyzed together: each TGA
+        estimator is evaluated only once for the whole set of tiers, for
+        example all the syllables of a corpus.
 
-        tier = sppasTGA.tga_to_tier(ts.nPVI(), timegroups, "TGA-nPVI")
-        trs_out.append(tier)
-        trs_out.add_hierarchy_link("TimeAssociation", timegroups, tier)
+        :param tiers: (list of sppasTier) Syllables
+        :returns: (list of sppasTranscription) The result of each tier
 
-        # Put TGA Intercept/Slope results
+        """
+        tgc = TimeGroupColumns()
+        all_timegroups = list()
+        offsets = [0]
+        for syllables in tiers:
+            # Create the time groups: intervals of consecutive syllables
+            timegroups = self.syllables_to_timegroups(syllables)
+            timegroups.set_meta('timegroups_of_tier', syllables.get_name())
+            all_timegroups.append(timegroups)
+
+            # Append the durations of the syllables of each timegroup
+            durations = self.timegroups_to_durations(syllables, timegroups)
+            for tg_label in durations:
+                tgc.append(tg_label, durations[tg_label])
+            offsets.append(len(tgc))
+
+        # Estimate TGA on all the timegroups at once
+        results = [
+            ("TGA-Occurrences", "int", tgc.len()),
+            ("TGA-Total", "float", tgc.total()),
+            ("TGA-Mean", "float", tgc.mean()),
+            ("TGA-Median", "float", tgc.median()),
+            ("TGA-StdDev", "float", tgc.stdev()),
+            ("TGA-nPVI", "float", tgc.nPVI())]
+        reglin = list()
         if self._options['original'] is True:
-            tier = sppasTGA.tga_to_tier_reglin(
-                ts.intercept_slope_original(),
-                timegroups,
-                True)
-            tier.set_name('TGA-Intercept_original')
-            trs_out.append(tier)
-            trs_out.add_hierarchy_link("TimeAssociation", timegroups, tier)
-
-            tier = sppasTGA.tga_to_tier_reglin(
-                ts.intercept_slope_original(),
-                timegroups,
-                False)
-            tier.set_name('TGA-slope_original')
-            trs_out.append(tier)
-            trs_out.add_hierarchy_link("TimeAssociation", timegroups, tier)
-
+            reglin.append(("original", tgc.intercept_slope_original()))
         if self._options['annotationpro'] is True:
-            tier = sppasTGA.tga_to_tier_reglin(
-                ts.intercept_slope(),
-                timegroups,
-                True)
-            tier.set_name('TGA-Intercept_timestamps')
-            trs_out.append(tier)
-            trs_out.add_hierarchy_link("TimeAssociation", timegroups, tier)
-
-            tier = sppasTGA.tga_to_tier_reglin(
-                ts.intercept_slope(),
-                timegroups,
-                False)
-            tier.set_name('TGA-slope_timestamps')
-            trs_out.append(tier)
-            trs_out.add_hierarchy_link("TimeAssociation", timegroups, tier)
-
-        return trs_out
+            reglin.append(("timestamps", tgc.intercept_slope()))
+
+        # Put TGA results of each tier into a transcription
+        trs = list()
+        for i, syllables in enumerate(tiers):
+            timegroups = all_timegroups[i]
+            trs_out = sppasTranscription("TimeGroupAnalyser")
+            trs_out.append(timegroups)
+
+            # Create the time segments
+            timesegs = self.syllables_to_timesegments(syllables)
+            trs_out.append(timesegs)
+            trs_out.add_hierarchy_link("TimeAssociation", timegroups, timesegs)
+
+            # The results of the timegroups of this tier
+            keys = tgc.get_keys()[offsets[i]:offsets[i+1]]
+
+            # Put TGA non-optional results into tiers
+            for tier_name, tag_type, values in results:
+                tier = sppasTGA.tga_to_tier(
+                    dict(zip(keys, values[offsets[i]:offsets[i+1]])),
+                    timegroups, tier_name, tag_type)
+                trs_out.append(tier)
+                trs_out.add_hierarchy_link("TimeAssociation", timegroups, tier)
+
+            # Put TGA Intercept/Slope results
+            for name, values in reglin:
+                tga_result = dict(zip(keys, values[offsets[i]:offsets[i+1]]))
+                for intercept, tier_name in ((True, 'TGA-Intercept_'),
+                                             (False, 'TGA-slope_')):
+                    tier = sppasTGA.tga_to_tier_reglin(
+                        tga_result, timegroups, intercept)
+                    tier.set_name(tier_name + name)
+                    trs_out.append(tier)
+                    trs_out.add_hierarchy_link(
+                        "TimeAssociation", timegroups, tier)
+
+            trs.append(trs_out)
+
+        return trs
 
     # ----------------------------------------------------------------------
     # Apply the annotation on one given file
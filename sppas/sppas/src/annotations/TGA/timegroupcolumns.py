@@ -0,0 +1,342 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    src.annotations.TGA.timegroupcolumns.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+"""
+import math
+
+from sppas.src.calculus.stats.central import fmedian
+
+# ----------------------------------------------------------------------------
+
+
+class TimeGroupColumns(object):
+    """Time Group Analyzer estimator on columns of values.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      contact@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+
+    The durations of all the time groups are stored in a single list and
+    the time groups are the offsets of their first and last values in this
+    list. Any number of time groups - for example all the time groups of a
+    corpus - can then be appended.
+
+    The sums needed by the estimators are accumulated in a single scan of
+    the values, group by group: sums of the durations and of their squares,
+    pairwise variability and sums of the regression lines. Each estimator
+    is then obtained from the sums of each group, except the median which
+    needs the values. Each estimator returns a list with the result of each
+    time group, in the order the time groups were appended. The results are
+    the ones of TimeGroupAnalysis, except for the rounding errors.
+
+    >>> tga = TimeGroupColumns()
+    >>> tga.append('tg1', [1.0, 1.2, 3.2, 4.1])
+    >>> tga.append('tg2', [2.9, 3.3, 3.6, 5.8])
+    >>> means = tga.mean()
+    >>> slopes = [s for i, s in tga.intercept_slope()]
+    >>> result = tga.to_dict(tga.nPVI())
+
+    """
+
+    def __init__(self, dict_items=None):
+        """Create a new TimeGroupColumns instance.
+
+        :param dict_items: (dict) a dict of a list of durations.
+
+        """
+        self._keys = list()
+        self._values = list()
+        self._offsets = [0]
+        self._sums = None
+
+        if dict_items is not None:
+            for key, values in dict_items.items():
+                self.append(key, values)
+
+    # -----------------------------------------------------------------------
+
+    def append(self, key, values):
+        """Append a time group.
+
+        :param key: (str) Name of the time group. It can be already used.
+        :param values: (list) Durations of the segments of the time group.
+
+        """
+        self._keys.append(key)
+        self._values.extend(values)
+        self._offsets.append(len(self._values))
+        self._sums = None
+
+    # -----------------------------------------------------------------------
+
+    def get_keys(self):
+        """Return the list of the names of the time groups."""
+        return self._keys
+
+    # -----------------------------------------------------------------------
+
+    def get_values(self, index):
+        """Return the durations of the time group at the given index.
+
+        :param index: (int)
+        :returns: (list)
+
+        """
+        return self._values[self._offsets[index]:self._offsets[index+1]]
+
+    # -----------------------------------------------------------------------
+
+    def to_dict(self, results):
+        """Return a dict of (key, result) of the results of an estimator.
+
+        If a key is used by several time groups, the last result is kept.
+
+        :param results: (list) Result of each time group.
+        :returns: (dict)
+
+        """
+        return dict(zip(self._keys, results))
+
+    # -----------------------------------------------------------------------
+    # Descriptive statistics
+    # -----------------------------------------------------------------------
+
+    def len(self):
+        """Estimate the number of occurrences of each time group."""
+        return [self._offsets[i+1] - self._offsets[i]
+                for i in range(len(self._keys))]
+
+    # -----------------------------------------------------------------------
+
+    def total(self):
+        """Estimate the sum of the durations of each time group."""
+        return [s[1] for s in self.__get_sums()]
+
+    # -----------------------------------------------------------------------
+
+    def min(self):
+        """Estimate the minimum duration of each time group."""
+        return [s[2] for s in self.__get_sums()]
+
+    # -----------------------------------------------------------------------
+
+    def max(self):
+        """Estimate the maximum duration of each time group."""
+        return [s[3] for s in self.__get_sums()]
+
+    # -----------------------------------------------------------------------
+
+    def mean(self):
+        """Estimate the arithmetic mean of the durations of each time group."""
+        return [s[1] / float(s[0]) if s[0] > 0 else 0.
+                for s in self.__get_sums()]
+
+    # -----------------------------------------------------------------------
+
+    def median(self):
+        """Estimate the 'middle' duration of each time group."""
+        return [fmedian(self.get_values(i)) for i in range(len(self._keys))]
+
+    # -----------------------------------------------------------------------
+
+    def variance(self):
+        """Estimate the variance of the durations of each time group.
+
+        The variance is estimated for a population (N for the denominator)
+        from the sums of the deviations to the first duration of the group
+        and of their squares.
+
+        """
+        results = list()
+        for s in self.__get_sums():
+            n = s[0]
+            if n < 2:
+                results.append(0.)
+            else:
+                results.append(max(0., (s[5] - s[4] * s[4] / n) / n))
+        return results
+
+    # -----------------------------------------------------------------------
+
+    def stdev(self):
+        """Estimate the standard deviation of each time group."""
+        return [math.sqrt(variance) for variance in self.variance()]
+
+    # -----------------------------------------------------------------------
+    # Specific estimators for speech rythm analysis
+    # -----------------------------------------------------------------------
+
+    def rPVI(self):
+        """Estimate the Raw Pairwise Variability Index of each time group."""
+        return [s[6] / (s[0] - 1) if s[0] > 1 else 0.
+                for s in self.__get_sums()]
+
+    # -----------------------------------------------------------------------
+
+    def nPVI(self):
+        """Estimate the Normalized Pairwise Variability Index of each time group."""
+        return [100. * s[7] / (s[0] - 1) if s[0] > 1 else 0.
+                for s in self.__get_sums()]
+
+    # -----------------------------------------------------------------------
+
+    def intercept_slope_original(self):
+        """Estimate the intercept like the original TGA of each time group.
+
+        The points (x,y) of a time group are:
+            - x is the position
+            - y is the duration
+
+        :returns: (list) (intercept, slope) of each time group
+
+        """
+        return [TimeGroupColumns.__linear_regression(s, s[8:11])
+                for s in self.__get_sums()]
+
+    # -----------------------------------------------------------------------
+
+    def intercept_slope(self):
+        """Estimate the intercept like AnnotationPro of each time group.
+
+        The points (x,y) of a time group are:
+            - x is the timestamps
+            - y is the duration
+
+        :returns: (list) (intercept, slope) of each time group
+
+        """
+        return [TimeGroupColumns.__linear_regression(s, s[11:14])
+                for s in self.__get_sums()]
+
+    # -----------------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------------
+
+    def __get_sums(self):
+        """Return the sums of each time group, accumulated in one scan.
+
+        The sums of a time group are: the number of values, their total,
+        min and max, the sums of the deviations to the first value and of
+        their squares, the sums of the rPVI and of the nPVI, and the sums
+        of x, x^2 and x*deviation with the positions then the timestamps
+        as x.
+
+        :returns: (list of tuples)
+
+        """
+        if self._sums is not None:
+            return self._sums
+
+        values = self._values
+        offsets = self._offsets
+        self._sums = list()
+        for i in range(len(self._keys)):
+            begin = offsets[i]
+            end = offsets[i+1]
+            if begin == end:
+                self._sums.append((0, 0., 0., 0.) + (0., ) * 10)
+                continue
+
+            y0 = values[begin]
+            total = vmin = vmax = y0
+            sum_d = sum_d2 = 0.
+            sum_r = sum_n = 0.
+            sum_p = sum_p2 = sum_pd = 0.
+            sum_t = sum_t2 = sum_td = 0.
+            timestamp = y0
+            for k in range(begin + 1, end):
+                y = values[k]
+                prev = values[k-1]
+                total += y
+                if y < vmin:
+                    vmin = y
+                elif y > vmax:
+                    vmax = y
+                d = y - y0
+                sum_d += d
+                sum_d2 += d * d
+                delta = math.fabs(prev - y)
+                sum_r += delta
+                sum_n += delta / ((prev + y) / 2.)
+                p = k - begin
+                sum_p += p
+                sum_p2 += p * p
+                sum_pd += p * d
+                sum_t += timestamp
+                sum_t2 += timestamp * timestamp
+                sum_td += timestamp * d
+                timestamp += y
+
+            self._sums.append((end - begin, total, vmin, vmax,
+                               sum_d, sum_d2, sum_r, sum_n,
+                               sum_p, sum_p2, sum_pd,
+                               sum_t, sum_t2, sum_td))
+
+        return self._sums
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __linear_regression(sums, x_sums):
+        """Linear regression as proposed in TGA, by Dafydd Gibbon.
+
+        :param sums: (tuple) Sums of a time group
+        :param x_sums: (tuple) Sums of x, x^2 and x*deviation of the group
+        :returns: intercept, slope
+
+        """
+        n = float(sums[0])
+        if n == 0:
+            return 0.
+
+        sum_x, sum_x2, sum_xd = x_sums
+        mean_x = sum_x / n
+        xy_sum = sum_xd - sum_x * sums[4] / n
+        xsq_sum = sum_x2 - sum_x * sum_x / n
+
+        m = xy_sum
+        if xsq_sum != 0:
+            m = xy_sum / xsq_sum
+        b = sums[1] / n - m * mean_x
+
+        return b, m
+
+    # -----------------------------------------------------------------------
+    # Overloads
+    # -----------------------------------------------------------------------
+
+    def __len__(self):
+        return len(self._keys)
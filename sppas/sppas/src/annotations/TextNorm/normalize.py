@@ -104,6 +104,7 @@ class TextNormalizer(object):
         if vocab is None:
             self.vocab = sppasVocabulary()
         self.num_dict = sppasDictRepl(None)
+        self._num2letter = None
 
         # members
         self.lang = lang
@@ -171,6 +172,7 @@ class TextNormalizer(object):
 
         """
         self.lang = lang
+        self._num2letter = None
 
     # -----------------------------------------------------------------------
 
@@ -181,8 +183,10 @@ class TextNormalizer(object):
 
         """
         self.num_dict = num_dict
+        self._num2letter = None
         try:
-            sppasNumConstructor.construct(self.lang, self.num_dict)
+            self._num2letter = sppasNumConstructor.construct(self.lang,
+                                                             self.num_dict)
             logging.info('Conversion of numbers enabled for language {:s}'
                          ''.format(self.lang))
         except Exception as e:
@@ -256,20 +260,15 @@ class TextNormalizer(object):
         :returns: (list)
 
         """
-        try:
-            num2letter = sppasNumConstructor.construct(self.lang, self.num_dict)
-        except:
-            return utt
+        if self._num2letter is None:
+            try:
+                self._num2letter = sppasNumConstructor.construct(self.lang,
+                                                                 self.num_dict)
+            except:
+                return utt
 
         try:
-            _result = list()
-            for token in utt:
-                if token.isdigit():
-                    _result.append(num2letter.convert(token))
-                else:
-                    _result.append(token)
-
-            return _result
+            return self._num2letter.convert_tokens(utt)
 
         except Exception as e:
             logging.error('Conversion of numbers disabled due to the '
@@ -342,8 +341,7 @@ class TextNormalizer(object):
         _str = sppasUnicode(entry).to_strip()
 
         # Remove UTF-8 specific characters that are not in our dictionaries!
-        for key in self.dicoutf:
-            _str = _str.replace(key, self.dicoutf.replace(key))
+        _str = self.dicoutf.replace_all(_str)
 
         # Clean the Enriched Orthographic Transcription
         ortho = sppasOrthoTranscription()
@@ -59,6 +59,37 @@ class sppasNumAsianType(sppasNumBase):
             if self._lang_dict.is_unk(str(i)):
                 raise sppasValueError(self._lang_dict, str(i))
 
+        # "wordified" numbers lower than 10000, indexed by their value
+        self._myriad_table = [None] * 10000
+
+    # ---------------------------------------------------------------------------
+
+    def _clear_cache(self):
+        """Forget all the already converted numbers."""
+        super(sppasNumAsianType, self)._clear_cache()
+        self._myriad_table = [None] * 10000
+
+    # ---------------------------------------------------------------------------
+
+    def _myriad(self, number):
+        """Return the "wordified" version of a number lower than 10000.
+
+        The asian numbers are made of groups of 4 digits: each group is
+        converted only once, then it is taken from a table.
+
+        :param number: (int) number to convert in word
+        :returns: (str)
+
+        """
+        if number >= 10000:
+            return self._thousands(number)
+
+        word = self._myriad_table[number]
+        if word is None:
+            word = self._thousands(number)
+            self._myriad_table[number] = word
+        return word
+
     # ---------------------------------------------------------------------------
 
     def _tenth_of_thousands(self, number):
@@ -72,11 +103,11 @@ class sppasNumAsianType(sppasNumBase):
 
         """
         if number < 10000:
-            return self._thousands(number)
+            return self._myriad(number)
         else:
             mult = None
             if int(number/10000)*10000 != 10000:
-                mult = self._thousands(int(number/10000))
+                mult = self._myriad(int(number/10000))
 
             if mult is None:
                 if int(str(number)[1:]) == 0:
@@ -85,13 +116,13 @@ class sppasNumAsianType(sppasNumBase):
                 else:
                     return self._lang_dict['1'] \
                            + self._lang_dict['10000'] \
-                           + self._thousands(number % 10000)
+                           + self._myriad(number % 10000)
             else:
                 if int(str(number)[1:]) == 0:
                     return mult + self._lang_dict['10000']
                 else:
                     return mult + self._lang_dict['10000'] \
-                           + self._thousands(number % 10000)
+                           + self._myriad(number % 10000)
 
     # ---------------------------------------------------------------------------
 
@@ -110,7 +141,7 @@ class sppasNumAsianType(sppasNumBase):
         else:
             mult = None
             if int(number/1000000000)*1000000000 != 1000000000:
-                mult = self._thousands(int(number/1000000000))
+                mult = self._myriad(int(number/1000000000))
 
             if mult is None:
                 if int(str(number)[1:]) == 0:
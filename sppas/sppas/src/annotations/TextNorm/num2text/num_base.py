@@ -31,6 +31,7 @@
 """
 
 from sppas import sppasValueError, sppasTypeError, sppasDictRepl
+from sppas.src.structs.lrucache import sppasLRUCache
 
 # ---------------------------------------------------------------------------
 
@@ -40,6 +41,9 @@ class sppasNumBase(object):
     ASIAN_TYPED_LANGUAGES = ("yue", "cmn", "jpn", "pcm")
     EUROPEAN_TYPED_LANGUAGES = ("fra", "ita", "eng", "spa", "pol", "por", "vie", "khm")
 
+    # Number of converted numbers kept in memory
+    CACHE_SIZE = 1024
+
     # ---------------------------------------------------------------------------
 
     def __init__(self, lang=None, dictionary=None):
@@ -77,6 +81,9 @@ class sppasNumBase(object):
 
             self._lang_dict = dictionary
 
+        self._cache = sppasLRUCache(sppasNumBase.CACHE_SIZE)
+        self._cache_version = self._lang_dict.get_version()
+
     # ---------------------------------------------------------------------------
 
     def get_lang(self):
@@ -99,11 +106,19 @@ class sppasNumBase(object):
         if lang in self.languages:
             self.__lang = lang
             self._lang_dict = sppasDictRepl(self.__lang)
+            self._clear_cache()
         else:
             raise sppasValueError(lang, str(self.languages))
 
     # ---------------------------------------------------------------------------
 
+    def _clear_cache(self):
+        """Forget all the already converted numbers."""
+        self._cache.clear()
+        self._cache_version = self._lang_dict.get_version()
+
+    # ---------------------------------------------------------------------------
+
     def _get_lang_dict(self):
         """Return the current language dictionary.
 
@@ -283,7 +298,8 @@ class sppasNumBase(object):
 
         Returns the entire number given in parameter in a "wordified" state
         it calls recursively the sub functions within the instance and more
-        specifics ones in the sub-classes
+        specifics ones in the sub-classes. The most recently converted
+        numbers are cached.
 
         :param number: (int) number to convert into word
         :returns: (str)
@@ -293,6 +309,48 @@ class sppasNumBase(object):
         if stringyfied_number.isdigit() is False:
             raise sppasValueError(number, "int")
 
+        if self._cache_version != self._lang_dict.get_version():
+            self._clear_cache()
+        res = self._cache.get(stringyfied_number)
+        if res is None:
+            res = self.__convert(stringyfied_number)
+            self._cache.set(stringyfied_number, res)
+
+        return res if res is not None else number
+
+    # ---------------------------------------------------------------------------
+
+    def convert_tokens(self, tokens):
+        """Return the list of tokens with their numbers "wordified".
+
+        Only the tokens made of digits are converted, each distinct one
+        only once, and the other ones are returned unchanged.
+
+        :param tokens: (list of str)
+        :returns: (list of str)
+
+        """
+        converted = dict()
+        result = list()
+        for token in tokens:
+            if token not in converted:
+                if token.isdigit():
+                    converted[token] = self.convert(token)
+                else:
+                    converted[token] = token
+            result.append(converted[token])
+
+        return result
+
+    # ---------------------------------------------------------------------------
+
+    def __convert(self, stringyfied_number):
+        """Return the "wordified" number, without using the cache.
+
+        :param stringyfied_number: (str) digits of the number to convert
+        :returns: (str)
+
+        """
         res = ''
         if len(stringyfied_number) > 1:
             if stringyfied_number.startswith('0'):
@@ -300,5 +358,5 @@ class sppasNumBase(object):
                     res += self._lang_dict['0'] + self.separator
                     stringyfied_number = stringyfied_number[1:]
 
-        res += self._billions(int(number))
-        return res if res is not None else number
+        res += self._billions(int(stringyfied_number))
+        return res
@@ -95,7 +95,7 @@ class sppasNumMandarinChinese(sppasNumAsianType):
         else:
             mult = None
             if int(number/1000000000)*1000000000 != 1000000000:
-                mult = self._thousands(int(number/1000000000))
+                mult = self._myriad(int(number/1000000000))
 
             if mult is None:
                 if int(str(number)[1:]) == 0:
@@ -116,38 +116,4 @@ class sppasSimpleSplitter(object):
         if sppasLangISO.without_whitespace(self.__lang) is True:
             s = self.split_characters(s)
 
-        toks = list()
-        for t in s.split():
-
-            # if not a phonetized entry
-            if t.startswith("/") is False and t.endswith("/") is False:
-
-                if sppasLangISO.without_whitespace(self.__lang) is False:
-                    # Split numbers if stick to characters
-                    # attention: do not replace [a-zA-Z] by [\w] (because \w includes numbers)
-                    # and not on Asian languages: it can be a tone!
-                    t = re.sub(u('([0-9])([a-zA-Z])'), u(r'\1 \2'), t)
-                    t = re.sub(u('([a-zA-Z])([0-9])'), u(r'\1 \2'), t)
-
-                # Split some punctuation
-                t = re.sub(u('\\[\\]'), u(r'\\] \\['), t)
-
-                # Split dots if stick to the beginning of a word
-                # info: a dot at the end of a word is analyzed by the tokenizer
-                t = re.sub(u(' \.([\w-])'), u(r' . \1'), t)
-                t = re.sub(u('^\.([\w-])'), u(r' . \1'), t)
-
-                # Split replacement characters
-                for r in self.__repl:
-                    if t.endswith(r):
-                        t = t[:-len(r)]
-                        t = t + ' ' + r
-
-            toks.append(t.strip())
-
-        # s = " ".join(toks)
-
-        # Then split each time there is a space and return result
-        # s = sppasUnicode(s).to_strip()
-
         return s.split()
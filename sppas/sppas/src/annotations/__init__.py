@@ -69,6 +69,7 @@ from .Activity import sppasActivity
 from .OtherRepet import sppasOtherRepet
 
 from .searchtier import sppasFindTier
+from .intervaltree import sppasIntervalTree
 from .param import sppasParam
 from .manager import sppasAnnotationsManager
 
@@ -88,6 +89,7 @@ __all__ = (
     'sppasActivity',
     'sppasOtherRepet',
     'sppasFindTier',
+    'sppasIntervalTree',
     'sppasParam',
     'sppasAnnotationsManager'
 )
@@ -0,0 +1,135 @@
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+
+    src.annotations.intervaltree.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+"""
+
+from bisect import bisect_left
+
+# ---------------------------------------------------------------------------
+
+
+class sppasIntervalTree(object):
+    """Search for the annotations overlapping a time interval.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+
+    The annotations are sorted by their lowest localization. A balanced
+    binary tree is stored into a list: each node stores the highest
+    localization of the annotations below it, so that the sub-trees
+    without any overlapping annotation are skipped. The tree is built in
+    O(n log n) and a search returning k annotations is in O((k+1) log n).
+
+    The localizations are compared with their midpoint values.
+
+    >>> tree = sppasIntervalTree(tier)
+    >>> tree.find(1.5, 2.5)
+    >>> tree.find(1.5, 2.5, delta=0.2)
+
+    """
+
+    def __init__(self, annotations=()):
+        """Create a sppasIntervalTree instance.
+
+        :param annotations: (iterable) sppasTier or list of sppasAnnotation
+
+        """
+        items = list()
+        for i, ann in enumerate(annotations):
+            items.append((ann.get_lowest_localization().get_midpoint(),
+                          ann.get_highest_localization().get_midpoint(),
+                          i, ann))
+        items.sort(key=lambda item: item[:3])
+
+        self.__begins = [item[0] for item in items]
+        self.__annotations = [item[3] for item in items]
+
+        # highest localization of the annotations of each node
+        size = 1
+        while size < len(items):
+            size *= 2
+        self.__size = size
+        self.__ends = [float("-inf")] * (2 * size)
+        for i, item in enumerate(items):
+            self.__ends[size + i] = item[1]
+        for node in range(size - 1, 0, -1):
+            self.__ends[node] = max(self.__ends[2 * node],
+                                    self.__ends[2 * node + 1])
+
+    # -----------------------------------------------------------------------
+
+    def find(self, begin, end, delta=0.):
+        """Return the annotations overlapping an interval.
+
+        An annotation is returned if it starts before end+delta and if it
+        ends after begin-delta: with delta=0., it is the overlapping of
+        sppasTier.find(). The annotations are sorted by their lowest
+        localization.
+
+        :param begin: (float) Begin value of the interval
+        :param end: (float) End value of the interval
+        :param delta: (float) Extension of the interval at both sides
+        :returns: list of sppasAnnotation
+
+        """
+        lower = begin - delta
+        upper = bisect_left(self.__begins, end + delta)
+
+        annotations = list()
+        if upper == 0 or self.__ends[1] <= lower:
+            return annotations
+
+        # explore the nodes from the left to the right
+        size = self.__size
+        nodes = [(1, 0, size)]
+        while nodes:
+            node, first, last = nodes.pop()
+            if first >= upper or self.__ends[node] <= lower:
+                continue
+            if node >= size:
+                annotations.append(self.__annotations[first])
+            else:
+                middle = (first + last) // 2
+                nodes.append((2 * node + 1, middle, last))
+                nodes.append((2 * node, first, middle))
+
+        return annotations
+
+    # -----------------------------------------------------------------------
+
+    def __len__(self):
+        return len(self.__annotations)
@@ -1,10 +1,59 @@
 # -*- coding: utf8 -*-
 
 import unittest
+import random
 
 from sppas.src.config import symbols
-from sppas.src.anndata import sppasTranscription
-from sppas.src.annotations.Activity.activity import sppasActivity
+from sppas.src.anndata import sppasTier
+from sppas.src.anndata import sppasLocation, sppasInterval, sppasPoint
+from sppas.src.anndata import sppasLabel, sppasTag
+from sppas.src.anndata.aio.aioutils import fill_gaps, unfill_gaps
+from sppas.src.annotations.Activity.activity import Activity
+
+# ---------------------------------------------------------------------------
+
+
+def get_tier_fill_gaps(activity, tokens_tier, tmin, tmax):
+    """Return the activity tier estimated on the tokens with fill_gaps()."""
+    new_tier = sppasTier('Activity')
+    current = "<INIT>"
+    if tokens_tier.is_empty():
+        return new_tier
+    tokens = fill_gaps(tokens_tier, tmin, tmax)
+
+    if len(tokens) == 1:
+        new_tier.create_annotation(
+            tokens[0].get_location().copy(),
+            sppasLabel(sppasTag(activity.fix_activity(tokens[0]))))
+        return new_tier
+
+    for ann in tokens:
+        new_activity = activity.fix_activity(ann)
+        if current != new_activity and current != "<INIT>":
+            if len(new_tier) == 0:
+                begin = tokens.get_first_point().copy()
+            else:
+                begin = new_tier.get_last_point().copy()
+            new_tier.create_annotation(
+                sppasLocation(sppasInterval(begin,
+                                            ann.get_lowest_localization())),
+                sppasLabel(sppasTag(current)))
+        current = new_activity
+
+    if len(new_tier) == 0:
+        new_tier.create_annotation(
+            sppasLocation(sppasInterval(tokens.get_first_point(),
+                                        tokens.get_last_point())),
+            sppasLabel(sppasTag(current)))
+    elif new_tier.get_last_point() < tokens.get_last_point():
+        new_tier.create_annotation(
+            sppasLocation(sppasInterval(new_tier.get_last_point(),
+                                        tokens.get_last_point())),
+            sppasLabel(sppasTag(current)))
+
+    new_tier = unfill_gaps(new_tier)
+    new_tier.set_name('Activity')
+    return new_tier
 
 # ---------------------------------------------------------------------------
 
@@ -17,10 +66,53 @@ class TestActivity(unittest.TestCase):
     def tearDown(self):
         pass
 
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def tokens(*intervals):
+        """Return a tier of tokens from tuples (begin, end, token)."""
+        tier = sppasTier('TokensAlign')
+        for begin, end, token in intervals:
+            label = None
+            if token is not None:
+                label = sppasLabel(sppasTag(token))
+            tier.create_annotation(
+                sppasLocation(sppasInterval(sppasPoint(begin),
+                                            sppasPoint(end))), label)
+        return tier
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def serialize(tier):
+        """Return the tuples (begin, end, activity) of an activity tier."""
+        result = list()
+        for ann in tier:
+            loc = ann.get_location().get_best()
+            if loc.is_point():
+                begin = end = loc.get_midpoint()
+            else:
+                begin = loc.get_begin().get_midpoint()
+                end = loc.get_end().get_midpoint()
+            result.append((begin, end, ann.serialize_labels()))
+        return result
+
+    # -----------------------------------------------------------------------
+
+    def assertSameTier(self, tier, tmin=None, tmax=None):
+        """Check the activity tier against the one of fill_gaps()."""
+        a = Activity()
+        expected = get_tier_fill_gaps(a, tier, tmin, tmax)
+        result = a.get_tier(tier, tmin, tmax)
+        self.assertEqual(self.serialize(expected), self.serialize(result))
+        return result
+
+    # -----------------------------------------------------------------------
+
     def test_create(self):
 
         # create an instance with the default symbols
-        a = sppasActivity()
+        a = Activity()
         for s in symbols.all:
             self.assertTrue(s in a)
         self.assertTrue(symbols.unk in a)
@@ -31,18 +123,75 @@ class TestActivity(unittest.TestCase):
             a.append_activity(s, symbols.all[s])
         self.assertEqual(len(a), len(symbols.all) + 1)
 
-    def test_get_tier(self):
-        a = sppasActivity()
-        trs = sppasTranscription()
+    # -----------------------------------------------------------------------
 
-        # No tokensTier
-        with self.assertRaises(IOError):
-            a.get_tier(trs)
+    def test_get_tier(self):
+        a = Activity()
 
         # Test with an empty Tokens tier
-        trs.create_tier('TokensAlign')
-        tier = a.get_tier(trs)
+        tier = a.get_tier(sppasTier('TokensAlign'), None, None)
         self.assertEqual(len(tier), 0)
 
-        # now, test with a real TokensTier
-        # ...
+        # A single token
+        tier = self.assertSameTier(self.tokens((1., 2., "hello")))
+        self.assertEqual([(1., 2., "speech")], self.serialize(tier))
+        tier = self.assertSameTier(self.tokens((1., 2., "#")))
+        self.assertEqual([(1., 2., "silence")], self.serialize(tier))
+
+        # Tokens without gaps
+        tokens = self.tokens((0., 1., "#"), (1., 2., "hello"),
+                             (2., 3., "world"), (3., 4., "@"),
+                             (4., 5., "#"))
+        tier = self.assertSameTier(tokens)
+        self.assertEqual([(0., 1., "silence"), (1., 3., "speech"),
+                          (3., 4., "laugh"), (4., 5., "silence")],
+                         self.serialize(tier))
+
+        # Tokens with gaps: the activity of a gap is unknown
+        tokens = self.tokens((0., 1., "#"), (1.5, 2., "hello"),
+                             (2., 3., "world"), (3.2, 4., "world"),
+                             (4., 5., None), (5., 6., "#"))
+        tier = self.assertSameTier(tokens)
+        self.assertEqual([(0., 1., "silence"), (1.5, 3., "speech"),
+                          (3.2, 4., "speech"), (5., 6., "silence")],
+                         self.serialize(tier))
+
+        # Gaps before tmin and after tmax
+        self.assertSameTier(tokens, sppasPoint(0.), sppasPoint(6.))
+        self.assertSameTier(tokens, sppasPoint(0.), sppasPoint(8.))
+        tier = self.assertSameTier(self.tokens((1., 2., "hello")),
+                                   sppasPoint(0.), sppasPoint(3.))
+        self.assertEqual([(1., 2., "speech")], self.serialize(tier))
+
+    # -----------------------------------------------------------------------
+
+    def test_get_tier_points(self):
+        tier = sppasTier('TokensAlign')
+        for t, token in ((1., "#"), (2., "hello"), (3., "world"),
+                         (4., "*"), (5., "#")):
+            tier.create_annotation(sppasLocation(sppasPoint(t)),
+                                   sppasLabel(sppasTag(token)))
+        self.assertSameTier(tier)
+        self.assertSameTier(tier, sppasPoint(0.), sppasPoint(6.))
+
+    # -----------------------------------------------------------------------
+
+    def test_get_tier_random(self):
+        """... the same tiers as with fill_gaps() on random tiers."""
+        random.seed(50)
+        tokens = ["#", "+", "*", "@", "dummy", "sil", "sp", "noise", "laugh",
+                  "a", "b", "c", "", None]
+        for i in range(300):
+            intervals = list()
+            t = random.choice((0., random.uniform(0., 1.)))
+            for j in range(random.randint(1, 30)):
+                if random.random() < 0.3:
+                    t += random.uniform(0.01, 0.5)
+                end = t + random.uniform(0.01, 0.5)
+                intervals.append((t, end, random.choice(tokens)))
+                t = end
+            tier = self.tokens(*intervals)
+            tmin = random.choice((None, sppasPoint(0.),
+                                  sppasPoint(intervals[0][0])))
+            tmax = random.choice((None, sppasPoint(t), sppasPoint(t + 1.)))
+            self.assertSameTier(tier, tmin, tmax)
@@ -0,0 +1,152 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    src.annotations.tests.test_intervaltree.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+    :summary:      Test the search of overlapping annotations.
+
+"""
+import unittest
+import random
+
+from sppas.src.anndata import sppasTier
+from sppas.src.anndata import sppasLocation, sppasInterval, sppasPoint
+from sppas.src.anndata import sppasLabel, sppasTag
+
+from ..intervaltree import sppasIntervalTree
+from ..ReOccurrences.reoccurrences import Reoccurences
+
+# ---------------------------------------------------------------------------
+
+
+def create_tier(intervals, name="tier"):
+    """Return a tier from a list of (begin, end, text)."""
+    tier = sppasTier(name)
+    for begin, end, text in intervals:
+        tier.create_annotation(
+            sppasLocation(sppasInterval(sppasPoint(begin), sppasPoint(end))),
+            sppasLabel(sppasTag(text)))
+    return tier
+
+# ---------------------------------------------------------------------------
+
+
+class TestIntervalTree(unittest.TestCase):
+    """Test of the search of the annotations overlapping an interval."""
+
+    def setUp(self):
+        self.tier = create_tier([(0., 1., "a"), (1., 2., "b"), (2., 3.5, "c"),
+                                 (4., 5., "d"), (5., 6., "e")])
+
+    # -----------------------------------------------------------------------
+
+    def test_find(self):
+        tree = sppasIntervalTree(self.tier)
+        self.assertEqual(5, len(tree))
+        self.assertEqual([], tree.find(-2., -1.))
+        self.assertEqual([], tree.find(7., 8.))
+        self.assertEqual([], tree.find(3.6, 3.9))
+        self.assertEqual([], tree.find(3.5, 4.))
+
+        # same as the overlaps of the tier
+        for begin, end in ((0., 6.), (0.5, 1.5), (1., 2.), (3., 4.5)):
+            self.assertEqual(
+                self.tier.find(sppasPoint(begin), sppasPoint(end)),
+                tree.find(begin, end))
+
+        # with a delta
+        self.assertEqual([self.tier[2], self.tier[3]],
+                         tree.find(3.6, 3.9, delta=0.2))
+        self.assertEqual([self.tier[3]], tree.find(3.65, 3.9, delta=0.11))
+
+    # -----------------------------------------------------------------------
+
+    def test_empty(self):
+        tree = sppasIntervalTree()
+        self.assertEqual(0, len(tree))
+        self.assertEqual([], tree.find(0., 10.))
+
+    # -----------------------------------------------------------------------
+
+    def test_random(self):
+        random.seed(12)
+        anns = list()
+        tier = sppasTier()
+        for i in range(300):
+            begin = random.uniform(0., 100.)
+            end = begin + random.expovariate(1.)
+            anns.append(tier.create_annotation(sppasLocation(
+                sppasInterval(sppasPoint(begin), sppasPoint(end)))))
+        tree = sppasIntervalTree(reversed(anns))
+
+        for i in range(100):
+            begin = random.uniform(-5., 105.)
+            end = begin + random.uniform(0., 3.)
+            delta = random.choice((0., 0.5))
+            expected = [a for a in tier
+                        if a.get_lowest_localization().get_midpoint() < end + delta
+                        and a.get_highest_localization().get_midpoint() > begin - delta]
+            self.assertEqual(expected, tree.find(begin, end, delta))
+
+# ---------------------------------------------------------------------------
+
+
+class TestReOccurrences(unittest.TestCase):
+    """Test of the search of the re-occurrences of annotations."""
+
+    def test_make_reoccurrences(self):
+        ref = create_tier([(0., 1., "le"), (1., 2., "chat"), (2., 3., "dort"),
+                           (5., 6., "chat")])
+        comp = create_tier([(0.5, 1.2, "chat"), (2.2, 2.5, "chat"),
+                            (3.3, 4., "dort"), (4., 5., "le")])
+
+        self.assertEqual({"chat"}, Reoccurences.get_tags(ref[1]))
+        tree = sppasIntervalTree(comp)
+        self.assertEqual([comp[0]],
+                         Reoccurences.find_reoccurrences(ref[1], tree))
+        self.assertEqual([comp[0], comp[1]],
+                         Reoccurences.find_reoccurrences(ref[1], tree, 0.5))
+
+        tier = Reoccurences.make_reoccurrences(ref, comp, 0.5)
+        self.assertEqual(2, len(tier))
+        self.assertEqual(ref[1].get_location(), tier[0].get_location())
+        self.assertEqual(2, tier[0].get_best_tag().get_typed_content())
+        self.assertEqual(ref[2].get_location(), tier[1].get_location())
+        self.assertEqual(1, tier[1].get_best_tag().get_typed_content())
+
+        tier = Reoccurences.make_reoccurrences(ref, comp, 3.5)
+        self.assertEqual(4, len(tier))
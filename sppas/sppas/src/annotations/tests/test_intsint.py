@@ -63,6 +63,34 @@ class TestIntsint(unittest.TestCase):
         with self.assertRaises(IOError):
             Intsint().annotate([(0.1, 240)])
 
+    def test_optimise(self):
+        intsint = Intsint()
+        intsint.annotate(self.anchors)
+        best = (intsint.best_mid, intsint.best_range, intsint.min_ss_error,
+                intsint.best_intsint, intsint.best_estimate)
+
+        # the errors of the best tones are the ones estimated by the tones
+        ss_error = 0.
+        for target, estimate in zip(intsint.targets, intsint.best_estimate):
+            ss_error += (estimate - target) * (estimate - target)
+        self.assertAlmostEqual(ss_error, intsint.min_ss_error)
+
+        # a search which can't reach the minimum error is stopped and it
+        # does not change the best tones
+        intsint.mid = intsint.best_mid + 0.1
+        intsint.min_ss_error = 0.
+        intsint.optimise(intsint.mid, intsint.best_range)
+        intsint.min_ss_error = best[2]
+        self.assertEqual(best, (intsint.best_mid, intsint.best_range,
+                                intsint.min_ss_error, intsint.best_intsint,
+                                intsint.best_estimate))
+
+        # the tones are estimated for all the anchors without a bound
+        intsint.min_ss_error = 32764
+        intsint.optimise(intsint.mid, intsint.best_range)
+        self.assertEqual(len(self.anchors), len(intsint.best_intsint))
+        self.assertEqual(intsint.best_mid, intsint.mid)
+
     def test_sppasintsint(self):
         si = sppasIntsint()
         # to be continued...
@@ -41,13 +41,30 @@
 
 """
 import unittest
+import os
+import shutil
 import struct
+import random
 
+from sppas.src.config import paths
+from sppas.src.files.fileutils import sppasFileUtils
+from sppas.src.anndata import sppasRW
 from sppas.src.annotations.SearchIPUs.silences import sppasSilences
+from sppas.src.annotations.SearchIPUs.searchipus import SearchIPUs
+from sppas.src.annotations.SearchIPUs.sppassearchipus import sppasSearchIPUs
+from sppas.src.annotations.SearchIPUs.streamingipus import sppasStreamingIPUs
+from sppas.src.annotations.SearchIPUs.thresholdsweep import sppasThresholdSweep
 from sppas.src.audiodata import sppasChannel
 
 # ---------------------------------------------------------------------------
 
+TEMP = sppasFileUtils().set_random()
+SAMPLES = [os.path.join(paths.samples, "samples-eng", "oriana1.wav"),
+           os.path.join(paths.samples, "samples-eng", "ENG_M15_ENG_T02.wav"),
+           os.path.join(paths.samples, "samples-fra", "F_F_B003-P8.wav")]
+
+# ---------------------------------------------------------------------------
+
 
 class TestSilences(unittest.TestCase):
     """Test the search of silences.
@@ -191,3 +208,247 @@ class TestSilences(unittest.TestCase):
 
 # ---------------------------------------------------------------------------
 
+# ---------------------------------------------------------------------------
+
+
+class TestThresholdSweep(unittest.TestCase):
+    """Test the search of tracks with many thresholds."""
+
+    def setUp(self):
+        # Bursts of noise of various amplitudes and durations
+        random.seed(10)
+        samples = list()
+        for i in range(60):
+            amplitude = random.choice((0, 0, 20, 300, 1000, 3000))
+            duration = random.randint(100, 4000)
+            samples.extend(random.randint(-amplitude, amplitude)
+                           for _ in range(duration))
+        frames = b''.join(struct.pack('<h', elem) for elem in samples)
+        self.channel = sppasChannel(framerate=8000, sampwidth=2, frames=frames)
+
+    # -----------------------------------------------------------------------
+
+    def test_transitions(self):
+        searcher = SearchIPUs(self.channel)
+        sweep = sppasThresholdSweep(searcher)
+        volumes = searcher.get_volstats().volumes()
+        for threshold in (1, 50, 200, 800, 2000, 10000):
+            expected = [i for i in range(1, len(volumes))
+                        if (volumes[i-1] < threshold) is not
+                        (volumes[i] < threshold)]
+            self.assertEqual(expected, sweep.get_transitions(threshold))
+
+    # -----------------------------------------------------------------------
+
+    def test_get_tracks(self):
+        """... tracks are the ones of SearchIPUs.get_tracks()."""
+        searcher = SearchIPUs(self.channel)
+        sweep = sppasThresholdSweep(searcher)
+        for threshold in (0, 10, 100, 200, 500, 900, 1500, 2500):
+            for min_sil, min_ipu in ((0.06, 0.06), (0.25, 0.3), (0.5, 0.1)):
+                searcher.set_vol_threshold(threshold)
+                searcher.set_min_sil(min_sil)
+                searcher.set_min_ipu(min_ipu)
+                self.assertEqual(
+                    searcher.get_tracks(),
+                    sweep.get_tracks(threshold, min_sil, min_ipu,
+                                     searcher.get_shift_start(),
+                                     searcher.get_shift_end()))
+
+        counts = sweep.count_tracks([100, 1500], 0.25, 0.3)
+        self.assertEqual(len(sweep.get_tracks(1500, 0.25, 0.3)), counts[1])
+
+    # -----------------------------------------------------------------------
+
+    def test_adjust_bounds(self):
+        """... the shared volumes are the ones of volumes_between()."""
+        for vagueness in (0.005, 0.0045):
+            silences = sppasSilences(self.channel, vagueness=vagueness)
+            volstats = silences.get_volstats()
+            positions = list(range(0, int(self.channel.get_nframes()), 37))
+            delta = int(1.5 * 0.02 * 8000)
+            shift = int(vagueness * 8000)
+            for threshold in (10, 400, 2000):
+                expected = list()
+                for pos in positions:
+                    start_pos = max(pos - delta, 0)
+                    volumes = volstats.volumes_between(
+                        start_pos, start_pos + delta * 3, vagueness)
+                    new_pos = pos
+                    for idx in range(len(volumes), 0, -1):
+                        if volumes[idx - 1] > threshold:
+                            new_pos = start_pos + idx * shift
+                            break
+                    expected.append(new_pos)
+                self.assertEqual(expected,
+                                 silences.adjust_bounds(positions, threshold, -1))
+
+# ---------------------------------------------------------------------------
+
+
+class TestSearchIPUsBatch(unittest.TestCase):
+    """Test the annotation of several files by several processes."""
+
+    def setUp(self):
+        os.mkdir(TEMP)
+        for dirname in ("seq", "par"):
+            os.mkdir(os.path.join(TEMP, dirname))
+            for filename in SAMPLES:
+                shutil.copy(filename, os.path.join(TEMP, dirname))
+
+    def tearDown(self):
+        shutil.rmtree(TEMP)
+
+    # -----------------------------------------------------------------------
+
+    def test_batch_processing(self):
+        """... the result is the one of the sequential processing."""
+        results = dict()
+        for dirname, nb_proc in (("seq", 1), ("par", 2)):
+            ann = sppasSearchIPUs()
+            ann.set_nb_proc(nb_proc)
+            self.assertEqual(nb_proc, ann.get_nb_proc())
+            files = [os.path.join(TEMP, dirname, os.path.basename(f))
+                     for f in SAMPLES]
+            out_names = ann.batch_processing(files, output_format=".xra")
+            self.assertEqual(len(SAMPLES), len(out_names))
+            results[dirname] = [sppasRW(f).read() for f in out_names]
+
+            # The existing results are not re-computed
+            self.assertEqual([], ann.batch_processing(files,
+                                                      output_format=".xra"))
+
+        for trs_seq, trs_par in zip(results["seq"], results["par"]):
+            tier_seq = trs_seq.find("IPUs")
+            tier_par = trs_par.find("IPUs")
+            self.assertEqual(len(tier_seq), len(tier_par))
+            for a1, a2 in zip(tier_seq, tier_par):
+                self.assertEqual(a1.get_location(), a2.get_location())
+                self.assertEqual(a1.get_labels(), a2.get_labels())
+            for key in ("number_of_ipus", "estimated_threshold_volume"):
+                self.assertEqual(tier_seq.get_meta(key), tier_par.get_meta(key))
+
+# ---------------------------------------------------------------------------
+
+
+class TestStreamingIPUs(unittest.TestCase):
+    """Test the search of IPUs in a stream."""
+
+    def setUp(self):
+        # Bursts of noise of various amplitudes and durations
+        random.seed(20)
+        samples = list()
+        for i in range(200):
+            amplitude = random.choice((0, 10, 20, 300, 1000, 3000))
+            duration = random.randint(100, 6000)
+            samples.extend(random.randint(-amplitude, amplitude)
+                           for _ in range(duration))
+        self.frames = b''.join(struct.pack('<h', elem) for elem in samples)
+        self.channel = sppasChannel(framerate=8000, sampwidth=2,
+                                    frames=self.frames)
+
+    # -----------------------------------------------------------------------
+
+    def stream(self, stream, block_size=0):
+        """Return the tracks of the frames given block by block."""
+        tracks = list()
+        pos = 0
+        while pos < len(self.frames):
+            size = block_size or random.randint(1, 3000)
+            tracks.extend(stream.process(self.frames[pos:pos + size * 2]))
+            pos += size * 2
+        tracks.extend(stream.flush())
+        return tracks
+
+    # -----------------------------------------------------------------------
+
+    def test_fixed_threshold(self):
+        """... tracks are the ones of SearchIPUs.get_tracks()."""
+        for threshold in (15, 100, 500, 900, 2000):
+            for min_sil, min_ipu in ((0.06, 0.06), (0.25, 0.3), (0.5, 0.1)):
+                searcher = SearchIPUs(self.channel)
+                searcher.set_vol_threshold(threshold)
+                searcher.set_min_sil(min_sil)
+                searcher.set_min_ipu(min_ipu)
+
+                stream = sppasStreamingIPUs(framerate=8000, sampwidth=2)
+                stream.set_vol_threshold(threshold)
+                stream.set_min_sil(min_sil)
+                stream.set_min_ipu(min_ipu)
+                self.assertEqual(searcher.get_tracks(), self.stream(stream))
+
+                # the stream was reset by flush
+                self.assertEqual(0, stream.get_nframes())
+                self.assertEqual(searcher.get_tracks(), self.stream(stream, 80))
+
+    # -----------------------------------------------------------------------
+
+    def test_estimated_threshold(self):
+        stream = sppasStreamingIPUs(framerate=8000, sampwidth=2)
+        self.assertEqual(0, stream.get_effective_threshold())
+        latency = int(stream.get_latency() * 8000)
+        tracks = list()
+        pos = 0
+        while pos < len(self.frames):
+            for track in stream.process(self.frames[pos:pos + 160]):
+                # IPUs are returned with a bounded latency
+                if stream.get_nframes() > stream.WARMUP_DUR * 8000 + latency:
+                    end = track[1] - int(stream.get_shift_end() * 8000)
+                    self.assertLessEqual(stream.get_nframes() - end, latency)
+                tracks.append(track)
+            pos += 160
+            # only a few seconds of frames are kept in memory
+            self.assertLess(len(stream._frames), 2 * 3 * 8000)
+        self.assertGreater(stream.get_effective_threshold(), 0)
+        tracks.extend(stream.flush())
+
+        self.assertGreater(len(tracks), 0)
+        for (b1, e1), (b2, e2) in zip(tracks, tracks[1:]):
+            self.assertLess(b1, e1)
+            self.assertLessEqual(b1, b2)
+        self.assertLessEqual(tracks[-1][1], len(self.frames) // 2)
+
+    # -----------------------------------------------------------------------
+
+    def test_estimated_threshold_digital_silence(self):
+        """... the threshold is estimated when the volume is not 0."""
+        silence = b'\x00\x00' * (3 * 8000)
+        self.frames = silence + self.frames
+        channel = sppasChannel(framerate=8000, sampwidth=2, frames=self.frames)
+        searcher = SearchIPUs(channel)
+        searcher.set_vol_threshold(0)
+        self.assertGreater(len(searcher.get_tracks()), 0)
+
+        stream = sppasStreamingIPUs(framerate=8000, sampwidth=2)
+        tracks = stream.process(silence)
+        self.assertEqual([], tracks)
+        self.assertEqual(0, stream.get_effective_threshold())
+        tracks = self.stream(stream, 160)
+        self.assertGreater(len(tracks), 0)
+        self.assertGreaterEqual(tracks[0][0], len(silence) // 2 - 8000)
+
+        # a stream with only a digital silence has no track, like with
+        # any fixed threshold
+        tracks = stream.process(silence)
+        tracks.extend(stream.flush())
+        self.assertEqual([], tracks)
+
+    # -----------------------------------------------------------------------
+
+    def test_estimated_threshold_memory(self):
+        """... a long digital silence is not kept in memory."""
+        stream = sppasStreamingIPUs(framerate=8000, sampwidth=2)
+        silence = b'\x00\x00' * 1600
+        for i in range(600):
+            self.assertEqual([], stream.process(silence))
+            self.assertLess(len(stream._frames), 2 * 3 * 8000)
+            self.assertLessEqual(len(stream._waiting),
+                                 stream.WARMUP_DUR / stream.get_win_length())
+        self.assertEqual(0, stream.get_effective_threshold())
+        self.assertEqual(len(stream._history),
+                         stream.HISTORY_DUR / stream.get_win_length())
+
+        # the IPUs after the silence are found
+        tracks = self.stream(stream, 160)
+        self.assertGreater(len(tracks), 0)
+        self.assertGreaterEqual(tracks[0][0], 600 * 1600 - 8000)
@@ -0,0 +1,158 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    src.annotations.tests.test_momel.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+    :summary:      Test Momel.
+
+"""
+import unittest
+import random
+
+from ..Momel.momel import Momel
+
+# ---------------------------------------------------------------------------
+
+
+def parabola(nb, top, x_top, a=-0.05):
+    return [top + a * (x - x_top) * (x - x_top) for x in range(nb)]
+
+# ---------------------------------------------------------------------------
+
+
+def cible_calcrgp(momel, ix):
+    """Return the target of a pitch value, estimated with calcrgp()."""
+    dpx = max(0, ix - int(momel.lfen1 / 2))
+    fpx = min(momel.nval, ix - int(momel.lfen1 / 2) + momel.lfen1 + 1)
+    pond = [1. if h > momel.SEUILV else 0. for h in momel.hzptr]
+    nsup = 0
+    nsupr = -1
+    while nsup > nsupr:
+        nsupr = nsup
+        nsup = 0
+        try:
+            momel.calcrgp(pond, dpx, fpx - 1)
+        except ValueError:
+            return 0., 0.
+        for x in range(dpx, fpx):
+            hzes = momel.a0 + (momel.a1 + momel.a2 * float(x)) * float(x)
+            if momel.hzptr[x] == 0. or hzes / momel.hzptr[x] > momel.maxec:
+                nsup += 1
+                pond[x] = 0.
+
+    if momel.a2 != 0.:
+        vxc = (0.0 - momel.a1) / (momel.a2 + momel.a2)
+        if ix - momel.lfen1 < vxc < ix + momel.lfen1:
+            vyc = momel.a0 + (momel.a1 + momel.a2 * vxc) * vxc
+            if momel.hzinf < vyc < momel.hzsup:
+                return vxc, vyc
+    return 0., 0.
+
+# ---------------------------------------------------------------------------
+
+
+class TestMomel(unittest.TestCase):
+
+    def test_calcrgp(self):
+        momel = Momel()
+        momel.set_pitch_array(parabola(40, 200., 20.))
+        momel.calcrgp([1.] * 40, 0, 39)
+        self.assertAlmostEqual(momel.a2, -0.05, places=6)
+        self.assertAlmostEqual(momel.a1, 2., places=4)
+        self.assertAlmostEqual(momel.a0, 180., places=3)
+
+        with self.assertRaises(ValueError):
+            momel.calcrgp([1., 1.] + [0.] * 38, 0, 39)
+
+    # -----------------------------------------------------------------------
+
+    def test_cible(self):
+        momel = Momel()
+        pitch = parabola(60, 220., 30.)
+        pitch[10] = 0.
+        momel.set_pitch_array(pitch)
+        momel.cible()
+        self.assertEqual(len(momel.cibx), 60)
+        self.assertEqual(len(momel.ciby), 60)
+        for ix in range(5, 55):
+            self.assertAlmostEqual(momel.cibx[ix], 30., places=4)
+            self.assertAlmostEqual(momel.ciby[ix], 220., places=4)
+
+        momel.set_pitch_array([])
+        with self.assertRaises(IOError):
+            momel.cible()
+
+    # -----------------------------------------------------------------------
+
+    def test_cible_long(self):
+        """... the targets of calcrgp(), even with large powers of x."""
+        random.seed(46)
+        pitch = list()
+        while len(pitch) < 12000:
+            top = random.uniform(120., 280.)
+            pitch.extend(parabola(random.randint(10, 80), top,
+                                  random.uniform(0., 40.),
+                                  random.uniform(-0.1, 0.1)))
+            pitch.extend([0.] * random.randint(0, 30))
+        pitch = [p + random.uniform(-5., 5.) if p > 0. else 0.
+                 for p in pitch]
+
+        momel = Momel()
+        momel.set_pitch_array(pitch)
+        momel.cible()
+        for ix in list(range(200)) + list(range(momel.nval - 1000,
+                                                momel.nval)):
+            self.assertEqual(cible_calcrgp(momel, ix),
+                             (momel.cibx[ix], momel.ciby[ix]))
+
+    # -----------------------------------------------------------------------
+
+    def test_annotate(self):
+        pitch = parabola(80, 180., 35.) + [0.] * 10 + parabola(80, 240., 40.)
+        anchors = Momel().annotate(list(pitch))
+        self.assertGreater(len(anchors), 1)
+        for i in range(1, len(anchors)):
+            self.assertGreater(anchors[i].x, anchors[i-1].x)
+
+        # annotate the IPUs of a batch with the same instance
+        momel = Momel()
+        result = momel.annotate_batch([pitch, [0.] * 50, pitch])
+        self.assertEqual(3, len(result))
+        self.assertEqual([], result[1])
+        for expected, batch in ((anchors, result[0]), (anchors, result[2])):
+            self.assertEqual([(a.x, a.y) for a in expected],
+                             [(a.x, a.y) for a in batch])
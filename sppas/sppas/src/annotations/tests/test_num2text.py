@@ -256,3 +256,51 @@ class TestNum2Text(unittest.TestCase):
         self.assertEqual(u('七千二百零四十五'), self.num_cmn.convert(7245))
         self.assertEqual(u('一百万二千八十二'), self.num_cmn.convert(1002082))
         self.assertEqual(u('十亿二千八十二'), self.num_cmn.convert(1000002082))
+
+# ---------------------------------------------------------------------------
+
+
+class TestNum2TextCache(unittest.TestCase):
+
+    def setUp(self):
+        self.dict_cmn = sppasDictRepl(os.path.join(paths.resources, 'num', 'cmn_num.repl'), nodump=True)
+        self.dict_fra = sppasDictRepl(os.path.join(paths.resources, 'num', 'fra_num.repl'), nodump=True)
+        self.num_cmn = sppasNumConstructor.construct('cmn', self.dict_cmn)
+        self.num_fra = sppasNumConstructor.construct('fra', self.dict_fra)
+
+    # -----------------------------------------------------------------------
+
+    def test_cache(self):
+        """... converted numbers are cached."""
+        self.assertEqual(u('七千二百零四十五'), self.num_cmn.convert(7245))
+        self.assertEqual(u('七千二百零四十五'), self.num_cmn.convert("7245"))
+        self.assertEqual(u('一百万二千八十二'), self.num_cmn.convert(1002082))
+        self.assertEqual(u('十亿二千八十二'), self.num_cmn.convert(1000002082))
+        self.assertEqual(u('十亿二千八十二'), self.num_cmn.convert(1000002082))
+
+        # same results with a fresh converter, i.e. an empty cache
+        num_cmn = sppasNumConstructor.construct('cmn', self.dict_cmn)
+        for i in (0, 7, 22, 462, 7245, 10000, 12345, 99999, 1002082):
+            self.assertEqual(num_cmn.convert(i), self.num_cmn.convert(i))
+            self.assertEqual(num_cmn.convert(i), self.num_cmn.convert(i))
+
+        # the cache is invalidated when the dictionary is modified
+        self.assertEqual(u('二十二'), self.num_cmn.convert(22))
+        self.dict_cmn.pop('20')
+        self.dict_cmn.add('20', u('廿'))
+        self.assertEqual(u('廿二'), self.num_cmn.convert(22))
+
+        with self.assertRaises(sppasValueError):
+            self.num_cmn.convert("12a")
+
+    # -----------------------------------------------------------------------
+
+    def test_convert_tokens(self):
+        """... convert only the tokens made of digits."""
+        self.assertEqual([], self.num_fra.convert_tokens([]))
+        self.assertEqual(
+            [u("il"), u("a"), u("vingt_quatre"), u("ans"), u("vingt_quatre"), u("1,5")],
+            self.num_fra.convert_tokens([u("il"), u("a"), u("24"), u("ans"), u("24"), u("1,5")]))
+        self.assertEqual(
+            [self.num_cmn.convert(i) for i in (3, 30, 462, 3)],
+            self.num_cmn.convert_tokens(["3", "30", "462", "3"]))
@@ -166,6 +166,29 @@ class TestDictPhon(unittest.TestCase):
 
     # -----------------------------------------------------------------------
 
+    def test_phonetize_many(self):
+        """... Phonetization of a list of utterances."""
+
+        utterances = ['a b a c', 'a b a c d', 'a + a', "gpd_4 a'b-a + c"]
+        expected = [self.grph.phonetize(u) for u in utterances]
+        self.assertEqual(expected, self.grph.phonetize_many(utterances))
+
+        # the phonetizations are cached and the cache is invalidated by
+        # changes of the dictionary
+        self.assertEqual("a b "+symbols.unk, self.grph.phonetize('a b d'))
+        self.dd.add_pron("d", "d")
+        self.assertEqual("a b d", self.grph.phonetize('a b d'))
+        self.assertEqual(["a b d", "a d"],
+                         self.grph.phonetize_many(['a b d', 'a d']))
+
+        # in parallel
+        utterances = ['a b d', 'c a', 'a-b', 'aa c'] * 1000
+        expected = ['a b d', 'c a', 'a-b', 'a-a c'] * 1000
+        self.assertEqual(expected,
+                         self.grph.phonetize_many(utterances, nb_proc=2))
+
+    # -----------------------------------------------------------------------
+
     def test_phonetize_with_map_table(self):
         """... Phonetization of an utterance if a sppasMapping() is fixed."""
 
@@ -295,6 +318,35 @@ class TestDAGPhon(unittest.TestCase):
         self.assertEqual(set(result.split("|")),
                          set(self.dd.decompose("p1 p2|x2 p3", "x1 x2 x3").split("|")))
 
+    # -----------------------------------------------------------------------
+
+    def test_kbest(self):
+        """... Paths of a lattice, the shortest first."""
+        lattice = sppasDAGPhonetizer.phon2lattice("p1 p2|x2-y2 p3|x3")
+        self.assertEqual([['p1'], ['p2', 'x2-y2'], ['p3', 'x3']], lattice)
+
+        paths = [p for c, i, p in sppasDAGPhonetizer.kbest(lattice)]
+        self.assertEqual(["p1-p2-p3", "p1-p2-x3", "p1-x2-y2-p3", "p1-x2-y2-x3"],
+                         paths)
+
+        # the generator is lazy: the first path of a huge lattice is immediate
+        lattice = sppasDAGPhonetizer.phon2lattice(" ".join(["a|b-c|d"] * 60))
+        cost, indexes, p = next(sppasDAGPhonetizer.kbest(lattice))
+        self.assertEqual(60, cost)
+        self.assertEqual("-".join(["a"] * 60), p)
+
+    # -----------------------------------------------------------------------
+
+    def test_variants(self):
+        """... Only the shortest variants are returned."""
+        self.dd.set_variants(1)
+        self.assertEqual("a-b", self.dd.decompose("a|c-d b", "e-f-g"))
+        self.dd.set_variants(2)
+        self.assertEqual("a-b|c-d-b", self.dd.decompose("a|c-d b", "e-f-g"))
+        self.assertEqual("a|b", self.dd.decompose("a", "b|a"))
+        self.dd.set_variants(4)
+        self.assertEqual(4, len(self.dd.decompose(" ".join(["a|b"] * 40)).split('|')))
+
 # ---------------------------------------------------------------------------
 
 
@@ -339,6 +391,37 @@ class TestPhonUnk(unittest.TestCase):
         self.assertEqual(set('a-b|aa-b'.split('|')),
                          set(self.p.get_phon('abd').split('|')))
 
+    # -----------------------------------------------------------------------
+
+    def test_cache(self):
+        """... Unknown entries are phonetized only once."""
+        self.assertEqual(self.p.get_phon('abc'), self.p.get_phon('abc'))
+        self.assertEqual(1, len(self.p._cache))
+        with self.assertRaises(Exception):
+            self.p.get_phon('ddd')
+        with self.assertRaises(Exception):
+            self.p.get_phon('ddd')
+        self.assertEqual(2, len(self.p._cache))
+
+        self.p.set_variants(1)
+        self.assertEqual(0, len(self.p._cache))
+        self.assertEqual('a-b-c', self.p.get_phon('abc'))
+
+    # -----------------------------------------------------------------------
+
+    def test_cache_dict_version(self):
+        """... Phonetizations are not re-used if the dictionary changed."""
+        pdict = sppasDictPron()
+        pdict.add_pron('a', 'a')
+        pdict.add_pron('b', 'b')
+        p = sppasPhonUnk(pdict)
+        self.assertEqual('a-b', p.get_phon('abz'))
+
+        pdict.add_pron('z', 'zz')
+        self.assertEqual('a-b-zz', p.get_phon('abz'))
+        self.assertEqual(sppasPhonUnk(pdict).get_phon('abz'),
+                         p.get_phon('abz'))
+
 
 # ---------------------------------------------------------------------------
 
@@ -178,6 +178,28 @@ class TestDataSpeaker(unittest.TestCase):
         d = DataSpeaker(["tok1", "tok2", "tok1"])
         self.assertEqual(d.is_word_repeated(0, 1, d), 2)
         self.assertEqual(d.is_word_repeated(1, 2, d), -1)
+        self.assertEqual(d.is_word_repeated(0, 3, d), -1)
+        self.assertEqual(d.is_word_repeated(0, -1, d), -1)
+
+    # -----------------------------------------------------------------------
+
+    def test_index(self):
+        d = DataSpeaker(["tok1", "tok2", "*", "tok1", "tok2", "tok3", "tok1"])
+        self.assertEqual(d.get_word_positions("tok1"), [0, 3, 6])
+        self.assertEqual(d.get_word_positions("*"), [])
+        self.assertEqual(d.get_word_positions("toto"), [])
+
+        self.assertEqual(d.get_repeats(0, 1, d), [3, 6])
+        self.assertEqual(d.get_repeats(0, 4, d), [6])
+        self.assertEqual(d.get_repeats(2, 0, d), [])
+        self.assertEqual(d.get_repeats(5, 0, d), [5])
+
+        self.assertEqual(d.get_repeated_until(0), 1)
+        self.assertEqual(d.get_repeated_until(1), 1)
+        self.assertEqual(d.get_repeated_until(2), -1)
+        self.assertEqual(d.get_repeated_until(3), 3)
+        self.assertEqual(d.get_repeated_until(4), -1)
+        self.assertEqual(d.get_repeated_until(7), -1)
 
 # ---------------------------------------------------------------------------
 
@@ -273,6 +273,39 @@ class TestSyllabifier(unittest.TestCase):
 
     # -----------------------------------------------------------------------
 
+    def test_compiled_rules(self):
+        rules = self.syll_fra.rules
+        ids = rules.get_class_ids(['a', 'p', 'j', '#', 'toto'])
+        self.assertEqual(1, ids[0])
+        self.assertEqual(0, ids[3])
+        self.assertEqual(0, ids[4])
+        self.assertEqual(['V', 'P', 'G', '#', '#'],
+                         [rules.get_class_name(c) for c in ids])
+
+        # exception rule, then general rules of the same length
+        vpgv = tuple(rules.get_class_ids(['a', 'p', 'j', 'a']))
+        self.assertEqual(0, rules.get_class_ids_boundary(vpgv))
+        vppv = tuple(rules.get_class_ids(['a', 'p', 't', 'a']))
+        self.assertEqual(1, rules.get_class_ids_boundary(vppv))
+        self.assertEqual(rules.get_class_rules_boundary("VPGV"),
+                         rules.get_class_ids_boundary(vpgv))
+
+        # gap rules, with and without ANY
+        for gp in rules.gap:
+            self.assertEqual(rules.gap[gp], rules.get_gap(gp))
+        self.assertEqual(0, rules.get_gap("ANY ANY V x y"))
+
+    # -----------------------------------------------------------------------
+
+    def test_annotate_batch(self):
+        ipus = [['a', 'p', 's', 'k', 'm', 'w', 'a'], ['#'], [],
+                ['g', 'j', 'i', 't', 'p', '#']]
+        self.assertEqual([self.syll_fra.annotate(p) for p in ipus],
+                         self.syll_fra.annotate_batch(ipus))
+        self.assertEqual([], self.syll_fra.annotate_batch([]))
+
+    # -----------------------------------------------------------------------
+
     def test_phonetize_syllables(self):
         phonemes = ['a', 'p', 's', 'k', 'm', 'w', 'a']
         syllables = self.syll_fra.annotate(phonemes)
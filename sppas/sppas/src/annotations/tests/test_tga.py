@@ -42,9 +42,11 @@
 """
 import unittest
 import os.path
+import random
 
 from ..TGA import sppasTGA
 from ..TGA import TimeGroupAnalysis
+from ..TGA import TimeGroupColumns
 from sppas.src.anndata import sppasRW
 from sppas.src.anndata import sppasTranscription
 from sppas.src.anndata import sppasTier
@@ -228,3 +230,99 @@ class TestTGA(unittest.TestCase):
         self.assertEqual(10, len(trs2))
 
         # we should test the content of the TGA result!
+
+# --------------------------------------------------------------------------
+
+
+class TestTimeGroupColumns(unittest.TestCase):
+    """Test of the class TimeGroupColumns.
+
+    """
+    def setUp(self):
+        path = os.path.join(DATA, "tga.TextGrid")
+        trs = sppasRW(path).read()
+        tier = trs.find('Syllables')
+        t = sppasTGA()
+        timegroups = t.syllables_to_timegroups(tier)
+        self.tg_dur = t.timegroups_to_durations(tier, timegroups)
+
+    # -----------------------------------------------------------------------
+
+    def test_append(self):
+        tgc = TimeGroupColumns()
+        self.assertEqual(0, len(tgc))
+        tgc.append("tg1", [0.1, 0.2, 0.3])
+        tgc.append("tg2", [0.3])
+        self.assertEqual(2, len(tgc))
+        self.assertEqual(["tg1", "tg2"], tgc.get_keys())
+        self.assertEqual([0.1, 0.2, 0.3], tgc.get_values(0))
+        self.assertEqual([0.3], tgc.get_values(1))
+        self.assertEqual([3, 1], tgc.len())
+        self.assertEqual({"tg1": 3, "tg2": 1}, tgc.to_dict(tgc.len()))
+        self.assertEqual([0.1, 0.3], tgc.min())
+        self.assertEqual([0.3, 0.3], tgc.max())
+        self.assertEqual([0., 0.], tgc.rPVI()[1:] + tgc.nPVI()[1:])
+        self.assertEqual((0.3, 0.), tgc.intercept_slope()[1])
+
+    # -----------------------------------------------------------------------
+
+    def test_same_as_analysis(self):
+        # the time groups of the sample, then random ones
+        random.seed(48)
+        tg_dur = dict(self.tg_dur)
+        for i in range(200):
+            tg_dur["rand_%d" % i] = [random.uniform(0.05, 0.6)
+                                     for _ in range(random.randint(1, 30))]
+
+        tga = TimeGroupAnalysis(tg_dur)
+        tgc = TimeGroupColumns(tg_dur)
+        self.assertEqual(len(tg_dur), len(tgc))
+        self.assertEqual(tga.len(), tgc.to_dict(tgc.len()))
+        self.assertEqual(tga.median(), tgc.to_dict(tgc.median()))
+
+        for estimator in ("total", "min", "max", "mean", "variance",
+                          "stdev", "rPVI", "nPVI"):
+            expected = getattr(tga, estimator)()
+            result = tgc.to_dict(getattr(tgc, estimator)())
+            for key in tg_dur:
+                self.assertAlmostEqual(expected[key], result[key], places=10,
+                                       msg=estimator)
+
+        for estimator in ("intercept_slope_original", "intercept_slope"):
+            expected = getattr(tga, estimator)()
+            result = tgc.to_dict(getattr(tgc, estimator)())
+            for key in tg_dur:
+                for v1, v2 in zip(expected[key], result[key]):
+                    self.assertAlmostEqual(v1, v2, places=10, msg=estimator)
+
+# --------------------------------------------------------------------------
+
+
+class TestConvertTiers(unittest.TestCase):
+    """Test of the TGA of several tiers at once.
+
+    """
+    def setUp(self):
+        path = os.path.join(DATA, "tga.TextGrid")
+        trs = sppasRW(path).read()
+        self.tier = trs.find('Syllables')
+
+    # -----------------------------------------------------------------------
+
+    def test_convert_tiers(self):
+        t = sppasTGA()
+        timegroups = t.syllables_to_timegroups(self.tier)
+        tga = TimeGroupAnalysis(t.timegroups_to_durations(self.tier,
+                                                           timegroups))
+        expected = tga.total()
+
+        results = t.convert_tiers([self.tier, self.tier])
+        self.assertEqual(2, len(results))
+        for trs in results:
+            self.assertEqual(len(t.convert(self.tier)), len(trs))
+            tier = trs.find('TGA-Total')
+            self.assertEqual(len(timegroups), len(tier))
+            for tg_ann, ann in zip(timegroups, tier):
+                self.assertEqual(
+                    round(expected[tg_ann.serialize_labels()], 5),
+                    ann.get_best_tag().get_typed_content())
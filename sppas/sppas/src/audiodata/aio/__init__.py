@@ -41,6 +41,7 @@ from sppas.src.utils.makeunicode import u
 
 from ..audiodataexc import AudioIOError
 from .audiofactory import sppasAudioFactory
+from .wavemmapio import WaveMMapIO
 
 # ----------------------------------------------------------------------------
 # Variables
@@ -90,6 +91,32 @@ def open(filename):
 # ----------------------------------------------------------------------------
 
 
+def open_mmap(filename):
+    """Open a Waveform Audio file with its data memory-mapped.
+
+    :param filename: (str) the file name (including path)
+    :raise: IOError, UnicodeError, Exception
+    :returns: WaveMMapIO()
+
+    >>> Open a long audio file and extract a fragment without loading it:
+    >>> audio = audiodata.aio.open_mmap(filename)
+    >>> audio.extract_channel(0)
+    >>> fragment = audio.get_channel(0).extract_fragment(begin, end)
+
+    """
+    aud = WaveMMapIO()
+    try:
+        aud.open(u(filename))
+    except IOError as e:
+        if isinstance(e, AudioIOError):
+            raise
+        raise AudioIOError(message=str(e), filename=None)
+
+    return aud
+
+# ----------------------------------------------------------------------------
+
+
 def save(filename, audio):
     """Write an audio file.
 
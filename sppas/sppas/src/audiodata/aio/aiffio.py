@@ -157,12 +157,8 @@ class AiffIO(sppasAudioPCM):
         else:
             self.verify_channels()
 
-            frames = b""
+            frames = b"".join(self.iter_channels_frames())
             sp = self._channels[0].get_sampwidth()
-            for i in range(0, self._channels[0].get_nframes()*sp, sp):
-                for j in range(len(self._channels)):
-                    fc = self._channels[j].get_frames()
-                    frames += fc[i:i+sp]
 
             f = aifc.open(filename, 'w')
             f.setnchannels(len(self._channels))
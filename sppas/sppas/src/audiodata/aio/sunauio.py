@@ -93,20 +93,13 @@ class SunauIO(sppasAudioPCM):
 
         else:
             self.verify_channels()
-
-            frames = b""
-            sp = self._channels[0].get_sampwidth()
-            for i in range(0, self._channels[0].get_nframes()*sp, sp):
-                for j in range(len(self._channels)):
-                    fc = self._channels[j].get_frames()
-                    frames += fc[i:i+sp]
-
             f = sunau.Au_write(filename)
             f.setnchannels(len(self._channels))
-            f.setsampwidth(sp)
+            f.setsampwidth(self._channels[0].get_sampwidth())
             f.setframerate(self._channels[0].get_framerate())
             try:
-                f.writeframes(frames)
+                for frames in self.iter_channels_frames():
+                    f.writeframes(frames)
             finally:
                 f.close()
 
@@ -100,18 +100,13 @@ class WaveIO(sppasAudioPCM):
 
         else:
             self.verify_channels()
-            sw = self._channels[0].get_sampwidth()
-            frames = b""
-            for i in range(0, self._channels[0].get_nframes()*sw, sw):
-                for j in range(len(self._channels)):
-                    frames += self._channels[j].get_frames(sw)
-
             f = wave.Wave_write(u(filename))
             f.setnchannels(len(self._channels))
             f.setsampwidth(self._channels[0].get_sampwidth())
             f.setframerate(self._channels[0].get_framerate())
             try:
-                f.writeframes(frames)
+                for frames in self.iter_channels_frames():
+                    f.writeframes(frames)
             finally:
                 f.close()
 
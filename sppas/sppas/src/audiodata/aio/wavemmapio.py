@@ -0,0 +1,300 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    src.audiodata.aio.wavemmapio.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+"""
+
+import mmap
+import struct
+
+from sppas.src.utils import u
+
+from ..audioframes import sppasAudioFrames
+from ..audiodataexc import AudioError
+from ..audiodataexc import AudioIOError
+from ..audiodataexc import AudioDataError
+from ..audiodataexc import ChannelIndexError
+from ..audiodataexc import IntervalError
+from ..channel import sppasChannel
+from .waveio import WaveIO
+
+# ---------------------------------------------------------------------------
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+# ---------------------------------------------------------------------------
+
+
+class sppasWaveMMap(object):
+    """A memory-mapped reader of the PCM data of a Waveform Audio File.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2018  Brigitte Bigi
+
+    It has the same methods as the Wave_read() of the wave library, and it
+    can also return frames as views on the mapped file. The file is mapped
+    read-only: the system shares its pages between all the processes which
+    are reading it.
+
+    """
+
+    def __init__(self, filename):
+        """Memory-map a wave file.
+
+        :param filename: (str) input file name.
+        :raises: AudioIOError
+
+        """
+        self._mmap = None
+        self._data = memoryview(b"")
+        self._pos = 0
+
+        with open(filename, "rb") as fp:
+            try:
+                self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # an empty file can't be mapped
+                raise AudioIOError(message="Malformed file", filename=filename)
+
+        try:
+            self.__parse(filename)
+        except:
+            self.close()
+            raise
+
+    # -----------------------------------------------------------------------
+
+    def __parse(self, filename):
+        """Read the header and set a view on the data chunk."""
+        m = self._mmap
+        if len(m) < 12 or m[0:4] != b"RIFF" or m[8:12] != b"WAVE":
+            raise AudioIOError(message="Not a RIFF/WAVE file", filename=filename)
+
+        fmt = None
+        pos = 12
+        while pos + 8 <= len(m):
+            chunk_id = m[pos:pos+4]
+            chunk_size = struct.unpack("<I", m[pos+4:pos+8])[0]
+            pos += 8
+            if chunk_id == b"fmt ":
+                fmt = m[pos:pos+chunk_size]
+            elif chunk_id == b"data":
+                if fmt is None:
+                    break
+                self.__set_format(fmt, filename)
+                end = min(pos + chunk_size, len(m))
+                end -= (end - pos) % (self._sampwidth * self._nchannels)
+                self._data = memoryview(m)[pos:end]
+                return
+            # chunks are word-aligned
+            pos += chunk_size + (chunk_size % 2)
+
+        raise AudioIOError(message="Malformed file", filename=filename)
+
+    # -----------------------------------------------------------------------
+
+    def __set_format(self, fmt, filename):
+        """Set the audio parameters from the content of the fmt chunk."""
+        if len(fmt) < 16:
+            raise AudioIOError(message="Malformed file", filename=filename)
+        (audio_format, nchannels, framerate, _, _, bits) = \
+            struct.unpack("<HHIIHH", fmt[:16])
+        if audio_format == WAVE_FORMAT_EXTENSIBLE and len(fmt) >= 26:
+            audio_format = struct.unpack("<H", fmt[24:26])[0]
+        if audio_format != WAVE_FORMAT_PCM:
+            raise AudioIOError(message="Not a PCM file", filename=filename)
+        if nchannels == 0:
+            raise AudioDataError(filename)
+
+        self._nchannels = nchannels
+        self._framerate = framerate
+        self._sampwidth = (bits + 7) // 8
+
+    # -----------------------------------------------------------------------
+    # Getters, like Wave_read
+    # -----------------------------------------------------------------------
+
+    def getnchannels(self):
+        return self._nchannels
+
+    def getsampwidth(self):
+        return self._sampwidth
+
+    def getframerate(self):
+        return self._framerate
+
+    def getnframes(self):
+        return len(self._data) // (self._sampwidth * self._nchannels)
+
+    # -----------------------------------------------------------------------
+    # Position, like Wave_read
+    # -----------------------------------------------------------------------
+
+    def tell(self):
+        return self._pos
+
+    def rewind(self):
+        self._pos = 0
+
+    def setpos(self, pos):
+        if pos < 0 or pos > self.getnframes():
+            raise IntervalError(pos, self.getnframes())
+        self._pos = pos
+
+    # -----------------------------------------------------------------------
+    # Read frames
+    # -----------------------------------------------------------------------
+
+    def readframes(self, nframes):
+        """Read and return at most n frames, as a bytes object.
+
+        :param nframes: (int) the number of frames to read
+        :returns: (str) frames
+
+        """
+        view = self.get_view(self._pos, self._pos + int(nframes))
+        self._pos += len(view) // (self._sampwidth * self._nchannels)
+        return view.tobytes()
+
+    # -----------------------------------------------------------------------
+
+    def get_view(self, begin=0, end=None):
+        """Return the frames between two positions without copying them.
+
+        :param begin: (int) position of the first frame
+        :param end: (int) position after the last frame, or None
+        :returns: (memoryview) interleaved frames
+
+        """
+        framesize = self._sampwidth * self._nchannels
+        if end is None:
+            end = self.getnframes()
+        begin = max(0, int(begin))
+        end = min(self.getnframes(), int(end))
+        if begin > end:
+            raise IntervalError(begin, end)
+        return self._data[begin*framesize:end*framesize]
+
+    # -----------------------------------------------------------------------
+
+    def close(self):
+        """Release the mapped file.
+
+        The mapping remains valid while channels are viewing it: it will
+        then be released with the last view.
+
+        """
+        self._data.release()
+        self._data = memoryview(b"")
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass
+            self._mmap = None
+
+# ---------------------------------------------------------------------------
+
+
+class WaveMMapIO(WaveIO):
+    """A memory-mapped wave file open/save sppasAudioPCM class.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2018  Brigitte Bigi
+
+    The PCM data of the file is memory-mapped instead of being loaded.
+    The frames of the extracted channels of a mono file are views on the
+    mapped file, so extracting fragments or getting chunks of frames of
+    these channels doesn't copy any data. The channels of a multi-channels
+    file are de-interleaved into memory.
+
+    """
+
+    def __init__(self):
+        """Constructor."""
+        super(WaveMMapIO, self).__init__()
+
+    # -----------------------------------------------------------------------
+
+    def open(self, filename):
+        """Memory-map a Waveform Audio File Format file.
+
+        :param filename (str) input file name.
+
+        """
+        self._audio_fp = sppasWaveMMap(u(filename))
+
+    # -----------------------------------------------------------------------
+
+    def extract_channel(self, index=0):
+        """Extract a channel from the mapped file.
+
+        :param index: (int) The index of the channel to extract
+        :returns: the index of the sppasChannel() in the list
+
+        """
+        if self._audio_fp is None:
+            raise AudioError
+
+        index = int(index)
+        if index < 0 or index >= self.get_nchannels():
+            raise ChannelIndexError(index)
+
+        a = sppasAudioFrames(self._audio_fp.get_view(),
+                             self.get_sampwidth(),
+                             self.get_nchannels())
+        frames = a.get_channel_frames(index)
+        if isinstance(frames, memoryview) is False:
+            frames = memoryview(frames)
+        channel = sppasChannel(self.get_framerate(),
+                               self.get_sampwidth(),
+                               frames)
+
+        return self.append_channel(channel)
+
+    # -----------------------------------------------------------------------
+
+    def extract_channels(self):
+        """Extract all channels from the mapped file."""
+        if self._audio_fp is None:
+            raise AudioError
+
+        for index in range(self.get_nchannels()):
+            self.extract_channel(index)
@@ -94,6 +94,9 @@ class sppasAudioPCM(object):
 
     """
 
+    # Number of frames of the blocks for streamed read/write
+    BLOCK_SIZE = 65536
+
     def __init__(self):
         """Create a new sppasAudioPCM instance."""
         super(sppasAudioPCM, self).__init__()
@@ -220,25 +223,13 @@ class sppasAudioPCM(object):
             raise ChannelIndexError(index)
 
         nc = self.get_nchannels()
-        self.seek(0)
-        data = self.read_frames(self.get_nframes())
-
         if nc == 0:
             raise AudioDataError
 
         if index+1 > nc:
             raise ChannelIndexError(index)
 
-        if nc == 1:
-            channel = sppasChannel(self.get_framerate(),
-                                   self.get_sampwidth(),
-                                   data)
-            return self.append_channel(channel)
-
-        frames = b""
-        sw = self.get_sampwidth()
-        for i in range(index*sw, len(data), nc*sw):
-            frames += data[i:i+sw]
+        frames = self.__read_channel(index)
         channel = sppasChannel(self.get_framerate(),
                                self.get_sampwidth(),
                                frames)
@@ -256,23 +247,67 @@ class sppasAudioPCM(object):
         if self._audio_fp is None:
             raise AudioError
 
-        nc = self.get_nchannels()
-        sw = self.get_sampwidth()
-        self.seek(0)
-        data = self.read_frames(self.get_nframes())
-
-        if nc == 0:
+        if self.get_nchannels() == 0:
             raise AudioDataError
 
-        for index in range(nc):
-            frames = b""
-            for i in range(index*sw, len(data), nc*sw):
-                frames = frames + data[i:i+sw]
+        for frames in self.__read_all_channels():
             channel = sppasChannel(self.get_framerate(),
                                    self.get_sampwidth(),
                                    frames)
             self.append_channel(channel)
 
+    # ----------------------------------------------------------------------
+
+    def __read_channel(self, index):
+        """Return the frames of a channel of the Audio File Pointer.
+
+        The file is read block by block and only the frames of the given
+        channel are de-interleaved.
+
+        :param index: (int) The index of the channel
+        :returns: (str)
+
+        """
+        nc = self.get_nchannels()
+        self.seek(0)
+        if nc == 1:
+            return self.read_frames(self.get_nframes())
+
+        blocks = list()
+        while True:
+            frames = self.read_frames(sppasAudioPCM.BLOCK_SIZE)
+            if len(frames) == 0:
+                break
+            a = sppasAudioFrames(frames, self.get_sampwidth(), nc)
+            blocks.append(a.get_channel_frames(index))
+
+        return b"".join(blocks)
+
+    # ----------------------------------------------------------------------
+
+    def __read_all_channels(self):
+        """Return the frames of each channel of the Audio File Pointer.
+
+        The file is read and de-interleaved block by block.
+
+        :returns: (list of str)
+
+        """
+        nc = self.get_nchannels()
+        self.seek(0)
+        if nc == 1:
+            return [self.read_frames(self.get_nframes())]
+
+        blocks = [list() for _ in range(nc)]
+        while True:
+            channels_frames = self.read_channels(sppasAudioPCM.BLOCK_SIZE)
+            if len(channels_frames[0]) == 0:
+                break
+            for i in range(nc):
+                blocks[i].append(channels_frames[i])
+
+        return [b"".join(b) for b in blocks]
+
     # ----------------------------------------------------------------------
     # Read content, for audiofp
     # ----------------------------------------------------------------------
@@ -315,6 +350,42 @@ class sppasAudioPCM(object):
                                                  self.get_sampwidth(),
                                                  self.get_nchannels())
 
+    # ----------------------------------------------------------------------
+
+    def read_channels(self, nframes):
+        """Read n frames from the audio file and de-interleave them.
+
+        Calling this method until it returns empty frames allows to
+        process the channels of a file which doesn't fit in memory.
+
+        :param nframes: (int) the number of frames to read
+        :returns: (list of str) frames of each channel
+
+        """
+        return sppasAudioFrames.deinterleave(self.read_frames(nframes),
+                                             self.get_sampwidth(),
+                                             self.get_nchannels())
+
+    # ----------------------------------------------------------------------
+
+    def iter_channels_frames(self, nframes=None):
+        """Iterate over the interleaved frames of the uploaded channels.
+
+        :param nframes: (int) number of frames of each block, or None
+        :returns: (str) interleaved frames of a block
+
+        """
+        if nframes is None:
+            nframes = sppasAudioPCM.BLOCK_SIZE
+        nframes = int(nframes)
+        sw = self._channels[0].get_sampwidth()
+        channels_frames = [c.get_frames() for c in self._channels]
+        total = min(len(f) for f in channels_frames)
+        for start in range(0, total, nframes*sw):
+            end = start + nframes*sw
+            yield sppasAudioFrames.interleave(
+                [f[start:end] for f in channels_frames], sw)
+
     # ----------------------------------------------------------------------
     # Getters, for audiofp
     # ----------------------------------------------------------------------
@@ -34,9 +34,11 @@
 
 """
 
-import struct
+import sys
 import math
+from array import array
 
+from .audioframes import sppasAudioFrames
 from .audiodataexc import SampleWidthError, ChannelIndexError
 
 # ---------------------------------------------------------------------------
@@ -73,15 +75,11 @@ class sppasAudioConverter(object):
         samples_width = int(samples_width)
 
         # Unpack to get all values, depending on the number of bytes of each value.
-        if samples_width == 4:
-            data = list(struct.unpack("<%ul" % (len(frames) / 4), frames))
-
-        elif samples_width == 2:
-            data = list(struct.unpack("<%uh" % (len(frames) / 2), frames))
+        if samples_width in (2, 4):
+            data = sppasAudioConverter.__frames2array(frames, samples_width)
 
         elif samples_width == 1:
-            tmp_data = struct.unpack("%uB" % len(frames), frames)
-            data = [s - 128 for s in tmp_data]
+            data = [s - 128 for s in bytearray(frames)]
 
         else:
             raise SampleWidthError(samples_width)
@@ -90,7 +88,7 @@ class sppasAudioConverter(object):
         if nchannels > 1:
             # Split channels
             for i in range(nchannels):
-                samples.append([data[j] for j in range(i, len(data), nchannels)])
+                samples.append(list(data[i::nchannels]))
         else:
             samples.append(list(data))
 
@@ -113,29 +111,47 @@ class sppasAudioConverter(object):
         nchannels = int(nchannels)
         if nchannels < 1:
             raise ChannelIndexError(nchannels)
+        if samples_width not in (1, 2, 4):
+            raise SampleWidthError(samples_width)
 
         nframes = len(samples[0])
-        frames = b""
-
-        if samples_width == 4:
-            for i in range(nframes):
-                for j in range(nchannels):
-                    frames += struct.pack("<l", samples[j][i])
-            return frames
-
-        if samples_width == 2:
-            for i in range(nframes):
-                for j in range(nchannels):
-                    frames += struct.pack("<h", samples[j][i])
-            return frames
-
-        if samples_width == 1:
-            for i in range(nframes):
-                for j in range(nchannels):
-                    frames += struct.pack("<b", samples[j][i])
-            return frames
-
-        raise SampleWidthError(samples_width)
+        typecode = sppasAudioFrames.get_typecode(samples_width)
+        if nchannels == 1:
+            data = array(typecode, samples[0])
+        else:
+            # Interleave channels
+            data = array(typecode, [0]) * (nframes * nchannels)
+            for j in range(nchannels):
+                data[j::nchannels] = array(typecode, samples[j][:nframes])
+
+        if sys.byteorder == "big":
+            data.byteswap()
+        try:
+            return data.tobytes()
+        except AttributeError:
+            # python 2
+            return data.tostring()
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __frames2array(frames, samples_width):
+        """Return the signed samples of little-endian frames.
+
+        :param frames: (str) Audio frames
+        :param samples_width: (int) 2 or 4
+        :returns: (array)
+
+        """
+        data = array(sppasAudioFrames.get_typecode(samples_width))
+        try:
+            data.frombytes(frames)
+        except AttributeError:
+            # python 2
+            data.fromstring(frames)
+        if sys.byteorder == "big":
+            data.byteswap()
+        return data
 
     # -----------------------------------------------------------------------
 
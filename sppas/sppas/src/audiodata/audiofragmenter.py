@@ -0,0 +1,243 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+    src.audiodata.audiofragmenter.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+"""
+import os
+from multiprocessing.pool import ThreadPool
+
+from sppas.src.utils import b
+from sppas.src.files.fileutils import sppasFileUtils
+
+from .aio import open as audio_open
+from .aio import get_extension
+from .aio.wavemmapio import sppasWaveMMap
+from .audiodataexc import IntervalError
+from .autils import open_audio_writer
+from .autils import convert_audio_file
+
+# ----------------------------------------------------------------------------
+
+
+class sppasAudioFragmenter(object):
+    """Write fragments of an audio file into separated audio files.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2018  Brigitte Bigi
+
+    The fragments are views on the memory-mapped data of the audio file:
+    they are not copied before being written. If a format is given, the
+    channel is converted once into a temporary file which is mapped, so
+    that fragments are cut exactly where they were cut from a converted
+    channel. The writes of the fragments are shared by a pool of threads.
+
+    >>> fragmenter = sppasAudioFragmenter(filename, framerate=16000)
+    >>> fragmenter.write_fragments([(0.5, 1.2), (1.5, 3.)],
+    >>>                            ["track_1.wav", "track_2.wav"])
+    >>> fragmenter.close()
+
+    """
+
+    NB_THREADS = 4
+
+    def __init__(self, input_audio, framerate=None, sampwidth=None,
+                 channel=None):
+        """Create a sppasAudioFragmenter instance.
+
+        :param input_audio: (str) Audio file name to cut
+        :param framerate: (int) Frame rate of the fragments, or None to keep
+        the one of the audio file
+        :param sampwidth: (int) Sample width of the fragments, or None to
+        keep the one of the audio file
+        :param channel: (int) Index of the channel to write, or None to
+        write all the channels of the audio file
+        :raises: AudioIOError, ChannelIndexError
+
+        """
+        self._converted = None
+        self._mmap = None
+
+        audio = audio_open(input_audio)
+        self._framerate = audio.get_framerate()
+        self._sampwidth = audio.get_sampwidth()
+        self._nchannels = audio.get_nchannels()
+
+        if framerate is None:
+            framerate = self._framerate
+        if sampwidth is None:
+            sampwidth = self._sampwidth
+        convert = framerate != self._framerate or \
+            sampwidth != self._sampwidth or \
+            (channel is not None and self._nchannels > 1)
+
+        if convert is True:
+            audio.close()
+            self._converted = sppasFileUtils().set_random() + ".wav"
+            convert_audio_file(input_audio, self._converted,
+                               framerate, sampwidth,
+                               0 if channel is None else channel)
+            input_audio = self._converted
+            self._framerate = framerate
+            self._sampwidth = sampwidth
+            self._nchannels = 1
+
+        if get_extension(input_audio).lower() in ("wav", "wave"):
+            if convert is False:
+                audio.close()
+            self._mmap = sppasWaveMMap(input_audio)
+            self._data = self._mmap.get_view()
+        else:
+            self._data = memoryview(audio.read_frames(audio.get_nframes()))
+            audio.close()
+
+    # -----------------------------------------------------------------------
+
+    def get_framerate(self):
+        """Return the frame rate of the fragments."""
+        return self._framerate
+
+    def get_sampwidth(self):
+        """Return the sample width of the fragments."""
+        return self._sampwidth
+
+    def get_nchannels(self):
+        """Return the number of channels of the fragments."""
+        return self._nchannels
+
+    def get_nframes(self):
+        """Return the number of frames of the audio data."""
+        return len(self._data) // (self._sampwidth * self._nchannels)
+
+    # -----------------------------------------------------------------------
+
+    def get_fragment(self, begin, end):
+        """Return the frames between two positions, without copying them.
+
+        Positions are bounded like in sppasChannel.extract_fragment().
+
+        :param begin: (int) position of the first frame
+        :param end: (int) position after the last frame
+        :returns: (memoryview) interleaved frames
+        :raises: IntervalError
+
+        """
+        nframes = self.get_nframes()
+        begin = int(begin)
+        end = int(end)
+        if end < 0 or end > nframes:
+            end = nframes
+        if begin > nframes:
+            return self._data[0:0]
+        if begin < 0:
+            begin = 0
+        if begin > end:
+            raise IntervalError(begin, end)
+
+        framesize = self._sampwidth * self._nchannels
+        return self._data[begin*framesize:end*framesize]
+
+    # -----------------------------------------------------------------------
+
+    def write_fragment(self, filename, begin, end, silence=0):
+        """Write the frames between two positions into an audio file.
+
+        :param filename: (str) Audio file name to write (.wav or .au)
+        :param begin: (int) position of the first frame
+        :param end: (int) position after the last frame
+        :param silence: (int) Number of frames of silence to surround
+        the fragment with
+        :raises: AudioTypeError, IntervalError
+
+        """
+        frames = self.get_fragment(begin, end)
+        if silence > 0:
+            framesize = self._sampwidth * self._nchannels
+            pad = (b(" \x00") * (silence * framesize))[:silence * framesize]
+            frames = b"".join((pad, frames.tobytes(), pad))
+
+        writer = open_audio_writer(filename, self._nchannels,
+                                   self._sampwidth, self._framerate)
+        try:
+            writer.writeframes(frames)
+        finally:
+            writer.close()
+
+    # -----------------------------------------------------------------------
+
+    def write_fragments(self, intervals, filenames, silence=0.,
+                        nb_threads=NB_THREADS):
+        """Write fragments into audio files.
+
+        :param intervals: (list) List of tuples (begin, end) in seconds,
+        i.e. the result of sppasTier.get_midpoint_intervals()
+        :param filenames: (list) Audio file name of each interval
+        :param silence: (float) Duration of the silence to surround the
+        fragments with, in seconds
+        :param nb_threads: (int) Number of writing threads
+        :raises: AudioTypeError, IntervalError
+
+        """
+        if len(intervals) != len(filenames):
+            raise ValueError('Expected {:d} file names. Got {:d}.'
+                             ''.format(len(intervals), len(filenames)))
+        nb_silence = int(silence * self._framerate) if silence > 0. else 0
+        jobs = [(filename,
+                 int(begin * self._framerate),
+                 int(end * self._framerate))
+                for (begin, end), filename in zip(intervals, filenames)]
+
+        if nb_threads > 1 and len(jobs) > 1:
+            pool = ThreadPool(nb_threads)
+            try:
+                pool.map(lambda job: self.write_fragment(*job, silence=nb_silence),
+                         jobs)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            for job in jobs:
+                self.write_fragment(*job, silence=nb_silence)
+
+    # -----------------------------------------------------------------------
+
+    def close(self):
+        """Release the audio data and remove the converted file."""
+        self._data = memoryview(b"")
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._converted is not None:
+            if os.path.exists(self._converted):
+                os.remove(self._converted)
+            self._converted = None
@@ -34,11 +34,18 @@
 
 """
 
-import audioop
-import struct
+import sys
+import math
+from array import array
 
 from .audiodataexc import SampleWidthError, ChannelIndexError
 
+try:
+    import audioop
+except ImportError:
+    # audioop was removed from the standard library of python 3.13
+    audioop = None
+
 # ---------------------------------------------------------------------------
 
 
@@ -51,7 +58,10 @@ class sppasAudioFrames(object):
     :license:      GPL, v3
     :copyright:    Copyright (C) 2011-2016  Brigitte Bigi
 
-    TODO: There's no unittests of this class.
+    Samples are signed integers in the native byte order, like in the
+    audioop module. The C implementation of audioop is used when it is
+    available. Otherwise, the samples are accessed through an array view
+    of the frames, with no copy of the data.
 
     """
     def __init__(self, frames=b"", sampwidth=2, nchannels=1):
@@ -77,6 +87,35 @@ class sppasAudioFrames(object):
 
     # -----------------------------------------------------------------------
 
+    def get_samples(self):
+        """Return the samples of all channels, interleaved.
+
+        The frames are not copied: the returned object is a view on them.
+
+        :returns: (memoryview) signed integers
+
+        """
+        return sppasAudioFrames.frames2samples(self._frames, self._sampwidth)
+
+    # -----------------------------------------------------------------------
+
+    def get_channel_frames(self, idx):
+        """Return the frames of the given channel.
+
+        :param idx: (int) index of the channel
+        :returns: (str) frames of the channel
+
+        """
+        idx = int(idx)
+        if idx < 0 or idx >= self._nchannels:
+            raise ChannelIndexError(idx)
+        if self._nchannels == 1:
+            return self._frames
+        return sppasAudioFrames.__tobytes(
+            self.get_samples()[idx::self._nchannels])
+
+    # -----------------------------------------------------------------------
+
     def resample(self, rate, new_rate=16000):
         """Return re-sampled frames.
 
@@ -85,7 +124,41 @@ class sppasAudioFrames(object):
         :returns: (str) converted frames
 
         """
-        return audioop.ratecv(self._frames, self._sampwidth, self._nchannels, rate, new_rate, None)[0]
+        if audioop is not None:
+            return audioop.ratecv(self._frames, self._sampwidth,
+                                  self._nchannels, rate, new_rate, None)[0]
+
+        # Linear interpolation, like in audioop.ratecv()
+        d = math.gcd(int(rate), int(new_rate))
+        rate = int(rate) // d
+        new_rate = int(new_rate) // d
+        nchannels = self._nchannels
+        shift = 32 - 8 * self._sampwidth
+        samples = self.get_samples()
+        nframes = len(samples) // nchannels
+
+        converted = list()
+        prev = [0] * nchannels
+        cur = [0] * nchannels
+        pos = -new_rate
+        i = 0
+        while True:
+            while pos < 0:
+                if i == nframes:
+                    return sppasAudioFrames.samples2frames(
+                        converted, self._sampwidth)
+                prev = cur
+                cur = [samples[i*nchannels + c] << shift
+                       for c in range(nchannels)]
+                i += 1
+                pos += new_rate
+            while pos >= 0:
+                for c in range(nchannels):
+                    value = int((float(prev[c]) * float(pos) +
+                                 float(cur[c]) * float(new_rate - pos)) /
+                                float(new_rate))
+                    converted.append(value >> shift)
+                pos -= rate
 
     # -----------------------------------------------------------------------
 
@@ -99,7 +172,23 @@ class sppasAudioFrames(object):
         """
         if new_sampwidth not in [1, 2, 4]:
             raise SampleWidthError
-        return audioop.lin2lin(self._frames, self._sampwidth, new_sampwidth)
+        if audioop is not None:
+            return audioop.lin2lin(self._frames, self._sampwidth, new_sampwidth)
+
+        if new_sampwidth == self._sampwidth:
+            return bytes(self._frames)
+        if sys.byteorder == "little":
+            return sppasAudioFrames.__lin2lin(self._frames, self._sampwidth,
+                                              new_sampwidth)
+
+        samples = self.get_samples()
+        if new_sampwidth > self._sampwidth:
+            shift = 8 * (new_sampwidth - self._sampwidth)
+            converted = [s << shift for s in samples]
+        else:
+            shift = 8 * (self._sampwidth - new_sampwidth)
+            converted = [s >> shift for s in samples]
+        return sppasAudioFrames.samples2frames(converted, new_sampwidth)
 
     # -----------------------------------------------------------------------
 
@@ -112,7 +201,15 @@ class sppasAudioFrames(object):
 
         """
         value = int(value)
-        return audioop.bias(self._frames, self._sampwidth, value)
+        if audioop is not None:
+            return audioop.bias(self._frames, self._sampwidth, value)
+
+        mask = (1 << (8 * self._sampwidth)) - 1
+        offset = 1 << (8 * self._sampwidth - 1)
+        value = (value + offset) & mask
+        converted = [((s + value) & mask) - offset
+                     for s in self.get_samples()]
+        return sppasAudioFrames.samples2frames(converted, self._sampwidth)
 
     # -----------------------------------------------------------------------
 
@@ -124,7 +221,22 @@ class sppasAudioFrames(object):
         :returns: (str) converted frames
 
         """
-        return audioop.mul(self._frames, self._sampwidth, factor)
+        if audioop is not None:
+            return audioop.mul(self._frames, self._sampwidth, factor)
+
+        factor = float(factor)
+        max_val = sppasAudioFrames.get_maxval(self._sampwidth)
+        min_val = sppasAudioFrames.get_minval(self._sampwidth)
+        converted = list()
+        for s in self.get_samples():
+            v = s * factor
+            if v > max_val:
+                converted.append(max_val)
+            elif v < min_val + 1:
+                converted.append(min_val)
+            else:
+                converted.append(int(math.floor(v)))
+        return sppasAudioFrames.samples2frames(converted, self._sampwidth)
 
     # -----------------------------------------------------------------------
 
@@ -134,7 +246,19 @@ class sppasAudioFrames(object):
         :returns: number of zero crossing
 
         """
-        return audioop.cross(self._frames, self._sampwidth)
+        if audioop is not None:
+            return audioop.cross(self._frames, self._sampwidth)
+
+        samples = self.get_samples()
+        if len(samples) == 0:
+            return -1
+        ncross = 0
+        prev = samples[0] < 0
+        for s in samples:
+            if (s < 0) is not prev:
+                ncross += 1
+                prev = not prev
+        return ncross
 
     # -----------------------------------------------------------------------
 
@@ -144,46 +268,55 @@ class sppasAudioFrames(object):
         :returns (min,max)
 
         """
-        return audioop.minmax(self._frames, self._sampwidth)
+        if audioop is not None:
+            return audioop.minmax(self._frames, self._sampwidth)
+
+        samples = self.get_samples()
+        if len(samples) == 0:
+            return 0x7fffffff, -0x80000000
+        return min(samples), max(samples)
 
     # -----------------------------------------------------------------------
 
     def min(self):
         """Return the minimum of the values of all frames."""
 
-        return audioop.minmax(self._frames, self._sampwidth)[0]
+        return self.minmax()[0]
 
     # -----------------------------------------------------------------------
 
     def max(self):
         """Return the maximum of the values of all frames."""
 
-        return audioop.minmax(self._frames, self._sampwidth)[1]
+        return self.minmax()[1]
 
     # -----------------------------------------------------------------------
 
     def avg(self):
         """Return the average of all the frames."""
+        if audioop is not None:
+            return audioop.avg(self._frames, self._sampwidth)
 
-        return audioop.avg(self._frames, self._sampwidth)
+        samples = self.get_samples()
+        if len(samples) == 0:
+            return 0
+        return sum(samples) // len(samples)
 
     # -----------------------------------------------------------------------
 
     def rms(self):
-        """Return the root mean square of the frames."""
+        """Return the root mean square of the frames.
+
+        With several channels, it is the average of the rms of each one.
+
+        """
         if self._nchannels == 1:
-            return audioop.rms(self._frames, self._sampwidth)
+            return sppasAudioFrames.__rms(self._frames, self._sampwidth)
 
         rms_sum = 0
         for i in range(self._nchannels):
-            new_frames = b""
-            for j in range(i*self._sampwidth,
-                           len(self._frames),
-                           self._sampwidth*self._nchannels):
-
-                for k in range(self._sampwidth):
-                    new_frames += self._frames[j+k]
-            rms_sum += audioop.rms(new_frames, self._sampwidth)
+            rms_sum += sppasAudioFrames.__rms(self.get_channel_frames(i),
+                                              self._sampwidth)
 
         return int(rms_sum/self._nchannels)
 
@@ -198,26 +331,180 @@ class sppasAudioFrames(object):
         :returns: (float) the clipping rate
 
         """
-        if self._sampwidth == 4:
-            data = struct.unpack("<%ul" % (len(self._frames) / 4), self._frames)
-        elif self._sampwidth == 2:
-            data = struct.unpack("<%uh" % (len(self._frames) / 2), self._frames)
-        else:
-            data = struct.unpack("%uB" % len(self._frames), self._frames)
-            data = [s - 128 for s in data]
-
         max_val = int(sppasAudioFrames.get_maxval(self._sampwidth) * (factor/2.))
         min_val = int(sppasAudioFrames.get_minval(self._sampwidth) * (factor/2.))
 
-        nb_clipping = 0
-        for i in range(len(data)):
-            if data[i] >= max_val or data[i] <= min_val:
-                nb_clipping += 1
+        if self._sampwidth == 1:
+            # 8 bits frames are unsigned
+            data = memoryview(self._frames)
+            max_val += 128
+            min_val += 128
+        else:
+            data = self.get_samples()
+        if len(data) == 0:
+            return 0.
+
+        nb_clipping = sum(1 for s in data if s >= max_val or s <= min_val)
 
         return float(nb_clipping)/len(data)
 
     # -----------------------------------------------------------------------
 
+    @staticmethod
+    def __rms(frames, sampwidth):
+        """Return the root mean square of the frames of a channel."""
+        if audioop is not None:
+            return audioop.rms(frames, sampwidth)
+
+        samples = sppasAudioFrames.frames2samples(frames, sampwidth)
+        if len(samples) == 0:
+            return 0
+        return int(math.sqrt(float(sum(s*s for s in samples)) / len(samples)))
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def get_typecode(size):
+        """Return the array typecode of signed samples of a given sampwidth.
+
+        :param size: (int) the sampwidth
+        :returns: (str) 'b', 'h' or the 4 bytes one of 'i' and 'l'
+
+        """
+        if size == 1:
+            return 'b'
+        if size == 2:
+            return 'h'
+        if size == 4:
+            if array('i').itemsize == 4:
+                return 'i'
+            return 'l'
+        raise SampleWidthError(size)
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def frames2samples(frames, size):
+        """Return a view of the frames as signed samples.
+
+        :param frames: (str) frames
+        :param size: (int) the sampwidth
+        :returns: (memoryview) signed integers in the native byte order
+
+        """
+        typecode = sppasAudioFrames.get_typecode(size)
+        try:
+            return memoryview(frames).cast('B').cast(typecode)
+        except AttributeError:
+            # python 2: memoryview can't be casted
+            return array(typecode, frames)
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def samples2frames(samples, size):
+        """Return the frames of a list of signed samples.
+
+        :param samples: (list of int) samples
+        :param size: (int) the sampwidth
+        :returns: (str) frames in the native byte order
+
+        """
+        return sppasAudioFrames.__tobytes(
+            array(sppasAudioFrames.get_typecode(size), samples))
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def deinterleave(frames, size, nchannels):
+        """Return the frames of each channel of interleaved frames.
+
+        All channels are extracted in one pass, with strided copies.
+
+        :param frames: (str) interleaved frames
+        :param size: (int) the sampwidth
+        :param nchannels: (int) number of channels in the frames
+        :returns: (list of str) frames of each channel
+
+        """
+        nchannels = int(nchannels)
+        if nchannels < 1:
+            raise ChannelIndexError(nchannels)
+        if nchannels == 1:
+            return [frames]
+
+        # ignore an incomplete frame at the end
+        nbytes = (len(frames) // (size * nchannels)) * size * nchannels
+        samples = sppasAudioFrames.frames2samples(frames[:nbytes], size)
+        return [sppasAudioFrames.__tobytes(samples[i::nchannels])
+                for i in range(nchannels)]
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def interleave(channels_frames, size):
+        """Return the interleaved frames of several channels.
+
+        :param channels_frames: (list of str) frames of each channel
+        :param size: (int) the sampwidth
+        :returns: (str) interleaved frames of the shortest channel length
+
+        """
+        nchannels = len(channels_frames)
+        if nchannels == 0:
+            return b""
+        if nchannels == 1:
+            return channels_frames[0]
+
+        nbytes = min(len(f) for f in channels_frames) // size * size
+        frames = bytearray(nbytes * nchannels)
+        try:
+            samples = memoryview(frames).cast(
+                sppasAudioFrames.get_typecode(size))
+        except AttributeError:
+            # python 2: memoryview can't be casted
+            samples = array(sppasAudioFrames.get_typecode(size), frames)
+        for i, channel_frames in enumerate(channels_frames):
+            samples[i::nchannels] = sppasAudioFrames.frames2samples(
+                channel_frames[:nbytes], size)
+
+        if isinstance(samples, array):
+            return sppasAudioFrames.__tobytes(samples)
+        return bytes(frames)
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __lin2lin(frames, size, new_size):
+        """Return little-endian frames with a new sample width.
+
+        Shifting the samples of whole bytes is moving their bytes: only
+        the most significant ones are kept, with strided copies.
+
+        """
+        frames = memoryview(frames).cast('B') if hasattr(memoryview, 'cast') \
+            else bytearray(frames)
+        nframes = len(frames) // size
+        converted = bytearray(nframes * new_size)
+        if new_size > size:
+            for k in range(size):
+                converted[new_size - size + k::new_size] = frames[k::size]
+        else:
+            for k in range(new_size):
+                converted[k::new_size] = frames[size - new_size + k::size]
+        return bytes(converted)
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __tobytes(samples):
+        """Return the bytes of an array or of a memoryview."""
+        try:
+            return samples.tobytes()
+        except AttributeError:
+            # python 2 array
+            return samples.tostring()
+
     @staticmethod
     def get_maxval(size, signed=True):
         """Return the max value for a given sampwidth.
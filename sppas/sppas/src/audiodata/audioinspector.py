@@ -0,0 +1,370 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+    src.audiodata.audioinspector.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+"""
+import os
+import sys
+import math
+import json
+import codecs
+import wave
+import sunau
+import multiprocessing
+from array import array
+from operator import mul
+
+from sppas.src.config import sg
+
+from . import audioframes
+from .audioframes import sppasAudioFrames
+from .audiodataexc import AudioTypeError, AudioIOError
+
+try:
+    import aifc
+except ImportError:
+    # aifc was removed from the standard library of python 3.13
+    aifc = None
+
+# ----------------------------------------------------------------------------
+
+CLIPPING_FACTOR = 0.99  # Samples from this ratio of the full scale are clipped
+SILENCE_LEVEL = 0.01    # Windows with a rms under this ratio are silences
+
+# ----------------------------------------------------------------------------
+
+
+class sppasAudioInspector(object):
+    """Scan the audio files of a corpus and estimate their properties.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2018  Brigitte Bigi
+
+    The properties of the header (frame rate, sample width, number of
+    channels and duration) are read without decoding any frame. The
+    properties of the signal are estimated in only one pass on blocks of
+    frames, with one window of analysis after the other:
+
+        - rms: root mean square of all the samples;
+        - peak: highest absolute value of the samples;
+        - clipping: ratio of the samples close to the full scale;
+        - dc_offset: mean value of the samples;
+        - silence: ratio of the windows with a rms close to 0.
+
+    Results are cached: an already scanned file is not scanned again while
+    its size and modification time are unchanged.
+
+    >>> inspector = sppasAudioInspector(cache_file="corpus.json")
+    >>> results = inspector.inspect_many(filenames)
+    >>> inspector.save_cache()
+    >>> sppasAudioInspector.write_report(results, "corpus.csv")
+
+    """
+
+    HEADER = ("filename", "size", "mtime", "framerate", "sampwidth",
+              "nchannels", "nframes", "duration")
+    STATS = ("rms", "peak", "clipping", "dc_offset", "silence")
+    READERS = {"wav": wave, "wave": wave, "au": sunau,
+               "aif": aifc, "aiff": aifc, "aifc": aifc}
+    BLOCK_SIZE = 65536
+
+    def __init__(self, stats=True, frame_duration=0.02, cache_file=None):
+        """Create a sppasAudioInspector instance.
+
+        :param stats: (bool) Estimate the properties of the signal
+        :param frame_duration: (float) Duration of the windows of analysis
+        :param cache_file: (str) Name of the JSON file of the cache
+
+        """
+        self._stats = bool(stats)
+        self._frame_duration = float(frame_duration)
+        self._cache_file = cache_file
+        self._cache = dict()
+        if cache_file is not None and os.path.exists(cache_file):
+            with open(cache_file, "r") as fp:
+                self._cache = json.load(fp)
+
+    # -----------------------------------------------------------------------
+
+    def get_cache(self):
+        """Return the dictionary of cached results, key=file name."""
+        return self._cache
+
+    # -----------------------------------------------------------------------
+
+    def save_cache(self):
+        """Save the cached results into the JSON cache file."""
+        if self._cache_file is not None:
+            with open(self._cache_file, "w") as fp:
+                json.dump(self._cache, fp, indent=1)
+
+    # -----------------------------------------------------------------------
+
+    def inspect(self, filename):
+        """Return the properties of an audio file.
+
+        :param filename: (str) Audio file name
+        :returns: (dict) the properties, key=name of the property
+        :raises: AudioTypeError, AudioIOError
+
+        """
+        cached = self.__get_cached(filename)
+        if cached is not None:
+            return cached
+
+        result = self.__inspect(filename)
+        self._cache[os.path.abspath(filename)] = result
+        return result
+
+    # -----------------------------------------------------------------------
+
+    def inspect_many(self, filenames, nb_proc=0):
+        """Return the properties of several audio files.
+
+        The files not already in the cache are scanned by several processes.
+        An error is reported into the "error" key of the result of a file.
+
+        :param filenames: (list of str) Audio file names
+        :param nb_proc: (int) Number of processes (0=all the CPUs)
+        :returns: (list of dict) the properties of each file
+
+        """
+        results = [self.__get_cached(f) for f in filenames]
+        todo = [f for f, r in zip(filenames, results) if r is None]
+
+        if nb_proc == 0:
+            nb_proc = multiprocessing.cpu_count()
+        if nb_proc > 1 and len(todo) > 1:
+            pool = multiprocessing.Pool(min(nb_proc, len(todo)),
+                                        initializer=_init_inspector,
+                                        initargs=(self,))
+            try:
+                scanned = pool.map(_eval_inspector_file, todo)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            _init_inspector(self)
+            scanned = [_eval_inspector_file(f) for f in todo]
+
+        scanned = iter(scanned)
+        for i, filename in enumerate(filenames):
+            if results[i] is None:
+                results[i] = next(scanned)
+                if "error" not in results[i]:
+                    self._cache[os.path.abspath(filename)] = results[i]
+
+        return results
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def write_report(results, filename):
+        """Write results into a CSV or a JSON file.
+
+        :param results: (list of dict) the properties of the files
+        :param filename: (str) the report file name (.csv or .json)
+
+        """
+        if filename.lower().endswith(".json"):
+            with open(filename, "w") as fp:
+                json.dump(results, fp, indent=1)
+            return
+
+        keys = sppasAudioInspector.HEADER + sppasAudioInspector.STATS
+        with codecs.open(filename, 'w', sg.__encoding__) as fp:
+            fp.write(",".join(keys) + ",error\n")
+            for result in results:
+                values = ['"{}"'.format(result["filename"])]
+                for key in keys[1:]:
+                    value = result.get(key, "")
+                    if isinstance(value, float):
+                        value = round(value, 6)
+                    values.append(str(value))
+                values.append('"{}"'.format(result.get("error", "")))
+                fp.write(",".join(values) + "\n")
+
+    # -----------------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------------
+
+    def __get_cached(self, filename):
+        """Return the cached result of a file, or None if outdated."""
+        cached = self._cache.get(os.path.abspath(filename), None)
+        if cached is None or os.path.exists(filename) is False:
+            return None
+        if cached["size"] != os.path.getsize(filename) or \
+                cached["mtime"] != os.path.getmtime(filename):
+            return None
+        if self._stats is True and "rms" not in cached:
+            return None
+        return cached
+
+    # -----------------------------------------------------------------------
+
+    def __inspect(self, filename):
+        """Read the header of a file then estimate the signal properties."""
+        ext = os.path.splitext(filename)[1][1:].lower()
+        reader = sppasAudioInspector.READERS.get(ext, None)
+        if reader is None:
+            raise AudioTypeError(ext)
+
+        result = {"filename": filename,
+                  "size": os.path.getsize(filename),
+                  "mtime": os.path.getmtime(filename)}
+        try:
+            fp = reader.open(filename, "rb")
+        except Exception as e:
+            raise AudioIOError(message=str(e), filename=filename)
+        try:
+            result["framerate"] = fp.getframerate()
+            result["sampwidth"] = fp.getsampwidth()
+            result["nchannels"] = fp.getnchannels()
+            result["nframes"] = fp.getnframes()
+            result["duration"] = float(fp.getnframes()) / fp.getframerate()
+            if self._stats is True:
+                result.update(self.__signal_stats(fp, reader))
+        finally:
+            fp.close()
+
+        return result
+
+    # -----------------------------------------------------------------------
+
+    def __signal_stats(self, fp, reader):
+        """Estimate the signal properties from the frames of a file."""
+        sampwidth = fp.getsampwidth()
+        win_len = max(1, int(self._frame_duration * fp.getframerate()))
+        win_size = win_len * fp.getnchannels() * sampwidth
+        block_len = win_len * max(1, sppasAudioInspector.BLOCK_SIZE // win_len)
+
+        # only frames of wave files are little-endian, but sunau
+        # decodes mu-law frames into the native byte order
+        swap = sampwidth > 1 and \
+            (reader is aifc or
+             (reader is sunau and fp.getcomptype() != 'ULAW')) is not \
+            (sys.byteorder == "big")
+        unsigned = sampwidth == 1 and reader is wave
+
+        max_val = sppasAudioFrames.get_maxval(sampwidth)
+        clip_val = int(CLIPPING_FACTOR * max_val)
+        sil_val = SILENCE_LEVEL * max_val
+
+        nb_samples = 0
+        total = 0
+        energy = 0.
+        peak = 0
+        nb_clipped = 0
+        nb_win = 0
+        nb_sil = 0
+        while True:
+            frames = fp.readframes(block_len)
+            if len(frames) == 0:
+                break
+            frames = sppasAudioInspector.__to_native(frames, sampwidth,
+                                                     swap, unsigned)
+            samples = sppasAudioFrames.frames2samples(frames, sampwidth)
+            nb_samples += len(samples)
+            total += sum(samples)
+
+            for start in range(0, len(frames), win_size):
+                window = frames[start:start+win_size]
+                n = len(window) // sampwidth
+                if audioframes.audioop is not None:
+                    rms = audioframes.audioop.rms(window, sampwidth)
+                    w_min, w_max = audioframes.audioop.minmax(window, sampwidth)
+                    energy += float(rms * rms) * n
+                else:
+                    s = samples[start//sampwidth:start//sampwidth+n]
+                    w_energy = sum(map(mul, s, s))
+                    rms = math.sqrt(float(w_energy) / n)
+                    w_min, w_max = min(s), max(s)
+                    energy += w_energy
+                peak = max(peak, w_max, -w_min)
+                if w_max >= clip_val or w_min <= -clip_val:
+                    s = samples[start//sampwidth:start//sampwidth+n]
+                    nb_clipped += sum(1 for x in s
+                                      if x >= clip_val or x <= -clip_val)
+                nb_win += 1
+                if rms < sil_val:
+                    nb_sil += 1
+
+        if nb_samples == 0:
+            return {"rms": 0., "peak": 0, "clipping": 0.,
+                    "dc_offset": 0., "silence": 0.}
+
+        return {"rms": math.sqrt(energy / nb_samples),
+                "peak": peak,
+                "clipping": float(nb_clipped) / nb_samples,
+                "dc_offset": float(total) / nb_samples,
+                "silence": float(nb_sil) / nb_win}
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __to_native(frames, sampwidth, swap, unsigned):
+        """Return frames of signed samples in the native byte order."""
+        if swap is False and unsigned is False:
+            return frames
+        if audioframes.audioop is not None:
+            if unsigned is True:
+                return audioframes.audioop.bias(frames, 1, -128)
+            return audioframes.audioop.byteswap(frames, sampwidth)
+
+        if unsigned is True:
+            return bytes(bytearray((x - 128) & 0xFF for x in bytearray(frames)))
+        samples = array(sppasAudioFrames.get_typecode(sampwidth), frames)
+        samples.byteswap()
+        return samples.tobytes()
+
+# ----------------------------------------------------------------------------
+# Inspection of files by the processes of a pool
+# ----------------------------------------------------------------------------
+
+
+_process_inspector = None
+
+
+def _init_inspector(inspector):
+    """Store the options of the inspection in the current process."""
+    global _process_inspector
+    _process_inspector = inspector
+
+
+def _eval_inspector_file(filename):
+    """Return the properties of an audio file, or the error."""
+    try:
+        return _process_inspector.inspect(filename)
+    except Exception as e:
+        return {"filename": filename, "error": str(e)}
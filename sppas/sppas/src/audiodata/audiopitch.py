@@ -32,9 +32,28 @@
     src.audiodata.audiopitch.py
     ~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
-    TO BE IMPLEMENTED.
+    Fundamental frequency estimation, with the YIN algorithm:
+
+        A. de Cheveigné, H. Kawahara (2002).
+        YIN, a fundamental frequency estimator for speech and music.
+        Journal of the Acoustical Society of America, 111(4), pp. 1917-1930.
 
 """
+import multiprocessing
+from operator import mul
+
+from .audioconvert import sppasAudioConverter
+
+# ---------------------------------------------------------------------------
+
+MIN_F0 = 50.       # Hz, like the Momel F0 threshold
+MAX_F0 = 600.      # Hz, like the Momel F0 ceiling
+THRESHOLD = 0.3    # Max aperiodicity of a voiced frame
+SILENCE = 0.003    # Min amplitude of a voiced frame, relatively to the max
+ANALYSIS_RATE = 8000  # Hz, max sample rate of the analysis
+BLOCK_SIZE = 500   # Nb of pitch values estimated from a block of samples
+
+# ---------------------------------------------------------------------------
 
 
 class AudioPitch(object):
@@ -44,14 +63,39 @@ class AudioPitch(object):
     :contact:      develop@sppas.org
     :license:      GPL, v3
     :copyright:    Copyright (C) 2011-2017  Brigitte Bigi
-    :summary:      A pitch audio utility class. NOT IMPLEMENTED!!!!
+    :summary:      A pitch audio utility class.
+
+    The pitch is estimated every delta seconds with the YIN algorithm;
+    the value of an unvoiced frame is 0. The channel is analyzed block by
+    block and it is down-sampled to about 8000Hz before the analysis:
+    the max F0 is far below the Nyquist frequency.
+
+    >>> p = AudioPitch(delta=0.01)
+    >>> p.eval_pitch("sample.wav")
+    >>> momel = sppasMomel()
+    >>> anchors = momel.convert(p.get_pitch_list())
 
     """
-    def __init__(self, delta=0.01):
-        """Create a new AudioPitch instance."""
+    def __init__(self, delta=0.01, minf0=MIN_F0, maxf0=MAX_F0,
+                 threshold=THRESHOLD):
+        """Create a new AudioPitch instance.
+
+        :param delta: (float) Time step of the pitch values, in seconds
+        :param minf0: (float) Min F0 to search for, in Hz
+        :param maxf0: (float) Max F0 to search for, in Hz
+        :param threshold: (float) Max aperiodicity of voiced frames
+
+        """
+        if delta <= 0.:
+            raise ValueError('Invalid pitch delta: {}'.format(delta))
+        if minf0 <= 0. or maxf0 <= minf0:
+            raise ValueError('Invalid F0 range: {}-{}'.format(minf0, maxf0))
 
         self.pitch = []
         self.delta = delta
+        self.minf0 = float(minf0)
+        self.maxf0 = float(maxf0)
+        self.threshold = float(threshold)
 
     # ------------------------------------------------------------------
 
@@ -62,8 +106,8 @@ class AudioPitch(object):
         :returns: float
 
         """
-        idx = int(time/self.delta) + 1
-        if len(self.pitch) < idx:
+        idx = int(round(time/self.delta))
+        if 0 <= idx < len(self.pitch):
             return self.pitch[idx]
         else:
             raise ValueError('%d not in range' % idx)
@@ -85,10 +129,189 @@ class AudioPitch(object):
     # ------------------------------------------------------------------
 
     def eval_pitch(self, filename):
-        """WILL evaluate pitch values...
+        """Evaluate pitch values of the first channel of an audio file.
+
+        :param filename: (str) Name of an audio file
+        :returns: (list of float) pitch values
+
+        """
+        from .aio import open as audio_open
+
+        audio = audio_open(filename)
+        try:
+            channel = audio.get_channel(audio.extract_channel(0))
+        finally:
+            audio.close()
+
+        return self.eval_channel_pitch(channel)
+
+    # ------------------------------------------------------------------
+
+    def eval_channel_pitch(self, channel):
+        """Evaluate pitch values of a channel.
+
+        :param channel: (sppasChannel)
+        :returns: (list of float) pitch values
+
+        """
+        self.pitch = list(self.iter_channel_pitch(channel))
+        return self.pitch
+
+    # ------------------------------------------------------------------
+
+    def eval_many(self, filenames, nb_proc=0):
+        """Evaluate pitch values of several audio files.
+
+        The files are analyzed by several processes, with the options of
+        this instance. The pitch values of this instance are not modified.
+
+        :param filenames: (list of str) Name of audio files
+        :param nb_proc: (int) Max number of processes. If 0, the number of
+        CPUs is used.
+        :returns: (list of list of float) pitch values of each file
+
+        """
+        if nb_proc == 0:
+            nb_proc = multiprocessing.cpu_count()
+        nb_proc = min(nb_proc, len(filenames))
+
+        if nb_proc < 2:
+            return [AudioPitch._copy(self).eval_pitch(f) for f in filenames]
+
+        pool = multiprocessing.Pool(nb_proc,
+                                    initializer=_init_pitch,
+                                    initargs=(self,))
+        try:
+            results = pool.map(_eval_pitch_file, filenames)
+        finally:
+            pool.close()
+            pool.join()
+
+        return results
+
+    # ------------------------------------------------------------------
+
+    def iter_channel_pitch(self, channel):
+        """Estimate the pitch values of a channel, block by block.
+
+        The i-th value is estimated in a window centered on time i*delta.
+
+        :param channel: (sppasChannel)
+        :returns: (float) the pitch values
 
         """
-        raise NotImplementedError
+        framerate = channel.get_framerate()
+        sampwidth = channel.get_sampwidth()
+        frames = channel.get_frames()
+        nsamples = len(frames) // sampwidth
+
+        # Analysis at a lower sample rate
+        factor = max(1, framerate // ANALYSIS_RATE)
+        rate = float(framerate) / factor
+        tau_min = max(2, int(rate / self.maxf0))
+        tau_max = int(rate / self.minf0) + 1
+        win = tau_max
+        length = win + tau_max + 1
+        floor = float(2 ** (8 * sampwidth - 1)) * factor * SILENCE
+        floor = floor * floor * win
+
+        nvalues = int(float(nsamples) / framerate / self.delta) + 1
+        for first in range(0, nvalues, BLOCK_SIZE):
+            last = min(nvalues, first + BLOCK_SIZE)
+
+            # the down-sampled samples of the block, with a zero-padding
+            begin = int(round(first * self.delta * rate)) - length // 2
+            end = int(round((last - 1) * self.delta * rate)) - length // 2 + length
+            samples = AudioPitch._get_samples(frames, sampwidth, nsamples,
+                                              begin * factor, end * factor)
+            if factor > 1:
+                samples = list(map(sum, zip(*[samples[j::factor]
+                                              for j in range(factor)])))
+
+            # cumulated energy
+            energy = [0.] * (len(samples) + 1)
+            total = 0.
+            for i, x in enumerate(samples):
+                total += x * x
+                energy[i + 1] = total
+
+            for i in range(first, last):
+                start = int(round(i * self.delta * rate)) - length // 2 - begin
+                yield self.__yin(samples, energy, start, win,
+                                 tau_min, tau_max, rate, floor)
+
+    # ------------------------------------------------------------------
+    # Private
+    # ------------------------------------------------------------------
+
+    def __yin(self, samples, energy, start, win, tau_min, tau_max, rate,
+              floor):
+        """Estimate the F0 of a frame with YIN.
+
+        :returns: (float) F0 or 0. if the frame is unvoiced
+
+        """
+        e0 = energy[start + win] - energy[start]
+        if e0 < floor:
+            return 0.
+
+        # cumulative mean normalized difference function
+        frame = samples[start:start + win]
+        cmnd = [1.] * (tau_max + 2)
+        cumul = 0.
+        for tau in range(1, tau_max + 2):
+            s = start + tau
+            r = sum(map(mul, frame, samples[s:s + win]))
+            d = e0 + energy[s + win] - energy[s] - 2. * r
+            cumul += d
+            if cumul > 0.:
+                cmnd[tau] = d * tau / cumul
+
+        # first minimum below the threshold
+        tau = tau_min
+        while tau <= tau_max:
+            if cmnd[tau] < self.threshold:
+                while tau < tau_max and cmnd[tau + 1] < cmnd[tau]:
+                    tau += 1
+                break
+            tau += 1
+        if tau > tau_max:
+            return 0.
+
+        # parabolic interpolation
+        a, b, c = cmnd[tau - 1], cmnd[tau], cmnd[tau + 1]
+        div = a - 2. * b + c
+        shift = 0.
+        if div > 0.:
+            shift = max(-1., min(1., 0.5 * (a - c) / div))
+
+        f0 = rate / (tau + shift)
+        if f0 < self.minf0 or f0 > self.maxf0:
+            return 0.
+        return f0
+
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _get_samples(frames, sampwidth, nsamples, begin, end):
+        """Return the samples from begin to end, padded with zeros."""
+        before = max(0, -begin)
+        after = max(0, end - nsamples)
+        begin = max(0, begin)
+        end = min(nsamples, end)
+        samples = list()
+        if end > begin:
+            samples = sppasAudioConverter().unpack_data(
+                frames[begin * sampwidth:end * sampwidth], sampwidth, 1)[0]
+        return [0] * before + list(samples) + [0] * after
+
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _copy(pitch):
+        """Return an AudioPitch with the same options than the given one."""
+        return AudioPitch(pitch.delta, pitch.minf0, pitch.maxf0,
+                          pitch.threshold)
 
     # -----------------------------------------------------------------------
     # Overloads
@@ -96,3 +319,21 @@ class AudioPitch(object):
 
     def __len__(self):
         return len(self.pitch)
+
+# ---------------------------------------------------------------------------
+# Functions used by the processes of AudioPitch.eval_many()
+# ---------------------------------------------------------------------------
+
+
+_process_pitch = None
+
+
+def _init_pitch(pitch):
+    """Store the options of the pitch estimation in the current process."""
+    global _process_pitch
+    _process_pitch = pitch
+
+
+def _eval_pitch_file(filename):
+    """Evaluate the pitch values of an audio file in the current process."""
+    return AudioPitch._copy(_process_pitch).eval_pitch(filename)
@@ -34,13 +34,26 @@
 
 """
 
+import wave
+import sunau
+
+try:
+    import audioop
+except ImportError:
+    # audioop was removed from the standard library of python 3.13
+    audioop = None
+
 from .aio import open as audio_open
 from .aio import save as audio_save
+from .aio import get_extension
 
+from .audiodataexc import AudioTypeError, ChannelIndexError
 from .audio import sppasAudioPCM
+from .audioframes import sppasAudioFrames
 from .channel import sppasChannel
 from .channelframes import sppasChannelFrames
 from .channelformatter import sppasChannelFormatter
+from .channelresampler import sppasChannelResampler
 from .channelsilence import sppasChannelSilence
 
 # ------------------------------------------------------------------------
@@ -185,3 +198,98 @@ def write_channel(audioname, channel):
     audio_out.append_channel(channel)
     audio_save(audioname, audio_out)
 
+# ------------------------------------------------------------------------
+
+
+def open_audio_writer(audioname, nchannels, sampwidth, framerate):
+    """Return a writer of frames into a .wav or .au audio file.
+
+    The frames are written with the writeframes() method of the returned
+    object, which must be closed when done.
+
+    :param audioname: (str) Audio file name to write
+    :param nchannels: (int) Number of interleaved channels of the frames
+    :param sampwidth: (int) Sample width of the frames
+    :param framerate: (int) Frame rate of the frames
+    :raises: AudioTypeError
+
+    """
+    ext = get_extension(audioname).lower()
+    if ext in ("wav", "wave"):
+        writer = wave.open(audioname, "wb")
+    elif ext == "au":
+        writer = sunau.open(audioname, "wb")
+    else:
+        raise AudioTypeError(ext)
+    writer.setnchannels(nchannels)
+    writer.setsampwidth(sampwidth)
+    writer.setframerate(framerate)
+
+    return writer
+
+# ------------------------------------------------------------------------
+
+
+def convert_audio_file(input_audio, output_audio,
+                       framerate=16000, sampwidth=2, idx=0, nframes=None,
+                       antialias=False):
+    """Convert a channel of an audio file into a mono audio file.
+
+    The file is read, converted and written block by block so that
+    files larger than the memory can be converted. The frame rate is
+    changed by audioop.ratecv(), like sppasChannelFormatter does, or by
+    the band-limited sppasChannelResampler with antialias or if audioop
+    is not available.
+
+    :param input_audio: (str) Audio file name to convert
+    :param output_audio: (str) Audio file name to write (.wav or .au)
+    :param framerate: (int) Frame rate of the output file
+    :param sampwidth: (int) Sample width of the output file
+    :param idx: (int) Index of the channel to convert
+    :param nframes: (int) Number of frames of each block
+    :param antialias: (bool) Use the band-limited resampler
+    :raises: AudioTypeError, ChannelIndexError
+
+    """
+    if nframes is None:
+        nframes = sppasAudioPCM.BLOCK_SIZE
+
+    audio = audio_open(input_audio)
+    idx = int(idx)
+    if idx < 0 or idx >= audio.get_nchannels():
+        audio.close()
+        raise ChannelIndexError(idx)
+    try:
+        out = open_audio_writer(output_audio, 1, sampwidth, framerate)
+    except:
+        audio.close()
+        raise
+
+    resample = audio.get_framerate() != framerate
+    resampler = None
+    if resample is True and (antialias is True or audioop is None):
+        resampler = sppasChannelResampler(sampwidth,
+                                          audio.get_framerate(),
+                                          framerate)
+    # the state of ratecv() is given from a block to the next one
+    state = None
+    try:
+        while True:
+            frames = audio.read_channels(nframes)[idx]
+            if len(frames) == 0:
+                break
+            if audio.get_sampwidth() != sampwidth:
+                frames = sppasAudioFrames(frames, audio.get_sampwidth(), 1)\
+                    .change_sampwidth(sampwidth)
+            if resampler is not None:
+                frames = resampler.process(frames)
+            elif resample is True:
+                frames, state = audioop.ratecv(frames, sampwidth, 1,
+                                               audio.get_framerate(),
+                                               framerate, state)
+            out.writeframes(frames)
+        if resampler is not None:
+            out.writeframes(resampler.flush())
+    finally:
+        out.close()
+        audio.close()
@@ -35,9 +35,11 @@
 
 """
 
+import math
+from math import fsum
+from operator import mul
+
 import sppas.src.calculus.stats.central as central
-import sppas.src.calculus.stats.variability as variability
-import sppas.src.calculus.stats.moment as moment
 
 # ---------------------------------------------------------------------------
 
@@ -61,6 +63,7 @@ class sppasBaseVolume(object):
         self._volumes = list()
         self._rms = 0
         self._winlen = float(win_len)
+        self._stats = None
 
     # -----------------------------------------------------------------------
 
@@ -74,6 +77,35 @@ class sppasBaseVolume(object):
 
     # -----------------------------------------------------------------------
 
+    def _reset_stats(self):
+        """Forget the statistics: the volume values have changed."""
+        self._stats = None
+
+    # -----------------------------------------------------------------------
+
+    def _get_stats(self):
+        """Return the mean, the variance and the stdev of RMS values.
+
+        They are estimated only once.
+
+        :returns: (tuple of float)
+
+        """
+        if self._stats is None or self._stats[0] != len(self._volumes):
+            n = len(self._volumes)
+            mean = 0.
+            variance = 0.
+            if n > 0:
+                mean = fsum(self._volumes) / float(n)
+            if n > 1:
+                deviations = [v - mean for v in self._volumes]
+                variance = fsum(map(mul, deviations, deviations)) / n
+            self._stats = (n, mean, variance, math.sqrt(variance))
+
+        return self._stats[1:]
+
+    # -----------------------------------------------------------------------
+
     def volume(self):
         """Return the global volume value (rms).
         
@@ -104,6 +136,27 @@ class sppasBaseVolume(object):
 
     # -----------------------------------------------------------------------
 
+    def set_volume_value(self, index, value):
+        """Set manually the rms at a given position."""
+        self._volumes[index] = value
+        self._reset_stats()
+
+    # -----------------------------------------------------------------------
+
+    def set_volume_values(self, values):
+        """Set manually all the rms values.
+
+        :param values: (list) as many values as the current ones
+
+        """
+        if len(values) != len(self._volumes):
+            raise ValueError('Expected {:d} values. Got {:d}.'
+                             ''.format(len(self._volumes), len(values)))
+        self._volumes[:] = values
+        self._reset_stats()
+
+    # -----------------------------------------------------------------------
+
     def len(self):
         """Return the number of RMS values that were estimated.
         
@@ -140,7 +193,7 @@ class sppasBaseVolume(object):
         :returns: (float)
 
         """
-        return central.fmean(self._volumes)
+        return self._get_stats()[0]
 
     # -----------------------------------------------------------------------
 
@@ -160,7 +213,7 @@ class sppasBaseVolume(object):
         :returns: (int)
 
         """
-        return variability.lvariance(self._volumes)
+        return self._get_stats()[1]
 
     # -----------------------------------------------------------------------
 
@@ -170,7 +223,7 @@ class sppasBaseVolume(object):
         :returns: (int)
 
         """
-        return variability.lstdev(self._volumes)
+        return self._get_stats()[2]
 
     # -----------------------------------------------------------------------
 
@@ -180,7 +233,8 @@ class sppasBaseVolume(object):
         :returns: (float) coef variation given as a percentage.
 
         """
-        return moment.lvariation(self._volumes)
+        mean, variance, stdev = self._get_stats()
+        return stdev / mean * 100.
 
     # -----------------------------------------------------------------------
 
@@ -192,7 +246,10 @@ class sppasBaseVolume(object):
         :returns: (list of float)
 
         """
-        return variability.lzs(self._volumes)
+        if len(self._volumes) < 2:
+            return [0.] * len(self._volumes)
+        mean, variance, stdev = self._get_stats()
+        return [(v - mean) / stdev for v in self._volumes]
 
     # -----------------------------------------------------------------------
 
@@ -202,7 +259,7 @@ class sppasBaseVolume(object):
         :returns: (float)
 
         """
-        return variability.lsterr(self._volumes)
+        return self._get_stats()[2] / float(math.sqrt(len(self._volumes)))
 
     # -----------------------------------------------------------------------
 
@@ -139,6 +139,18 @@ class sppasChannel(object):
 
     # -----------------------------------------------------------------------
 
+    def get_samples(self):
+        """Return the samples of the channel.
+
+        The frames are not copied: the returned object is a view on them.
+
+        :returns: (memoryview) signed integers
+
+        """
+        return sppasAudioFrames.frames2samples(self._frames, self._sampwidth)
+
+    # -----------------------------------------------------------------------
+
     def get_nframes(self):
         """Return the number of frames.
 
@@ -0,0 +1,287 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+
+    src.audiodata.channelenergy.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+"""
+import math
+from operator import mul
+from collections import OrderedDict
+
+try:
+    from itertools import accumulate
+except ImportError:
+    # python 2
+    def accumulate(iterable):
+        total = 0
+        for x in iterable:
+            total += x
+            yield total
+
+from . import audioframes
+from .audioframes import sppasAudioFrames
+
+# ----------------------------------------------------------------------------
+
+CHUNK_SIZE = 4096    # Nb of frames of a chunk of prefix sums
+CACHE_SIZE = 32      # Nb of chunks of prefix sums kept in memory
+
+# ----------------------------------------------------------------------------
+
+
+class sppasChannelEnergy(object):
+    """Sum of the squared samples of any window of a channel.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2018  Brigitte Bigi
+
+    The channel is divided into chunks. The prefix sums of the squared
+    samples of a chunk are computed the first time a window needs them,
+    and the most recently used ones are kept in a cache. The cumulative
+    sums of the totals of the chunks are kept too. The energy of any
+    window is then the difference of two cumulative sums plus the partial
+    chunks at both edges: it is obtained in constant time, and only one
+    value per chunk is kept in memory for the whole channel.
+
+    >>> energy = sppasChannelEnergy(channel)
+    >>> energy.rms(0, 160)
+    >>> energy.rms_values(80, 1600, 3200)
+
+    """
+
+    def __init__(self, channel, chunk_size=CHUNK_SIZE):
+        """Create a sppasChannelEnergy instance.
+
+        :param channel: (sppasChannel) The channel to work on.
+        :param chunk_size: (int) Nb of frames of a chunk of prefix sums
+
+        """
+        self._frames = channel.get_frames()
+        self._sampwidth = channel.get_sampwidth()
+        self._nframes = len(self._frames) // self._sampwidth
+        self._chunk_size = max(1, int(chunk_size))
+        self._chunks = OrderedDict()
+        self._totals = dict()
+        self._cumul = [0]
+
+    # -----------------------------------------------------------------------
+
+    def get_nframes(self):
+        """Return the number of frames of the channel."""
+        return self._nframes
+
+    # -----------------------------------------------------------------------
+
+    def energy(self, begin, end):
+        """Return the sum of the squared samples of a window.
+
+        The window is clipped to the range of the channel.
+
+        :param begin: (int) Position of the first frame
+        :param end: (int) Position after the last frame
+        :returns: (int)
+
+        """
+        begin = min(max(0, int(begin)), self._nframes)
+        end = min(max(begin, int(end)), self._nframes)
+        if end == begin:
+            return 0
+
+        first, b = divmod(begin, self._chunk_size)
+        last, e = divmod(end, self._chunk_size)
+        if first == last:
+            prefix = self.__prefix_sums(first)
+            return prefix[e] - prefix[b]
+
+        prefix = self.__prefix_sums(first)
+        total = prefix[-1] - prefix[b]
+        total += self.__cumul(last) - self.__cumul(first + 1)
+        if e > 0:
+            total += self.__prefix_sums(last)[e]
+        return total
+
+    # -----------------------------------------------------------------------
+
+    def rms(self, begin=0, end=None):
+        """Return the root mean square of a window.
+
+        The window is clipped to the range of the channel, and the RMS of
+        an empty window is 0.
+
+        :param begin: (int) Position of the first frame
+        :param end: (int) Position after the last frame. None for the end.
+        :returns: (int)
+
+        """
+        if end is None:
+            end = self._nframes
+        begin = min(max(0, int(begin)), self._nframes)
+        end = min(max(begin, int(end)), self._nframes)
+        if end == begin:
+            return 0
+        return int(math.sqrt(float(self.energy(begin, end)) / (end - begin)))
+
+    # -----------------------------------------------------------------------
+
+    def rms_values(self, nb_frames, begin=0, end=None, nb_values=None):
+        """Return the root mean square of consecutive windows.
+
+        The windows don't overlap: each frame is read only once, so that
+        audioop is faster than the prefix sums if it is available.
+
+        :param nb_frames: (int) Nb of frames of each window
+        :param begin: (int) Position of the first frame of the first window
+        :param end: (int) Position after the last frame. None for the end.
+        :param nb_values: (int) Nb of windows; by default, the last one
+        is the one which contains end-1.
+        :returns: (list of int)
+
+        """
+        nb_frames = int(nb_frames)
+        if nb_frames < 1:
+            raise ValueError('Invalid window size: {}'.format(nb_frames))
+        if end is None:
+            end = self._nframes
+        end = min(int(end), self._nframes)
+        begin = max(0, int(begin))
+        if nb_values is None:
+            nb_values = max(0, (end - begin + nb_frames - 1) // nb_frames)
+
+        if audioframes.audioop is None:
+            return [self.rms(begin + i * nb_frames,
+                             min(begin + (i + 1) * nb_frames, end))
+                    for i in range(nb_values)]
+
+        # The windows entirely inside the range are all of the same size
+        rms = audioframes.audioop.rms
+        frames = memoryview(self._frames)
+        step = nb_frames * self._sampwidth
+        start = begin * self._sampwidth
+        nb_full = max(0, min(nb_values, (end - begin) // nb_frames))
+        values = [rms(frames[i:i + step], self._sampwidth)
+                  for i in range(start, start + nb_full * step, step)]
+
+        for i in range(nb_full, nb_values):
+            first = begin + i * nb_frames
+            last = min(first + nb_frames, end)
+            if last > first:
+                values.append(rms(
+                    frames[first * self._sampwidth:last * self._sampwidth],
+                    self._sampwidth))
+            else:
+                values.append(0)
+        return values
+
+    # -----------------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------------
+
+    def __cumul(self, idx):
+        """Return the sum of the squared samples of the chunks before idx.
+
+        The cumulative sums are extended up to the given chunk the first
+        time it is needed.
+
+        :param idx: (int) Index of the chunk
+        :returns: (int)
+
+        """
+        cumul = self._cumul
+        while len(cumul) <= idx:
+            cumul.append(cumul[-1] + self.__total(len(cumul) - 1))
+        return cumul[idx]
+
+    # -----------------------------------------------------------------------
+
+    def __total(self, idx):
+        """Return the sum of the squared samples of a chunk.
+
+        A total already known from the prefix sums of the chunk is used
+        only once, by the cumulative sums.
+
+        :param idx: (int) Index of the chunk
+        :returns: (int)
+
+        """
+        total = self._totals.pop(idx, None)
+        if total is None:
+            prefix = self._chunks.get(idx, None)
+            if prefix is not None:
+                total = prefix[-1]
+            else:
+                samples = self.__samples(idx)
+                total = sum(map(mul, samples, samples))
+        return total
+
+    # -----------------------------------------------------------------------
+
+    def __prefix_sums(self, idx):
+        """Return the prefix sums of the squared samples of a chunk.
+
+        :param idx: (int) Index of the chunk
+        :returns: (list of int) the first value is 0
+
+        """
+        prefix = self._chunks.get(idx, None)
+        if prefix is not None:
+            self._chunks.pop(idx)
+            self._chunks[idx] = prefix
+            return prefix
+
+        samples = self.__samples(idx)
+        prefix = [0]
+        prefix.extend(accumulate(map(mul, samples, samples)))
+        if idx >= len(self._cumul):
+            self._totals[idx] = prefix[-1]
+
+        self._chunks[idx] = prefix
+        if len(self._chunks) > CACHE_SIZE:
+            self._chunks.popitem(last=False)
+
+        return prefix
+
+    # -----------------------------------------------------------------------
+
+    def __samples(self, idx):
+        """Return the samples of a chunk.
+
+        :param idx: (int) Index of the chunk
+        :returns: (memoryview or array of int)
+
+        """
+        begin = idx * self._chunk_size
+        end = min(begin + self._chunk_size, self._nframes)
+        return sppasAudioFrames.frames2samples(
+            self._frames[begin * self._sampwidth:end * self._sampwidth],
+            self._sampwidth)
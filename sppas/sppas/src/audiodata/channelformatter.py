@@ -59,6 +59,7 @@ class sppasChannelFormatter(object):
         self._channel = channel
         self._framerate = channel.get_framerate()
         self._sampwidth = channel.get_sampwidth()
+        self._antialias = False
 
     # -----------------------------------------------------------------------
     # Getters
@@ -124,6 +125,18 @@ class sppasChannelFormatter(object):
 
     # -----------------------------------------------------------------------
 
+    def set_antialias(self, value):
+        """Use the band-limited resampler to change the frame rate.
+
+        It is disabled by default: the frames are linearly interpolated.
+
+        :param value: (bool)
+
+        """
+        self._antialias = bool(value)
+
+    # -----------------------------------------------------------------------
+
     def convert(self):
         """Convert the channel.
 
@@ -224,7 +237,8 @@ class sppasChannelFormatter(object):
             raise ValueError
         new_channel = sppasChannel()
         f = self._channel.get_frames()
-        new_channel.set_frames(f[:begin*self._sampwidth] + f[end*self._sampwidth:])
+        new_channel.set_frames(b"".join((f[:begin*self._sampwidth],
+                                          f[end*self._sampwidth:])))
         new_channel.set_sampwidth(self._sampwidth)
         new_channel.set_framerate(self._framerate)
         self._channel = new_channel
@@ -242,7 +256,9 @@ class sppasChannelFormatter(object):
             return
         new_channel = sppasChannel()
         f = self._channel.get_frames()
-        new_channel.set_frames(f[:position*self._sampwidth] + frames + f[position*self._sampwidth:])
+        new_channel.set_frames(b"".join((f[:position*self._sampwidth],
+                                          frames,
+                                          f[position*self._sampwidth:])))
         new_channel.set_sampwidth(self._sampwidth)
         new_channel.set_framerate(self._framerate)
         self._channel = new_channel
@@ -258,7 +274,7 @@ class sppasChannelFormatter(object):
         if len(frames) == 0:
             return
         new_channel = sppasChannel()
-        new_channel.set_frames(self._channel.get_frames() + frames)
+        new_channel.set_frames(b"".join((self._channel.get_frames(), frames)))
         new_channel.set_sampwidth(self._sampwidth)
         new_channel.set_framerate(self._framerate)
         self._channel = new_channel
@@ -282,6 +298,9 @@ class sppasChannelFormatter(object):
 
         # Convert the self._framerate if it needs to
         if self._channel.get_framerate() != self._framerate:
-            fragment.resample(self._sampwidth, self._channel.get_framerate(), self._framerate)
+            fragment.resample(self._sampwidth,
+                              self._channel.get_framerate(),
+                              self._framerate,
+                              self._antialias)
 
         return fragment.get_frames()
@@ -35,6 +35,7 @@
 
 from sppas.src.utils import b
 from .audioframes import sppasAudioFrames
+from .channelresampler import sppasChannelResampler
 
 # ---------------------------------------------------------------------------
 
@@ -89,7 +90,7 @@ class sppasChannelFrames(object):
         if nframes <= 0:
             return False
 
-        self._frames += b(" \x00") * nframes
+        self._frames = b"".join((self._frames, b(" \x00") * nframes))
         return True
 
     # ----------------------------------------------------------------------------
@@ -104,21 +105,31 @@ class sppasChannelFrames(object):
         if nframes <= 0:
             return False
 
-        self._frames = b(" \x00") * nframes + self._frames
+        self._frames = b"".join((b(" \x00") * nframes, self._frames))
         return True
 
     # ----------------------------------------------------------------------------
 
-    def resample(self, sampwidth, rate, newrate):
+    def resample(self, sampwidth, rate, newrate, antialias=False):
         """Resample the frames with a new frame rate.
 
+        By default, the frames are linearly interpolated by audioop.ratecv().
+        With antialias, the band-limited sppasChannelResampler is used: it
+        does not fold the high frequencies into the band of a lower frame
+        rate, but it is much slower.
+
         :param sampwidth: (int) sample width of the frames.
         :param rate: (int) current frame rate of the frames
         :param newrate: (int) new frame rate of the frames
+        :param antialias: (bool) use the band-limited resampler
 
         """
-        a = sppasAudioFrames(self._frames, sampwidth, 1)
-        self._frames = a.resample(rate, newrate)
+        if antialias is True:
+            resampler = sppasChannelResampler(sampwidth, rate, newrate)
+            self._frames = resampler.resample(self._frames)
+        else:
+            a = sppasAudioFrames(self._frames, sampwidth, 1)
+            self._frames = a.resample(rate, newrate)
 
     # ----------------------------------------------------------------------------
 
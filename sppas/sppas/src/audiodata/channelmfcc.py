@@ -31,8 +31,9 @@
     src.audiodata.channelmfcc.py
     ~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
-    Requires HTK to be installed.
-
+    The evaluation of MFCC is implemented natively, following the
+    algorithms of the HCopy command of HTK. HCopy can also still be used
+    if HTK is installed.
 
     Mel-frequency cepstrum (MFC) is a representation of the short-term power
     spectrum of a sound, based on a linear cosine transform of a log power
@@ -48,8 +49,51 @@
 
 """
 import os
+import math
+import cmath
+import struct
 import subprocess
 
+from .audioconvert import sppasAudioConverter
+
+# ---------------------------------------------------------------------------
+
+# HTK codes of the MFCC base parameter kind and of the qualifiers
+HTK_MFCC = 6
+HTK_QUALIFIERS = {
+    "E": 0o100,
+    "N": 0o200,
+    "D": 0o400,
+    "A": 0o1000,
+    "C": 0o2000,
+    "Z": 0o4000,
+    "K": 0o10000,
+    "0": 0o20000
+}
+
+# Default values of the HTK configuration parameters, except TARGETKIND
+# which is the one of the acoustic models of SPPAS.
+HTK_DEFAULTS = {
+    "SOURCERATE": 625.,
+    "TARGETKIND": "MFCC_0_D_N_Z",
+    "TARGETRATE": 100000.,
+    "WINDOWSIZE": 250000.,
+    "ZMEANSOURCE": False,
+    "USEHAMMING": True,
+    "PREEMCOEF": 0.97,
+    "NUMCHANS": 26,
+    "LOFREQ": -1.,
+    "HIFREQ": -1.,
+    "USEPOWER": False,
+    "NUMCEPS": 12,
+    "CEPLIFTER": 22,
+    "ENORMALISE": True,
+    "ESCALE": 0.1,
+    "SILFLOOR": 50.,
+    "DELTAWINDOW": 2,
+    "ACCWINDOW": 2
+}
+
 # ---------------------------------------------------------------------------
 
 
@@ -81,17 +125,150 @@ class sppasChannelMFCC(object):
     :copyright:    Copyright (C) 2011-2016  Brigitte Bigi
     :summary:      A channel MFCC extractor class.
 
+    The parameters are the ones of the HTK configuration files, and the
+    features are the ones HCopy produces from them: pre-emphasis, Hamming
+    window, FFT, mel filterbank, DCT, liftering, then optionally the log
+    energy (_E), C0 (_0), the cepstral mean subtraction (_Z), the deltas
+    (_D), the accelerations (_A) and the suppression of the absolute
+    energy (_N).
+
+    >>> mfcc = sppasChannelMFCC(channel)
+    >>> mfcc.set_config("models-fra/config")
+    >>> features = mfcc.evaluate()
+
     """
     def __init__(self, channel=None):
         """Create a sppasChannelMFCC instance.
 
-        :param channel: (sppasChannel) The channel to work on. Currently not used...!!!
+        :param channel: (sppasChannel) The channel to work on.
+
+        """
+        self._channel = None
+        self._params = dict(HTK_DEFAULTS)
+        self.set_channel(channel)
+
+    # ----------------------------------------------------------------------
+
+    def set_channel(self, channel):
+        """Set the channel to work on.
+
+        The sample period of the source is the one of the channel.
+
+        :param channel: (sppasChannel)
 
         """
         self._channel = channel
+        if channel is not None:
+            self.set_parameter("SOURCERATE",
+                               10000000. / channel.get_framerate())
+
+    # ----------------------------------------------------------------------
+    # Parameters
+    # ----------------------------------------------------------------------
+
+    def get_parameter(self, name):
+        """Return the value of an HTK configuration parameter.
+
+        :param name: (str) Name of the parameter, like in HTK config files
+        :returns: the value of the parameter
+
+        """
+        return self._params[name.upper()]
+
+    # ----------------------------------------------------------------------
+
+    def set_parameter(self, name, value):
+        """Set the value of an HTK configuration parameter.
+
+        Unknown parameters are ignored.
+
+        :param name: (str) Name of the parameter, like in HTK config files
+        :param value: (str, float, int or bool) Value of the parameter
+
+        """
+        name = name.upper()
+        if name not in HTK_DEFAULTS:
+            return
+        default = HTK_DEFAULTS[name]
+        if isinstance(default, bool):
+            if isinstance(value, bool) is False:
+                value = str(value).upper() in ("T", "TRUE", "1")
+        elif isinstance(default, int):
+            value = int(float(value))
+        elif isinstance(default, float):
+            value = float(value)
+        else:
+            value = str(value).upper()
+        self._params[name] = value
+
+    # ----------------------------------------------------------------------
+
+    def set_config(self, filename):
+        """Set the parameters from an HTK configuration file.
+
+        :param filename: (str) Name of a file with "NAME = value" lines
+
+        """
+        with open(filename, "r") as fp:
+            for line in fp:
+                line = line.split("#")[0]
+                if "=" in line:
+                    name, value = line.split("=", 1)
+                    name = name.strip().split(":")[-1]
+                    self.set_parameter(name, value.strip())
 
     # ----------------------------------------------------------------------
 
+    def set_features(self, features):
+        """Set the parameters from the acoustic features of a model.
+
+        :param features: (sppasAcFeatures)
+
+        """
+        self.set_parameter("SOURCERATE", 10000000. / features.framerate)
+        self.set_parameter("TARGETKIND", features.targetkind)
+        self.set_parameter("TARGETRATE", features.win_shift_ms * 10000.)
+        self.set_parameter("WINDOWSIZE", features.win_length_ms * 10000.)
+        self.set_parameter("PREEMCOEF", features.pre_em_coef)
+        self.set_parameter("NUMCHANS", features.num_chans)
+        self.set_parameter("CEPLIFTER", features.num_lift_ceps)
+        self.set_parameter("NUMCEPS", features.num_ceps)
+        self.set_parameter("ENORMALISE", False)
+
+    # ----------------------------------------------------------------------
+
+    def get_qualifiers(self):
+        """Return the qualifiers of the target kind.
+
+        The target kind is like the ones of HTK config files (MFCC_0_D_N_Z)
+        or the one returned by sppasAcModel.get_mfcc_parameter_kind().
+
+        :returns: (str) the qualifiers, like "0DNZ"
+
+        """
+        kind = self._params["TARGETKIND"].upper().split("_")
+        if kind[0] != "MFCC":
+            raise ValueError("Only MFCC target kinds are supported, "
+                             "not {:s}".format(self._params["TARGETKIND"]))
+        return "".join(kind[1:])
+
+    # ----------------------------------------------------------------------
+
+    def get_parameter_kind(self):
+        """Return the HTK code of the parameter kind of the features.
+
+        :returns: (int)
+
+        """
+        code = HTK_MFCC
+        for q in self.get_qualifiers():
+            code |= HTK_QUALIFIERS.get(q, 0)
+        return code
+
+    # ----------------------------------------------------------------------
+    # Evaluation
+    # ----------------------------------------------------------------------
+
     def hcopy(self, wavconfigfile, scpfile):
         """Create MFCC files from features described in the config file.
         Requires HCopy to be installed.
@@ -114,7 +291,354 @@ class sppasChannelMFCC(object):
 
     # ----------------------------------------------------------------------
 
-    def evaluate(self, features):
-        """Evaluate MFCC of the given channel."""
+    def evaluate(self, features=None, cache_file=None):
+        """Evaluate MFCC of the given channel.
+
+        :param features: (sppasAcFeatures) Acoustic features, or None to
+        use the current parameters
+        :param cache_file: (str) Name of an HTK parameter file. It is read
+        if it exists with the same parameter kind; otherwise the features
+        are evaluated and saved into it.
+        :returns: (list of list of float) one vector of features per frame
+
+        """
+        if features is not None:
+            self.set_features(features)
+        kind = self.get_parameter_kind()
+        period = int(self._params["TARGETRATE"])
+
+        if cache_file is not None and os.path.exists(cache_file):
+            cached_kind, cached_period, vectors = \
+                sppasChannelMFCC.read_htk(cache_file)
+            if cached_kind == kind and cached_period == period:
+                return vectors
+
+        vectors = self.__finalize(list(self.iter_static()))
+
+        if cache_file is not None:
+            sppasChannelMFCC.write_htk(cache_file, vectors, period, kind)
+
+        return vectors
+
+    # ----------------------------------------------------------------------
+
+    def iter_static(self):
+        """Evaluate the static features of the channel, frame by frame.
+
+        The channel is read block by block, so that this method can be
+        used on long channels. The static features are the cepstral
+        coefficients, then C0 and the log energy if they are required.
+        The log energy is not normalized and the cepstral mean is not
+        subtracted: both require the whole channel.
+
+        :returns: (list of float) the static features of each frame
+
+        """
+        if self._channel is None:
+            return
+        qualifiers = self.get_qualifiers()
+        period = float(self._params["SOURCERATE"])
+        win_size = int(self._params["WINDOWSIZE"] / period)
+        shift = int(self._params["TARGETRATE"] / period)
+        analyzer = _sppasMFCCAnalyzer(self._params, win_size)
+
+        sampwidth = self._channel.get_sampwidth()
+        frames = self._channel.get_frames()
+        nsamples = len(frames) // sampwidth
+        nframes = 0
+        if nsamples >= win_size:
+            nframes = (nsamples - win_size) // shift + 1
+
+        block = 256
+        for first in range(0, nframes, block):
+            last = min(nframes, first + block)
+            begin = first * shift
+            end = (last - 1) * shift + win_size
+            samples = sppasAudioConverter().unpack_data(
+                frames[begin * sampwidth:end * sampwidth], sampwidth, 1)[0]
+            for t in range(last - first):
+                s = t * shift
+                yield analyzer.static(samples[s:s + win_size], qualifiers)
+
+    # ----------------------------------------------------------------------
+
+    def __finalize(self, vectors):
+        """Add the dynamic features to the static ones.
+
+        :param vectors: (list of list of float) static features
+        :returns: (list of list of float)
+
+        """
+        qualifiers = self.get_qualifiers()
+        if len(vectors) == 0:
+            return vectors
+        nstatic = len(vectors[0])
+
+        if "E" in qualifiers and self._params["ENORMALISE"] is True:
+            e_max = max(v[-1] for v in vectors)
+            e_min = e_max - (self._params["SILFLOOR"] * math.log(10.)) / 10.
+            for v in vectors:
+                v[-1] = 1. - (e_max - max(v[-1], e_min)) * self._params["ESCALE"]
+
+        if "Z" in qualifiers:
+            # the log energy is not a cepstral coefficient
+            ncep = nstatic - 1 if "E" in qualifiers else nstatic
+            n = float(len(vectors))
+            means = [sum(v[i] for v in vectors) / n for i in range(ncep)]
+            for v in vectors:
+                for i in range(ncep):
+                    v[i] -= means[i]
+
+        if "D" in qualifiers or "A" in qualifiers:
+            deltas = sppasChannelMFCC.regression(
+                vectors, self._params["DELTAWINDOW"])
+            if "A" in qualifiers:
+                accs = sppasChannelMFCC.regression(
+                    deltas, self._params["ACCWINDOW"])
+                vectors = [v + d + a for v, d, a in zip(vectors, deltas, accs)]
+            else:
+                vectors = [v + d for v, d in zip(vectors, deltas)]
+
+        if "N" in qualifiers and ("E" in qualifiers or "0" in qualifiers):
+            # suppress the absolute energy, i.e. the last static value
+            vectors = [v[:nstatic-1] + v[nstatic:] for v in vectors]
+
+        return vectors
+
+    # ----------------------------------------------------------------------
+
+    @staticmethod
+    def regression(vectors, window):
+        """Return the regression coefficients of a list of vectors.
+
+        It's the HTK formula, with the first and last vectors replicated
+        at the edges.
+
+        :param vectors: (list of list of float)
+        :param window: (int) the half-size of the regression window
+        :returns: (list of list of float)
+
+        """
+        n = len(vectors)
+        window = int(window)
+        norm = 2. * sum(theta * theta for theta in range(1, window + 1))
+        result = list()
+        for t in range(n):
+            d = [0.] * len(vectors[t])
+            for theta in range(1, window + 1):
+                after = vectors[min(n - 1, t + theta)]
+                before = vectors[max(0, t - theta)]
+                for i in range(len(d)):
+                    d[i] += theta * (after[i] - before[i])
+            result.append([x / norm for x in d])
+        return result
+
+    # ----------------------------------------------------------------------
+    # HTK parameter files
+    # ----------------------------------------------------------------------
+
+    @staticmethod
+    def write_htk(filename, vectors, period, kind):
+        """Write features into an uncompressed HTK parameter file.
+
+        :param filename: (str) Name of the file
+        :param vectors: (list of list of float) one vector per frame
+        :param period: (int) sample period in 100ns units
+        :param kind: (int) HTK code of the parameter kind
+
+        """
+        kind &= ~(HTK_QUALIFIERS["C"] | HTK_QUALIFIERS["K"])
+        size = len(vectors[0]) if len(vectors) > 0 else 0
+        with open(filename, "wb") as fp:
+            fp.write(struct.pack(">iihh", len(vectors), int(period),
+                                 size * 4, kind))
+            for v in vectors:
+                fp.write(struct.pack(">%df" % size, *v))
+
+    # ----------------------------------------------------------------------
+
+    @staticmethod
+    def read_htk(filename):
+        """Read an uncompressed HTK parameter file.
 
-        raise NotImplementedError
+        :param filename: (str) Name of the file
+        :returns: (tuple) kind, period, vectors
+
+        """
+        with open(filename, "rb") as fp:
+            nvectors, period, size, kind = struct.unpack(">iihh", fp.read(12))
+            size //= 4
+            vectors = list()
+            for i in range(nvectors):
+                vectors.append(list(struct.unpack(">%df" % size,
+                                                  fp.read(size * 4))))
+        return kind, period, vectors
+
+# ---------------------------------------------------------------------------
+
+
+class _sppasMFCCAnalyzer(object):
+    """Static features of a frame, with pre-computed tables.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2018  Brigitte Bigi
+
+    """
+    def __init__(self, params, win_size):
+        self._params = params
+        self._win_size = win_size
+        self._fft_size = 2
+        while self._fft_size < win_size:
+            self._fft_size *= 2
+
+        # Hamming window
+        if params["USEHAMMING"] is True:
+            a = 2. * math.pi / (win_size - 1)
+            self._window = [0.54 - 0.46 * math.cos(a * i)
+                            for i in range(win_size)]
+        else:
+            self._window = None
+
+        # FFT: bit reversal permutation and twiddle factors
+        n = self._fft_size
+        bits = n.bit_length() - 1
+        self._reverse = [int(format(i, "0%db" % bits)[::-1], 2)
+                         for i in range(n)]
+        self._twiddles = [cmath.exp(-2j * math.pi * k / n)
+                          for k in range(n // 2)]
+
+        self.__init_filterbank()
+
+        # DCT and liftering
+        numchans = params["NUMCHANS"]
+        numceps = params["NUMCEPS"]
+        lifter = params["CEPLIFTER"]
+        norm = math.sqrt(2. / numchans)
+        self._dct = list()
+        for j in range(1, numceps + 1):
+            w = 1.
+            if lifter > 0:
+                w = 1. + lifter / 2. * math.sin(j * math.pi / lifter)
+            self._dct.append([w * norm * math.cos(math.pi * j / numchans * (k + 0.5))
+                              for k in range(numchans)])
+        self._c0_norm = norm
+
+    # ----------------------------------------------------------------------
+
+    def __init_filterbank(self):
+        """Compute the mel filterbank, like HTK does."""
+        params = self._params
+        n = self._fft_size
+        half = n // 2
+        fres = 1.0e7 / (params["SOURCERATE"] * n * 700.)
+        numchans = params["NUMCHANS"]
+
+        def mel(k):
+            return 1127. * math.log(1. + (k - 1) * fres)
+
+        klo = 2
+        khi = half
+        mlo = 0.
+        mhi = mel(half + 1)
+        if params["LOFREQ"] >= 0.:
+            mlo = 1127. * math.log(1. + params["LOFREQ"] / 700.)
+            klo = max(2, int((params["LOFREQ"] * params["SOURCERATE"] * 1.0e-7) * n + 2.5))
+        if params["HIFREQ"] >= 0.:
+            mhi = 1127. * math.log(1. + params["HIFREQ"] / 700.)
+            khi = min(half, int((params["HIFREQ"] * params["SOURCERATE"] * 1.0e-7) * n + 0.5))
+
+        # centre frequencies, with indexes from 1 to numchans+1
+        maxchan = numchans + 1
+        cf = [0.] + [float(c) / maxchan * (mhi - mlo) + mlo
+                     for c in range(1, maxchan + 1)]
+
+        # the lower channel and its weight of each FFT bin k (1..half)
+        self._bins = list()
+        chan = 1
+        for k in range(1, half + 1):
+            if k < klo or k > khi:
+                continue
+            melk = mel(k)
+            while chan <= maxchan and cf[chan] < melk:
+                chan += 1
+            lo = chan - 1
+            if lo > 0:
+                weight = (cf[lo + 1] - melk) / (cf[lo + 1] - cf[lo])
+            else:
+                weight = (cf[1] - melk) / (cf[1] - mlo)
+            self._bins.append((k - 1, lo, weight))
+
+    # ----------------------------------------------------------------------
+
+    def fft(self, x):
+        """Return the FFT of a list of fft_size real values."""
+        n = self._fft_size
+        a = [complex(x[r]) for r in self._reverse]
+        size = 2
+        while size <= n:
+            half = size // 2
+            step = n // size
+            tw = self._twiddles[::step]
+            for start in range(0, n, size):
+                for k in range(half):
+                    i = start + k
+                    t = tw[k] * a[i + half]
+                    a[i + half] = a[i] - t
+                    a[i] += t
+            size *= 2
+        return a
+
+    # ----------------------------------------------------------------------
+
+    def static(self, samples, qualifiers):
+        """Return the static features of a frame.
+
+        :param samples: (list of int) the win_size samples of the frame
+        :param qualifiers: (str) qualifiers of the target kind
+        :returns: (list of float)
+
+        """
+        params = self._params
+        x = [float(s) for s in samples]
+        if params["ZMEANSOURCE"] is True:
+            mean = sum(x) / len(x)
+            x = [v - mean for v in x]
+
+        energy = None
+        if "E" in qualifiers:
+            energy = math.log(max(sum(v * v for v in x), 1.0e-5))
+
+        # pre-emphasis
+        k = params["PREEMCOEF"]
+        if k > 0.:
+            x = [x[0] * (1. - k)] + [x[i] - k * x[i - 1]
+                                      for i in range(1, len(x))]
+
+        if self._window is not None:
+            x = [v * w for v, w in zip(x, self._window)]
+        x.extend([0.] * (self._fft_size - len(x)))
+
+        # mel filterbank
+        spectrum = self.fft(x)
+        numchans = params["NUMCHANS"]
+        fbank = [0.] * (numchans + 2)
+        use_power = params["USEPOWER"]
+        for (k, lo, weight) in self._bins:
+            ek = abs(spectrum[k])
+            if use_power is True:
+                ek *= ek
+            t = weight * ek
+            fbank[lo] += t
+            fbank[lo + 1] += ek - t
+        fbank = [math.log(max(v, 1.)) for v in fbank[1:numchans + 1]]
+
+        # cepstral coefficients
+        features = [sum(w * f for w, f in zip(row, fbank)) for row in self._dct]
+        if "0" in qualifiers:
+            features.append(self._c0_norm * sum(fbank))
+        if energy is not None:
+            features.append(energy)
+        return features
@@ -0,0 +1,271 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+
+    src.audiodata.channelresampler.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+"""
+import math
+from operator import mul
+
+from .audioframes import sppasAudioFrames
+
+# ----------------------------------------------------------------------------
+
+ZERO_CROSSINGS = 24  # Nb of zero crossings of the sinc on each side
+ROLLOFF = 0.95        # Cut-off frequency relatively to the Nyquist frequency
+KAISER_BETA = 8.     # Shape of the Kaiser window: about 80dB of attenuation
+
+# ----------------------------------------------------------------------------
+
+
+def gcd(a, b):
+    """Return the greatest common divisor of a and b."""
+    while b:
+        a, b = b, a % b
+    return a
+
+# ----------------------------------------------------------------------------
+
+
+def bessel_i0(x):
+    """Return the modified Bessel function of order 0 of x."""
+    total = 1.
+    term = 1.
+    k = 1
+    while term > 1e-12 * total:
+        term *= (x / (2. * k)) ** 2
+        total += term
+        k += 1
+    return total
+
+# ----------------------------------------------------------------------------
+
+
+class sppasChannelResampler(object):
+    """Change the frame rate of the frames of a channel.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2018  Brigitte Bigi
+
+    A polyphase FIR resampler: the rate is multiplied by up/down, and a
+    low-pass filter (a sinc with a Kaiser window) removes the frequencies
+    above the lowest Nyquist frequency. Unlike audioop.ratecv(), which
+    interpolates linearly, it does not fold the high frequencies into the
+    band of a lower frame rate, like when 44.1kHz or 48kHz are converted
+    into the 16kHz of the acoustic models.
+
+    Each output sample is the product of one of the "up" phases of the
+    filter by a few input samples only. The frames can be given in
+    several blocks: the last input samples of a block are kept for the
+    next one, so that files larger than memory can be converted.
+
+    >>> resampler = sppasChannelResampler(2, 44100, 16000)
+    >>> frames = resampler.resample(channel.get_frames())
+    >>> # or, block by block:
+    >>> frames = b"".join(resampler.process(f) for f in blocks)
+    >>> frames += resampler.flush()
+
+    """
+
+    def __init__(self, sampwidth, rate, new_rate):
+        """Create a sppasChannelResampler instance.
+
+        :param sampwidth: (int) sample width of the frames
+        :param rate: (int) current frame rate of the frames
+        :param new_rate: (int) new frame rate of the frames
+
+        """
+        rate = int(rate)
+        new_rate = int(new_rate)
+        if rate <= 0 or new_rate <= 0:
+            raise ValueError('Invalid frame rates: {}, {}'.format(rate, new_rate))
+
+        d = gcd(rate, new_rate)
+        self._up = new_rate // d
+        self._down = rate // d
+        self._sampwidth = sampwidth
+        self._minval = sppasAudioFrames.get_minval(sampwidth)
+        self._maxval = sppasAudioFrames.get_maxval(sampwidth)
+
+        # Length of the filter, in input samples (for each phase)
+        ratio = max(1., float(self._down) / float(self._up))
+        self._ntaps = 2 * int(math.ceil(ZERO_CROSSINGS * ratio))
+        self._phases = self.__design_filter()
+        # Delay of the filter, at the up-sampled rate
+        self._delay = (self._ntaps * self._up) // 2
+
+        self.reset()
+
+    # -----------------------------------------------------------------------
+
+    def reset(self):
+        """Forget the frames of the previous blocks."""
+        # input samples, starting at index self._first, with zeros before 0
+        self._buffer = [0.] * self._ntaps
+        self._first = -self._ntaps
+        self._nin = 0
+        self._nout = 0
+
+    # -----------------------------------------------------------------------
+
+    def resample(self, frames):
+        """Return the re-sampled frames.
+
+        :param frames: (str) all the frames of a channel
+        :returns: (str) converted frames
+
+        """
+        if self._up == self._down:
+            return frames
+        self.reset()
+        return b"".join((self.process(frames), self.flush()))
+
+    # -----------------------------------------------------------------------
+
+    def process(self, frames):
+        """Return the frames which can be re-sampled from a new block.
+
+        :param frames: (str) the frames of the next block
+        :returns: (str) converted frames
+
+        """
+        if self._up == self._down:
+            return frames
+        samples = sppasAudioFrames.frames2samples(frames, self._sampwidth)
+        self._buffer.extend(samples)
+        self._nin += len(samples)
+        return self.__convert(self._nin)
+
+    # -----------------------------------------------------------------------
+
+    def flush(self):
+        """Return the last re-sampled frames, after the last block.
+
+        :returns: (str) converted frames
+
+        """
+        if self._up == self._down:
+            return b""
+        self._buffer.extend([0.] * self._ntaps)
+        frames = self.__convert(self._nin + self._ntaps)
+        self.reset()
+        return frames
+
+    # -----------------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------------
+
+    def __design_filter(self):
+        """Return the phases of the low-pass filter.
+
+        The coefficients of each phase are reversed, so that they can be
+        multiplied by the input samples in their natural order.
+
+        :returns: (list of list of float)
+
+        """
+        up = self._up
+        size = self._ntaps * up
+        center = (size - 1) / 2.
+        # cut-off frequency, in cycles per up-sampled sample
+        cutoff = ROLLOFF * 0.5 / max(up, self._down)
+        norm = bessel_i0(KAISER_BETA)
+
+        coefs = list()
+        for j in range(size):
+            t = j - center
+            if t == 0.:
+                value = 2. * cutoff
+            else:
+                value = math.sin(2. * math.pi * cutoff * t) / (math.pi * t)
+            r = 2. * t / (size - 1)
+            value *= bessel_i0(KAISER_BETA * math.sqrt(max(0., 1. - r * r))) / norm
+            coefs.append(value)
+
+        # the gain of each phase is 1
+        phases = list()
+        for p in range(up):
+            phase = coefs[p::up]
+            gain = sum(phase)
+            phases.append([c / gain for c in reversed(phase)])
+
+        return phases
+
+    # -----------------------------------------------------------------------
+
+    def __convert(self, available):
+        """Return the frames of the output samples computable from the buffer.
+
+        :param available: (int) Nb of input samples in the buffer
+        :returns: (str) frames
+
+        """
+        up = self._up
+        down = self._down
+        ntaps = self._ntaps
+        phases = self._phases
+        buf = self._buffer
+        first = self._first
+        minval = self._minval
+        maxval = self._maxval
+
+        # total number of output samples of the input samples
+        nout_max = (self._nin * up + down - 1) // down
+
+        values = list()
+        n = self._nout
+        while n < nout_max:
+            s = n * down + self._delay
+            last, p = divmod(s, up)
+            if last >= available:
+                break
+            start = last - ntaps + 1 - first
+            v = sum(map(mul, phases[p], buf[start:start + ntaps]))
+            v = int(math.floor(v + 0.5))
+            if v > maxval:
+                v = maxval
+            elif v < minval:
+                v = minval
+            values.append(v)
+            n += 1
+        self._nout = n
+
+        # forget the input samples which won't be used anymore
+        s = n * down + self._delay
+        keep = s // up - ntaps + 1 - first
+        if keep > 0:
+            del buf[:keep]
+            self._first += keep
+
+        return sppasAudioFrames.samples2frames(values, self._sampwidth)
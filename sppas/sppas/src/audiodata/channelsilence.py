@@ -34,7 +34,6 @@
 
 """
 
-from .channel import sppasChannel
 from .channelvolume import sppasChannelVolume
 
 # ----------------------------------------------------------------------------
@@ -112,10 +111,8 @@ class sppasChannelSilence(object):
         """
         delta = int(self._volume_stats.get_winlen() * self._channel.get_framerate())
         from_pos = max(pos-delta, 0)
-        self._channel.seek(from_pos)
-        frames = self._channel.get_frames(delta*2)
-        c = sppasChannel(self._channel.get_framerate(), self._channel.get_sampwidth(), frames)
-        vol_stats = sppasChannelVolume(c, win_length)
+        vol_stats = self._volume_stats.volumes_between(
+            from_pos, from_pos + delta*2, win_length)
 
         if direction == 1:
             for i, v in enumerate(vol_stats):
@@ -33,7 +33,7 @@
 
 """
 
-import struct
+from operator import add
 
 from .channel import sppasChannel
 from .channelframes import sppasChannelFrames
@@ -53,6 +53,10 @@ class sppasChannelMixer(object):
     :summary:      A channel utility class to mix several channels in one.
 
     """
+
+    # Number of frames of the blocks which are mixed at once
+    BLOCK_SIZE = 65536
+
     def __init__(self):
         """Create a ChannelMixer instance."""
         
@@ -155,30 +159,28 @@ class sppasChannelMixer(object):
 
         sampwidth = self._channels[0].get_sampwidth()
         framerate = self._channels[0].get_framerate()
-
-        frames = b""
-        if sampwidth == 4:
-            for s in range(0, len(self._channels[0].get_frames()), sampwidth):
-                value = sppasChannelMixer._sample_calculator(self._channels, s, sampwidth, self._factors, attenuator)
-                try:
-                    frames += struct.pack("<l", long(value))  # python 2
-                except:
-                    frames += struct.pack("<l", int(value))  # python 3
-
-        elif sampwidth == 2:
-            for s in range(0, len(self._channels[0].get_frames()), sampwidth):
-                value = sppasChannelMixer._sample_calculator(self._channels, s, sampwidth, self._factors, attenuator)
-                frames += struct.pack("<h", int(value))
-
-        else:
-            for s in range(0, len(self._channels[0].get_frames()), sampwidth):
-                value = sppasChannelMixer._sample_calculator(self._channels, s, sampwidth, self._factors, attenuator)
-                frames += struct.pack("<b", int(value))
+        frames = b"".join(self.iter_mix(attenuator))
 
         return sppasChannel(framerate, sampwidth, frames)
 
     # -----------------------------------------------------------------------
 
+    def iter_mix(self, attenuator=1, nframes=None):
+        """Mix the channels of the list, block by block.
+
+        :param attenuator: (float) the factor to apply to each sample calculated
+        :param nframes: (int) number of frames of each block
+        :returns: (str) the mixed frames of each block
+
+        """
+        self.check_channels()
+
+        sampwidth = self._channels[0].get_sampwidth()
+        for values in self.__iter_blocks(attenuator, nframes):
+            yield sppasAudioConverter().samples2frames([values], sampwidth)
+
+    # -----------------------------------------------------------------------
+
     def get_minmax(self):
         """Return a tuple with the minimum and the maximum samples values.
 
@@ -188,23 +190,53 @@ class sppasChannelMixer(object):
         # ensuring conformity
         self.check_channels()
 
-        sampwidth = self._channels[0].get_sampwidth()
         minval = 0
         maxval = 0
-        sampsum = 0
-        for s in range(0, len(self._channels[0].get_frames()), sampwidth):
-            value = sppasChannelMixer._sample_calculator(self._channels, s, sampwidth, self._factors, 1)
-            try:
-                sampsum = long(value)   # python 2
-            except:
-                sampsum = int(value)  # python 3
-            maxval = max(sampsum, maxval)
-            minval = min(sampsum, minval)
+        for values in self.__iter_blocks(1):
+            if len(values) > 0:
+                minval = min(minval, min(values))
+                maxval = max(maxval, max(values))
 
         return minval, maxval
 
     # -----------------------------------------------------------------------
 
+    def __iter_blocks(self, attenuator, nframes=None):
+        """Return the mixed samples, block by block.
+
+        Each block is the weighted sum of the samples of all channels,
+        truncated to the range of the sample width, like it is done by
+        _sample_calculator() for a single sample.
+
+        :param attenuator: (float) the factor to apply to each sum of samples
+        :param nframes: (int) number of frames of each block
+        :returns: (list of int) the samples of each block
+
+        """
+        if nframes is None:
+            nframes = sppasChannelMixer.BLOCK_SIZE
+        sampwidth = self._channels[0].get_sampwidth()
+        minval = float(sppasChannelFrames().get_minval(sampwidth))
+        maxval = float(sppasChannelFrames().get_maxval(sampwidth))
+        all_frames = [c.get_frames() for c in self._channels]
+        blocksize = int(nframes) * sampwidth
+
+        for start in range(0, len(all_frames[0]), blocksize):
+            sums = None
+            for factor, frames in zip(self._factors, all_frames):
+                data = sppasAudioConverter().unpack_data(
+                    frames[start:start+blocksize], sampwidth, 1)[0]
+                data = [v * factor * attenuator for v in data]
+                if sums is None:
+                    sums = data
+                else:
+                    sums = list(map(add, sums, data))
+
+            # truncate the values if there is clipping
+            yield [int(min(max(v, minval), maxval)) for v in sums]
+
+    # -----------------------------------------------------------------------
+
     def norm_length(self):
         """Normalize the number of frames of all the channels,
         by appending silence at the end.
@@ -34,9 +34,7 @@
 
 """
 
-import logging
-
-from .audioframes import sppasAudioFrames
+from .channelenergy import sppasChannelEnergy
 from .basevolume import sppasBaseVolume
 
 # ----------------------------------------------------------------------------
@@ -52,6 +50,8 @@ class sppasChannelVolume(sppasBaseVolume):
     :copyright:    Copyright (C) 2011-2016  Brigitte Bigi
 
     The volume is the estimation of RMS values, sampled with a window of 10ms.
+    The squared samples are summed only once, so that the volume values of
+    any other window can be estimated in constant time.
 
     """
 
@@ -65,76 +65,50 @@ class sppasChannelVolume(sppasBaseVolume):
         super(sppasChannelVolume, self).__init__(win_len)
         self._channel = channel
         self._win_len = win_len
+        self._energy = sppasChannelEnergy(channel)
+        self._volumes = self.volumes_between(0, self._energy.get_nframes(),
+                                             win_len)
+        self._rms = self._channel.rms()
 
-        # Remember current position
-        pos = channel.tell()
-
-        # Rewind to the beginning
-        channel.rewind()
-
-        # Constants
-        nb_frames = int(win_len * channel.get_framerate())
-        nb_vols = int(channel.get_duration()/win_len) + 1
-        self._volumes = [0] * nb_vols
-
-        previous_rms = 0
-        for i in range(nb_vols):
-            frames = channel.get_frames(nb_frames)
-            a = sppasAudioFrames(frames, channel.get_sampwidth(), 1)
-            rms = a.rms()
-            if rms > 0:  # provide negative values of corrupted audio files
-                self._volumes[i] = rms
-            elif rms < 0:
-                self._volumes[i] = previous_rms
-                logging.warning("Corrupted audio? "
-                                "The RMS is a negative value {:d}".format(rms))
-            previous_rms = rms
+    # -----------------------------------------------------------------------
 
-        if self._volumes[-1] == 0:
-            self._volumes.pop()
+    def evaluate(self, win_len):
+        """Force to re-estimate the volume values with a new window length.
 
-        # Returns to the position where we was before
-        channel.seek(pos)
+        :param win_len: (float) Window length to estimate the volume.
 
-        self._rms = channel.rms()
+        """
+        self._volumes = self.volumes_between(0, self._energy.get_nframes(),
+                                             win_len)
+        self._reset_stats()
+        self._rms = self._channel.rms()
+        self._win_len = win_len
+        self._winlen = float(win_len)
 
     # -----------------------------------------------------------------------
 
-    def set_volume_value(self, index, value):
-        """Set manually the rms at a given position."""
-        self._volumes[index] = value
+    def volumes_between(self, from_pos, to_pos, win_len):
+        """Estimate the volume values of a part of the channel.
 
-    # -----------------------------------------------------------------------
+        The values are the ones of a sppasChannelVolume() of the frames
+        between the given positions, but they are estimated without
+        reading the frames.
 
-    def evaluate(self, win_len):
-        """Force to re-estimate the global rms value."""
-
-        # Remember current position
-        pos = self._channel.tell()
-
-        # Rewind to the beginning
-        self._channel.rewind()
-
-        nb_frames = int(win_len * self._channel.get_framerate())
-        nb_vols = int(self._channel.get_duration()/win_len) + 1
-        previous_rms = 0
-        for i in range(nb_vols):
-            frames = self._channel.get_frames(nb_frames)
-            a = sppasAudioFrames(frames, self._channel.get_sampwidth(), 1)
-            rms = a.rms()
-            if rms > 0:  # provide negative values of corrupted audio files
-                self._volumes[i] = rms
-            elif rms < 0:
-                self._volumes[i] = previous_rms
-                logging.warning("Corrupted audio? "
-                                "The RMS is a negative value {:d}".format(rms))
-            previous_rms = rms
-
-        if self._volumes[-1] == 0:
-            self._volumes.pop()
-
-        # Returns to the position where we was before
-        self._channel.seek(pos)
+        :param from_pos: (int) Position of the first frame
+        :param to_pos: (int) Position after the last frame
+        :param win_len: (float) Window length to estimate the volume.
+        :returns: (list of int)
 
-        self._rms = self._channel.rms()
-        self._win_len = win_len
+        """
+        framerate = self._channel.get_framerate()
+        from_pos = int(from_pos)
+        to_pos = min(int(to_pos), self._energy.get_nframes())
+        nb_frames = int(win_len * framerate)
+        duration = float(max(0, to_pos - from_pos)) / float(framerate)
+        nb_vols = int(duration / win_len) + 1
+
+        volumes = self._energy.rms_values(nb_frames, from_pos, to_pos, nb_vols)
+        if volumes[-1] == 0:
+            volumes.pop()
+
+        return volumes
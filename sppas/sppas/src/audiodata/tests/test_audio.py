@@ -83,6 +83,10 @@ class TestAudioPCM(unittest.TestCase):
         cidx2 = a3.extract_channel(1)
         c1 = a3.get_channel(cidx1)
         c2 = a3.get_channel(cidx2)
+        a3.seek(0)
+        frames = a3.read_channels(a3.get_nframes())
+        self.assertEqual(frames[0], c1.get_frames())
+        self.assertEqual(frames[1], c2.get_frames())
         self.assertEqual(0, a2.append_channel(c1))
         self.assertEqual(1, a2.append_channel(c2))
         a2.insert_channel(0, c1)
@@ -41,6 +41,8 @@ from sppas.src.config import paths
 from ..aio import open as audio_open
 from ..aio import save as audio_save
 from ..aio import save_fragment as audio_save_fragment
+from ..aio import open_mmap as audio_open_mmap
+from ..audio import sppasAudioPCM
 
 from sppas.src.files.fileutils import sppasFileUtils
 
@@ -205,3 +207,80 @@ class TestData(unittest.TestCase):
         self.assertEqual(channel_ref.get_nframes(), channel_read.get_nframes())
         self.assertEqual(samples_ref, samples_read)
         self.assertEqual(frames_ref, frames_read)
+
+# ---------------------------------------------------------------------------
+
+
+class TestWaveMMap(unittest.TestCase):
+
+    def setUp(self):
+        if os.path.exists(TEMP) is False:
+            os.mkdir(TEMP)
+
+    def tearDown(self):
+        shutil.rmtree(TEMP)
+
+    def test_same_as_wave(self):
+        for sample in (sample_1, sample_2, sample_3):
+            audio = audio_open(sample)
+            mapped = audio_open_mmap(sample)
+            self.assertEqual(audio.get_framerate(), mapped.get_framerate())
+            self.assertEqual(audio.get_sampwidth(), mapped.get_sampwidth())
+            self.assertEqual(audio.get_nchannels(), mapped.get_nchannels())
+            self.assertEqual(audio.get_nframes(), mapped.get_nframes())
+
+            self.assertEqual(audio.read_frames(1000), mapped.read_frames(1000))
+            self.assertEqual(1000, mapped.tell())
+            audio.seek(5000)
+            mapped.seek(5000)
+            self.assertEqual(audio.read_frames(100), mapped.read_frames(100))
+            self.assertEqual(audio.read_samples(10), mapped.read_samples(10))
+
+            audio.extract_channels()
+            mapped.extract_channels()
+            for i in range(audio.get_nchannels()):
+                self.assertEqual(audio.get_channel(i).get_frames(),
+                                 mapped.get_channel(i).get_frames())
+                self.assertEqual(audio.get_channel(i).rms(),
+                                 mapped.get_channel(i).rms())
+            audio.close()
+            mapped.close()
+
+    def test_views(self):
+        mapped = audio_open_mmap(sample_1)
+        mapped.extract_channel(0)
+        channel = mapped.get_channel(0)
+        self.assertIsInstance(channel.get_frames(), memoryview)
+        fragment = channel.extract_fragment(16000, 32000)
+        self.assertIsInstance(fragment.get_frames(), memoryview)
+        self.assertEqual(16000, fragment.get_nframes())
+        mapped.seek(16000)
+        self.assertEqual(mapped.read_frames(16000), fragment.get_frames())
+        self.assertEqual(mapped.read_frames(100), channel.get_frames()[64000:64200])
+
+        # the channel remains valid after the file is closed
+        mapped.close()
+        self.assertEqual(16000*2, len(fragment.get_frames().tobytes()))
+
+        # save the channel and compare
+        audio = sppasAudioPCM()
+        audio.append_channel(channel)
+        audio_save(os.path.join(TEMP, "mapped.wav"), audio)
+        saved = audio_open(os.path.join(TEMP, "mapped.wav"))
+        original = audio_open(sample_1)
+        self.assertEqual(original.read_frames(original.get_nframes()),
+                         saved.read_frames(saved.get_nframes()))
+        saved.close()
+        original.close()
+
+    def test_not_read(self):
+        with self.assertRaises(IOError):
+            audio_open_mmap(os.path.join(TEMP, "nofile.wav"))
+        with open(os.path.join(TEMP, "empty.wav"), "wb") as fp:
+            fp.write(b"")
+        with self.assertRaises(IOError):
+            audio_open_mmap(os.path.join(TEMP, "empty.wav"))
+        with open(os.path.join(TEMP, "text.wav"), "wb") as fp:
+            fp.write(b"This is not an audio file.")
+        with self.assertRaises(IOError):
+            audio_open_mmap(os.path.join(TEMP, "text.wav"))
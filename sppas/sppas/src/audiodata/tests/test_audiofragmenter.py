@@ -0,0 +1,129 @@
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+    src.audiodata.tests.test_audiofragmenter.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+"""
+import unittest
+import os
+import shutil
+
+from sppas.src.config import paths
+from sppas.src.files.fileutils import sppasFileUtils
+
+from ..aio import open as audio_open
+from ..audiodataexc import IntervalError
+from ..audiofragmenter import sppasAudioFragmenter
+from .. import autils
+
+# ---------------------------------------------------------------------------
+
+TEMP = sppasFileUtils().set_random()
+sample_1 = os.path.join(paths.samples, "samples-eng", "oriana1.wav")
+sample_2 = os.path.join(paths.samples, "samples-cat", "TB-FE1-H1_phrase1.wav")
+
+# ---------------------------------------------------------------------------
+
+
+class TestAudioFragmenter(unittest.TestCase):
+
+    def setUp(self):
+        if os.path.exists(TEMP) is False:
+            os.mkdir(TEMP)
+
+    def tearDown(self):
+        shutil.rmtree(TEMP)
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def read_file(filename):
+        with open(filename, "rb") as fp:
+            return fp.read()
+
+    # -----------------------------------------------------------------------
+
+    def test_fragment(self):
+        fragmenter = sppasAudioFragmenter(sample_1)
+        audio = audio_open(sample_1)
+        self.assertEqual(fragmenter.get_framerate(), audio.get_framerate())
+        self.assertEqual(fragmenter.get_nframes(), audio.get_nframes())
+        audio.extract_channel(0)
+        channel = audio.get_channel(0)
+        audio.close()
+
+        for begin, end in ((0, 100), (1000, 20000), (20000, -1)):
+            self.assertEqual(
+                fragmenter.get_fragment(begin, end).tobytes(),
+                channel.extract_fragment(begin, end).get_frames())
+        self.assertEqual(len(fragmenter.get_fragment(10**9, 10**9+1)), 0)
+        with self.assertRaises(IntervalError):
+            fragmenter.get_fragment(200, 100)
+        fragmenter.close()
+
+    # -----------------------------------------------------------------------
+
+    def test_write_fragments(self):
+        """... files are identical to the ones of the channel fragments."""
+        intervals = [(0.1, 0.8), (0.5, 1.9), (2.5, 3.1), (3., 99.)]
+        for sample in (sample_1, sample_2):
+            channel = autils.extract_audio_channel(sample, 0)
+            channel = autils.format_channel(channel, 16000, 2)
+            for silence in (0., 0.15):
+                expected = list()
+                for i, (begin, end) in enumerate(intervals):
+                    filename = os.path.join(TEMP, "expected%d.wav" % i)
+                    fragment = autils.extract_channel_fragment(
+                        channel, begin, end, silence)
+                    autils.write_channel(filename, fragment)
+                    expected.append(self.read_file(filename))
+
+                for nb_threads in (1, 3):
+                    fragmenter = sppasAudioFragmenter(sample, 16000, 2, 0)
+                    filenames = [os.path.join(TEMP, "track%d.wav" % i)
+                                 for i in range(len(intervals))]
+                    fragmenter.write_fragments(intervals, filenames,
+                                               silence, nb_threads)
+                    fragmenter.close()
+                    self.assertEqual(expected,
+                                     [self.read_file(f) for f in filenames])
+
+    # -----------------------------------------------------------------------
+
+    def test_close(self):
+        fragmenter = sppasAudioFragmenter(sample_2, 16000, 2, 0)
+        converted = fragmenter._converted
+        self.assertTrue(os.path.exists(converted))
+        fragmenter.close()
+        self.assertFalse(os.path.exists(converted))
+        self.assertEqual(fragmenter.get_nframes(), 0)
+
+        with self.assertRaises(ValueError):
+            fragmenter.write_fragments([(0., 1.)], [])
@@ -0,0 +1,154 @@
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+        ---------------------------------------------------------------------
+
+    src.audiodata.tests.test_audioframes.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+"""
+import unittest
+import os
+
+from sppas.src.config import paths
+from ..aio import open as audio_open
+from .. import audioframes
+from ..audioframes import sppasAudioFrames
+
+sample_1 = os.path.join(paths.samples, "samples-eng", "oriana1.wav")   # mono
+sample_2 = os.path.join(paths.samples, "samples-eng", "oriana3.wave")  # stereo
+
+# ---------------------------------------------------------------------------
+
+
+class TestAudioFrames(unittest.TestCase):
+
+    def setUp(self):
+        self.audioop = audioframes.audioop
+        self._sample_1 = audio_open(sample_1)
+        self._sample_2 = audio_open(sample_2)
+
+    def tearDown(self):
+        audioframes.audioop = self.audioop
+        self._sample_1.close()
+        self._sample_2.close()
+
+    # -----------------------------------------------------------------------
+
+    def all_results(self, frames, sampwidth, nchannels):
+        """Return the results of all the methods of an sppasAudioFrames."""
+        a = sppasAudioFrames(frames, sampwidth, nchannels)
+        results = [a.minmax(), a.min(), a.max(), a.avg(), a.cross(),
+                   a.rms(), a.bias(100), a.bias(-70000), a.mul(0.5),
+                   a.mul(-3), a.clipping_rate(0.8), a.resample(16000, 8000),
+                   a.resample(16000, 44100)]
+        for w in (1, 2, 4):
+            results.append(a.change_sampwidth(w))
+        return results
+
+    # -----------------------------------------------------------------------
+
+    def test_samples(self):
+        frames = sppasAudioFrames.samples2frames([0, -1, 32767, -32768], 2)
+        self.assertEqual(8, len(frames))
+        a = sppasAudioFrames(frames, 2, 2)
+        self.assertEqual([0, -1, 32767, -32768], list(a.get_samples()))
+        self.assertEqual(sppasAudioFrames.samples2frames([0, 32767], 2),
+                         a.get_channel_frames(0))
+        self.assertEqual(sppasAudioFrames.samples2frames([-1, -32768], 2),
+                         a.get_channel_frames(1))
+        for w in (1, 2, 4):
+            samples = [0, 1, -1, sppasAudioFrames.get_maxval(w),
+                       sppasAudioFrames.get_minval(w)]
+            frames = sppasAudioFrames.samples2frames(samples, w)
+            self.assertEqual(len(samples) * w, len(frames))
+            self.assertEqual(samples,
+                             list(sppasAudioFrames.frames2samples(frames, w)))
+
+    # -----------------------------------------------------------------------
+
+    def test_interleave(self):
+        for w in (1, 2, 4):
+            left = sppasAudioFrames.samples2frames([1, 2, 3], w)
+            right = sppasAudioFrames.samples2frames([-1, -2, -3], w)
+            frames = sppasAudioFrames.samples2frames([1, -1, 2, -2, 3, -3], w)
+            self.assertEqual(frames,
+                             sppasAudioFrames.interleave([left, right], w))
+            self.assertEqual([left, right],
+                             sppasAudioFrames.deinterleave(frames, w, 2))
+            self.assertEqual([frames],
+                             sppasAudioFrames.deinterleave(frames, w, 1))
+            # the shortest channel gives the length
+            self.assertEqual(frames,
+                             sppasAudioFrames.interleave([left + left, right], w))
+
+        frames = self._sample_2.read_frames(self._sample_2.get_nframes())
+        channels = sppasAudioFrames.deinterleave(frames, 2, 3)
+        self.assertEqual(3, len(channels))
+        channels = sppasAudioFrames.deinterleave(frames, 2, 2)
+        self.assertEqual(frames, sppasAudioFrames.interleave(channels, 2))
+
+    # -----------------------------------------------------------------------
+
+    def test_without_audioop(self):
+        """... the array implementation gives the same results as audioop."""
+        if self.audioop is None:
+            return
+        for sample in (self._sample_1, self._sample_2):
+            frames = sample.read_frames(4000)
+            for w in (1, 2, 4):
+                for n in (1, 2):
+                    expected = self.all_results(frames, w, n)
+                    audioframes.audioop = None
+                    self.assertEqual(expected, self.all_results(frames, w, n))
+                    audioframes.audioop = self.audioop
+
+    # -----------------------------------------------------------------------
+
+    def test_empty(self):
+        audioframes.audioop = None
+        a = sppasAudioFrames(b"", 2, 1)
+        self.assertEqual((0x7fffffff, -0x80000000), a.minmax())
+        self.assertEqual(0, a.avg())
+        self.assertEqual(0, a.rms())
+        self.assertEqual(-1, a.cross())
+        self.assertEqual(b"", a.bias(3))
+        self.assertEqual(b"", a.mul(3))
+        self.assertEqual(b"", a.resample(16000, 8000))
+        self.assertEqual(0., a.clipping_rate(0.5))
+
+    # -----------------------------------------------------------------------
+
+    def test_rms(self):
+        frames = self._sample_2.read_frames(self._sample_2.get_nframes())
+        a = sppasAudioFrames(frames, self._sample_2.get_sampwidth(), 2)
+        r0 = sppasAudioFrames(a.get_channel_frames(0), 2, 1).rms()
+        r1 = sppasAudioFrames(a.get_channel_frames(1), 2, 1).rms()
+        self.assertEqual(int((r0 + r1) / 2), a.rms())
@@ -0,0 +1,140 @@
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+    src.audiodata.tests.test_audioinspector.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+"""
+import unittest
+import os
+import json
+import shutil
+
+from sppas.src.config import paths
+from sppas.src.files.fileutils import sppasFileUtils
+
+from .. import audioframes
+from ..aio import open as audio_open
+from ..audioframes import sppasAudioFrames
+from ..audioinspector import sppasAudioInspector
+
+# ---------------------------------------------------------------------------
+
+TEMP = sppasFileUtils().set_random()
+sample_1 = os.path.join(paths.samples, "samples-eng", "oriana1.wav")
+sample_2 = os.path.join(paths.samples, "samples-fra", "F_F_B003-P8.wav")
+
+# ---------------------------------------------------------------------------
+
+
+class TestAudioInspector(unittest.TestCase):
+
+    def setUp(self):
+        self.audioop = audioframes.audioop
+        if os.path.exists(TEMP) is False:
+            os.mkdir(TEMP)
+
+    def tearDown(self):
+        audioframes.audioop = self.audioop
+        shutil.rmtree(TEMP)
+
+    # -----------------------------------------------------------------------
+
+    def test_header(self):
+        inspector = sppasAudioInspector(stats=False)
+        result = inspector.inspect(sample_1)
+        audio = audio_open(sample_1)
+        self.assertEqual(result["framerate"], audio.get_framerate())
+        self.assertEqual(result["sampwidth"], audio.get_sampwidth())
+        self.assertEqual(result["nchannels"], audio.get_nchannels())
+        self.assertEqual(result["nframes"], audio.get_nframes())
+        self.assertAlmostEqual(result["duration"], audio.get_duration())
+        audio.close()
+        self.assertFalse("rms" in result)
+
+    # -----------------------------------------------------------------------
+
+    def test_stats(self):
+        audio = audio_open(sample_2)
+        frames = audio.read_frames(audio.get_nframes())
+        audio.close()
+        samples = sppasAudioFrames.frames2samples(frames, 2)
+        a = sppasAudioFrames(frames, 2, 1)
+
+        result = sppasAudioInspector().inspect(sample_2)
+        self.assertAlmostEqual(result["rms"], a.rms(), delta=1.)
+        self.assertEqual(result["peak"], max(a.max(), -a.min()))
+        self.assertAlmostEqual(result["dc_offset"],
+                               float(sum(samples)) / len(samples))
+        clip = int(0.99 * sppasAudioFrames.get_maxval(2))
+        nb_clipped = sum(1 for s in samples if abs(s) >= clip)
+        self.assertEqual(result["clipping"], float(nb_clipped) / len(samples))
+        self.assertTrue(0. < result["silence"] < 1.)
+
+        # the same results without audioop, except the rounding of the rms
+        audioframes.audioop = None
+        result_pure = sppasAudioInspector().inspect(sample_2)
+        self.assertAlmostEqual(result["rms"], result_pure["rms"], delta=1.)
+        for key in ("peak", "clipping", "dc_offset", "silence"):
+            self.assertEqual(result[key], result_pure[key])
+
+    # -----------------------------------------------------------------------
+
+    def test_inspect_many(self):
+        cache_file = os.path.join(TEMP, "cache.json")
+        sample = os.path.join(TEMP, "sample.wav")
+        shutil.copy(sample_1, sample)
+        filenames = [sample, sample_2, os.path.join(TEMP, "sample.txt")]
+
+        inspector = sppasAudioInspector(cache_file=cache_file)
+        results = inspector.inspect_many(filenames, nb_proc=2)
+        self.assertEqual(len(results), 3)
+        self.assertTrue("error" in results[2])
+        self.assertEqual(len(inspector.get_cache()), 2)
+        inspector.save_cache()
+
+        # cached results are returned while the file is unchanged
+        inspector = sppasAudioInspector(cache_file=cache_file)
+        cached = inspector.get_cache()[os.path.abspath(sample)]
+        cached["rms"] = -1
+        self.assertEqual(inspector.inspect(sample)["rms"], -1)
+        os.utime(sample, (0, 0))
+        self.assertTrue(inspector.inspect(sample)["rms"] > 0)
+
+        # reports
+        report = os.path.join(TEMP, "report.json")
+        sppasAudioInspector.write_report(results, report)
+        with open(report, "r") as fp:
+            self.assertEqual(json.load(fp)[0]["nframes"], results[0]["nframes"])
+        report = os.path.join(TEMP, "report.csv")
+        sppasAudioInspector.write_report(results, report)
+        with open(report, "r") as fp:
+            lines = fp.readlines()
+        self.assertEqual(len(lines), 4)
+        self.assertTrue(lines[1].startswith('"{}",'.format(sample)))
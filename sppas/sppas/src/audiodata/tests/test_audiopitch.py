@@ -0,0 +1,104 @@
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    src.audiodata.tests.test_audiopitch.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+"""
+import unittest
+import os
+import math
+
+from sppas.src.config import paths
+from ..channel import sppasChannel
+from ..audioconvert import sppasAudioConverter
+from ..audiopitch import AudioPitch
+
+sample_1 = os.path.join(paths.samples, "samples-fra", "AC track_0379.wav")
+
+# ---------------------------------------------------------------------------
+
+
+def voice_channel(f0, framerate=16000):
+    """Return a channel with 0.3s of silence then 0.5s of a harmonic sound."""
+    samples = [0] * int(0.3 * framerate)
+    for i in range(int(0.5 * framerate)):
+        t = 2. * math.pi * f0 * i / framerate
+        samples.append(int(6000. * math.sin(t) + 3000. * math.sin(2. * t) +
+                           1500. * math.sin(3. * t)))
+    frames = sppasAudioConverter().samples2frames([samples], 2, 1)
+    return sppasChannel(framerate, 2, frames)
+
+# ---------------------------------------------------------------------------
+
+
+class TestAudioPitch(unittest.TestCase):
+
+    def test_init(self):
+        with self.assertRaises(ValueError):
+            AudioPitch(delta=0.)
+        with self.assertRaises(ValueError):
+            AudioPitch(minf0=300, maxf0=200)
+
+    def test_channel_pitch(self):
+        for f0 in (80., 150., 320.):
+            p = AudioPitch(delta=0.01)
+            values = p.eval_channel_pitch(voice_channel(f0))
+            self.assertEqual(len(values), 81)
+            self.assertEqual(len(p), 81)
+            # silence
+            for v in values[:25]:
+                self.assertEqual(v, 0.)
+            # the harmonic sound
+            for v in values[33:-3]:
+                self.assertAlmostEqual(v, f0, delta=f0 * 0.01)
+            self.assertAlmostEqual(p.get_pitch(0.6), f0, delta=f0 * 0.01)
+            with self.assertRaises(ValueError):
+                p.get_pitch(1.)
+
+    def test_framerate(self):
+        p = AudioPitch(delta=0.005)
+        values = p.eval_channel_pitch(voice_channel(200., framerate=44100))
+        self.assertEqual(len(values), 161)
+        for v in values[66:-6]:
+            self.assertAlmostEqual(v, 200., delta=2.)
+
+    def test_eval_pitch(self):
+        p = AudioPitch()
+        values = p.eval_pitch(sample_1)
+        self.assertEqual(values, p.get_pitch_list())
+        self.assertEqual(len(values), 233)
+        voiced = [v for v in values if v > 0.]
+        self.assertGreater(len(voiced), 100)
+        for v in voiced:
+            self.assertTrue(50. <= v <= 600.)
+
+        self.assertEqual(p.eval_many([sample_1, sample_1], nb_proc=1),
+                         [values, values])
@@ -121,6 +121,40 @@ class TestChannel(unittest.TestCase):
         savedaudio.close()
         os.remove(sample_new)
 
+    def test_SaveStereo(self):
+        self._sample_2.extract_channels()
+        audio = sppasAudioPCM()
+        audio.append_channel(self._sample_2.get_channel(0))
+        audio.append_channel(self._sample_2.get_channel(1))
+        sample_new = os.path.join(TEMP, "stereo.wav")
+        audio_save(sample_new, audio)
+        savedaudio = audio_open(sample_new)
+
+        self._sample_2.rewind()
+        frames = self._sample_2.read_frames(self._sample_2.get_nframes())
+        saved_frames = savedaudio.read_frames(savedaudio.get_nframes())
+        self.assertEqual(2, savedaudio.get_nchannels())
+        self.assertEqual(frames, saved_frames)
+
+        savedaudio.close()
+        os.remove(sample_new)
+
+    def test_ReadChannels(self):
+        nframes = self._sample_2.get_nframes()
+        cidx = self._sample_2.extract_channel(1)
+        expected = self._sample_2.get_channel(cidx).get_frames()
+
+        self._sample_2.rewind()
+        blocks = list()
+        while True:
+            channels_frames = self._sample_2.read_channels(1000)
+            self.assertEqual(2, len(channels_frames))
+            if len(channels_frames[1]) == 0:
+                break
+            blocks.append(channels_frames[1])
+        self.assertEqual(nframes // 1000 + 1, len(blocks))
+        self.assertEqual(expected, b"".join(blocks))
+
     def test_ExtractFragment(self):
         self._sample_1.extract_channel(0)
         self._sample_3.extract_channel(0)
@@ -0,0 +1,124 @@
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    src.audiodata.tests.test_channelenergy.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+"""
+import unittest
+import os
+import random
+
+from sppas.src.config import paths
+from ..aio import open as audio_open
+from .. import audioframes
+from ..audioframes import sppasAudioFrames
+from ..channelenergy import sppasChannelEnergy
+
+sample_1 = os.path.join(paths.samples, "samples-eng", "oriana1.wav")
+
+# ---------------------------------------------------------------------------
+
+
+class TestChannelEnergy(unittest.TestCase):
+
+    def setUp(self):
+        self.audioop = audioframes.audioop
+        audio = audio_open(sample_1)
+        self._channel = audio.get_channel(audio.extract_channel(0))
+        audio.close()
+
+    def tearDown(self):
+        audioframes.audioop = self.audioop
+
+    # -----------------------------------------------------------------------
+
+    def rms(self, begin, end):
+        """Return the rms of a window, estimated from its frames."""
+        self._channel.seek(begin)
+        frames = self._channel.get_frames(end - begin)
+        return sppasAudioFrames(frames, self._channel.get_sampwidth()).rms()
+
+    # -----------------------------------------------------------------------
+
+    def test_energy(self):
+        energy = sppasChannelEnergy(self._channel, chunk_size=1000)
+        nframes = energy.get_nframes()
+        self.assertEqual(nframes, self._channel.get_nframes())
+        samples = self._channel.get_samples()
+        for begin, end in ((0, 0), (0, 10), (990, 1010), (999, 5001),
+                           (nframes - 7, nframes + 50)):
+            end_c = min(end, nframes)
+            expected = sum(s * s for s in samples[begin:end_c])
+            self.assertEqual(energy.energy(begin, end), expected)
+
+        # the cumulative sums of the chunks are extended in any order
+        energy = sppasChannelEnergy(self._channel, chunk_size=1000)
+        for begin, end in ((20500, 30700), (1500, 2500), (0, nframes),
+                           (2999, 25001)):
+            expected = sum(s * s for s in samples[begin:end])
+            self.assertEqual(energy.energy(begin, end), expected)
+
+        self.assertEqual(energy.rms(), self._channel.rms())
+        self.assertEqual(energy.rms(10, 10), 0)
+        self.assertEqual(energy.rms(nframes, nframes + 100), 0)
+
+    # -----------------------------------------------------------------------
+
+    def test_rms(self):
+        energy = sppasChannelEnergy(self._channel)
+        nframes = energy.get_nframes()
+        random.seed(1)
+        for i in range(200):
+            begin = random.randint(0, nframes - 1)
+            end = begin + random.randint(1, 20000)
+            self.assertEqual(energy.rms(begin, end), self.rms(begin, end))
+
+    # -----------------------------------------------------------------------
+
+    def test_rms_values(self):
+        energy = sppasChannelEnergy(self._channel)
+        nframes = energy.get_nframes()
+        values = energy.rms_values(160)
+        self.assertEqual(len(values), (nframes + 159) // 160)
+        self.assertEqual(values[100], self.rms(16000, 16160))
+        self.assertEqual(values[-1], self.rms(160 * (len(values) - 1), nframes))
+
+        some = energy.rms_values(80, 1000, 2000, nb_values=15)
+        self.assertEqual(len(some), 15)
+        self.assertEqual(some[-3:], [self.rms(1960, 2000), 0, 0])
+
+        # without audioop, the values are estimated with the prefix sums
+        audioframes.audioop = None
+        self.assertEqual(energy.rms_values(160), values)
+        self.assertEqual(energy.rms_values(80, 1000, 2000, nb_values=15), some)
+
+        with self.assertRaises(ValueError):
+            energy.rms_values(0)
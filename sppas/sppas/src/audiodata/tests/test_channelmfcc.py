@@ -0,0 +1,182 @@
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    src.audiodata.tests.test_channelmfcc.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+"""
+import unittest
+import os
+import math
+import cmath
+import shutil
+import tempfile
+
+from sppas.src.config import paths
+from sppas.src.models.acm.features import sppasAcFeatures
+from ..aio import open as audio_open
+from ..channel import sppasChannel
+from ..audioconvert import sppasAudioConverter
+from ..channelmfcc import sppasChannelMFCC, _sppasMFCCAnalyzer
+
+sample_1 = os.path.join(paths.samples, "samples-eng", "oriana1.wav")
+config = os.path.join(paths.resources, "models", "models-eng", "config")
+
+# ---------------------------------------------------------------------------
+
+
+def sine_channel(frequency, duration=0.5, framerate=16000):
+    """Return a channel with a sine wave."""
+    n = int(duration * framerate)
+    samples = [int(10000. * math.sin(2. * math.pi * frequency * i / framerate))
+               for i in range(n)]
+    frames = sppasAudioConverter().samples2frames([samples], 2, 1)
+    return sppasChannel(framerate, 2, frames)
+
+# ---------------------------------------------------------------------------
+
+
+class TestChannelMFCC(unittest.TestCase):
+
+    def setUp(self):
+        self._temp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self._temp)
+
+    # -----------------------------------------------------------------------
+
+    def test_parameters(self):
+        mfcc = sppasChannelMFCC()
+        mfcc.set_config(config)
+        self.assertEqual(mfcc.get_parameter("TARGETKIND"), "MFCC_0_D_N_Z")
+        self.assertEqual(mfcc.get_parameter("NUMCHANS"), 26)
+        self.assertEqual(mfcc.get_parameter("WINDOWSIZE"), 250000.)
+        self.assertTrue(mfcc.get_parameter("usehamming"))
+        self.assertEqual(mfcc.get_qualifiers(), "0DNZ")
+        self.assertEqual(mfcc.get_parameter_kind(), 6 | 8192 | 256 | 128 | 2048)
+
+        mfcc.set_features(sppasAcFeatures())
+        self.assertEqual(mfcc.get_parameter("TARGETKIND"), "MFCC_0_D_N_Z")
+        self.assertFalse(mfcc.get_parameter("ENORMALISE"))
+
+        mfcc.set_parameter("TARGETKIND", "LPC")
+        with self.assertRaises(ValueError):
+            mfcc.get_qualifiers()
+
+    # -----------------------------------------------------------------------
+
+    def test_fft(self):
+        mfcc = sppasChannelMFCC()
+        analyzer = _sppasMFCCAnalyzer(mfcc._params, 400)
+        n = 512
+        x = [math.sin(i * 0.3) + 0.5 * math.cos(i * 1.7) for i in range(n)]
+        result = analyzer.fft(x)
+        for k in (0, 1, 24, 100, 255):
+            expected = sum(x[i] * cmath.exp(-2j * math.pi * k * i / n)
+                           for i in range(n))
+            self.assertAlmostEqual(abs(result[k] - expected), 0., places=6)
+
+    # -----------------------------------------------------------------------
+
+    def test_dimensions(self):
+        audio = audio_open(sample_1)
+        channel = audio.get_channel(audio.extract_channel(0))
+        audio.close()
+        nsamples = channel.get_nframes()
+
+        mfcc = sppasChannelMFCC(channel)
+        mfcc.set_config(config)
+        vectors = mfcc.evaluate()
+        self.assertEqual(len(vectors), int((nsamples - 400) // 160) + 1)
+        for v in vectors:
+            self.assertEqual(len(v), 25)
+
+        # cepstral mean subtracted, C0 suppressed
+        for i in range(12):
+            mean = sum(v[i] for v in vectors) / len(vectors)
+            self.assertAlmostEqual(mean, 0., places=6)
+
+        mfcc.set_parameter("TARGETKIND", "MFCC_E_D_A_Z")
+        vectors = mfcc.evaluate()
+        self.assertEqual(len(vectors[0]), 39)
+
+        mfcc.set_parameter("TARGETKIND", "MFCC")
+        vectors = mfcc.evaluate()
+        self.assertEqual(len(vectors[0]), 12)
+        static = list(mfcc.iter_static())
+        self.assertEqual(vectors, static)
+
+    # -----------------------------------------------------------------------
+
+    def test_sine(self):
+        mfcc = sppasChannelMFCC(sine_channel(1000.))
+        mfcc.set_parameter("TARGETKIND", "MFCC_0_D")
+        vectors = mfcc.evaluate()
+        self.assertEqual(len(vectors[0]), 26)
+        # a stationary signal: same static features and no deltas
+        for v in vectors[5:-5]:
+            for i in range(13):
+                self.assertAlmostEqual(v[i], vectors[5][i], places=4)
+            for i in range(13, 26):
+                self.assertAlmostEqual(v[i], 0., places=4)
+
+        # the energy of the sine is in the filter of its frequency
+        analyzer = _sppasMFCCAnalyzer(mfcc._params, 400)
+        samples = [10000. * math.sin(2. * math.pi * 1000. * i / 16000.)
+                   for i in range(400)]
+        x = [v * w for v, w in zip(samples, analyzer._window)]
+        x.extend([0.] * 112)
+        spectrum = analyzer.fft(x)
+        peak = max(range(256), key=lambda k: abs(spectrum[k]))
+        self.assertEqual(peak, 32)
+
+    # -----------------------------------------------------------------------
+
+    def test_cache(self):
+        filename = os.path.join(self._temp, "sine.mfc")
+        mfcc = sppasChannelMFCC(sine_channel(440.))
+        vectors = mfcc.evaluate(cache_file=filename)
+        self.assertTrue(os.path.exists(filename))
+
+        kind, period, saved = sppasChannelMFCC.read_htk(filename)
+        self.assertEqual(kind, mfcc.get_parameter_kind())
+        self.assertEqual(period, 100000)
+        self.assertEqual(len(saved), len(vectors))
+        for v, s in zip(vectors, saved):
+            for a, b in zip(v, s):
+                self.assertAlmostEqual(a, b, places=3)
+
+        # the cached features are read
+        mfcc.set_channel(sine_channel(1000.))
+        self.assertEqual(mfcc.evaluate(cache_file=filename), saved)
+        # the cached features are not the expected ones
+        mfcc.set_parameter("TARGETKIND", "MFCC_0")
+        self.assertEqual(len(mfcc.evaluate(cache_file=filename)[0]), 13)
@@ -0,0 +1,170 @@
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    src.audiodata.tests.test_channelresampler.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+"""
+import unittest
+import os
+import math
+import shutil
+
+from sppas.src.config import paths
+from sppas.src.files.fileutils import sppasFileUtils
+
+from ..audioframes import sppasAudioFrames
+from ..channel import sppasChannel
+from ..channelformatter import sppasChannelFormatter
+from ..channelresampler import sppasChannelResampler
+from ..autils import convert_audio_file, format_channel, write_channel
+from ..aio import open as audio_open
+from ..audiodataexc import AudioTypeError
+
+TEMP = sppasFileUtils().set_random()
+sample_1 = os.path.join(paths.samples, "samples-cat", "TB-FE1-H1_phrase1.wav")
+
+# ---------------------------------------------------------------------------
+
+
+class TestChannelResampler(unittest.TestCase):
+
+    @staticmethod
+    def tone(frequency, framerate, duration=0.1, amplitude=10000):
+        """Return the frames of a sine wave."""
+        n = int(duration * framerate)
+        samples = [int(amplitude * math.sin(2. * math.pi * frequency * i / framerate))
+                   for i in range(n)]
+        return sppasAudioFrames.samples2frames(samples, 2)
+
+    @staticmethod
+    def amplitude(frames):
+        """Return the peak amplitude of the middle of the frames."""
+        samples = sppasAudioFrames.frames2samples(frames, 2)
+        middle = samples[len(samples) // 4:3 * len(samples) // 4]
+        return max(abs(s) for s in middle)
+
+    # -----------------------------------------------------------------------
+
+    def test_length(self):
+        frames = self.tone(440, 44100)
+        for rate, new_rate in ((44100, 16000), (48000, 16000),
+                               (8000, 16000), (16000, 16000)):
+            r = sppasChannelResampler(2, rate, new_rate)
+            converted = r.resample(frames)
+            expected = int(math.ceil(4410. * new_rate / rate))
+            self.assertEqual(len(converted), 2 * expected)
+        self.assertEqual(sppasChannelResampler(2, 44100, 16000).resample(b""), b"")
+
+        with self.assertRaises(ValueError):
+            sppasChannelResampler(2, 0, 16000)
+
+    # -----------------------------------------------------------------------
+
+    def test_bandwidth(self):
+        for rate in (44100, 48000):
+            r = sppasChannelResampler(2, rate, 16000)
+            # the pass-band is kept...
+            passed = self.amplitude(r.resample(self.tone(1000, rate)))
+            self.assertTrue(9800 < passed <= 10000)
+            # ...but the frequencies above 8kHz are not folded back
+            stopped = self.amplitude(r.resample(self.tone(9000, rate)))
+            self.assertLess(stopped, 10)
+
+    # -----------------------------------------------------------------------
+
+    def test_process(self):
+        frames = self.tone(440, 44100, duration=0.5)
+        r = sppasChannelResampler(2, 44100, 16000)
+        expected = r.resample(frames)
+        r.reset()
+        converted = list()
+        for i in range(0, len(frames), 2 * 997):
+            converted.append(r.process(frames[i:i + 2 * 997]))
+        converted.append(r.flush())
+        self.assertEqual(b"".join(converted), expected)
+
+    # -----------------------------------------------------------------------
+
+    def test_formatter(self):
+        frames = self.tone(440, 44100)
+        channel = sppasChannel(44100, 2, frames)
+        expected = sppasAudioFrames(frames, 2, 1).resample(44100, 16000)
+
+        # the frames are linearly interpolated by default...
+        formatter = sppasChannelFormatter(channel)
+        formatter.set_framerate(16000)
+        formatter.convert()
+        self.assertEqual(formatter.get_channel().get_frames(), expected)
+
+        # ...and the band-limited resampler is an option
+        formatter = sppasChannelFormatter(channel)
+        formatter.set_framerate(16000)
+        formatter.set_antialias(True)
+        formatter.convert()
+        self.assertEqual(formatter.get_channel().get_frames(),
+                         sppasChannelResampler(2, 44100, 16000).resample(frames))
+
+    # -----------------------------------------------------------------------
+
+    def test_convert_audio_file(self):
+        if os.path.exists(TEMP) is False:
+            os.mkdir(TEMP)
+        try:
+            output = os.path.join(TEMP, "converted.wav")
+            convert_audio_file(sample_1, output, 16000, 2, nframes=4096)
+
+            audio = audio_open(sample_1)
+            channel = audio.get_channel(audio.extract_channel(0))
+            audio.close()
+            expected = format_channel(channel, 16000, 2)
+
+            converted = audio_open(output)
+            self.assertEqual(converted.get_framerate(), 16000)
+            self.assertEqual(converted.get_nchannels(), 1)
+            self.assertEqual(converted.read_frames(converted.get_nframes()),
+                             expected.get_frames())
+            converted.close()
+
+            # with the band-limited resampler
+            frames = self.tone(440, 44100, duration=0.5)
+            tone = os.path.join(TEMP, "tone.wav")
+            write_channel(tone, sppasChannel(44100, 2, frames))
+            convert_audio_file(tone, output, 16000, 2, nframes=997,
+                               antialias=True)
+            converted = audio_open(output)
+            self.assertEqual(converted.read_frames(converted.get_nframes()),
+                             sppasChannelResampler(2, 44100, 16000).resample(frames))
+            converted.close()
+
+            with self.assertRaises(AudioTypeError):
+                convert_audio_file(sample_1, output + ".txt")
+        finally:
+            shutil.rmtree(TEMP)
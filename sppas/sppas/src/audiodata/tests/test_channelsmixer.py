@@ -39,6 +39,8 @@ from sppas.src.config import paths
 from ..aio import open as audio_open
 from ..channelformatter import sppasChannelFormatter
 from ..channelsmixer import sppasChannelMixer
+from ..channel import sppasChannel
+from ..audioframes import sppasAudioFrames
 
 # ---------------------------------------------------------------------------
 
@@ -83,3 +85,32 @@ class TestChannelsMixer(unittest.TestCase):
 
         self.assertEqual(newchannel.get_nframes(), mixer.get_channel(0).get_nframes())
         self.assertEqual(newchannel.get_nframes(), mixer.get_channel(1).get_nframes())
+
+    def test_MixSamples(self):
+        mixer = sppasChannelMixer()
+        frames1 = sppasAudioFrames.samples2frames([0, 100, -100, 30000, -30000], 2)
+        frames2 = sppasAudioFrames.samples2frames([1, 100, 100, 30000, -30000], 2)
+        mixer.append_channel(sppasChannel(16000, 2, frames1))
+        mixer.append_channel(sppasChannel(16000, 2, frames2), 0.5)
+        mixed = mixer.mix()
+        self.assertEqual([0, 150, -50, 32767, -32768],
+                         list(sppasAudioFrames(mixed.get_frames()).get_samples()))
+        self.assertEqual((-32768, 32767), mixer.get_minmax())
+        mixed = mixer.mix(attenuator=0.5)
+        self.assertEqual([0, 75, -25, 22500, -22500],
+                         list(sppasAudioFrames(mixed.get_frames()).get_samples()))
+
+        # block by block
+        blocks = list(mixer.iter_mix(0.5, nframes=2))
+        self.assertEqual(3, len(blocks))
+        self.assertEqual(mixed.get_frames(), b"".join(blocks))
+
+    def test_MixLong(self):
+        self._sample_1.extract_channel(0)
+        channel = self._sample_1.get_channel(0)
+        mixer = sppasChannelMixer()
+        mixer.append_channel(channel)
+        mixer.append_channel(channel, -1)
+        mixed = mixer.mix()
+        self.assertEqual(channel.get_nframes(), mixed.get_nframes())
+        self.assertEqual((0, 0), mixer.get_minmax())
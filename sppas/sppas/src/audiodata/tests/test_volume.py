@@ -34,9 +34,11 @@
 """
 import unittest
 import os.path
+import math
 
 from sppas.src.config import paths
 from ..aio import open as audio_open
+from ..channel import sppasChannel
 from ..channelvolume import sppasChannelVolume
 from ..audiovolume import sppasAudioVolume
 
@@ -65,3 +67,51 @@ class TestVolume(unittest.TestCase):
         self.assertEqual(int(chanvol.mean()), int(audiovol.mean()))
         self.assertEqual(int(chanvol.variance()), int(audiovol.variance()))
         self.assertEqual(int(chanvol.stdev()), int(audiovol.stdev()))
+
+    def test_stats(self):
+        audio = audio_open(sample_1)
+        channel = audio.get_channel(audio.extract_channel(0))
+        chanvol = sppasChannelVolume(channel)
+        volumes = chanvol.volumes()
+
+        n = len(volumes)
+        mean = float(sum(volumes)) / n
+        variance = sum((v - mean) ** 2 for v in volumes) / n
+        stdev = math.sqrt(variance)
+        self.assertAlmostEqual(chanvol.mean(), mean)
+        self.assertAlmostEqual(chanvol.variance(), variance)
+        self.assertAlmostEqual(chanvol.stdev(), stdev)
+        self.assertAlmostEqual(chanvol.stderr(), stdev / math.sqrt(n))
+        self.assertAlmostEqual(chanvol.coefvariation(), stdev / mean * 100.)
+        zscores = chanvol.zscores()
+        for i in range(0, n, 97):
+            self.assertAlmostEqual(zscores[i], (volumes[i] - mean) / stdev)
+
+        # the stats are estimated again if a volume value changes
+        mean = chanvol.mean()
+        chanvol.set_volume_value(0, chanvol.volume_at(0) + 1000)
+        self.assertAlmostEqual(chanvol.mean(), mean + 1000. / len(volumes))
+
+    def test_evaluate(self):
+        audio = audio_open(sample_1)
+        channel = audio.get_channel(audio.extract_channel(0))
+        chanvol = sppasChannelVolume(channel)
+        chanvol.evaluate(0.02)
+        self.assertEqual(chanvol.get_winlen(), 0.02)
+        self.assertEqual(chanvol.volumes(),
+                         sppasChannelVolume(channel, 0.02).volumes())
+
+    def test_volumes_between(self):
+        audio = audio_open(sample_1)
+        channel = audio.get_channel(audio.extract_channel(0))
+        chanvol = sppasChannelVolume(channel)
+        nframes = int(channel.get_nframes())
+        for start in (0, 1234, 56789, nframes - 500):
+            for win_len in (0.005, 0.01):
+                channel.seek(start)
+                c = sppasChannel(channel.get_framerate(),
+                                 channel.get_sampwidth(),
+                                 channel.get_frames(800))
+                self.assertEqual(
+                    chanvol.volumes_between(start, start + 800, win_len),
+                    sppasChannelVolume(c, win_len).volumes())
@@ -50,6 +50,7 @@ Requires the following other packages:
 """
 from .dictpron import sppasDictPron
 from .dictrepl import sppasDictRepl
+from .replautomaton import sppasReplAutomaton
 from .mapping import sppasMapping
 from .wordstrain import sppasWordStrain
 from .patterns import sppasPatterns
@@ -60,6 +61,7 @@ from .dumpfile import sppasDumpFile
 __all__ = (
     "sppasMapping",
     "sppasDictRepl",
+    "sppasReplAutomaton",
     "sppasDictPron",
     "sppasWordStrain",
     "sppasPatterns",
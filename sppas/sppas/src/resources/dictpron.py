@@ -107,6 +107,9 @@ class sppasDictPron(object):
         # The pronunciation dictionary
         self._dict = dict()
 
+        # Number of changes of the dictionary
+        self._version = 0
+
         # Either read the dictionary from a dumped file or from the original
         # ASCII one.
         if dict_filename is not None:
@@ -139,6 +142,17 @@ class sppasDictPron(object):
 
     # -----------------------------------------------------------------------
 
+    def get_version(self):
+        """Return the number of changes of the dictionary.
+
+        It allows the users of the dictionary to know if the data they
+        computed from it are still valid.
+
+        """
+        return self._version
+
+    # -----------------------------------------------------------------------
+
     def get_unkstamp(self):
         """Return the unknown words stamp."""
         return symbols.unk
@@ -243,6 +257,7 @@ class sppasDictPron(object):
 
         # Add (or change) the entry in the dict
         self._dict[entry] = new_pron
+        self._version += 1
 
     # -----------------------------------------------------------------------
 
@@ -39,6 +39,7 @@ from sppas.src.config import sg
 from sppas.src.utils import sppasUnicode, u
 
 from .dumpfile import sppasDumpFile
+from .replautomaton import sppasReplAutomaton
 from .resourcesexc import FileUnicodeError
 
 # ----------------------------------------------------------------------------
@@ -84,6 +85,9 @@ class sppasDictRepl(object):
         """
         self._dict = dict()
         self._filename = ""
+        self._version = 0  # number of changes of the dictionary
+        self._automaton = None
+        self._automaton_version = -1
 
         if dict_filename is not None:
 
@@ -112,10 +116,53 @@ class sppasDictRepl(object):
         """Return the name of the file from which the vocab comes from."""
         return self._filename
 
+    # -----------------------------------------------------------------------
+
+    def get_version(self):
+        """Return the number of changes of the dictionary.
+
+        It allows the users of the dictionary to know if the data they
+        computed from it are still valid.
+
+        """
+        return self._version
+
     # -----------------------------------------------------------------------
     # Getters
     # -----------------------------------------------------------------------
 
+    def get_automaton(self):
+        """Return the automaton to search all the keys in only one pass.
+
+        The automaton is built the first time it's requested, then it is
+        re-used until the dictionary is modified.
+
+        :returns: (sppasReplAutomaton)
+
+        """
+        if self._automaton is None or self._automaton_version != self._version:
+            self._automaton = sppasReplAutomaton(self._dict.keys())
+            self._automaton_version = self._version
+
+        return self._automaton
+
+    # -----------------------------------------------------------------------
+
+    def replace_all(self, text):
+        """Replace all the occurrences of the keys in a text.
+
+        Occurrences are searched from left to right, the longest key
+        first. Replacements are not cascaded: a replaced string is not
+        examined again.
+
+        :param text: (str) Unicode string
+        :returns: (str)
+
+        """
+        return self.get_automaton().replace(u(text), self._dict.get)
+
+    # -----------------------------------------------------------------------
+
     def is_key(self, entry):
         """Return True if entry is exactly a key in the dictionary.
 
@@ -258,6 +305,7 @@ class sppasDictRepl(object):
 
         # Append
         self._dict[key] = value
+        self._version += 1
 
     # -----------------------------------------------------------------------
 
@@ -270,6 +318,7 @@ class sppasDictRepl(object):
         s = sppasDictRepl.format_token(entry)
         if s in self._dict:
             self._dict.pop(s)
+            self._version += 1
 
     # -----------------------------------------------------------------------
 
@@ -287,6 +336,8 @@ class sppasDictRepl(object):
 
         for k in to_pop:
             self._dict.pop(k)
+        if len(to_pop) > 0:
+            self._version += 1
 
     # -----------------------------------------------------------------------
     # File
@@ -96,6 +96,7 @@ class sppasMapping(sppasDictRepl):
 
         """
         self._keep_miss = keep_miss
+        self._version += 1
 
     # -----------------------------------------------------------------------
 
@@ -107,6 +108,7 @@ class sppasMapping(sppasDictRepl):
 
         """
         self._reverse = reverse
+        self._version += 1
 
     # -----------------------------------------------------------------------
 
@@ -118,6 +120,7 @@ class sppasMapping(sppasDictRepl):
 
         """
         self._miss_symbol = str(symbol)
+        self._version += 1
 
     # -----------------------------------------------------------------------
     # Mapping entries
@@ -0,0 +1,218 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    src.resources.replautomaton.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+"""
+
+from collections import deque
+
+# ---------------------------------------------------------------------------
+
+
+class sppasReplAutomaton(object):
+    """Multi-patterns matching with an Aho-Corasick automaton.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+
+    The automaton is built from a set of keys, like the ones of a
+    replacement dictionary. Then, all the occurrences of all the keys in a
+    string are found in only one pass over the string, instead of searching
+    each key one after the other.
+
+    Matches are the leftmost-longest ones and they don't overlap: it is the
+    result of a replacement from left to right, preferring the longest key.
+
+    >>> a = sppasReplAutomaton(["km", "km/h", "h"])
+    >>> list(a.search("10km/h"))
+    [(2, 6, 'km/h')]
+    >>> a.replace("10km/h 3h", {"km/h": "kmh", "h": "hours"})
+    '10kmh 3hours'
+
+    """
+
+    def __init__(self, keys=()):
+        """Create a sppasReplAutomaton instance.
+
+        :param keys: (iterable) The strings to search for
+
+        """
+        # The trie: for each state, the transitions and the depth.
+        self._goto = [dict()]
+        self._depth = [0]
+        # For each state, the key it represents (if any)
+        self._key = [None]
+        # Failure links and longest key ending in each state
+        self._fail = [0]
+        self._out = [None]
+        self._compiled = True
+
+        for key in keys:
+            self.add(key)
+
+    # -----------------------------------------------------------------------
+
+    def add(self, key):
+        """Add a key in the automaton.
+
+        :param key: (str) A non-empty string
+
+        """
+        if len(key) == 0:
+            return
+
+        state = 0
+        for character in key:
+            next_state = self._goto[state].get(character)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][character] = next_state
+                self._goto.append(dict())
+                self._depth.append(self._depth[state] + 1)
+                self._key.append(None)
+            state = next_state
+
+        self._key[state] = key
+        self._compiled = False
+
+    # -----------------------------------------------------------------------
+
+    def search(self, text):
+        """Generate the leftmost-longest occurrences of the keys in a text.
+
+        :param text: (str)
+        :returns: Generator of tuples (start, end, key)
+
+        """
+        if self._compiled is False:
+            self.__compile()
+
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        depth = self._depth
+        n = len(text)
+
+        i = 0
+        state = 0
+        candidate = None
+        while True:
+            if i == n:
+                if candidate is None:
+                    return
+                # Restart after the candidate: it must be yielded.
+                yield candidate
+                i = candidate[1]
+                state = 0
+                candidate = None
+                continue
+
+            character = text[i]
+            while state > 0 and character not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(character, 0)
+            i += 1
+
+            # The longest key ending here is the one starting first
+            key = out[state]
+            if key is not None:
+                start = i - len(key)
+                if candidate is None or start <= candidate[0]:
+                    candidate = (start, i, key)
+
+            # No other key can start before (or with) the candidate.
+            if candidate is not None and i - depth[state] > candidate[0]:
+                yield candidate
+                i = candidate[1]
+                state = 0
+                candidate = None
+
+    # -----------------------------------------------------------------------
+
+    def replace(self, text, substitutions):
+        """Replace all the occurrences of the keys in a text.
+
+        :param text: (str)
+        :param substitutions: (dict or function) The replacement of each key
+        :returns: (str)
+
+        """
+        if callable(substitutions) is False:
+            substitutions = substitutions.get
+
+        result = list()
+        previous = 0
+        for start, end, key in self.search(text):
+            result.append(text[previous:start])
+            result.append(substitutions(key))
+            previous = end
+
+        if previous == 0:
+            return text
+        result.append(text[previous:])
+        return "".join(result)
+
+    # -----------------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------------
+
+    def __compile(self):
+        """Fix the failure links and the outputs of the states."""
+        self._fail = [0] * len(self._goto)
+        self._out = list(self._key)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for character, next_state in self._goto[state].items():
+                queue.append(next_state)
+                f = self._fail[state]
+                while f > 0 and character not in self._goto[f]:
+                    f = self._fail[f]
+                f = self._goto[f].get(character, 0)
+                self._fail[next_state] = f
+                if self._out[next_state] is None:
+                    self._out[next_state] = self._out[f]
+
+        self._compiled = True
+
+    # -----------------------------------------------------------------------
+    # Overloads
+    # -----------------------------------------------------------------------
+
+    def __len__(self):
+        """Return the number of keys of the automaton."""
+        return len([k for k in self._key if k is not None])
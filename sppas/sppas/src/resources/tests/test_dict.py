@@ -49,6 +49,7 @@ from sppas.src.utils.makeunicode import u
 from ..dictpron import sppasDictPron
 from ..dictrepl import sppasDictRepl
 from ..mapping import sppasMapping
+from ..replautomaton import sppasReplAutomaton
 from ..unigram import sppasUnigram
 from ..wordstrain import sppasWordStrain
 
@@ -290,6 +291,53 @@ class TestDictRepl(unittest.TestCase):
         self.assertTrue(d.replace_reversed("v2"), "key1|key2")
         self.assertEqual(d.replace_reversed("v0"), "")
 
+    # -----------------------------------------------------------------------
+
+    def test_replace_all(self):
+        d = sppasDictRepl()
+        d.add("km", "kilometers")
+        d.add("km/h", "kilometers_hour")
+        d.add("h", "hours")
+        self.assertEqual(3, d.get_version())
+        self.assertEqual("10 kilometers_hour in 2 hours",
+                         d.replace_all("10 km/h in 2 h"))
+        self.assertEqual("10 kilometers", d.replace_all("10 km"))
+        self.assertEqual("", d.replace_all(""))
+
+        # the automaton is re-used until the dict is modified
+        a = d.get_automaton()
+        self.assertIs(a, d.get_automaton())
+        d.pop("km/h")
+        self.assertIsNot(a, d.get_automaton())
+        self.assertEqual("10 kilometers/hours", d.replace_all("10 km/h"))
+
+# ---------------------------------------------------------------------------
+
+
+class TestReplAutomaton(unittest.TestCase):
+    """Test of the Aho-Corasick automaton."""
+
+    def test_search(self):
+        a = sppasReplAutomaton(["he", "she", "his", "hers"])
+        self.assertEqual(4, len(a))
+        self.assertEqual([(1, 4, "she")], list(a.search("ushers")))
+        self.assertEqual([(0, 4, "hers"), (5, 8, "his")],
+                         list(a.search("hers his")))
+        self.assertEqual([], list(a.search("xyz")))
+
+        # leftmost first, then longest
+        a = sppasReplAutomaton(["bc", "abcd", "cde"])
+        self.assertEqual([(0, 4, "abcd")], list(a.search("abcde")))
+        self.assertEqual([(1, 3, "bc")], list(a.search("xbcde")))
+
+    def test_replace(self):
+        a = sppasReplAutomaton([u("œ"), u("，"), u("。")])
+        repl = {u("œ"): u("oe"), u("，"): u(", "), u("。"): u(". ")}
+        self.assertEqual(u("coeur, oeil. "),
+                         a.replace(u("cœur，œil。"), repl))
+        self.assertEqual(u("abc"), a.replace(u("abc"), repl))
+        self.assertEqual(u("CŒUR"), a.replace(u("CŒUR"), lambda k: k))
+
 # ---------------------------------------------------------------------------
 
 
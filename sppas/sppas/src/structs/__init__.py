@@ -40,7 +40,7 @@ structs: access and manage data structures.
 *****************************************************************************
 
 This package includes classes to manage data like un-typed options, a
-language, a dag...
+language, a dag, a cache...
 
 Requires the following other packages:
 
@@ -55,6 +55,7 @@ from .basefset import sppasBaseSet
 from .baseoption import sppasBaseOption
 from .baseoption import sppasOption
 from .lang import sppasLangResource
+from .lrucache import sppasLRUCache
 from .metainfo import sppasMetaInfo
 
 __all__ = (
@@ -64,5 +65,6 @@ __all__ = (
     "sppasBaseOption",
     "sppasOption",
     "sppasLangResource",
+    "sppasLRUCache",
     "sppasMetaInfo",
 )
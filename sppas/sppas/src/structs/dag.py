@@ -29,10 +29,14 @@
 
         ---------------------------------------------------------------------
 
-    annotations.dag.py
-    ~~~~~~~~~~~~~~~~~~
+    structs.dag.py
+    ~~~~~~~~~~~~~~~
 
 """
+import heapq
+from array import array
+
+from sppas import sppasValueError
 
 
 class DAG(object):
@@ -40,6 +44,10 @@ class DAG(object):
 
     Implementation inspired from: http://www.python.org/doc/essays/graphs/
 
+    The graph algorithms don't use recursion: long graphs like the ones
+    of phonetization lattices can't reach the recursion limit. Nodes are
+    converted into integer indexes and edges into arrays of indexes.
+
     """
 
     def __init__(self):
@@ -91,69 +99,286 @@ class DAG(object):
     def remove_edge(self, src, dst):
         self.__graph[src].pop(dst)
 
+    # -----------------------------------------------------------------------
+    # Graph algorithms.
+    # All of them are iterative: they don't depend on the recursion limit.
+    # -----------------------------------------------------------------------
+
+    def topological_order(self):
+        """Return the list of nodes sorted in a topological order.
+
+        Each node is placed before all the nodes it has an edge to.
+        Kahn's algorithm is used.
+
+        :returns: (list)
+        :raises: sppasValueError if the graph has a cycle
+
+        """
+        nodes, index, adjacency = self.__compile()
+        indegree = array('i', [0] * len(nodes))
+        for edges in adjacency:
+            for dst in edges:
+                indegree[dst] += 1
+
+        order = array('i', [i for i in range(len(nodes)) if indegree[i] == 0])
+        i = 0
+        while i < len(order):
+            for dst in adjacency[order[i]]:
+                indegree[dst] -= 1
+                if indegree[dst] == 0:
+                    order.append(dst)
+            i += 1
+
+        if len(order) != len(nodes):
+            raise sppasValueError('DAG', 'cycle')
+
+        return [nodes[i] for i in order]
+
     # -----------------------------------------------------------------------
 
-    def find_path(self, start, end, path=[]):
+    def find_path(self, start, end):
         """Determine a path between two nodes.
 
-        It takes a graph and the start and end nodes as arguments. It
+        It takes the start and end nodes as arguments. It
         will return a list of nodes (including the start and end nodes)
         comprising the path. When no path can be found, it returns None.
         Note: The same node will not occur more than once on the path
         returned (i.e. it won't contain cycles).
 
-            >>> find_path(graph, 'A', 'C')
+            >>> graph.find_path('A', 'C')
             >>> ['A', 'B', 'C']
+
+        """
+        for path in self.iter_all_paths(start, end):
+            return path
+        return None
+
+    # -----------------------------------------------------------------------
+
+    def find_all_paths(self, start, end):
+        """Return the list of all the paths between two nodes.
+
+        Paths are ordered like a depth-first search following the edges in
+        the order they were added.
+
+        """
+        return list(self.iter_all_paths(start, end))
+
+    # -----------------------------------------------------------------------
+
+    def iter_all_paths(self, start, end):
+        """Generate all the paths between two nodes.
+
+        Paths are generated in the same order than find_all_paths().
+        This is an iterative depth-first search: only the current path is
+        stored, as an array of node indexes.
+
+        :returns: Generator of lists of nodes
+
         """
-        path += [start]
         if start == end:
-            return [path]
-        if start not in self.__graph:
-            return []
+            yield [start]
+            return
+
+        nodes, index, adjacency = self.__compile()
+        if start not in index or end not in index:
+            return
+        src = index[start]
+        dst = index[end]
+
+        # current path and, for each of its nodes, the next edge to follow
+        path = array('i', [src])
+        edge = array('i', [0])
+        in_path = array('b', [0] * len(nodes))
+        in_path[src] = 1
+
+        while len(path) > 0:
+            node = path[-1]
+            if edge[-1] == len(adjacency[node]):
+                # all edges of this node were explored: backtrack
+                in_path[node] = 0
+                path.pop()
+                edge.pop()
+                continue
+
+            nxt = adjacency[node][edge[-1]]
+            edge[-1] += 1
+            if in_path[nxt] == 1:
+                continue
+            if nxt == dst:
+                yield [nodes[i] for i in path] + [end]
+            else:
+                path.append(nxt)
+                edge.append(0)
+                in_path[nxt] = 1
+
+    # -----------------------------------------------------------------------
 
-        for node in self.__graph[start]:
-            if node not in path:
-                new_path = self.find_path(node, end, path)
-                if len(new_path) > 0:
-                    return new_path
-        return []
+    def find_shortest_path(self, start, end):
+        """Return the path with the minimum number of nodes.
+
+        A breadth-first search is used.
+
+        :returns: (list) the path or None if there's no path
+
+        """
+        if start == end:
+            return [start]
+
+        nodes, index, adjacency = self.__compile()
+        if start not in index or end not in index:
+            return None
+        src = index[start]
+        dst = index[end]
+
+        parent = array('i', [-1] * len(nodes))
+        parent[src] = src
+        queue = array('i', [src])
+        i = 0
+        while i < len(queue):
+            node = queue[i]
+            for nxt in adjacency[node]:
+                if parent[nxt] == -1:
+                    parent[nxt] = node
+                    if nxt == dst:
+                        return self.__backtrack(nodes, parent, src, dst)
+                    queue.append(nxt)
+            i += 1
+
+        return None
 
     # -----------------------------------------------------------------------
 
-    def find_all_paths(self, start, end, path=[]):
-        path = path + [start]
+    def iter_shortest_paths(self, start, end, weight=None):
+        """Generate the paths between two nodes, the shortest first.
+
+        The length of a path is the sum of the weights of its nodes. By
+        default, each node has a weight of 1, i.e. the length is the number
+        of nodes. The exact distance of each node to the end is computed
+        in reverse topological order, then a best-first search yields the
+        paths one by one: getting the k shortest paths does not require to
+        enumerate all of them.
+
+            >>> for length, path in graph.iter_shortest_paths(0, 5):
+            >>>     print(length, path)
+
+        :param start: Start node
+        :param end: End node
+        :param weight: (function) Return the weight (int or float) of a node
+        :returns: Generator of tuples (length, list of nodes)
+        :raises: sppasValueError if the graph has a cycle
+
+        """
         if start == end:
-            return [path]
-        if start not in self.__graph:
-            return []
+            yield (1 if weight is None else weight(start)), [start]
+            return
+
+        nodes, index, adjacency = self.__compile()
+        if start not in index or end not in index:
+            return
+        src = index[start]
+        dst = index[end]
+        if weight is None:
+            costs = array('i', [1] * len(nodes))
+        else:
+            costs = [weight(n) for n in nodes]
+
+        # Distance of each node to the end, in reverse topological order.
+        # None means that the end can't be reached.
+        order = [index[n] for n in self.topological_order()]
+        dist = [None] * len(nodes)
+        dist[dst] = costs[dst]
+        for node in reversed(order):
+            for nxt in adjacency[node]:
+                if dist[nxt] is not None:
+                    d = costs[node] + dist[nxt]
+                    if dist[node] is None or d < dist[node]:
+                        dist[node] = d
+        if dist[src] is None:
+            return
+
+        # Best-first search on partial paths, with the exact distance to
+        # the end as heuristic: the complete paths are popped in order.
+        # The counter preserves the order of the edges for equal lengths.
+        counter = 0
+        heap = [(dist[src], counter, 0, (src, None))]
+        while heap:
+            estimate, _, length, partial = heapq.heappop(heap)
+            node = partial[0]
+            length += costs[node]
+            if node == dst:
+                path = list()
+                while partial is not None:
+                    path.append(nodes[partial[0]])
+                    partial = partial[1]
+                path.reverse()
+                yield length, path
+                continue
+            for nxt in adjacency[node]:
+                if dist[nxt] is not None:
+                    counter += 1
+                    heapq.heappush(heap, (length + dist[nxt], counter,
+                                          length, (nxt, partial)))
+
+    # -----------------------------------------------------------------------
 
-        paths = []
-        for node in self.__graph[start]:
-            if node not in path:
-                new_paths = self.find_all_paths(node, end, path)
-                for new_path in new_paths:
-                    paths.append(new_path)
+    def find_k_shortest_paths(self, start, end, k, weight=None):
+        """Return the list of the k shortest paths between two nodes.
 
+        :param start: Start node
+        :param end: End node
+        :param k: (int) Max number of paths
+        :param weight: (function) Return the weight of a node
+        :returns: (list) List of lists of nodes
+
+        """
+        paths = list()
+        if k <= 0:
+            return paths
+        for length, path in self.iter_shortest_paths(start, end, weight):
+            paths.append(path)
+            if len(paths) == k:
+                break
         return paths
 
     # -----------------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------------
 
-    def find_shortest_path(self, start, end, path=[]):
-        path += [start]
-        if start == end:
-            return path
-        if start not in self.__graph.keys():
-            return None
+    def __compile(self):
+        """Convert the graph into integer adjacency arrays.
+
+        Nodes which are only the destination of an edge are added.
 
-        shortest = None
-        for node in self.__graph[start]:
-            if node not in path:
-                new_path = self.find_shortest_path(node, end, path)
-                if new_path:
-                    if not shortest or len(new_path) < len(shortest):
-                        shortest = new_path
+        :returns: (list of nodes, dict of node indexes, list of arrays)
+
+        """
+        nodes = list(self.__graph.keys())
+        index = dict((node, i) for i, node in enumerate(nodes))
+        for edges in self.__graph.values():
+            for dst in edges:
+                if dst not in index:
+                    index[dst] = len(nodes)
+                    nodes.append(dst)
+
+        adjacency = [array('i', [index[dst]
+                                 for dst in self.__graph.get(node, ())])
+                     for node in nodes]
+
+        return nodes, index, adjacency
+
+    # -----------------------------------------------------------------------
 
-        return shortest
+    @staticmethod
+    def __backtrack(nodes, parent, src, dst):
+        """Return the path from src to dst from the array of parents."""
+        path = [nodes[dst]]
+        node = dst
+        while node != src:
+            node = parent[node]
+            path.append(nodes[node])
+        path.reverse()
+        return path
 
     # -----------------------------------------------------------------------
     # Overloads
@@ -0,0 +1,154 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    structs.lrucache.py
+    ~~~~~~~~~~~~~~~~~~~~
+
+"""
+
+import collections
+
+# ---------------------------------------------------------------------------
+
+
+class sppasLRUCache(object):
+    """Least-Recently-Used cache of a bounded size.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+
+    Store (key, value) pairs up to a given number of entries. When the cache
+    is full, the entry that was not used for the longest time is discarded.
+    It is a light alternative to functools.lru_cache which is not available
+    under python 2.7 and which can't be cleared for a single instance.
+
+    >>> cache = sppasLRUCache(2)
+    >>> cache.set('a', 1)
+    >>> cache.set('b', 2)
+    >>> cache.get('a')
+    1
+    >>> cache.set('c', 3)
+    >>> 'b' in cache
+    False
+
+    """
+
+    def __init__(self, size=1024):
+        """Create a new sppasLRUCache instance.
+
+        :param size: (int) Max number of entries. If 0, the size is unlimited.
+
+        """
+        super(sppasLRUCache, self).__init__()
+        self._size = 0
+        self._cache = collections.OrderedDict()
+        self.set_size(size)
+
+    # -----------------------------------------------------------------------
+
+    def get_size(self):
+        """Return the max number of entries of the cache."""
+        return self._size
+
+    # -----------------------------------------------------------------------
+
+    def set_size(self, size):
+        """Fix the max number of entries of the cache.
+
+        :param size: (int) Max number of entries. If 0, the size is unlimited.
+
+        """
+        size = int(size)
+        if size < 0:
+            raise ValueError('Unexpected value for the size of the cache.')
+        self._size = size
+        self.__shrink()
+
+    # -----------------------------------------------------------------------
+
+    def get(self, key, default=None):
+        """Return the value of a given key and mark it as recently used.
+
+        :param key: any hashable object
+        :param default: value to return if the key is not in the cache
+
+        """
+        try:
+            value = self._cache.pop(key)
+        except KeyError:
+            return default
+
+        self._cache[key] = value
+        return value
+
+    # -----------------------------------------------------------------------
+
+    def set(self, key, value):
+        """Add or update an entry of the cache.
+
+        :param key: any hashable object
+        :param value: any object
+
+        """
+        self._cache.pop(key, None)
+        self._cache[key] = value
+        self.__shrink()
+
+    # -----------------------------------------------------------------------
+
+    def clear(self):
+        """Remove all the entries of the cache."""
+        self._cache.clear()
+
+    # -----------------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------------
+
+    def __shrink(self):
+        """Discard the least recently used entries until the size is ok."""
+        if self._size == 0:
+            return
+        while len(self._cache) > self._size:
+            self._cache.popitem(last=False)
+
+    # -----------------------------------------------------------------------
+    # Overloads
+    # -----------------------------------------------------------------------
+
+    def __contains__(self, key):
+        return key in self._cache
+
+    def __len__(self):
+        """Return the number of entries in the cache."""
+        return len(self._cache)
@@ -0,0 +1,108 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    src.structs.tests.test_dag.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+"""
+import unittest
+
+from sppas.src.exc import sppasValueError
+
+from ..dag import DAG
+
+# ---------------------------------------------------------------------------
+
+
+class TestDAG(unittest.TestCase):
+
+    def setUp(self):
+        self.dag = DAG()
+        for node in "ABCDE":
+            self.dag.add_node(node)
+        self.dag.add_edge('A', 'B')
+        self.dag.add_edge('A', 'C')
+        self.dag.add_edge('B', 'C')
+        self.dag.add_edge('B', 'D')
+        self.dag.add_edge('C', 'D')
+        self.dag.add_edge('D', 'E')
+
+    def test_topological_order(self):
+        order = self.dag.topological_order()
+        self.assertEqual(['A', 'B', 'C', 'D', 'E'], order)
+        self.dag.add_edge('E', 'A')
+        with self.assertRaises(sppasValueError):
+            self.dag.topological_order()
+
+    def test_find_path(self):
+        self.assertEqual(['A', 'B', 'C', 'D'], self.dag.find_path('A', 'D'))
+        self.assertEqual(['A', 'B', 'C', 'D'], self.dag.find_path('A', 'D'))
+        self.assertIsNone(self.dag.find_path('D', 'A'))
+        self.assertIsNone(self.dag.find_path('X', 'A'))
+        self.assertEqual(['A'], self.dag.find_path('A', 'A'))
+
+    def test_find_all_paths(self):
+        paths = [['A', 'B', 'C', 'D', 'E'],
+                 ['A', 'B', 'D', 'E'],
+                 ['A', 'C', 'D', 'E']]
+        self.assertEqual(paths, self.dag.find_all_paths('A', 'E'))
+        self.assertEqual(paths, list(self.dag.iter_all_paths('A', 'E')))
+        self.assertEqual([], self.dag.find_all_paths('E', 'A'))
+
+    def test_find_shortest_path(self):
+        self.assertEqual(['A', 'B', 'D', 'E'],
+                         self.dag.find_shortest_path('A', 'E'))
+        self.assertEqual(['C', 'D'], self.dag.find_shortest_path('C', 'D'))
+        self.assertIsNone(self.dag.find_shortest_path('E', 'A'))
+
+    def test_shortest_paths(self):
+        paths = list(self.dag.iter_shortest_paths('A', 'E'))
+        self.assertEqual([(4, ['A', 'B', 'D', 'E']),
+                          (4, ['A', 'C', 'D', 'E']),
+                          (5, ['A', 'B', 'C', 'D', 'E'])], paths)
+
+        # with a weight for each node
+        weights = {'A': 1, 'B': 5, 'C': 1, 'D': 1, 'E': 1}
+        paths = self.dag.find_k_shortest_paths('A', 'E', 2,
+                                               weight=lambda n: weights[n])
+        self.assertEqual([['A', 'C', 'D', 'E'], ['A', 'B', 'D', 'E']], paths)
+        self.assertEqual([], self.dag.find_k_shortest_paths('A', 'E', 0))
+
+    def test_long_graph(self):
+        # a path longer than the recursion limit
+        dag = DAG()
+        for i in range(5000):
+            dag.add_node(i)
+            dag.add_edge(i, i+1)
+        self.assertEqual(5001, len(dag.find_path(0, 5000)))
+        self.assertEqual(5001, len(dag.find_shortest_path(0, 5000)))
+        self.assertEqual(1, len(dag.find_all_paths(0, 5000)))
+        self.assertEqual(1, len(dag.find_k_shortest_paths(0, 5000, 3)))
@@ -0,0 +1,77 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    src.structs.tests.test_lrucache.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+"""
+import unittest
+
+from ..lrucache import sppasLRUCache
+
+# ---------------------------------------------------------------------------
+
+
+class TestLRUCache(unittest.TestCase):
+
+    def test_init(self):
+        cache = sppasLRUCache()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.get_size(), 1024)
+        with self.assertRaises(ValueError):
+            sppasLRUCache(-1)
+
+    def test_get_set(self):
+        cache = sppasLRUCache(2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('c'))
+        self.assertEqual(cache.get('c', 3), 3)
+
+        # 'b' is the least recently used
+        cache.set('c', 3)
+        self.assertEqual(len(cache), 2)
+        self.assertFalse('b' in cache)
+        self.assertTrue('a' in cache)
+        self.assertTrue('c' in cache)
+
+    def test_size(self):
+        cache = sppasLRUCache(0)
+        for i in range(100):
+            cache.set(i, i)
+        self.assertEqual(len(cache), 100)
+        cache.set_size(10)
+        self.assertEqual(len(cache), 10)
+        self.assertTrue(99 in cache)
+        self.assertFalse(89 in cache)
+        cache.clear()
+        self.assertEqual(len(cache), 0)